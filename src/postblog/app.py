@@ -1,6 +1,20 @@
-"""PostBlogアプリケーションエントリーポイント。"""
+"""PostBlogアプリケーションエントリーポイント。
 
+最初の画面を表示するまでの時間を短くするため、起動時には画面表示に必要な
+モジュールだけを読み込む。openai・keyring・httpx・投稿クライアント・各画面は
+最初に使用する時点（OpenAIクライアントと投稿クライアントは最初の画面表示後の
+バックグラウンド）で読み込む。
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
 import logging
+import sys
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from postblog.config import ConfigManager
 from postblog.controllers.article_controller import ArticleController
@@ -8,78 +22,325 @@ from postblog.controllers.hearing_controller import HearingController
 from postblog.controllers.home_controller import HomeController
 from postblog.controllers.publish_controller import PublishController
 from postblog.controllers.settings_controller import SettingsController
-from postblog.gui.app_window import AppWindow
 from postblog.infrastructure.async_runner import AsyncRunner
+from postblog.infrastructure.blocking_executor import BlockingExecutor
 from postblog.infrastructure.credential.credential_manager import CredentialManager
-from postblog.infrastructure.llm.openai_client import OpenAIClient
+from postblog.infrastructure.llm.cached_client import CachedLLMClient, LLMResponseCache
+from postblog.infrastructure.llm.lazy_client import LazyLLMClient
+from postblog.infrastructure.startup_profiler import StartupProfiler
+from postblog.infrastructure.storage.body_codec import BodyCodec
 from postblog.infrastructure.storage.database import Database
 from postblog.infrastructure.storage.draft_repository import DraftRepository
 from postblog.infrastructure.storage.history_repository import HistoryRepository
 from postblog.logging_config import setup_logging
 from postblog.services.article_service import ArticleService
+from postblog.services.autosave_service import AutosaveService
 from postblog.services.draft_service import DraftService
 from postblog.services.hearing_service import HearingService
 from postblog.services.history_service import HistoryService
 from postblog.services.publish_service import PublishService
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from postblog.infrastructure.http_client import SharedHttpClient
+    from postblog.infrastructure.llm.base import LLMClient
+    from postblog.infrastructure.publishers.base import BlogPublisher
+
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:  # pragma: no cover
-    """アプリケーションを起動する。"""
-    setup_logging()
+def main(argv: list[str] | None = None) -> None:  # pragma: no cover
+    """アプリケーションを起動する。
+
+    Args:
+        argv: コマンドライン引数（Noneの場合は sys.argv）。
+    """
+    args = _parse_args(argv)
+    profiler = StartupProfiler()
+
+    with profiler.phase("logging"):
+        setup_logging()
     logger.info("PostBlog を起動します")
 
     # Infrastructure
-    config_manager = ConfigManager()
-    config_manager.load()
+    with profiler.phase("config"):
+        config_manager = ConfigManager()
+        config_manager.load()
     credential_manager = CredentialManager()
-    database = Database()
+    with profiler.phase("database"):
+        database = Database()
+        database.initialize()
     async_runner = AsyncRunner()
     async_runner.start()
 
+    with profiler.phase("services"):
+        # openai の読み込みとAPIキーの取得は最初の画面表示後に行う
+        lazy_llm_client = LazyLLMClient(
+            functools.partial(
+                _create_llm_client, credential_manager, config_manager.config.model
+            )
+        )
+        autosave, controllers = _create_controllers(
+            config_manager, credential_manager, database, async_runner, lazy_llm_client
+        )
+
+    # GUI
+    with profiler.phase("window"):
+        from postblog.gui.app_window import AppWindow
+
+        app = AppWindow()
+
+    # 自動保存の完了時刻をステータスバーに表示する（保存スレッドからGUIスレッドへ戻す）
+    autosave.set_on_saved(
+        lambda _draft: app.after(
+            0, app.statusbar.set_last_saved, datetime.now().strftime("%H:%M:%S")
+        )
+    )
+
+    # コンテキストにコントローラを登録
+    app.navigation.context.update(controllers)
+
+    def _warm_up() -> None:
+        """最初の画面表示後に OpenAI クライアントと投稿クライアントを生成する。"""
+        with profiler.phase("llm client", background=True):
+            lazy_llm_client.warm_up()
+        # 認証情報の読み出しを投稿画面の表示時（GUIスレッド）に行わないようにする
+        with profiler.phase("publishers", background=True):
+            controllers["publish_controller"].get_available_services()
+        if args.profile_startup:
+            app.after(0, _finish_profile)
+
+    def _on_first_frame() -> None:
+        """最初の画面が描画された時点の処理。"""
+        elapsed = profiler.mark_first_frame()
+        logger.info("最初の画面を表示しました: %.0f ms", elapsed * 1000)
+        threading.Thread(target=_warm_up, name="postblog-warm-up", daemon=True).start()
+
+    def _finish_profile() -> None:
+        """起動時間の計測結果を出力して終了する。"""
+        print(profiler.report(), file=sys.stderr)
+        app.quit()
+
+    # 画面の描画は保留中のアイドル処理として実行されるため、その後に呼ばれる
+    app.after_idle(_on_first_frame)
+
+    try:
+        app.mainloop()
+    finally:
+        autosave.set_on_saved(None)
+        autosave.stop()
+        async_runner.stop()
+        database.close()
+        logger.info("PostBlog を終了しました")
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """コマンドライン引数を解析する。
+
+    Args:
+        argv: コマンドライン引数（Noneの場合は sys.argv）。
+
+    Returns:
+        解析結果。
+    """
+    parser = argparse.ArgumentParser(prog="postblog")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="起動処理のフェーズごとの所要時間を表示して終了する",
+    )
+    return parser.parse_args(argv)
+
+
+def _create_controllers(
+    config_manager: ConfigManager,
+    credential_manager: CredentialManager,
+    database: Database,
+    async_runner: AsyncRunner,
+    llm_client: LLMClient,
+) -> tuple[AutosaveService, dict[str, Any]]:  # pragma: no cover
+    """リポジトリ・サービス・コントローラを生成する。
+
+    Args:
+        config_manager: 設定管理。
+        credential_manager: 認証情報マネージャー。
+        database: データベース。
+        async_runner: 非同期ランナー。
+        llm_client: LLMクライアント（キャッシュでラップして使用する）。
+
+    Returns:
+        開始済みの自動保存サービスと、コンテキスト名をキーとするコントローラの辞書。
+    """
     # Repositories
-    draft_repo = DraftRepository(database)
+    draft_repo = DraftRepository(database, codec=BodyCodec())
     history_repo = HistoryRepository(database)
 
     # LLM Client
-    api_key = credential_manager.retrieve("openai", "api_key") or ""
-    llm_client = OpenAIClient(api_key=api_key, model=config_manager.config.model)
+    cached_llm_client = CachedLLMClient(
+        llm_client, LLMResponseCache(), default_model=config_manager.config.model
+    )
 
     # Services
-    article_service = ArticleService(llm_client)
-    hearing_service = HearingService(llm_client)
+    article_service = ArticleService(cached_llm_client)
+    hearing_service = HearingService(cached_llm_client)
     draft_service = DraftService(draft_repo)
+    autosave = AutosaveService(
+        draft_service, interval=config_manager.config.auto_save_interval
+    )
+    autosave.start()
     publish_service = PublishService()
+    _register_http_publishers(publish_service, credential_manager, async_runner)
+    _register_blocking_publishers(publish_service, credential_manager, async_runner)
     history_service = HistoryService(history_repo)
 
     # Controllers
-    home_controller = HomeController(draft_service, history_service)
-    hearing_controller = HearingController(hearing_service, async_runner)
-    article_controller = ArticleController(article_service, draft_service, async_runner)
-    publish_controller = PublishController(
-        publish_service, history_service, async_runner
-    )
-    settings_controller = SettingsController(
-        config_manager, credential_manager, publish_service, async_runner
-    )
+    controllers: dict[str, Any] = {
+        "home_controller": HomeController(draft_service, history_service, async_runner),
+        "hearing_controller": HearingController(hearing_service, async_runner),
+        "article_controller": ArticleController(
+            article_service, draft_service, async_runner, autosave
+        ),
+        "publish_controller": PublishController(
+            publish_service, history_service, async_runner
+        ),
+        "settings_controller": SettingsController(
+            config_manager, credential_manager, publish_service, async_runner, autosave
+        ),
+    }
+    return autosave, controllers
 
-    # GUI
-    app = AppWindow()
 
-    # コンテキストにコントローラを登録
-    app.navigation.context["home_controller"] = home_controller
-    app.navigation.context["hearing_controller"] = hearing_controller
-    app.navigation.context["article_controller"] = article_controller
-    app.navigation.context["publish_controller"] = publish_controller
-    app.navigation.context["settings_controller"] = settings_controller
+def _create_llm_client(
+    credential_manager: CredentialManager, model: str
+) -> LLMClient:  # pragma: no cover
+    """OpenAIクライアントを生成する。
 
-    try:
-        app.mainloop()
-    finally:
-        async_runner.stop()
-        logger.info("PostBlog を終了しました")
+    Args:
+        credential_manager: 認証情報マネージャー。
+        model: デフォルトのモデル名。
+
+    Returns:
+        OpenAIクライアント。
+    """
+    from postblog.infrastructure.llm.openai_client import OpenAIClient
+
+    api_key = credential_manager.retrieve("openai", "api_key") or ""
+    return OpenAIClient(api_key=api_key, model=model)
+
+
+def _register_http_publishers(
+    publish_service: PublishService,
+    credential_manager: CredentialManager,
+    async_runner: AsyncRunner,
+) -> None:  # pragma: no cover
+    """HTTP系の投稿クライアントの生成関数を登録する。
+
+    投稿クライアントと共有HTTPクライアントは、投稿画面の表示や接続テストで
+    最初に必要になった時点で生成する。認証情報が保存されていない
+    サービスは生成せず、次回の使用時に再度確認する。
+
+    Args:
+        publish_service: 投稿サービス。
+        credential_manager: 認証情報マネージャー。
+        async_runner: 非同期ランナー（共有HTTPクライアントの破棄に使用）。
+    """
+
+    # 投稿クライアント共通のHTTP接続プール（AsyncRunnerのループ上で使用・破棄する）
+    @functools.cache
+    def http_client() -> SharedHttpClient:
+        from postblog.infrastructure.http_client import SharedHttpClient
+
+        client = SharedHttpClient()
+        async_runner.add_shutdown_hook(client.aclose)
+        return client
+
+    def qiita() -> BlogPublisher | None:
+        token = credential_manager.retrieve("qiita", "api_token")
+        if not token:
+            return None
+        from postblog.infrastructure.publishers.qiita import QiitaPublisher
+
+        return QiitaPublisher(token, http_client=http_client())
+
+    def hatena() -> BlogPublisher | None:
+        hatena_id = credential_manager.retrieve("hatena", "hatena_id")
+        blog_id = credential_manager.retrieve("hatena", "blog_id")
+        hatena_key = credential_manager.retrieve("hatena", "api_key")
+        if not (hatena_id and blog_id and hatena_key):
+            return None
+        from postblog.infrastructure.publishers.hatena import HatenaPublisher
+
+        return HatenaPublisher(
+            hatena_id, blog_id, hatena_key, http_client=http_client()
+        )
+
+    def wordpress() -> BlogPublisher | None:
+        site_url = credential_manager.retrieve("wordpress", "site_url")
+        username = credential_manager.retrieve("wordpress", "username")
+        app_password = credential_manager.retrieve("wordpress", "app_password")
+        if not (site_url and username and app_password):
+            return None
+        from postblog.infrastructure.publishers.wordpress import WordPressPublisher
+
+        return WordPressPublisher(
+            site_url, username, app_password, http_client=http_client()
+        )
+
+    publish_service.register_factory("qiita", qiita)
+    publish_service.register_factory("hatena", hatena)
+    publish_service.register_factory("wordpress", wordpress)
+
+
+def _register_blocking_publishers(
+    publish_service: PublishService,
+    credential_manager: CredentialManager,
+    async_runner: AsyncRunner,
+) -> None:  # pragma: no cover
+    """Git操作・SMTP送信を行う投稿クライアントの生成関数を登録する。
+
+    ブロッキング処理を実行するスレッドプールはサービスごとに1つ持ち、
+    AsyncRunner の停止時に停止する。
+
+    Args:
+        publish_service: 投稿サービス。
+        credential_manager: 認証情報マネージャー。
+        async_runner: 非同期ランナー（スレッドプールの停止に使用）。
+    """
+    # 同じリポジトリへのGit操作を直列化するため、Zennは1スレッドにする
+    zenn_executor = BlockingExecutor(max_workers=1, name="zenn")
+    ameba_executor = BlockingExecutor(max_workers=2, name="ameba")
+
+    async def shutdown_executors() -> None:
+        zenn_executor.shutdown()
+        ameba_executor.shutdown()
+
+    async_runner.add_shutdown_hook(shutdown_executors)
+
+    def zenn() -> BlogPublisher | None:
+        repo_path = credential_manager.retrieve("zenn", "repo")
+        github_token = credential_manager.retrieve("zenn", "github_token")
+        if not (repo_path and github_token):
+            return None
+        from postblog.infrastructure.publishers.zenn import ZennPublisher
+
+        return ZennPublisher(repo_path, github_token, executor=zenn_executor)
+
+    def ameba() -> BlogPublisher | None:
+        from_email = credential_manager.retrieve("ameba", "sender_email")
+        posting_email = credential_manager.retrieve("ameba", "recipient_email")
+        if not (from_email and posting_email):
+            return None
+        from postblog.infrastructure.publishers.ameba import AmebaPublisher
+
+        return AmebaPublisher(
+            from_email,
+            posting_email,
+            smtp_password=credential_manager.retrieve("ameba", "smtp_password") or "",
+            executor=ameba_executor,
+        )
+
+    publish_service.register_factory("zenn", zenn)
+    publish_service.register_factory("ameba", ameba)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -3,7 +3,11 @@
 記事の生成・SEO分析・下書き保存・再生成を管理する。
 """
 
+import asyncio
 import logging
+import threading
+from collections.abc import Sequence
+from dataclasses import replace
 from datetime import datetime
 from typing import Any
 
@@ -14,8 +18,14 @@ from postblog.models.draft import Draft
 from postblog.models.hearing import HearingResult
 from postblog.models.seo import SeoAdvice, SeoAnalysisResult
 from postblog.services.article_service import ArticleService
+from postblog.services.autosave_service import AutosaveService
 from postblog.services.draft_service import DraftService
-from postblog.services.seo_service import analyze_seo
+from postblog.services.seo_parser import find_edit_range, merge_edit_ranges
+from postblog.services.seo_service import (
+    SeoParseState,
+    analyze_seo_incremental,
+    analyze_seo_with_state,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +38,7 @@ class ArticleController:
         article_service: 記事生成サービス。
         draft_service: 下書き管理サービス。
         async_runner: 非同期ランナー。
+        autosave: 自動保存サービス（Noneの場合は自動保存しない）。
     """
 
     def __init__(
@@ -35,13 +46,25 @@ class ArticleController:
         article_service: ArticleService,
         draft_service: DraftService,
         async_runner: AsyncRunner,
+        autosave: AutosaveService | None = None,
     ) -> None:
         self._article_service = article_service
         self._draft_service = draft_service
         self._async_runner = async_runner
+        self._autosave = autosave
         self._current_article: Article | None = None
         self._current_seo_advice: SeoAdvice | None = None
         self._hearing_result: HearingResult | None = None
+        self._seo_result: SeoAnalysisResult | None = None
+        self._seo_state: SeoParseState | None = None
+        # 前回分析した本文のエディタ上のバージョン（不明な場合None）
+        self._seo_version: int | None = None
+        # 前回のSEO分析要求以降の本文の編集差分（不明な場合None）
+        self._body_edits: list[Any] | None = []
+        self._seo_lock = threading.Lock()
+        self._seo_generation = 0
+        self._seo_pending: tuple[int, Article, list[Any] | None, Any, Any] | None = None
+        self._seo_running = False
 
     @property
     def current_article(self) -> Article | None:
@@ -58,6 +81,7 @@ class ArticleController:
         hearing_result: HearingResult,
         on_success: Any = None,
         on_error: Any = None,
+        on_chunk: Any = None,
     ) -> None:
         """ヒアリング結果から記事を生成する（非同期）。
 
@@ -65,6 +89,8 @@ class ArticleController:
             hearing_result: ヒアリング結果。
             on_success: 成功時コールバック。
             on_error: 失敗時コールバック。
+            on_chunk: 本文チャンク受信時コールバック。指定した場合は
+                ストリーミングで生成し、本文を受信するたびに呼ばれる。
 
         Raises:
             ValidationError: ヒアリング結果が不完全な場合。
@@ -75,29 +101,24 @@ class ArticleController:
             raise ValidationError("ヒアリングサマリーがありません。")
 
         self._hearing_result = hearing_result
-
-        async def _generate() -> tuple[Article, SeoAdvice]:
-            return await self._article_service.generate(hearing_result)
-
-        def _on_success(result: tuple[Article, SeoAdvice]) -> None:
-            article, seo_advice = result
-            self._current_article = article
-            self._current_seo_advice = seo_advice
-            if on_success is not None:
-                on_success(result)
-
-        self._async_runner.run(_generate(), on_success=_on_success, on_error=on_error)
+        if self._autosave is not None:
+            self._autosave.reset()
+        self._start_generation(hearing_result, on_success, on_error, on_chunk)
 
     def regenerate_article(
         self,
         on_success: Any = None,
         on_error: Any = None,
+        on_chunk: Any = None,
     ) -> None:
         """記事を再生成する（非同期）。
 
+        同じヒアリング結果でも新しい記事を生成するため、LLMの応答キャッシュは使わない。
+
         Args:
             on_success: 成功時コールバック。
             on_error: 失敗時コールバック。
+            on_chunk: 本文チャンク受信時コールバック（ストリーミング生成）。
 
         Raises:
             ValidationError: ヒアリング結果がない場合。
@@ -105,15 +126,47 @@ class ArticleController:
         if self._hearing_result is None:
             raise ValidationError("ヒアリング結果がありません。再生成できません。")
 
-        hearing_result = self._hearing_result
+        self._start_generation(
+            self._hearing_result, on_success, on_error, on_chunk, use_cache=False
+        )
+
+    def _start_generation(
+        self,
+        hearing_result: HearingResult,
+        on_success: Any,
+        on_error: Any,
+        on_chunk: Any,
+        *,
+        use_cache: bool = True,
+    ) -> None:
+        """記事生成をAsyncRunnerで開始する。
+
+        Args:
+            hearing_result: ヒアリング結果。
+            on_success: 成功時コールバック。
+            on_error: 失敗時コールバック。
+            on_chunk: 本文チャンク受信時コールバック（Noneの場合は一括生成）。
+            use_cache: Falseの場合はLLMの応答キャッシュを使わずに生成する。
+        """
 
         async def _generate() -> tuple[Article, SeoAdvice]:
-            return await self._article_service.generate(hearing_result)
+            if on_chunk is None:
+                return await self._article_service.generate(
+                    hearing_result, use_cache=use_cache
+                )
+
+            stream = self._article_service.generate_stream(
+                hearing_result, use_cache=use_cache
+            )
+            async for chunk in stream:
+                on_chunk(chunk)
+            return stream.result
 
         def _on_success(result: tuple[Article, SeoAdvice]) -> None:
             article, seo_advice = result
             self._current_article = article
             self._current_seo_advice = seo_advice
+            self._mark_dirty()
             if on_success is not None:
                 on_success(result)
 
@@ -125,6 +178,7 @@ class ArticleController:
         body: str | None = None,
         tags: list[str] | None = None,
         meta_description: str | None = None,
+        deltas: Sequence[Any] | None = None,
     ) -> Article:
         """記事を更新する。
 
@@ -133,6 +187,9 @@ class ArticleController:
             body: 更新する本文。
             tags: 更新するタグリスト。
             meta_description: 更新するメタディスクリプション。
+            deltas: 前回の本文の更新から body までのエディタの編集差分
+                （offset・removed・inserted・version を持つ）。指定した場合、
+                次のSEO分析では本文を比較せずに差分から編集範囲を求める。
 
         Returns:
             更新後の記事。
@@ -148,6 +205,11 @@ class ArticleController:
             self._current_article.title = title
 
         if body is not None:
+            if deltas is not None:
+                if self._body_edits is not None:
+                    self._body_edits.extend(deltas)
+            elif body != self._current_article.body:
+                self._body_edits = None
             self._current_article.body = body
 
         if tags is not None:
@@ -158,11 +220,19 @@ class ArticleController:
             self._current_article.meta_description = meta_description
 
         self._current_article.updated_at = datetime.now()
+        self._mark_dirty()
         return self._current_article
 
+    def _mark_dirty(self) -> None:
+        """現在の記事の編集を自動保存サービスに通知する。"""
+        if self._autosave is not None and self._current_article is not None:
+            self._autosave.mark_dirty(self._build_draft())
+
     def analyze_seo(self) -> SeoAnalysisResult:
         """現在の記事のSEO分析を実行する。
 
+        前回の分析結果がある場合は、前回からの編集範囲だけを再解析する。
+
         Returns:
             SEO分析結果。
 
@@ -172,12 +242,137 @@ class ArticleController:
         if self._current_article is None:
             raise ValidationError("分析対象の記事がありません。")
 
-        result = analyze_seo(
-            title=self._current_article.title,
-            body=self._current_article.body,
-            keyword=self._current_article.seo_keywords,
-            meta_description=self._current_article.meta_description,
-        )
+        return self._analyze_article(self._current_article, self._take_body_edits())
+
+    def request_seo_analysis(
+        self,
+        on_success: Any = None,
+        on_error: Any = None,
+    ) -> None:
+        """現在の記事のSEO分析をワーカースレッドで実行する（非同期）。
+
+        分析中に再度要求された場合は最新の要求だけを保留し、
+        それより古い未実行の要求は破棄する。コールバックは最新の要求に
+        対する結果でのみ呼ばれる。コールバックはGUIスレッド外から
+        呼ばれるため、呼び出し側で ``after(0, ...)`` 等で戻すこと。
+
+        Args:
+            on_success: 成功時コールバック。
+            on_error: 失敗時コールバック。
+
+        Raises:
+            ValidationError: 記事がない場合。
+        """
+        if self._current_article is None:
+            raise ValidationError("分析対象の記事がありません。")
+
+        # 分析中に編集されても影響を受けないよう、要求時点の内容を複製する
+        article = replace(self._current_article, tags=list(self._current_article.tags))
+        edits = self._take_body_edits()
+        with self._seo_lock:
+            # 破棄する未実行の要求の差分は、この要求の差分の前に引き継ぐ
+            if self._seo_pending is not None:
+                skipped = self._seo_pending[2]
+                edits = None if skipped is None or edits is None else skipped + edits
+            self._seo_generation += 1
+            self._seo_pending = (
+                self._seo_generation,
+                article,
+                edits,
+                on_success,
+                on_error,
+            )
+            if self._seo_running:
+                return
+            self._seo_running = True
+
+        self._run_next_seo_analysis()
+
+    def _run_next_seo_analysis(self) -> None:
+        """保留中の最新のSEO分析要求を実行する。"""
+        with self._seo_lock:
+            pending = self._seo_pending
+            self._seo_pending = None
+            if pending is None:
+                self._seo_running = False
+                return
+
+        generation, article, edits, on_success, on_error = pending
+
+        async def _analyze() -> SeoAnalysisResult:
+            return await asyncio.to_thread(self._analyze_article, article, edits)
+
+        def _is_latest() -> bool:
+            with self._seo_lock:
+                return generation == self._seo_generation
+
+        def _on_success(result: SeoAnalysisResult) -> None:
+            self._run_next_seo_analysis()
+            if on_success is not None and _is_latest():
+                on_success(result)
+
+        def _on_error(error: Exception) -> None:
+            self._run_next_seo_analysis()
+            if on_error is not None and _is_latest():
+                on_error(error)
+
+        self._async_runner.run(_analyze(), on_success=_on_success, on_error=_on_error)
+
+    def _take_body_edits(self) -> list[Any] | None:
+        """SEO分析要求のために、前回の要求以降の本文の編集差分を取り出す。
+
+        Returns:
+            編集差分。不明な場合None。
+        """
+        edits, self._body_edits = self._body_edits, []
+        return edits
+
+    def _analyze_article(
+        self, article: Article, edits: list[Any] | None = None
+    ) -> SeoAnalysisResult:
+        """記事のSEO分析を実行し、インクリメンタル分析の状態を更新する。
+
+        Args:
+            article: 分析対象の記事。
+            edits: 前回の分析要求以降の本文の編集差分（不明な場合None）。
+
+        Returns:
+            SEO分析結果。
+        """
+        with self._seo_lock:
+            previous, previous_state = self._seo_result, self._seo_state
+            previous_version = self._seo_version
+
+        if previous is not None and previous_state is not None:
+            start, old_end, new_end = _edit_range(
+                previous_state.parsed.body, article.body, edits, previous_version
+            )
+            result, state = analyze_seo_incremental(
+                previous,
+                previous_state,
+                article.title,
+                article.body,
+                article.seo_keywords,
+                start=start,
+                old_end=old_end,
+                new_end=new_end,
+                meta_description=article.meta_description,
+            )
+        else:
+            result, state = analyze_seo_with_state(
+                title=article.title,
+                body=article.body,
+                keyword=article.seo_keywords,
+                meta_description=article.meta_description,
+            )
+
+        with self._seo_lock:
+            self._seo_result = result
+            self._seo_state = state
+            if edits is None:
+                self._seo_version = None
+            elif edits:
+                self._seo_version = edits[-1].version
         logger.info("SEO分析を実行しました: score=%d", result.score)
         return result
 
@@ -187,23 +382,71 @@ class ArticleController:
         Returns:
             保存された下書き。
 
+        Raises:
+            ValidationError: 記事がない場合。
+        """
+        saved = self._save_draft(self._build_draft())
+        logger.info("下書きを保存しました: id=%s", saved.id)
+        return saved
+
+    def request_save_draft(
+        self,
+        on_success: Any = None,
+        on_error: Any = None,
+    ) -> None:
+        """現在の記事を下書きとしてワーカースレッドで保存する（非同期）。
+
+        保存内容は呼び出し時点の記事から作成するため、保存中に編集されても
+        影響を受けない。コールバックはGUIスレッド外から呼ばれる。
+
+        Args:
+            on_success: 成功時コールバック（保存された下書きを受け取る）。
+            on_error: 失敗時コールバック。
+
+        Raises:
+            ValidationError: 記事がない場合。
+        """
+        draft = self._build_draft()
+
+        async def _save() -> Draft:
+            saved = await asyncio.to_thread(self._save_draft, draft)
+            logger.info("下書きを保存しました: id=%s", saved.id)
+            return saved
+
+        self._async_runner.run(_save(), on_success=on_success, on_error=on_error)
+
+    def _save_draft(self, draft: Draft) -> Draft:
+        """下書きを保存する。自動保存中の場合は同じ下書きへの更新として保存する。
+
+        Args:
+            draft: 保存する下書き。
+
+        Returns:
+            保存された下書き。
+        """
+        if self._autosave is not None:
+            return self._autosave.save(draft)
+        return self._draft_service.save(draft)
+
+    def _build_draft(self) -> Draft:
+        """現在の記事から保存用の下書きを作成する。
+
+        Returns:
+            下書き。
+
         Raises:
             ValidationError: 記事がない場合。
         """
         if self._current_article is None:
             raise ValidationError("保存する記事がありません。")
 
-        draft = Draft(
+        return Draft(
             title=self._current_article.title,
             body=self._current_article.body,
-            tags=self._current_article.tags,
+            tags=list(self._current_article.tags),
             blog_type_id=self._current_article.blog_type_id,
         )
 
-        saved = self._draft_service.save(draft)
-        logger.info("下書きを保存しました: id=%s", saved.id)
-        return saved
-
     def load_draft(self, draft_id: int) -> Article:
         """下書きを記事として読み込む。
 
@@ -230,6 +473,9 @@ class ArticleController:
         )
         self._current_seo_advice = None
         self._hearing_result = None
+        self._clear_seo_state()
+        if self._autosave is not None:
+            self._autosave.reset(draft)
 
         logger.info("下書きを読み込みました: id=%s", draft_id)
         return self._current_article
@@ -239,6 +485,17 @@ class ArticleController:
         self._current_article = None
         self._current_seo_advice = None
         self._hearing_result = None
+        self._clear_seo_state()
+        if self._autosave is not None:
+            self._autosave.reset()
+
+    def _clear_seo_state(self) -> None:
+        """インクリメンタルSEO分析の状態を破棄する。"""
+        with self._seo_lock:
+            self._seo_result = None
+            self._seo_state = None
+            self._seo_version = None
+        self._body_edits = None
 
     @staticmethod
     def _validate_title(title: str) -> None:
@@ -268,3 +525,38 @@ class ArticleController:
         for tag in tags:
             if len(tag) > 30:
                 raise ValidationError(f"タグは30文字以内で入力してください: {tag}")
+
+
+def _edit_range(
+    old: str, new: str, edits: list[Any] | None, version: int | None
+) -> tuple[int, int, int]:
+    """前回分析した本文からの編集範囲を求める。
+
+    編集差分が前回分析した本文のバージョンから途切れずに続いている場合は
+    差分から求め、そうでない場合（バージョンの欠落や不明な変更がある場合）は
+    本文を比較して求める。
+
+    Args:
+        old: 前回分析した本文。
+        new: 今回分析する本文。
+        edits: 前回の分析要求以降の編集差分（不明な場合None）。
+        version: 前回分析した本文のバージョン（不明な場合None）。
+
+    Returns:
+        (start, old_end, new_end) のタプル。
+    """
+    if (
+        edits is not None
+        and version is not None
+        and all(
+            edit.version == expected
+            for expected, edit in enumerate(edits, start=version + 1)
+        )
+    ):
+        start, old_end, new_end = merge_edit_ranges(
+            (edit.offset, len(edit.removed), len(edit.inserted)) for edit in edits
+        )
+        if new_end - old_end == len(new) - len(old):
+            return start, old_end, new_end
+    logger.debug("編集差分を使えないため本文を比較して編集範囲を求めます")
+    return find_edit_range(old, new)
@@ -85,13 +85,16 @@ class HearingController:
         user_message: str,
         on_success: Any = None,
         on_error: Any = None,
+        on_chunk: Any = None,
     ) -> None:
         """ユーザーメッセージを送信する（非同期）。
 
         Args:
             user_message: ユーザーのメッセージ。
-            on_success: 成功時コールバック。
+            on_success: 成功時コールバック（応答全文を受け取る）。
             on_error: 失敗時コールバック。
+            on_chunk: 応答チャンク受信時コールバック。指定した場合は
+                ストリーミングで応答を受信する。
 
         Raises:
             ValidationError: ヒアリングが未開始またはメッセージが不正な場合。
@@ -105,9 +108,18 @@ class HearingController:
         blog_type = self._blog_type
 
         async def _send() -> str:
-            return await self._hearing_service.send_message(
+            if on_chunk is None:
+                return await self._hearing_service.send_message(
+                    hearing_result, validated, blog_type
+                )
+
+            chunks: list[str] = []
+            async for chunk in self._hearing_service.send_message_stream(
                 hearing_result, validated, blog_type
-            )
+            ):
+                chunks.append(chunk)
+                on_chunk(chunk)
+            return "".join(chunks)
 
         self._async_runner.run(_send(), on_success=on_success, on_error=on_error)
 
@@ -1,16 +1,24 @@
 """ホーム画面コントローラ。
 
-下書き一覧と投稿履歴一覧を管理する。
+下書き一覧と投稿履歴一覧、投稿統計を管理する。
 """
 
+import asyncio
 import logging
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import Any
 
+from postblog.infrastructure.async_runner import AsyncRunner
 from postblog.services.draft_service import DraftService
 from postblog.services.history_service import HistoryService
 
 
 logger = logging.getLogger(__name__)
 
+# ホーム画面の投稿統計の集計日数
+STATS_DAYS = 30
+
 
 class HomeController:
     """ホーム画面のロジックを管理するコントローラ。
@@ -18,70 +26,196 @@ class HomeController:
     Args:
         draft_service: 下書き管理サービス。
         history_service: 投稿履歴管理サービス。
+        async_runner: 非同期ランナー。未指定の場合、一覧の取得要求は
+            呼び出し元のスレッドで実行する。
     """
 
     def __init__(
         self,
         draft_service: DraftService,
         history_service: HistoryService,
+        async_runner: AsyncRunner | None = None,
     ) -> None:
         self._draft_service = draft_service
         self._history_service = history_service
+        self._async_runner = async_runner
 
-    def get_recent_drafts(self, limit: int = 10) -> list[dict[str, str]]:
+    def get_recent_drafts(
+        self, limit: int = 10, offset: int = 0
+    ) -> list[dict[str, str]]:
         """最近の下書き一覧を取得する。
 
         Args:
             limit: 取得件数上限。
+            offset: 読み飛ばす件数。
 
         Returns:
             下書き情報の辞書リスト。
         """
         try:
-            drafts = self._draft_service.get_all()
-            sorted_drafts = sorted(drafts, key=lambda d: d.updated_at, reverse=True)[
-                :limit
-            ]
+            summaries = self._draft_service.get_summaries(limit, offset)
             return [
                 {
-                    "id": str(d.id) if d.id is not None else "",
+                    "id": str(d.id),
                     "title": d.title or "無題",
                     "blog_type_id": d.blog_type_id,
                     "updated_at": d.updated_at.isoformat(),
-                    "preview": d.body[:100] + "..." if len(d.body) > 100 else d.body,
+                    "preview": d.preview,
                 }
-                for d in sorted_drafts
+                for d in summaries
             ]
         except Exception:
             logger.exception("下書き一覧の取得に失敗しました")
             return []
 
-    def get_recent_history(self, limit: int = 10) -> list[dict[str, str | None]]:
+    def get_recent_history(
+        self, limit: int = 10, offset: int = 0
+    ) -> list[dict[str, str | None]]:
         """最近の投稿履歴一覧を取得する。
 
         Args:
             limit: 取得件数上限。
+            offset: 読み飛ばす件数。
 
         Returns:
             投稿履歴情報の辞書リスト。
         """
         try:
-            records = self._history_service.get_all()
+            summaries = self._history_service.get_summaries(limit, offset)
             return [
                 {
-                    "id": str(r.id) if r.id is not None else "",
+                    "id": str(r.id),
                     "title": r.title or "無題",
                     "service_name": r.service_name,
                     "status": r.status,
                     "article_url": r.article_url,
                     "published_at": r.published_at.isoformat(),
                 }
-                for r in records[:limit]
+                for r in summaries
             ]
         except Exception:
             logger.exception("投稿履歴の取得に失敗しました")
             return []
 
+    def request_recent_drafts(
+        self,
+        limit: int,
+        offset: int,
+        on_success: Callable[[list[dict[str, str]]], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """最近の下書き一覧をワーカースレッドで取得する（非同期）。
+
+        コールバックはGUIスレッド外から呼ばれるため、呼び出し側で
+        ``after(0, ...)`` 等で戻すこと。
+
+        Args:
+            limit: 取得件数上限。
+            offset: 読み飛ばす件数。
+            on_success: 成功時コールバック。
+            on_error: 失敗時コールバック。
+        """
+        self._request(
+            lambda: self.get_recent_drafts(limit, offset), on_success, on_error
+        )
+
+    def request_recent_history(
+        self,
+        limit: int,
+        offset: int,
+        on_success: Callable[[list[dict[str, str | None]]], None],
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """最近の投稿履歴一覧をワーカースレッドで取得する（非同期）。
+
+        コールバックはGUIスレッド外から呼ばれるため、呼び出し側で
+        ``after(0, ...)`` 等で戻すこと。
+
+        Args:
+            limit: 取得件数上限。
+            offset: 読み飛ばす件数。
+            on_success: 成功時コールバック。
+            on_error: 失敗時コールバック。
+        """
+        self._request(
+            lambda: self.get_recent_history(limit, offset), on_success, on_error
+        )
+
+    def request_publish_stats(
+        self,
+        on_success: Callable[[list[dict[str, str | int]]], None],
+        on_error: Callable[[Exception], None] | None = None,
+        *,
+        days: int = STATS_DAYS,
+        group_by: str = "service",
+    ) -> None:
+        """直近の投稿統計をワーカースレッドで取得する（非同期）。
+
+        コールバックはGUIスレッド外から呼ばれるため、呼び出し側で
+        ``after(0, ...)`` 等で戻すこと。
+
+        Args:
+            on_success: 成功時コールバック。
+            on_error: 失敗時コールバック。
+            days: 集計日数（今日を含む）。
+            group_by: 集計単位（"service" | "status" | "day"）。
+        """
+        self._request(
+            lambda: self.get_publish_stats(days, group_by), on_success, on_error
+        )
+
+    def _request(
+        self,
+        fetch: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_error: Callable[[Exception], None] | None,
+    ) -> None:
+        """取得関数をワーカースレッドで実行し、結果をコールバックで返す。
+
+        Args:
+            fetch: 取得関数。
+            on_success: 成功時コールバック。
+            on_error: 失敗時コールバック。
+        """
+        if self._async_runner is None:
+            on_success(fetch())
+            return
+
+        async def _fetch() -> Any:
+            return await asyncio.to_thread(fetch)
+
+        self._async_runner.run(_fetch(), on_success=on_success, on_error=on_error)
+
+    def get_publish_stats(
+        self, days: int = STATS_DAYS, group_by: str = "service"
+    ) -> list[dict[str, str | int]]:
+        """直近の投稿統計を取得する。
+
+        Args:
+            days: 集計日数（今日を含む）。
+            group_by: 集計単位（"service" | "status" | "day"）。
+
+        Returns:
+            投稿統計の辞書リスト。
+        """
+        today = date.today()
+        try:
+            stats = self._history_service.get_stats(
+                (today - timedelta(days=days - 1), today), group_by
+            )
+            return [
+                {
+                    "key": s.key,
+                    "total": s.total,
+                    "published": s.published,
+                    "failed": s.failed,
+                }
+                for s in stats
+            ]
+        except Exception:
+            logger.exception("投稿統計の取得に失敗しました")
+            return []
+
     def delete_draft(self, draft_id: int) -> bool:
         """下書きを削除する。
 
@@ -144,26 +144,42 @@ class PublishController:
     def _save_history(self, article: Article, results: list[PublishResult]) -> None:
         """投稿結果を履歴に保存する。
 
+        全サービスの結果を1つのトランザクションでまとめて保存する。
+        まとめての保存に失敗した場合は1件ずつ保存し、保存できた結果だけを残す。
+
         Args:
             article: 投稿した記事。
             results: 投稿結果リスト。
         """
-        for result in results:
+        published_at = datetime.now()
+        records = [
+            HistoryRecord(
+                title=article.title,
+                body_preview=article.body[:200],
+                blog_type_id=article.blog_type_id,
+                service_name=result.service_name,
+                article_url=result.article_url,
+                status="published" if result.success else "failed",
+                published_at=published_at,
+            )
+            for result in results
+        ]
+        if not records:
+            return
+
+        try:
+            self._history_service.save_many(records)
+            return
+        except Exception:
+            logger.exception("投稿履歴の一括保存に失敗したため1件ずつ保存します")
+
+        for record in records:
             try:
-                record = HistoryRecord(
-                    title=article.title,
-                    body_preview=article.body[:200],
-                    blog_type_id=article.blog_type_id,
-                    service_name=result.service_name,
-                    article_url=result.article_url,
-                    status="published" if result.success else "failed",
-                    published_at=datetime.now(),
-                )
                 self._history_service.save(record)
             except Exception:
                 logger.exception(
                     "投稿履歴の保存に失敗しました: service=%s",
-                    result.service_name,
+                    record.service_name,
                 )
 
     @staticmethod
@@ -10,6 +10,7 @@ from postblog.config import AppConfig, ConfigManager
 from postblog.exceptions import ValidationError
 from postblog.infrastructure.async_runner import AsyncRunner
 from postblog.infrastructure.credential.credential_manager import CredentialManager
+from postblog.services.autosave_service import AutosaveService
 from postblog.services.publish_service import PublishService
 
 
@@ -22,8 +23,9 @@ class SettingsController:
     Args:
         config_manager: 設定管理。
         credential_manager: 認証情報管理。
-        publish_service: 投稿サービス（接続テスト用）。
+        publish_service: 投稿サービス（接続テスト・認証情報変更の反映用）。
         async_runner: 非同期ランナー。
+        autosave: 自動保存サービス（自動保存間隔の変更を反映する）。
     """
 
     def __init__(
@@ -32,11 +34,13 @@ class SettingsController:
         credential_manager: CredentialManager,
         publish_service: PublishService,
         async_runner: AsyncRunner,
+        autosave: AutosaveService | None = None,
     ) -> None:
         self._config_manager = config_manager
         self._credential_manager = credential_manager
         self._publish_service = publish_service
         self._async_runner = async_runner
+        self._autosave = autosave
 
     def get_app_settings(self) -> dict[str, str | int]:
         """アプリケーション設定を取得する。
@@ -68,6 +72,8 @@ class SettingsController:
         self._validate_settings(kwargs)
         self._config_manager.update(**kwargs)
         self._config_manager.save()
+        if self._autosave is not None and "auto_save_interval" in kwargs:
+            self._autosave.set_interval(self._config_manager.config.auto_save_interval)
         logger.info("アプリケーション設定を更新しました")
         return self.get_app_settings()
 
@@ -123,6 +129,8 @@ class SettingsController:
         if not value.strip():
             raise ValidationError("認証情報を入力してください。")
         self._credential_manager.store(service_name, credential_type, value.strip())
+        # 次回の使用時に新しい認証情報で投稿クライアントを生成し直す
+        self._publish_service.invalidate(service_name)
         logger.info(
             "サービス認証情報を保存しました: service=%s, type=%s",
             service_name,
@@ -158,7 +166,9 @@ class SettingsController:
         Returns:
             削除成功の場合True。
         """
-        return self._credential_manager.delete(service_name, credential_type)
+        result = self._credential_manager.delete(service_name, credential_type)
+        self._publish_service.invalidate(service_name)
+        return result
 
     def test_connection(
         self,
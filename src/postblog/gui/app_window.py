@@ -12,19 +12,23 @@ import customtkinter as ctk
 from postblog.gui.components.sidebar import Sidebar
 from postblog.gui.components.statusbar import StatusBar
 from postblog.gui.navigation import NavigationManager
-from postblog.gui.views.blog_type_view import BlogTypeView
-from postblog.gui.views.editor_view import EditorView
-from postblog.gui.views.hearing_view import HearingView
-from postblog.gui.views.home_view import HomeView
-from postblog.gui.views.publish_view import PublishView
-from postblog.gui.views.result_view import ResultView
-from postblog.gui.views.service_view import ServiceView
-from postblog.gui.views.settings_view import SettingsView
-from postblog.gui.views.summary_view import SummaryView
 
 
 logger = logging.getLogger(__name__)
 
+# 画面名と画面クラスの完全修飾名
+VIEW_PATHS = {
+    "home": "postblog.gui.views.home_view.HomeView",
+    "blog_type": "postblog.gui.views.blog_type_view.BlogTypeView",
+    "hearing": "postblog.gui.views.hearing_view.HearingView",
+    "summary": "postblog.gui.views.summary_view.SummaryView",
+    "editor": "postblog.gui.views.editor_view.EditorView",
+    "publish": "postblog.gui.views.publish_view.PublishView",
+    "result": "postblog.gui.views.result_view.ResultView",
+    "services": "postblog.gui.views.service_view.ServiceView",
+    "settings": "postblog.gui.views.settings_view.SettingsView",
+}
+
 
 class AppWindow(ctk.CTk):
     """メインアプリケーションウィンドウ。"""
@@ -63,16 +67,9 @@ class AppWindow(ctk.CTk):
         self._statusbar.pack(side="bottom", fill="x")
 
     def _register_views(self) -> None:
-        """全画面を登録する。"""
-        self._navigation.register("home", HomeView)
-        self._navigation.register("blog_type", BlogTypeView)
-        self._navigation.register("hearing", HearingView)
-        self._navigation.register("summary", SummaryView)
-        self._navigation.register("editor", EditorView)
-        self._navigation.register("publish", PublishView)
-        self._navigation.register("result", ResultView)
-        self._navigation.register("services", ServiceView)
-        self._navigation.register("settings", SettingsView)
+        """全画面を登録する（各画面のモジュールは最初の遷移時に読み込む）。"""
+        for name, view_path in VIEW_PATHS.items():
+            self._navigation.register(name, view_path)
 
     def _on_sidebar_navigate(self, name: str) -> None:
         """サイドバーナビゲーションハンドラ。
@@ -41,7 +41,7 @@ class ChatBubble(ctk.CTkFrame):
             anchor = "w"
             padx = (10, 60)
 
-        label = ctk.CTkLabel(
+        self._label = ctk.CTkLabel(
             self,
             text=self._message,
             wraplength=500,
@@ -49,7 +49,7 @@ class ChatBubble(ctk.CTkFrame):
             text_color=text_color,
             font=ctk.CTkFont(size=14),
         )
-        label.pack(padx=12, pady=8)
+        self._label.pack(padx=12, pady=8)
 
         self.pack(anchor=anchor, padx=padx, pady=4, fill="x")
 
@@ -59,7 +59,7 @@ class ChatBubble(ctk.CTkFrame):
         Args:
             message: 新しいメッセージ内容。
         """
-        for widget in self.winfo_children():
-            if isinstance(widget, ctk.CTkLabel):
-                widget.configure(text=message)
-                break
+        if message == self._message:
+            return
+        self._message = message
+        self._label.configure(text=message)
@@ -0,0 +1,253 @@
+"""仮想化リストの表示範囲と行の割り当ての管理。
+
+スクロール位置から表示する項目の範囲を求め、項目の位置ごとに固定の
+行ウィジェット番号（``index % pool``）を割り当てる。項目はページ単位で
+遅延取得し、取得中の要求は1件に限る。読み込み直し後に届いた古い要求の
+結果は破棄する。Tkウィジェットには依存しない。
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """ページ取得の要求。
+
+    Args:
+        limit: 取得件数上限。
+        offset: 読み飛ばす件数。
+        generation: 要求時点の読み込み世代（reload ごとに増える）。
+    """
+
+    limit: int
+    offset: int
+    generation: int
+
+
+@dataclass(frozen=True)
+class RowPlacement:
+    """行ウィジェットの配置。
+
+    Args:
+        slot: 行ウィジェットの番号。
+        index: 表示する項目の位置。
+        y: 表示領域の上端からの位置（ピクセル）。
+        changed: 前回の配置から表示する項目が変わった場合True。
+    """
+
+    slot: int
+    index: int
+    y: int
+    changed: bool
+
+
+class ListWindow:
+    """仮想化リストの表示範囲・ページ取得・行の割り当てを管理する。
+
+    Args:
+        row_height: 1行の高さ（ピクセル）。
+        page_size: 1回に取得する件数。
+        buffer_rows: 表示範囲の前後に保持する行数。
+
+    Raises:
+        ValueError: 行の高さまたは取得件数が1未満の場合。
+    """
+
+    def __init__(self, row_height: int, page_size: int, buffer_rows: int) -> None:
+        if row_height < 1:
+            raise ValueError(f"row_heightは1以上である必要があります: {row_height}")
+        if page_size < 1:
+            raise ValueError(f"page_sizeは1以上である必要があります: {page_size}")
+        self._row_height = row_height
+        self._page_size = page_size
+        self._buffer_rows = max(0, buffer_rows)
+
+        self._items: list[dict[str, Any]] = []
+        self._exhausted = False
+        self._pending: PageRequest | None = None
+        self._generation = 0
+        self._offset = 0
+        self._slot_indexes: list[int | None] = []
+
+    @property
+    def items(self) -> list[dict[str, Any]]:
+        """取得済みの項目。"""
+        return self._items
+
+    @property
+    def offset(self) -> int:
+        """先頭からのスクロール量（ピクセル）。"""
+        return self._offset
+
+    @property
+    def is_loading(self) -> bool:
+        """ページを取得中かどうか。"""
+        return self._pending is not None
+
+    @property
+    def content_height(self) -> int:
+        """取得済みの項目全体の高さ（ピクセル）。"""
+        return len(self._items) * self._row_height
+
+    def reset(self) -> None:
+        """取得済みの項目と行の割り当てを破棄し、先頭に戻る。
+
+        取得中の要求の結果は、届いても破棄される。
+        """
+        self._items = []
+        self._exhausted = False
+        self._pending = None
+        self._generation += 1
+        self._offset = 0
+        self._slot_indexes = [None] * len(self._slot_indexes)
+
+    def pool_size(self, height: int) -> int:
+        """表示領域の高さに必要な行ウィジェット数を返す。
+
+        Args:
+            height: 表示領域の高さ（ピクセル）。
+
+        Returns:
+            表示範囲と前後の保持分を合わせた行数。
+        """
+        return self._visible_rows(height) + self._buffer_rows * 2
+
+    def next_page(self, height: int) -> PageRequest | None:
+        """表示範囲を埋めるために次に取得すべきページを返す。
+
+        要求を返した場合は取得中となり、add_page か fail_page で
+        結果を渡すまで次の要求は返さない。
+
+        Args:
+            height: 表示領域の高さ（ピクセル）。
+
+        Returns:
+            ページ取得の要求。取得不要または取得中の場合None。
+        """
+        if self._exhausted or self._pending is not None:
+            return None
+        first = self._offset // self._row_height
+        last_index = first + self._visible_rows(height) + self._buffer_rows
+        if last_index < len(self._items):
+            return None
+        self._pending = PageRequest(self._page_size, len(self._items), self._generation)
+        return self._pending
+
+    def add_page(self, request: PageRequest, page: list[dict[str, Any]]) -> bool:
+        """取得したページを追加する。
+
+        Args:
+            request: next_page が返した要求。
+            page: 取得した項目。
+
+        Returns:
+            追加した場合True。読み込み直し前の古い要求の場合False。
+        """
+        if request != self._pending:
+            return False
+        self._pending = None
+        self._items.extend(page)
+        if len(page) < request.limit:
+            self._exhausted = True
+        return True
+
+    def fail_page(self, request: PageRequest) -> None:
+        """ページの取得失敗を記録し、以降の取得を止める。
+
+        Args:
+            request: next_page が返した要求。
+        """
+        if request != self._pending:
+            return
+        self._pending = None
+        self._exhausted = True
+
+    def scroll_to(self, offset: int, height: int) -> None:
+        """指定位置までスクロールする（有効な範囲に収める）。
+
+        Args:
+            offset: 先頭からのスクロール量（ピクセル）。
+            height: 表示領域の高さ（ピクセル）。
+        """
+        max_offset = max(0, self.content_height - height)
+        self._offset = min(max(0, offset), max_offset)
+
+    def scroll_rows(self, rows: int, height: int) -> None:
+        """指定行数だけスクロールする。
+
+        Args:
+            rows: スクロールする行数（負の値で上方向）。
+            height: 表示領域の高さ（ピクセル）。
+        """
+        self.scroll_to(self._offset + rows * self._row_height, height)
+
+    def scrollbar_range(self, height: int) -> tuple[float, float]:
+        """スクロールバーに設定する表示範囲の割合を返す。
+
+        Args:
+            height: 表示領域の高さ（ピクセル）。
+
+        Returns:
+            (先頭, 末尾) の割合のタプル。
+        """
+        content = self.content_height
+        if content <= height:
+            return 0.0, 1.0
+        return self._offset / content, (self._offset + height) / content
+
+    def layout(self, height: int, pool: int) -> list[RowPlacement]:
+        """表示範囲の項目に行ウィジェットを割り当てる。
+
+        項目の位置ごとに行ウィジェットを固定で割り当てるため、1行分の
+        スクロールでは表示範囲に入った行だけが changed となる。
+
+        Args:
+            height: 表示領域の高さ（ピクセル）。
+            pool: 行ウィジェット数（pool_size 以上）。
+
+        Returns:
+            表示する行の配置のリスト。含まれない行ウィジェットは非表示にする。
+        """
+        if len(self._slot_indexes) < pool:
+            self._slot_indexes.extend([None] * (pool - len(self._slot_indexes)))
+        first = self._offset // self._row_height
+        start = max(0, first - self._buffer_rows)
+        end = min(
+            len(self._items), first + self._visible_rows(height) + self._buffer_rows
+        )
+
+        placements: list[RowPlacement] = []
+        for index in range(start, end):
+            slot = index % pool
+            changed = self._slot_indexes[slot] != index
+            self._slot_indexes[slot] = index
+            placements.append(
+                RowPlacement(
+                    slot, index, index * self._row_height - self._offset, changed
+                )
+            )
+        return placements
+
+    def item_at_slot(self, slot: int) -> dict[str, Any] | None:
+        """行ウィジェットに割り当てられた項目を返す。
+
+        Args:
+            slot: 行ウィジェットの番号。
+
+        Returns:
+            項目。割り当てがない場合None。
+        """
+        if slot >= len(self._slot_indexes):
+            return None
+        index = self._slot_indexes[slot]
+        if index is None or index >= len(self._items):
+            return None
+        return self._items[index]
+
+    def _visible_rows(self, height: int) -> int:
+        """表示領域に収まる行数（部分的に見える行を含む）を返す。"""
+        return math.ceil(height / self._row_height) + 1
@@ -0,0 +1,512 @@
+"""Markdownのブロック単位レンダラー。
+
+Markdownテキストをトップレベルのブロック（見出し・段落・リスト・コードブロック等）に
+分割し、ブロックごとに mistune の AST からプレビュー用のテキストとタグの組
+（セグメント）を生成する。生成結果はブロック内容のハッシュをキーにキャッシュし、
+前回の結果と比較して変更されたブロックの範囲だけを求められるようにする。
+Tkウィジェットには依存しない。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import mistune
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from postblog.gui.components.text_changes import EditDelta
+
+
+# キャッシュするブロック数の上限
+DEFAULT_CACHE_SIZE = 1024
+
+# プレビューの書式タグ
+TAG_H1 = "h1"
+TAG_H2 = "h2"
+TAG_H3 = "h3"
+TAG_BOLD = "bold"
+TAG_ITALIC = "italic"
+TAG_BOLD_ITALIC = "bold_italic"
+TAG_CODE = "code"
+TAG_CODE_BLOCK = "code_block"
+TAG_LINK = "link"
+TAG_LIST = "list"
+TAG_QUOTE = "quote"
+TAG_HR = "hr"
+
+# 見出しレベルごとのタグ（レベル3以上は TAG_H3 で表示する）
+HEADING_TAGS = {1: TAG_H1, 2: TAG_H2}
+
+# 区切り線として表示する文字列
+HR_TEXT = "─" * 24
+
+_FENCE_PATTERN = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+_HEADING_PATTERN = re.compile(r"^ {0,3}#{1,6}(?:\s|$)")
+
+# プレビューに表示するテキストと書式タグの組
+Segment = tuple[str, tuple[str, ...]]
+
+# ブロックのソースの範囲（開始位置, 終了位置）
+Span = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class RenderedBlock:
+    """レンダリング済みのブロック。
+
+    Args:
+        key: ブロックのMarkdownソースのハッシュ。
+        segments: 表示するテキストと書式タグの組（末尾はブロック間の空行）。
+        line_count: 表示上の行数（改行の数）。
+    """
+
+    key: str
+    segments: tuple[Segment, ...]
+    line_count: int
+
+
+@dataclass(frozen=True)
+class BlockPatch:
+    """前回のレンダリング結果から変更されたブロックの範囲。
+
+    Args:
+        start: 最初に変更されたブロックの位置。
+        removed: 削除する前回のブロック数。
+        inserted: start の位置に挿入するブロック。
+    """
+
+    start: int
+    removed: int
+    inserted: tuple[RenderedBlock, ...]
+
+    @property
+    def is_empty(self) -> bool:
+        """変更がない場合True。"""
+        return self.removed == 0 and not self.inserted
+
+
+def split_blocks(markdown_text: str) -> list[str]:
+    """Markdownテキストをトップレベルのブロックのソースに分割する。
+
+    空行でブロックを区切り、ATX見出しは単独のブロックにする。
+    フェンスで囲まれたコードブロックは空行を含めて1ブロックとして扱う。
+
+    Args:
+        markdown_text: Markdownテキスト。
+
+    Returns:
+        ブロックのソースのリスト（空行は含まない）。
+    """
+    spans, _stop = _split_spans(markdown_text)
+    return [markdown_text[start:end] for start, end in spans]
+
+
+def _split_spans(
+    text: str, start: int = 0, resync: Callable[[int], bool] | None = None
+) -> tuple[list[Span], int | None]:
+    """テキストを行単位で走査し、ブロックの範囲を求める。
+
+    ブロックは連続した行からなるため、ソースの範囲（末尾の改行を含まない）で表す。
+    ``resync`` を指定した場合は、どのブロックの途中でもない行の先頭ごとに
+    その位置を渡し、Trueが返されたところで走査を打ち切る。
+
+    Args:
+        text: Markdownテキスト。
+        start: 走査を開始する行の先頭位置（ブロックの途中でないこと）。
+        resync: 走査を打ち切る位置の判定関数。
+
+    Returns:
+        (ブロックの範囲のリスト, 打ち切った位置) のタプル。
+        末尾まで走査した場合、打ち切った位置はNone。
+    """
+    spans: list[Span] = []
+    block_start: int | None = None
+    block_end = 0
+    fence: str | None = None
+    pos = start
+
+    def flush() -> None:
+        nonlocal block_start
+        if block_start is not None:
+            spans.append((block_start, block_end))
+            block_start = None
+
+    while True:
+        if resync is not None and fence is None and block_start is None and resync(pos):
+            return spans, pos
+        newline = text.find("\n", pos)
+        end = len(text) if newline == -1 else newline
+        line = text[pos:end]
+
+        if fence is not None:
+            block_end = end
+            if line.strip().startswith(fence) and not line.strip().strip(fence[0]):
+                fence = None
+                flush()
+        elif match := _FENCE_PATTERN.match(line):
+            flush()
+            fence = match.group(1)
+            block_start, block_end = pos, end
+        elif not line.strip():
+            flush()
+        elif _HEADING_PATTERN.match(line):
+            flush()
+            spans.append((pos, end))
+        else:
+            if block_start is None:
+                block_start = pos
+            block_end = end
+
+        if newline == -1:
+            break
+        pos = newline + 1
+    flush()
+    return spans, None
+
+
+def diff_blocks(
+    old: Sequence[RenderedBlock], new: Sequence[RenderedBlock]
+) -> BlockPatch:
+    """前回と今回のレンダリング結果から変更されたブロックの範囲を求める。
+
+    先頭と末尾から一致するブロックを除いた残りを変更範囲とする。
+
+    Args:
+        old: 前回のレンダリング結果。
+        new: 今回のレンダリング結果。
+
+    Returns:
+        変更されたブロックの範囲。
+    """
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix].key == new[prefix].key:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and old[len(old) - 1 - suffix].key == new[len(new) - 1 - suffix].key
+    ):
+        suffix += 1
+    return BlockPatch(
+        start=prefix,
+        removed=len(old) - prefix - suffix,
+        inserted=tuple(new[prefix : len(new) - suffix]),
+    )
+
+
+class MarkdownBlockRenderer:
+    """ブロック単位でキャッシュするMarkdownレンダラー。
+
+    Args:
+        cache_size: キャッシュするブロック数の上限。
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self._markdown = mistune.create_markdown(renderer=None)
+        self._cache: OrderedDict[str, RenderedBlock] = OrderedDict()
+        self._cache_size = cache_size
+
+    @property
+    def cached_count(self) -> int:
+        """キャッシュ済みのブロック数。"""
+        return len(self._cache)
+
+    def render(self, markdown_text: str) -> list[RenderedBlock]:
+        """Markdownテキスト全体をブロック単位でレンダリングする。
+
+        Args:
+            markdown_text: Markdownテキスト。
+
+        Returns:
+            レンダリング済みのブロックのリスト。
+        """
+        return [self.render_block(source) for source in split_blocks(markdown_text)]
+
+    def render_block(self, source: str) -> RenderedBlock:
+        """1ブロックをレンダリングする（同じ内容のブロックはキャッシュを返す）。
+
+        Args:
+            source: ブロックのMarkdownソース。
+
+        Returns:
+            レンダリング済みのブロック。
+        """
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        tokens: list[dict[str, Any]] = self._markdown(source)
+        builder = _SegmentBuilder()
+        builder.blocks(tokens, ())
+        builder.add("\n", ())
+        segments = tuple(builder.segments)
+        block = RenderedBlock(
+            key=key,
+            segments=segments,
+            line_count=sum(text.count("\n") for text, _tags in segments),
+        )
+
+        self._cache[key] = block
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return block
+
+
+class BlockDocument:
+    """ブロックの分割結果を保持し、編集差分の周辺のブロックだけを分割し直す。
+
+    文書のソースとブロックごとのソースの範囲を保持する。差分を受け取ると、
+    編集位置の直前のブロックから、分割結果が前回と再び一致する位置までだけを
+    分割・レンダリングし直すため、更新のコストは文書の長さに依存しない。
+
+    Args:
+        renderer: ブロックのレンダラー。
+    """
+
+    def __init__(self, renderer: MarkdownBlockRenderer | None = None) -> None:
+        self._renderer = renderer or MarkdownBlockRenderer()
+        self._text = ""
+        self._spans: list[Span] = []
+        self._blocks: list[RenderedBlock] = []
+        self._version: int | None = None
+
+    @property
+    def text(self) -> str:
+        """文書のソース。"""
+        return self._text
+
+    @property
+    def blocks(self) -> list[RenderedBlock]:
+        """レンダリング済みのブロック。"""
+        return self._blocks
+
+    @property
+    def version(self) -> int | None:
+        """文書のバージョン（不明な場合None）。"""
+        return self._version
+
+    def reset(self, markdown_text: str, version: int | None = None) -> BlockPatch:
+        """文書全体を分割し直す。
+
+        Args:
+            markdown_text: Markdownテキスト。
+            version: テキストのバージョン（不明な場合None）。
+
+        Returns:
+            前回のブロックから変更されたブロックの範囲。
+        """
+        spans, _stop = _split_spans(markdown_text)
+        blocks = [
+            self._renderer.render_block(markdown_text[start:end])
+            for start, end in spans
+        ]
+        patch = diff_blocks(self._blocks, blocks)
+        self._text = markdown_text
+        self._spans = spans
+        self._blocks = blocks
+        self._version = version
+        return patch
+
+    def apply(self, deltas: Sequence[EditDelta]) -> list[BlockPatch] | None:
+        """編集差分を順に適用する。
+
+        適用済みのバージョンの差分は読み飛ばす。
+
+        Args:
+            deltas: 編集差分（発生順）。
+
+        Returns:
+            差分ごとの変更されたブロックの範囲（発生順）。バージョンが
+            連続しない、または文書と一致しない差分がある場合は何も適用せずNone。
+        """
+        if self._version is None:
+            return None
+        pending = [delta for delta in deltas if delta.version > self._version]
+        texts: list[str] = []
+        text = self._text
+        for expected, delta in enumerate(pending, start=self._version + 1):
+            if delta.version != expected:
+                return None
+            try:
+                text = delta.apply(text)
+            except ValueError:
+                return None
+            texts.append(text)
+
+        patches = [
+            self._apply_delta(delta, text)
+            for delta, text in zip(pending, texts, strict=True)
+        ]
+        if pending:
+            self._version = pending[-1].version
+        return patches
+
+    def _apply_delta(self, delta: EditDelta, text: str) -> BlockPatch:
+        """1件の差分の周辺のブロックを分割し直す。
+
+        編集位置を含むブロックの1つ前（見出しの変更で段落がつながる場合があるため）
+        から走査し、編集範囲より後ろで前回のブロックの開始位置と一致し、かつ
+        ブロックの途中でない位置で打ち切る。以降のブロックは位置をずらして引き継ぐ。
+
+        Args:
+            delta: 編集差分。
+            text: 差分を適用した後の文書。
+
+        Returns:
+            変更されたブロックの範囲。
+        """
+        old_end = delta.offset + len(delta.removed)
+        new_end = delta.offset + len(delta.inserted)
+        shift = new_end - old_end
+        spans = self._spans
+
+        containing = bisect_right(spans, delta.offset, key=lambda span: span[0]) - 1
+        first = max(0, containing - 1)
+        restart = spans[first][0] if containing >= 0 else 0
+
+        def resync(pos: int) -> bool:
+            if pos < new_end:
+                return False
+            index = bisect_left(spans, pos - shift, lo=first, key=lambda span: span[0])
+            return index < len(spans) and spans[index][0] == pos - shift
+
+        new_spans, stop = _split_spans(text, restart, resync)
+        last = len(spans)
+        if stop is not None:
+            last = bisect_left(spans, stop - shift, lo=first, key=lambda span: span[0])
+
+        new_blocks = [
+            self._renderer.render_block(text[start:end]) for start, end in new_spans
+        ]
+        patch = diff_blocks(self._blocks[first:last], new_blocks)
+
+        self._text = text
+        self._spans[first:] = [
+            *new_spans,
+            *((start + shift, end + shift) for start, end in spans[last:]),
+        ]
+        self._blocks[first:last] = new_blocks
+        return BlockPatch(
+            start=first + patch.start, removed=patch.removed, inserted=patch.inserted
+        )
+
+
+class _SegmentBuilder:
+    """mistune の AST トークンからセグメントを組み立てる。"""
+
+    def __init__(self) -> None:
+        self.segments: list[Segment] = []
+
+    def add(self, text: str, tags: tuple[str, ...]) -> None:
+        """セグメントを追加する（直前と同じタグの場合は連結する）。
+
+        Args:
+            text: 表示するテキスト。
+            tags: 書式タグ。
+        """
+        if not text:
+            return
+        if TAG_BOLD in tags and TAG_ITALIC in tags:
+            tags = (
+                *(t for t in tags if t not in (TAG_BOLD, TAG_ITALIC)),
+                TAG_BOLD_ITALIC,
+            )
+        if self.segments and self.segments[-1][1] == tags:
+            self.segments[-1] = (self.segments[-1][0] + text, tags)
+        else:
+            self.segments.append((text, tags))
+
+    def blocks(
+        self, tokens: list[dict[str, Any]], tags: tuple[str, ...], depth: int = 0
+    ) -> None:
+        """ブロック要素のトークンを追加する。
+
+        Args:
+            tokens: ブロック要素のトークン。
+            tags: 親要素から引き継ぐ書式タグ。
+            depth: リストの入れ子の深さ。
+        """
+        for token in tokens:
+            kind = token["type"]
+            if kind == "heading":
+                level = token["attrs"]["level"]
+                heading_tags = (*tags, HEADING_TAGS.get(level, TAG_H3))
+                self.inline(token["children"], heading_tags)
+                self.add("\n", heading_tags)
+            elif kind in ("paragraph", "block_text"):
+                self.inline(token["children"], tags)
+                self.add("\n", tags)
+            elif kind == "block_code":
+                code = token["raw"].rstrip("\n")
+                self.add(code + "\n", (*tags, TAG_CODE_BLOCK))
+            elif kind == "list":
+                self.list_items(token, tags, depth)
+            elif kind == "block_quote":
+                self.blocks(token["children"], (*tags, TAG_QUOTE), depth)
+            elif kind == "thematic_break":
+                self.add(HR_TEXT + "\n", (*tags, TAG_HR))
+            elif kind == "blank_line":
+                continue
+            elif "children" in token:
+                self.blocks(token["children"], tags, depth)
+            elif "raw" in token:
+                self.add(token["raw"].rstrip("\n") + "\n", tags)
+
+    def list_items(
+        self, token: dict[str, Any], tags: tuple[str, ...], depth: int
+    ) -> None:
+        """リストのトークンを追加する。
+
+        Args:
+            token: リストのトークン。
+            tags: 親要素から引き継ぐ書式タグ。
+            depth: リストの入れ子の深さ。
+        """
+        attrs = token.get("attrs", {})
+        number = attrs.get("start", 1)
+        list_tags = (*tags, TAG_LIST)
+        for item in token["children"]:
+            marker = f"{number}." if attrs.get("ordered") else "•"
+            self.add(f"{'    ' * depth}{marker} ", list_tags)
+            for i, child in enumerate(item.get("children", [])):
+                if child["type"] == "list":
+                    self.list_items(child, tags, depth + 1)
+                    continue
+                if i > 0:
+                    self.add("    " * (depth + 1), list_tags)
+                self.blocks([child], list_tags, depth + 1)
+            number += 1
+
+    def inline(self, tokens: list[dict[str, Any]], tags: tuple[str, ...]) -> None:
+        """インライン要素のトークンを追加する。
+
+        Args:
+            tokens: インライン要素のトークン。
+            tags: 親要素から引き継ぐ書式タグ。
+        """
+        for token in tokens:
+            kind = token["type"]
+            if kind == "emphasis":
+                self.inline(token["children"], (*tags, TAG_ITALIC))
+            elif kind == "strong":
+                self.inline(token["children"], (*tags, TAG_BOLD))
+            elif kind == "codespan":
+                self.add(token["raw"], (*tags, TAG_CODE))
+            elif kind in ("link", "image"):
+                self.inline(token["children"], (*tags, TAG_LINK))
+            elif kind in ("softbreak", "linebreak"):
+                self.add("\n", tags)
+            elif "children" in token:
+                self.inline(token["children"], tags)
+            else:
+                self.add(token.get("raw", ""), tags)
@@ -1,31 +1,52 @@
 """Markdownエディタコンポーネント。
 
-テキスト編集と変更イベント通知を提供する。
+テキスト編集と変更イベント通知を提供する。テキストウィジェットへの挿入・削除を
+横取りして編集差分を記録し、<<Modified>> イベントを契機に、実際に内容が
+変わった場合だけ差分とバージョン番号を通知する。
 """
 
 from __future__ import annotations
 
+import contextlib
+import tkinter
 from collections.abc import Callable
+from typing import Any
 
 import customtkinter as ctk
 
+from postblog.gui.components.text_changes import (
+    AstralPositions,
+    ChangeLog,
+    EditorChange,
+)
+
+
+# 変更通知のデバウンス時間（ミリ秒）
+CHANGE_DEBOUNCE_MS = 300
+
+# Tcl 8.6 の count -chars はBMP外の文字をサロゲートペアの2文字と数える
+_COUNTS_SURROGATES = tkinter.TclVersion < 9.0
+
 
 class MarkdownEditor(ctk.CTkFrame):
     """Markdownエディタ。
 
     Args:
         parent: 親ウィジェット。
-        on_change: テキスト変更時コールバック。
+        on_change: テキスト変更時コールバック（前回の通知以降の差分を受け取る）。
     """
 
     def __init__(
         self,
         parent: ctk.CTkFrame,
-        on_change: Callable[[str], None] | None = None,
+        on_change: Callable[[EditorChange], None] | None = None,
     ) -> None:
         super().__init__(parent)
         self._on_change = on_change
         self._debounce_id: str | None = None
+        self._editable = True
+        self._changes = ChangeLog()
+        self._astral = AstralPositions()
 
         self._textbox = ctk.CTkTextbox(
             self,
@@ -34,19 +55,169 @@ class MarkdownEditor(ctk.CTkFrame):
         )
         self._textbox.pack(fill="both", expand=True)
 
-        # テキスト変更イベント
-        self._textbox.bind("<KeyRelease>", self._on_key_release)
+        # テキスト変更イベント（CTkTextbox 内部の tk.Text のコマンドを中継する）
+        self._text: Any = self._textbox._textbox
+        self._install_change_tracking()
+        self._textbox.bind("<<Modified>>", self._on_modified)
+
+    @property
+    def version(self) -> int:
+        """テキストのバージョン（内容が変わるたびに1増える）。"""
+        return self._changes.version
+
+    @property
+    def is_editable(self) -> bool:
+        """編集可能な場合True。"""
+        return self._editable
+
+    def _install_change_tracking(self) -> None:
+        """テキストウィジェットのコマンドを差し替え、挿入・削除を横取りする。
+
+        キー入力・貼り付け・プログラムからの変更はすべてウィジェットの
+        コマンドを経由するため、元のコマンドを別名に退避して中継する。
+        """
+        self._widget_command = str(self._text)
+        self._original_command = f"{self._widget_command}_original"
+        self._text.tk.call("rename", self._widget_command, self._original_command)
+        self._text.tk.createcommand(self._widget_command, self._intercept)
+
+    def _call(self, *args: Any) -> Any:
+        """元のウィジェットコマンドを呼び出す。"""
+        return self._text.tk.call(self._original_command, *args)
+
+    def _intercept(self, command: str, *args: Any) -> Any:
+        """ウィジェットコマンドの中継処理。
+
+        Args:
+            command: サブコマンド名。
+            *args: サブコマンドの引数。
+
+        Returns:
+            元のコマンドの戻り値。
+        """
+        if command not in ("insert", "delete", "replace") or not args:
+            return self._call(command, *args)
+        if str(self._call("cget", "-state")) != "normal":
+            # 編集不可の状態ではTk自身が変更を無視する
+            return self._call(command, *args)
+
+        if command == "insert":
+            offset = self._offset(args[0])
+            result = self._call(command, *args)
+            self._record(offset, "", "".join(args[1::2]))
+            return result
+
+        if command == "delete" and len(args) > 2:
+            return self._delete_ranges(args)
+
+        offset, removed = self._range(*args[:2] if command == "replace" else args)
+        result = self._call(command, *args)
+        inserted = "".join(args[2::2]) if command == "replace" else ""
+        self._record(offset, removed, inserted)
+        return result
+
+    def _range(self, start: str, end: str | None = None) -> tuple[int, str]:
+        """範囲の開始位置（文字数）と範囲内の文字列を返す。
+
+        Args:
+            start: 開始インデックス。
+            end: 終了インデックス（省略時は開始位置の1文字）。
+
+        Returns:
+            (開始位置, 範囲内の文字列) のタプル。
+        """
+        first = self._index(start)
+        last = self._index(f"{first}+1c" if end is None else end)
+        removed = ""
+        if self._text.tk.getboolean(self._call("compare", first, "<", last)):
+            removed = str(self._call("get", first, last))
+        return self._offset(first), removed
+
+    def _delete_ranges(self, args: tuple[Any, ...]) -> Any:
+        """複数範囲の削除を中継し、範囲ごとの差分を記録する。
+
+        Tkと同様に範囲を位置順に並べて重なりをまとめ、後ろの範囲から順に
+        差分を記録する（前の範囲の位置が変わらないようにするため）。
+
+        Args:
+            args: delete サブコマンドの引数（開始・終了インデックスの並び）。
 
-    def _on_key_release(self, event: object) -> None:
-        """キーリリースイベントハンドラ（300msデバウンス）。"""
+        Returns:
+            元のコマンドの戻り値。
+        """
+        ranges = sorted(self._range(*args[i : i + 2]) for i in range(0, len(args), 2))
+        merged: list[tuple[int, str]] = []
+        for offset, removed in ranges:
+            if merged and offset <= merged[-1][0] + len(merged[-1][1]):
+                previous_offset, previous = merged[-1]
+                overlap = previous_offset + len(previous) - offset
+                merged[-1] = (previous_offset, previous + removed[overlap:])
+            else:
+                merged.append((offset, removed))
+        result = self._call("delete", *args)
+        for offset, removed in reversed(merged):
+            self._record(offset, removed, "")
+        return result
+
+    def _record(self, offset: int, removed: str, inserted: str) -> None:
+        """編集差分を記録し、BMP外の文字の位置を更新する。
+
+        Args:
+            offset: 編集位置（編集前の文書の先頭からの文字数）。
+            removed: 削除された文字列。
+            inserted: 挿入された文字列。
+        """
+        if self._changes.record(offset, removed, inserted) is not None:
+            self._astral.apply(offset, removed, inserted)
+
+    def _index(self, index: str) -> str:
+        """インデックスを正規化する（末尾の改行の後ろは末尾の改行の前に丸める）。
+
+        Args:
+            index: Tkのテキストインデックス。
+
+        Returns:
+            "行.列" 形式のインデックス。
+        """
+        resolved = str(self._call("index", index))
+        if self._text.tk.getboolean(self._call("compare", resolved, ">", "end-1c")):
+            resolved = str(self._call("index", "end-1c"))
+        return resolved
+
+    def _offset(self, index: str) -> int:
+        """インデックスを先頭からの文字数（Pythonの文字列の長さ）に変換する。
+
+        テキストを取り出さずにウィジェットの ``count -chars`` で数える。
+        Tcl 8.6 はBMP外の文字（絵文字など）を2文字と数えるため、
+        文書中にBMP外の文字がある場合だけその位置から換算する。
+
+        Args:
+            index: Tkのテキストインデックス。
+
+        Returns:
+            先頭からの文字数。
+        """
+        units = int(self._call("count", "-chars", "1.0", self._index(index)) or 0)
+        if _COUNTS_SURROGATES and self._astral:
+            return self._astral.to_offset(units)
+        return units
+
+    def _on_modified(self, event: object) -> None:
+        """<<Modified>> イベントハンドラ（300msデバウンス）。"""
+        if not self._textbox.edit_modified():
+            return
+        # 次の変更でもイベントが発生するよう、変更フラグを戻す
+        self._textbox.edit_modified(False)
         if self._debounce_id is not None:
             self.after_cancel(self._debounce_id)
-        self._debounce_id = self.after(300, self._fire_change)
+        self._debounce_id = self.after(CHANGE_DEBOUNCE_MS, self._fire_change)
 
     def _fire_change(self) -> None:
-        """変更イベントを発火する。"""
-        if self._on_change is not None:
-            self._on_change(self.get_text())
+        """変更イベントを発火する（内容が変わっていない場合は発火しない）。"""
+        self._debounce_id = None
+        change = self._changes.drain()
+        if change is not None and self._on_change is not None:
+            self._on_change(change)
 
     def get_text(self) -> str:
         """テキストを取得する。
@@ -65,10 +236,36 @@ class MarkdownEditor(ctk.CTkFrame):
         self._textbox.delete("1.0", "end")
         self._textbox.insert("1.0", text)
 
+    def append_text(self, text: str) -> None:
+        """末尾にテキストを追加する（ストリーミング表示用）。
+
+        編集不可の状態でも追加できる。
+
+        Args:
+            text: 追加するテキスト。
+        """
+        if not self._editable:
+            self._textbox.configure(state="normal")
+        self._textbox.insert("end-1c", text)
+        if not self._editable:
+            self._textbox.configure(state="disabled")
+        self._textbox.see("end")
+
     def set_editable(self, editable: bool) -> None:
         """編集可否を設定する。
 
         Args:
             editable: 編集可能にする場合True。
         """
+        self._editable = editable
         self._textbox.configure(state="normal" if editable else "disabled")
+
+    def destroy(self) -> None:
+        """エディタを破棄する。"""
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+            self._debounce_id = None
+        super().destroy()
+        # 中継用に登録したコマンドを削除する
+        with contextlib.suppress(tkinter.TclError):
+            self._text.tk.deletecommand(self._widget_command)
@@ -1,12 +1,44 @@
 """Markdownプレビューコンポーネント。
 
-Markdownテキストのプレビュー表示を提供する。
+Markdownテキストのプレビュー表示を提供する。プレビューはブロック単位で
+レンダリングし、前回から変更されたブロックの範囲だけをテキストボックスに
+反映するため、更新のコストは編集の大きさに比例する。エディタの編集差分を
+受け取った場合は、差分の周辺のブロックだけを分割し直す。
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 import customtkinter as ctk
 
+from postblog.gui.components.markdown_blocks import (
+    TAG_BOLD,
+    TAG_BOLD_ITALIC,
+    TAG_CODE,
+    TAG_CODE_BLOCK,
+    TAG_H1,
+    TAG_H2,
+    TAG_H3,
+    TAG_HR,
+    TAG_ITALIC,
+    TAG_LINK,
+    TAG_LIST,
+    TAG_QUOTE,
+    BlockDocument,
+    BlockPatch,
+    MarkdownBlockRenderer,
+    RenderedBlock,
+)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from postblog.gui.components.text_changes import EditorChange
+
+
+# 本文のフォントサイズ
+BASE_FONT_SIZE = 14
+
 
 class MarkdownPreview(ctk.CTkFrame):
     """Markdownプレビュー表示。
@@ -17,48 +49,109 @@ class MarkdownPreview(ctk.CTkFrame):
 
     def __init__(self, parent: ctk.CTkFrame) -> None:
         super().__init__(parent)
+        self._document = BlockDocument(MarkdownBlockRenderer())
+        self._blocks: list[RenderedBlock] = []
         self._textbox = ctk.CTkTextbox(
             self,
-            font=ctk.CTkFont(size=14),
+            font=ctk.CTkFont(size=BASE_FONT_SIZE),
             wrap="word",
             state="disabled",
         )
         self._textbox.pack(fill="both", expand=True)
+        self._configure_tags()
 
-    def update_preview(self, markdown_text: str) -> None:
+    def _configure_tags(self) -> None:
+        """書式タグを設定する。"""
+        # CTkTextbox.tag_config はフォントを指定できないため、内部の tk.Text に設定する
+        text: Any = self._textbox._textbox
+        code_family = "Consolas"
+
+        # 後に設定したタグほど優先されるため、見出しを最後に設定する
+        text.tag_configure(TAG_CODE, font=ctk.CTkFont(family=code_family))
+        text.tag_configure(
+            TAG_CODE_BLOCK,
+            font=ctk.CTkFont(family=code_family),
+            background="gray25",
+            lmargin1=12,
+            lmargin2=12,
+        )
+        text.tag_configure(TAG_BOLD, font=ctk.CTkFont(weight="bold"))
+        text.tag_configure(TAG_ITALIC, font=ctk.CTkFont(slant="italic"))
+        text.tag_configure(
+            TAG_BOLD_ITALIC, font=ctk.CTkFont(weight="bold", slant="italic")
+        )
+        text.tag_configure(TAG_LINK, foreground="#4a9eff", underline=True)
+        text.tag_configure(TAG_LIST, lmargin2=24)
+        text.tag_configure(TAG_QUOTE, foreground="gray60", lmargin1=16, lmargin2=16)
+        text.tag_configure(TAG_HR, foreground="gray50")
+        for tag, size in ((TAG_H3, 16), (TAG_H2, 20), (TAG_H1, 26)):
+            text.tag_configure(
+                tag, font=ctk.CTkFont(size=size, weight="bold"), spacing1=6
+            )
+
+    def update_preview(self, markdown_text: str, version: int | None = None) -> None:
         """プレビューを更新する。
 
+        変更されたブロックの範囲だけを書き換え、表示位置は維持する。
+
         Args:
             markdown_text: Markdownテキスト。
+            version: テキストのエディタ上のバージョン（不明な場合None）。
+                指定した場合、以降の変更は apply_changes で差分から反映できる。
         """
-        self._textbox.configure(state="normal")
-        self._textbox.delete("1.0", "end")
-        # 簡易プレビュー: Markdown記法を一部変換して表示
-        preview_text = self._simple_render(markdown_text)
-        self._textbox.insert("1.0", preview_text)
-        self._textbox.configure(state="disabled")
+        self._apply_patch(self._document.reset(markdown_text, version))
 
-    @staticmethod
-    def _simple_render(markdown_text: str) -> str:
-        """Markdownをプレーンテキストとして簡易レンダリングする。
+    def apply_changes(self, change: EditorChange) -> bool:
+        """エディタの編集差分をプレビューに反映する。
 
         Args:
-            markdown_text: Markdownテキスト。
+            change: エディタの変更通知。
 
         Returns:
-            レンダリングされたテキスト。
+            反映した場合True。前回の表示から差分を取りこぼしている場合は
+            何もせずFalse（呼び出し側で update_preview により全体を反映する）。
+        """
+        patches = self._document.apply(change.deltas)
+        if patches is None:
+            return False
+        for patch in patches:
+            self._apply_patch(patch)
+        return True
+
+    def _apply_patch(self, patch: BlockPatch) -> None:
+        """変更されたブロックの範囲をテキストボックスに反映する。
+
+        Args:
+            patch: 変更されたブロックの範囲。
         """
-        lines = []
-        for line in markdown_text.split("\n"):
-            stripped = line.strip()
-            if stripped.startswith("# "):
-                lines.append(stripped[2:].upper())
-                lines.append("=" * len(stripped[2:]))
-            elif stripped.startswith("## "):
-                lines.append(stripped[3:])
-                lines.append("-" * len(stripped[3:]))
-            elif stripped.startswith("### "):
-                lines.append(stripped[4:])
+        if patch.is_empty:
+            return
+
+        text: Any = self._textbox._textbox
+        start_line = 1 + sum(b.line_count for b in self._blocks[: patch.start])
+        end_line = start_line + sum(
+            b.line_count
+            for b in self._blocks[patch.start : patch.start + patch.removed]
+        )
+        inserted_lines = sum(b.line_count for b in patch.inserted)
+        top_line = int(text.index("@0,0").split(".")[0])
+
+        text.configure(state="normal")
+        text.delete(f"{start_line}.0", f"{end_line}.0")
+        args: list[Any] = []
+        for block in patch.inserted:
+            for chunk, tags in block.segments:
+                args.extend((chunk, tags))
+        if args:
+            text.insert(f"{start_line}.0", *args)
+        text.configure(state="disabled")
+
+        # 表示位置より上のブロックが変わった場合は、行数の増減だけ表示位置をずらす
+        if start_line < top_line:
+            if top_line >= end_line:
+                top_line += inserted_lines - (end_line - start_line)
             else:
-                lines.append(line)
-        return "\n".join(lines)
+                top_line = start_line
+            text.yview(f"{top_line}.0")
+
+        self._blocks[patch.start : patch.start + patch.removed] = patch.inserted
@@ -0,0 +1,157 @@
+"""SEOパネルコンポーネント。
+
+SEOスコアとチェック項目ごとの結果を表示する。
+チェック項目の行ウィジェットは再利用し、変化した行だけを更新する。
+更新が必要な行の判定は seo_rows.diff_seo_rows で行う。
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import customtkinter as ctk
+
+from postblog.gui.components.seo_rows import diff_seo_rows
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from postblog.gui.components.seo_rows import RowKey, SeoRowContent, SeoRowUpdate
+    from postblog.models.seo import SeoAnalysisResult
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _SeoRow:
+    """チェック項目1件分の行ウィジェット。"""
+
+    frame: ctk.CTkFrame
+    icon_label: ctk.CTkLabel
+    text_label: ctk.CTkLabel
+
+
+def _score_color(score: int) -> str:
+    """スコアに応じた表示色を返す。
+
+    Args:
+        score: SEOスコア。
+
+    Returns:
+        表示色。
+    """
+    if score >= 80:
+        return "#4CAF50"
+    if score >= 60:
+        return "#8BC34A"
+    if score >= 40:
+        return "#FFC107"
+    return "#F44336"
+
+
+class SeoPanel(ctk.CTkFrame):
+    """SEO分析結果パネル。
+
+    行はカテゴリと項目名をキーに保持し、ステータス・テキスト・色が
+    変わった行だけ ``configure`` する。
+
+    Args:
+        parent: 親ウィジェット。
+    """
+
+    WIDTH = 250
+
+    def __init__(self, parent: ctk.CTkFrame) -> None:
+        super().__init__(parent, width=self.WIDTH)
+        self.pack_propagate(False)
+
+        ctk.CTkLabel(
+            self, text="SEO Score", font=ctk.CTkFont(size=16, weight="bold")
+        ).pack(pady=(10, 5))
+
+        self._score_label = ctk.CTkLabel(
+            self, text="--/100", font=ctk.CTkFont(size=24, weight="bold")
+        )
+        self._score_label.pack(pady=5)
+        self._score: int | None = None
+
+        self._items_frame = ctk.CTkScrollableFrame(self)
+        self._items_frame.pack(fill="both", expand=True, padx=5, pady=5)
+
+        self._rows: dict[RowKey, _SeoRow] = {}
+        self._contents: dict[RowKey, SeoRowContent] = {}
+        self._order: tuple[RowKey, ...] = ()
+
+    def display(self, result: SeoAnalysisResult) -> None:
+        """SEO分析結果を表示する。
+
+        Args:
+            result: SEO分析結果。
+        """
+        if result.score != self._score:
+            self._score = result.score
+            self._score_label.configure(
+                text=f"{result.score}/100", text_color=_score_color(result.score)
+            )
+
+        diff = diff_seo_rows(self._contents, self._order, result.items)
+        for update in diff.updates:
+            self._update_row(update)
+
+        if diff.reorder:
+            self._relayout(diff.order)
+
+    def clear(self) -> None:
+        """表示中の分析結果を消去する。"""
+        if self._score is not None:
+            self._score = None
+            self._score_label.configure(text="--/100", text_color=("gray10", "gray90"))
+        if self._order:
+            self._relayout(())
+
+    def _update_row(self, update: SeoRowUpdate) -> None:
+        """チェック項目の行を作成または更新する。
+
+        Args:
+            update: 行の作成・更新の指示。
+        """
+        if update.created:
+            self._rows[update.key] = self._create_row()
+        row = self._rows[update.key]
+
+        content = update.content
+        if update.status_changed:
+            row.icon_label.configure(text=content.icon, text_color=content.color)
+        if update.text_changed:
+            row.text_label.configure(text=content.text)
+        self._contents[update.key] = content
+
+    def _create_row(self) -> _SeoRow:
+        """空の行ウィジェットを作成する。
+
+        Returns:
+            作成した行。
+        """
+        frame = ctk.CTkFrame(self._items_frame, fg_color="transparent")
+        icon_label = ctk.CTkLabel(
+            frame, text="", font=ctk.CTkFont(size=12, weight="bold"), width=30
+        )
+        icon_label.pack(side="left")
+        text_label = ctk.CTkLabel(frame, text="", font=ctk.CTkFont(size=11), anchor="w")
+        text_label.pack(side="left", fill="x", expand=True)
+        return _SeoRow(frame=frame, icon_label=icon_label, text_label=text_label)
+
+    def _relayout(self, order: tuple[RowKey, ...]) -> None:
+        """行の並び順を更新し、結果に含まれない行を隠す。
+
+        Args:
+            order: 表示する行のキー（表示順）。
+        """
+        for row in self._rows.values():
+            row.frame.pack_forget()
+        for key in order:
+            self._rows[key].frame.pack(fill="x", pady=1)
+        self._order = order
+        logger.debug("SEOパネルの行を再配置しました: %d件", len(order))
@@ -0,0 +1,130 @@
+"""SEOパネルのチェック項目行の差分計算。
+
+チェック項目をカテゴリと項目名のキーで表示中の行と突き合わせ、
+作成・更新が必要な行と並び順の変更を求める。Tkウィジェットには依存しない。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from postblog.models.seo import SeoCheckItem
+
+
+# 行のキー（カテゴリ, 項目名）
+RowKey = tuple[str, str]
+
+_STATUS_ICONS = {"pass": "OK", "warn": "!!", "fail": "NG"}
+_STATUS_COLORS = {"pass": "#4CAF50", "warn": "#FFC107", "fail": "#F44336"}
+
+
+@dataclass(frozen=True)
+class SeoRowContent:
+    """チェック項目1件分の表示内容。
+
+    Args:
+        icon: ステータスのアイコン文字列。
+        color: ステータスの表示色。
+        text: 項目のテキスト。
+    """
+
+    icon: str
+    color: str
+    text: str
+
+
+@dataclass(frozen=True)
+class SeoRowUpdate:
+    """行の作成・更新の指示。
+
+    Args:
+        key: 行のキー。
+        content: 表示する内容。
+        created: 行を新しく作成する場合True。
+        status_changed: アイコンまたは色が変わった場合True。
+        text_changed: テキストが変わった場合True。
+    """
+
+    key: RowKey
+    content: SeoRowContent
+    created: bool
+    status_changed: bool
+    text_changed: bool
+
+
+@dataclass(frozen=True)
+class SeoRowsDiff:
+    """表示中の行と分析結果の差分。
+
+    Args:
+        updates: 作成または更新が必要な行（変化のない行は含まない）。
+        order: 表示する行のキー（表示順）。
+        reorder: 並び順または表示する行が変わった場合True。
+    """
+
+    updates: tuple[SeoRowUpdate, ...]
+    order: tuple[RowKey, ...]
+    reorder: bool
+
+
+def row_content(item: SeoCheckItem) -> SeoRowContent:
+    """チェック項目の表示内容を返す。
+
+    Args:
+        item: チェック項目。
+
+    Returns:
+        表示内容。
+    """
+    return SeoRowContent(
+        icon=_STATUS_ICONS.get(item.status, "?"),
+        color=_STATUS_COLORS.get(item.status, "gray"),
+        text=f"{item.category}: {item.name}",
+    )
+
+
+def diff_seo_rows(
+    shown: Mapping[RowKey, SeoRowContent],
+    order: Sequence[RowKey],
+    items: Sequence[SeoCheckItem],
+) -> SeoRowsDiff:
+    """表示中の行と分析結果を突き合わせ、必要な更新を求める。
+
+    Args:
+        shown: 作成済みの行のキーと表示中の内容。非表示の行も含む。
+        order: 現在表示している行のキー（表示順）。
+        items: 分析結果のチェック項目。
+
+    Returns:
+        差分。
+    """
+    current = dict(shown)
+    updates: list[SeoRowUpdate] = []
+    for item in items:
+        key = (item.category, item.name)
+        content = row_content(item)
+        previous = current.get(key)
+        current[key] = content
+        if previous == content:
+            continue
+        updates.append(
+            SeoRowUpdate(
+                key=key,
+                content=content,
+                created=previous is None,
+                status_changed=previous is None
+                or (previous.icon, previous.color) != (content.icon, content.color),
+                text_changed=previous is None or previous.text != content.text,
+            )
+        )
+
+    new_order = tuple((item.category, item.name) for item in items)
+    return SeoRowsDiff(
+        updates=tuple(updates),
+        order=new_order,
+        reorder=new_order != tuple(order),
+    )
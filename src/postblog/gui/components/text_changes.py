@@ -0,0 +1,185 @@
+"""テキスト変更の差分管理。
+
+エディタへの挿入・削除を (offset, removed, inserted) の差分として記録し、
+変更ごとに単調増加するバージョン番号を付与する。利用側は差分を自分の
+コピーに適用することで、文書全体を読み直さずに変更へ追従できる。
+Tkウィジェットには依存しない。
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EditDelta:
+    """1回の編集による差分。
+
+    Args:
+        offset: 編集位置（編集前の文書の先頭からの文字数）。
+        removed: 削除された文字列。
+        inserted: 挿入された文字列。
+        version: この編集を適用した後の文書のバージョン。
+    """
+
+    offset: int
+    removed: str
+    inserted: str
+    version: int
+
+    def apply(self, text: str) -> str:
+        """差分を文字列に適用する。
+
+        Args:
+            text: 編集前の文書。
+
+        Returns:
+            編集後の文書。
+
+        Raises:
+            ValueError: 編集前の文書が差分と一致しない場合。
+        """
+        end = self.offset + len(self.removed)
+        if text[self.offset : end] != self.removed:
+            raise ValueError(f"差分を適用できません: version={self.version}")
+        return text[: self.offset] + self.inserted + text[end:]
+
+
+@dataclass(frozen=True)
+class EditorChange:
+    """変更通知。前回の通知以降の差分をまとめたもの。
+
+    Args:
+        version: 最後の差分を適用した後の文書のバージョン。
+        deltas: 前回の通知以降の差分（発生順）。
+    """
+
+    version: int
+    deltas: tuple[EditDelta, ...]
+
+
+def diff_text(before: str, after: str) -> tuple[int, str, str]:
+    """2つの文字列の差分を、先頭と末尾の一致部分を除いて求める。
+
+    Args:
+        before: 変更前の文字列。
+        after: 変更後の文字列。
+
+    Returns:
+        (offset, removed, inserted) のタプル。
+    """
+    limit = min(len(before), len(after))
+    prefix = 0
+    while prefix < limit and before[prefix] == after[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < limit - prefix
+        and before[len(before) - 1 - suffix] == after[len(after) - 1 - suffix]
+    ):
+        suffix += 1
+    return (
+        prefix,
+        before[prefix : len(before) - suffix],
+        after[prefix : len(after) - suffix],
+    )
+
+
+class ChangeLog:
+    """編集差分を記録し、通知前の差分をまとめて取り出す。"""
+
+    def __init__(self) -> None:
+        self._version = 0
+        self._pending: list[EditDelta] = []
+
+    @property
+    def version(self) -> int:
+        """現在の文書のバージョン（編集のたびに1増える）。"""
+        return self._version
+
+    def record(self, offset: int, removed: str, inserted: str) -> EditDelta | None:
+        """編集を記録する。
+
+        内容が変わらない編集（空の挿入・削除や同じ文字列への置換）は記録しない。
+
+        Args:
+            offset: 編集位置（編集前の文書の先頭からの文字数）。
+            removed: 削除された文字列。
+            inserted: 挿入された文字列。
+
+        Returns:
+            記録した差分。記録しなかった場合はNone。
+        """
+        if removed == inserted:
+            return None
+        self._version += 1
+        delta = EditDelta(offset, removed, inserted, self._version)
+        self._pending.append(delta)
+        return delta
+
+    def drain(self) -> EditorChange | None:
+        """未通知の差分を取り出す。
+
+        Returns:
+            変更通知。未通知の差分がない場合はNone。
+        """
+        if not self._pending:
+            return None
+        change = EditorChange(self._version, tuple(self._pending))
+        self._pending = []
+        return change
+
+
+class AstralPositions:
+    """文書中のBMP外の文字（絵文字など）の位置を編集差分から追跡する。
+
+    Tcl 8.6 のテキストウィジェットはBMP外の文字をサロゲートペアの2文字として
+    数えるため、ウィジェットの文字数（UTF-16 単位）を文字数に換算するのに使う。
+    更新と換算のコストはBMP外の文字数に比例し、文書の長さには依存しない。
+    """
+
+    def __init__(self) -> None:
+        # BMP外の文字の位置（文字数、昇順）
+        self._offsets: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def apply(self, offset: int, removed: str, inserted: str) -> None:
+        """編集を反映する。
+
+        Args:
+            offset: 編集位置（編集前の文書の先頭からの文字数）。
+            removed: 削除された文字列。
+            inserted: 挿入された文字列。
+        """
+        added = [offset + i for i, char in enumerate(inserted) if ord(char) > 0xFFFF]
+        if not self._offsets and not added:
+            return
+        end = offset + len(removed)
+        shift = len(inserted) - len(removed)
+        low = bisect_left(self._offsets, offset)
+        high = bisect_left(self._offsets, end)
+        self._offsets = (
+            self._offsets[:low]
+            + added
+            + [position + shift for position in self._offsets[high:]]
+        )
+
+    def to_offset(self, units: int) -> int:
+        """UTF-16 単位の位置を文字数に換算する。
+
+        Args:
+            units: 文書の先頭からの UTF-16 単位の数。
+
+        Returns:
+            先頭からの文字数。
+        """
+        offset = units
+        for index, position in enumerate(self._offsets):
+            # index 個前までのBMP外の文字で、UTF-16 単位の位置は index だけずれる
+            if position + index >= units:
+                break
+            offset -= 1
+        return offset
@@ -0,0 +1,250 @@
+"""仮想化リストコンポーネント。
+
+表示範囲の行と前後の少数の行だけをウィジェットとして保持し、スクロールに
+合わせて行ウィジェットを使い回す。データはスクロール位置に応じてページ単位で
+バックグラウンドで遅延取得するため、件数によらず表示のコストが一定になる。
+表示範囲と行の割り当ては ListWindow が管理する。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import customtkinter as ctk
+
+from postblog.gui.components.list_window import ListWindow, PageRequest
+
+
+# 1行の高さ（ピクセル）
+DEFAULT_ROW_HEIGHT = 56
+
+# 1回に取得する件数
+DEFAULT_PAGE_SIZE = 50
+
+# 表示範囲の前後に保持する行数
+DEFAULT_BUFFER_ROWS = 3
+
+# 行どうしの間隔（ピクセル）
+ROW_GAP = 8
+
+# ページ取得関数（件数上限・オフセット・成功時/失敗時コールバックを受け取る）
+PageRequester = Callable[
+    [
+        int,
+        int,
+        Callable[[list[dict[str, Any]]], None],
+        Callable[[Exception], None],
+    ],
+    None,
+]
+
+
+class VirtualList(ctk.CTkFrame):
+    """行ウィジェットを再利用する仮想化リスト。
+
+    Args:
+        parent: 親ウィジェット。
+        request_page: ページ取得関数。取得はバックグラウンドで行い、結果を
+            コールバックで返す（コールバックはGUIスレッド外から呼んでよい）。
+        format_row: 項目から行のタイトルと補足テキストを返す関数。
+        on_click: 行クリック時コールバック。
+        empty_text: 項目がない場合に表示するテキスト。
+        height: 表示領域の高さ（ピクセル）。
+        row_height: 1行の高さ（ピクセル）。
+        page_size: 1回に取得する件数。
+        buffer_rows: 表示範囲の前後に保持する行数。
+    """
+
+    def __init__(
+        self,
+        parent: ctk.CTkFrame,
+        request_page: PageRequester,
+        format_row: Callable[[dict[str, Any]], tuple[str, str]],
+        on_click: Callable[[dict[str, Any]], None] | None = None,
+        *,
+        empty_text: str = "No items",
+        height: int = 200,
+        row_height: int = DEFAULT_ROW_HEIGHT,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        buffer_rows: int = DEFAULT_BUFFER_ROWS,
+    ) -> None:
+        super().__init__(parent)
+        self._request_page = request_page
+        self._format_row = format_row
+        self._on_click = on_click
+        self._height = height
+        self._row_height = row_height
+        self._window = ListWindow(row_height, page_size, buffer_rows)
+
+        self._rows: list[ctk.CTkFrame] = []
+        self._row_labels: list[tuple[ctk.CTkLabel, ctk.CTkLabel]] = []
+
+        self._viewport = ctk.CTkFrame(self, height=height, fg_color="transparent")
+        self._viewport.pack(side="left", fill="both", expand=True)
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.pack(side="right", fill="y")
+        self._empty_label = ctk.CTkLabel(
+            self._viewport, text=empty_text, text_color="gray60"
+        )
+
+        self._viewport.bind("<Configure>", lambda e: self._redraw())
+        self._bind_wheel(self._viewport)
+
+    @property
+    def loaded_count(self) -> int:
+        """取得済みの項目数。"""
+        return len(self._window.items)
+
+    def reload(self) -> None:
+        """取得済みの項目を破棄し、先頭から読み込み直す。"""
+        self._window.reset()
+        self._redraw()
+
+    def _viewport_height(self) -> int:
+        """表示領域の高さを返す（配置前は指定値）。"""
+        height = self._viewport.winfo_height()
+        return height if height > 1 else self._height
+
+    def _load_next_page(self, height: int) -> None:
+        """表示範囲を埋めるのに必要なページの取得を開始する。
+
+        Args:
+            height: 表示領域の高さ。
+        """
+        request = self._window.next_page(height)
+        if request is None:
+            return
+        self._request_page(
+            request.limit,
+            request.offset,
+            lambda page: self.after(0, self._on_page_loaded, request, page),
+            lambda error: self.after(0, self._on_page_failed, request),
+        )
+
+    def _on_page_loaded(self, request: PageRequest, page: list[dict[str, Any]]) -> None:
+        """ページ取得完了時のハンドラ（GUIスレッドで呼ばれる）。
+
+        Args:
+            request: ページ取得の要求。
+            page: 取得した項目。
+        """
+        if self.winfo_exists() and self._window.add_page(request, page):
+            self._redraw()
+
+    def _on_page_failed(self, request: PageRequest) -> None:
+        """ページ取得失敗時のハンドラ（GUIスレッドで呼ばれる）。
+
+        Args:
+            request: ページ取得の要求。
+        """
+        if self.winfo_exists():
+            self._window.fail_page(request)
+            self._redraw()
+
+    def _ensure_pool(self, size: int) -> None:
+        """行ウィジェットを必要数まで作成する。
+
+        Args:
+            size: 必要な行ウィジェット数。
+        """
+        while len(self._rows) < size:
+            slot = len(self._rows)
+            row = ctk.CTkFrame(
+                self._viewport, height=self._row_height - ROW_GAP, corner_radius=8
+            )
+            title = ctk.CTkLabel(
+                row, text="", font=ctk.CTkFont(size=14, weight="bold"), anchor="w"
+            )
+            title.pack(padx=10, pady=(6, 0), anchor="w")
+            info = ctk.CTkLabel(
+                row,
+                text="",
+                font=ctk.CTkFont(size=11),
+                text_color="gray60",
+                anchor="w",
+            )
+            info.pack(padx=10, pady=(0, 6), anchor="w")
+
+            for widget in (row, title, info):
+                widget.bind("<Button-1>", lambda e, s=slot: self._on_row_click(s))
+                self._bind_wheel(widget)
+
+            self._rows.append(row)
+            self._row_labels.append((title, info))
+
+    def _redraw(self) -> None:
+        """スクロール位置に合わせて行ウィジェットを配置する。"""
+        height = self._viewport_height()
+        self._load_next_page(height)
+        self._window.scroll_to(self._window.offset, height)
+        self._ensure_pool(self._window.pool_size(height))
+
+        # 表示範囲に入った行だけテキストを書き換える
+        items = self._window.items
+        shown: set[int] = set()
+        for placement in self._window.layout(height, len(self._rows)):
+            shown.add(placement.slot)
+            if placement.changed:
+                title, info = self._format_row(items[placement.index])
+                title_label, info_label = self._row_labels[placement.slot]
+                title_label.configure(text=title)
+                info_label.configure(text=info)
+            self._rows[placement.slot].place(x=0, y=placement.y, relwidth=1.0)
+        for slot, row in enumerate(self._rows):
+            if slot not in shown:
+                row.place_forget()
+
+        if items or self._window.is_loading:
+            self._empty_label.place_forget()
+        else:
+            self._empty_label.place(relx=0.5, y=10, anchor="n")
+        self._scrollbar.set(*self._window.scrollbar_range(height))
+
+    def _scroll_to(self, offset: int) -> None:
+        """指定位置までスクロールする。
+
+        Args:
+            offset: 先頭からのスクロール量（ピクセル）。
+        """
+        self._window.scroll_to(offset, self._viewport_height())
+        self._redraw()
+
+    def _on_scrollbar(self, *args: str) -> None:
+        """スクロールバー操作時のハンドラ。"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * self._window.content_height))
+        elif args[0] == "scroll":
+            step = self._viewport_height() if args[2] == "pages" else self._row_height
+            self._scroll_to(self._window.offset + int(args[1]) * step)
+
+    def _on_mousewheel(self, event: Any) -> None:
+        """マウスホイール操作時のハンドラ。"""
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            direction = -1
+        else:
+            direction = 1
+        self._window.scroll_rows(direction, self._viewport_height())
+        self._redraw()
+
+    def _bind_wheel(self, widget: Any) -> None:
+        """マウスホイールのイベントを登録する。
+
+        Args:
+            widget: 対象のウィジェット。
+        """
+        widget.bind("<MouseWheel>", self._on_mousewheel)
+        widget.bind("<Button-4>", self._on_mousewheel)
+        widget.bind("<Button-5>", self._on_mousewheel)
+
+    def _on_row_click(self, slot: int) -> None:
+        """行クリック時のハンドラ。
+
+        Args:
+            slot: クリックされた行ウィジェットの番号。
+        """
+        item = self._window.item_at_slot(slot)
+        if self._on_click is not None and item is not None:
+            self._on_click(item)
@@ -5,7 +5,9 @@ BaseViewと NavigationManager による画面遷移と履歴管理を提供す
 
 from __future__ import annotations
 
+import importlib
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 
@@ -14,15 +16,25 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# 構築済みのまま保持する画面（retain が True の画面）数の上限
+DEFAULT_MAX_RETAINED_VIEWS = 4
+
 
 class BaseView:
     """全画面の基底クラス。
 
+    retain が True の画面は、2回目以降の表示で画面を再構築せず、
+    構築済みのフレームを再表示して refresh() でデータだけを更新する。
+    retain が False の画面は、他の画面へ遷移した時点で破棄される。
+
     Args:
         parent: 親ウィジェット。
         navigation: 画面遷移マネージャ。
     """
 
+    # 再表示時に構築済みのフレームを使い回す場合True
+    retain: bool = False
+
     def __init__(self, parent: ctk.CTkFrame, navigation: NavigationManager) -> None:
         self.parent = parent
         self.navigation = navigation
@@ -31,15 +43,25 @@ class BaseView:
     def build(self) -> None:
         """画面を構築する。サブクラスでオーバーライドする。"""
 
+    def refresh(self, **kwargs: Any) -> None:
+        """構築済みの画面のデータを更新する。retain が True の画面でオーバーライドする。
+
+        Args:
+            **kwargs: 画面に渡すパラメータ。
+        """
+
     def show(self, **kwargs: Any) -> None:
         """画面を表示する。
 
         Args:
             **kwargs: 画面に渡すパラメータ。
         """
-        if self.frame is not None:
-            self.frame.destroy()
-        self.build()
+        if self.frame is not None and self.retain:
+            self.refresh(**kwargs)
+        else:
+            if self.frame is not None:
+                self.frame.destroy()
+            self.build()
         if self.frame is not None:
             self.frame.pack(fill="both", expand=True)
 
@@ -58,14 +80,24 @@ class BaseView:
 class NavigationManager:
     """画面遷移と履歴を管理する。
 
+    retain が True の画面は最近使った順に保持し、上限を超えた場合は最も長く
+    使われていない画面（表示中の画面を除く）を破棄する。retain が False の画面は
+    表示のたびに再構築するため保持せず、非表示にした時点で破棄する。
+
     Args:
         content_frame: 画面表示用のコンテナフレーム。
+        max_retained_views: 構築済みのまま保持する画面（retain が True の画面）数の上限。
     """
 
-    def __init__(self, content_frame: ctk.CTkFrame) -> None:
+    def __init__(
+        self,
+        content_frame: ctk.CTkFrame,
+        max_retained_views: int = DEFAULT_MAX_RETAINED_VIEWS,
+    ) -> None:
         self._content_frame = content_frame
-        self._views: dict[str, type[BaseView]] = {}
-        self._view_instances: dict[str, BaseView] = {}
+        self._max_retained_views = max_retained_views
+        self._views: dict[str, type[BaseView] | str] = {}
+        self._view_instances: OrderedDict[str, BaseView] = OrderedDict()
         self._current_view: BaseView | None = None
         self._current_view_name: str = ""
         self._history: list[str] = []
@@ -81,12 +113,15 @@ class NavigationManager:
         """画面間で共有するコンテキスト。"""
         return self._context
 
-    def register(self, name: str, view_class: type[BaseView]) -> None:
+    def register(self, name: str, view_class: type[BaseView] | str) -> None:
         """画面を登録する（遅延読み込み）。
 
+        画面クラスを "モジュール名.クラス名" の文字列で指定した場合、
+        モジュールは最初にその画面へ遷移する時点で読み込む。
+
         Args:
             name: 画面名。
-            view_class: 画面クラス。
+            view_class: 画面クラス、またはその完全修飾名。
         """
         self._views[name] = view_class
 
@@ -102,18 +137,15 @@ class NavigationManager:
             return
 
         if self._current_view is not None:
-            self._current_view.hide()
+            self._leave_current_view()
             if self._current_view_name:
                 self._history.append(self._current_view_name)
 
-        if name not in self._view_instances:
-            view_class = self._views[name]
-            self._view_instances[name] = view_class(self._content_frame, self)
-
-        view = self._view_instances[name]
+        view = self._get_view(name)
         view.show(**kwargs)
         self._current_view = view
         self._current_view_name = name
+        self._evict_views()
         logger.info("画面遷移: %s", name)
 
     def go_back(self) -> None:
@@ -122,14 +154,70 @@ class NavigationManager:
             return
         previous = self._history.pop()
         if self._current_view is not None:
-            self._current_view.hide()
-
-        if previous in self._view_instances:
-            view = self._view_instances[previous]
-            view.show()
-            self._current_view = view
-            self._current_view_name = previous
-            logger.info("画面戻り: %s", previous)
+            self._leave_current_view()
+
+        # 上限を超えて破棄された画面は作り直す
+        view = self._get_view(previous)
+        view.show()
+        self._current_view = view
+        self._current_view_name = previous
+        self._evict_views()
+        logger.info("画面戻り: %s", previous)
+
+    def _leave_current_view(self) -> None:
+        """表示中の画面を非表示にする。retain でない画面は破棄する。"""
+        view = self._current_view
+        if view is None:
+            return
+        view.hide()
+        if not view.retain:
+            self._view_instances.pop(self._current_view_name, None)
+            view.destroy()
+
+    def _get_view(self, name: str) -> BaseView:
+        """画面のインスタンスを取得する。未生成の場合は生成する。
+
+        Args:
+            name: 画面名。
+
+        Returns:
+            画面のインスタンス（最近使った画面として記録される）。
+        """
+        if name not in self._view_instances:
+            view_class = self._resolve_view_class(name)
+            self._view_instances[name] = view_class(self._content_frame, self)
+        self._view_instances.move_to_end(name)
+        return self._view_instances[name]
+
+    def _resolve_view_class(self, name: str) -> type[BaseView]:
+        """画面クラスを取得する。完全修飾名で登録されている場合は読み込む。
+
+        Args:
+            name: 画面名。
+
+        Returns:
+            画面クラス。
+        """
+        view_class = self._views[name]
+        if isinstance(view_class, str):
+            module_name, _, class_name = view_class.rpartition(".")
+            module = importlib.import_module(module_name)
+            resolved: type[BaseView] = getattr(module, class_name)
+            self._views[name] = resolved
+            logger.debug("画面を読み込みました: %s", view_class)
+            return resolved
+        return view_class
+
+    def _evict_views(self) -> None:
+        """保持する画面数が上限を超えた場合、古い画面から破棄する。"""
+        retained = [name for name, view in self._view_instances.items() if view.retain]
+        for name in retained[: max(0, len(retained) - self._max_retained_views)]:
+            view = self._view_instances[name]
+            if view is self._current_view:
+                continue
+            del self._view_instances[name]
+            view.destroy()
+            logger.debug("画面を破棄しました: %s", name)
 
     def can_go_back(self) -> bool:
         """前の画面に戻れるかどうか。"""
@@ -12,7 +12,12 @@ from postblog.templates.hearing_templates import get_all_blog_types
 
 
 class BlogTypeView(BaseView):
-    """ブログ種別選択画面。"""
+    """ブログ種別選択画面。
+
+    表示内容は固定のため、構築済みの画面をそのまま再表示する。
+    """
+
+    retain = True
 
     def __init__(self, parent: ctk.CTkFrame, navigation: NavigationManager) -> None:
         super().__init__(parent, navigation)
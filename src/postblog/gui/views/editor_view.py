@@ -6,22 +6,30 @@ Markdownエディタ+プレビュー+SEOパネルを提供する。
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import customtkinter as ctk
 
+from postblog.exceptions import ValidationError
 from postblog.gui.components.markdown_editor import MarkdownEditor
 from postblog.gui.components.markdown_preview import MarkdownPreview
+from postblog.gui.components.seo_panel import SeoPanel
 from postblog.gui.components.tag_input import TagInput
 from postblog.gui.navigation import BaseView, NavigationManager
 
 
+if TYPE_CHECKING:  # pragma: no cover
+    from postblog.gui.components.text_changes import EditDelta, EditorChange
+
+
 logger = logging.getLogger(__name__)
 
 
 class EditorView(BaseView):
     """記事エディタ画面。"""
 
+    retain = True
+
     def __init__(self, parent: ctk.CTkFrame, navigation: NavigationManager) -> None:
         super().__init__(parent, navigation)
         self._editor: MarkdownEditor | None = None
@@ -29,10 +37,11 @@ class EditorView(BaseView):
         self._tag_input: TagInput | None = None
         self._title_entry: ctk.CTkEntry | None = None
         self._meta_textbox: ctk.CTkTextbox | None = None
-        self._seo_score_label: ctk.CTkLabel | None = None
-        self._seo_items_frame: ctk.CTkFrame | None = None
+        self._seo_panel: SeoPanel | None = None
         self._preview_visible: bool = True
         self._seo_visible: bool = True
+        # 最後にSEO分析を依頼した時点のエディタのバージョン
+        self._analyzed_version: int | None = None
 
     def build(self) -> None:
         """画面を構築する。"""
@@ -44,7 +53,11 @@ class EditorView(BaseView):
 
         # タイトル
         ctk.CTkLabel(meta_frame, text="Title:", anchor="w").pack(anchor="w")
-        self._title_entry = ctk.CTkEntry(meta_frame, height=35)
+        self._title_var = ctk.StringVar()
+        self._title_var.trace_add("write", lambda *_args: self._on_title_change())
+        self._title_entry = ctk.CTkEntry(
+            meta_frame, height=35, textvariable=self._title_var
+        )
         self._title_entry.pack(fill="x", pady=(2, 5))
 
         # タグ + キーワード
@@ -54,7 +67,7 @@ class EditorView(BaseView):
         tag_frame = ctk.CTkFrame(tag_kw_frame, fg_color="transparent")
         tag_frame.pack(side="left", fill="x", expand=True)
         ctk.CTkLabel(tag_frame, text="Tags:", anchor="w").pack(anchor="w")
-        self._tag_input = TagInput(tag_frame)
+        self._tag_input = TagInput(tag_frame, on_change=self._on_tags_change)
         self._tag_input.pack(fill="x")
 
         # メタディスクリプション
@@ -63,6 +76,7 @@ class EditorView(BaseView):
         )
         self._meta_textbox = ctk.CTkTextbox(meta_frame, height=50)
         self._meta_textbox.pack(fill="x", pady=(2, 0))
+        self._meta_textbox.bind("<<Modified>>", self._on_meta_modified)
 
         # メインコンテンツ（エディタ + プレビュー + SEO）
         content_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
@@ -83,21 +97,8 @@ class EditorView(BaseView):
         self._preview.pack(fill="both", expand=True)
 
         # SEOパネル
-        self._seo_frame = ctk.CTkFrame(content_frame, width=250)
-        self._seo_frame.pack(side="right", fill="y", padx=(10, 0))
-        self._seo_frame.pack_propagate(False)
-
-        ctk.CTkLabel(
-            self._seo_frame, text="SEO Score", font=ctk.CTkFont(size=16, weight="bold")
-        ).pack(pady=(10, 5))
-
-        self._seo_score_label = ctk.CTkLabel(
-            self._seo_frame, text="--/100", font=ctk.CTkFont(size=24, weight="bold")
-        )
-        self._seo_score_label.pack(pady=5)
-
-        self._seo_items_frame = ctk.CTkScrollableFrame(self._seo_frame)
-        self._seo_items_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        self._seo_panel = SeoPanel(content_frame)
+        self._seo_panel.pack(side="right", fill="y", padx=(10, 0))
 
         # ボタンエリア
         btn_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
@@ -122,12 +123,22 @@ class EditorView(BaseView):
         # 記事データの読み込み
         self._load_article_data()
 
+    def refresh(self, **kwargs: Any) -> None:
+        """記事データを読み込み直す（プレビュー・SEOパネルの表示状態は維持する）。"""
+        self._load_article_data()
+
     def _load_article_data(self) -> None:
         """記事データを読み込む。"""
         article_controller = self.navigation.context.get("article_controller")
         if article_controller is None:
             return
 
+        # 記事生成の場合はストリーミングで本文を表示する
+        hearing_result = self.navigation.context.pop("generate_hearing_result", None)
+        if hearing_result is not None:
+            self._generate_article(hearing_result)
+            return
+
         # 下書き読み込みの場合
         draft_id = self.navigation.context.pop("load_draft_id", None)
         if draft_id is not None:
@@ -135,32 +146,110 @@ class EditorView(BaseView):
                 article_controller.load_draft(draft_id)
             except Exception:
                 logger.exception("下書き読み込みに失敗しました")
+                self._clear_article_fields()
+                return
 
         article = article_controller.current_article
         if article is None:
+            self._clear_article_fields()
             return
 
         if self._title_entry:
+            self._title_entry.delete(0, "end")
             self._title_entry.insert(0, article.title)
-        if self._editor:
+        if self._editor and self._editor.get_text() != article.body:
             self._editor.set_text(article.body)
         if self._tag_input:
             self._tag_input.set_tags(article.tags)
         if self._meta_textbox:
+            self._meta_textbox.delete("1.0", "end")
             self._meta_textbox.insert("1.0", article.meta_description)
         if self._preview:
-            self._preview.update_preview(article.body)
+            self._preview.update_preview(
+                article.body, self._editor.version if self._editor else None
+            )
 
         self._run_seo_analysis()
 
-    def _on_editor_change(self, text: str) -> None:
-        """エディタ変更時のハンドラ。"""
+    def _clear_article_fields(self) -> None:
+        """入力欄・プレビュー・SEOパネルを空にする（前の記事の表示を残さない）。"""
+        if self._title_entry:
+            self._title_entry.delete(0, "end")
+        if self._tag_input:
+            self._tag_input.set_tags([])
+        if self._meta_textbox:
+            self._meta_textbox.delete("1.0", "end")
         if self._preview:
-            self._preview.update_preview(text)
-        self._run_seo_analysis()
+            self._preview.update_preview("")
+        if self._seo_panel:
+            self._seo_panel.clear()
+        if self._editor:
+            if self._editor.get_text():
+                self._editor.set_text("")
+            # 空にした内容はSEO分析の対象にしない
+            self._analyzed_version = self._editor.version
 
-    def _run_seo_analysis(self) -> None:
-        """SEO分析を実行する。"""
+    def _on_editor_change(self, change: EditorChange) -> None:
+        """エディタ変更時のハンドラ。"""
+        if self._editor is None:
+            return
+        # 差分を取りこぼしている場合だけ全体をプレビューし直す
+        if self._preview and not self._preview.apply_changes(change):
+            self._preview.update_preview(self._editor.get_text(), self._editor.version)
+        # 生成中のストリーミング表示と、分析済みの内容の場合はSEO分析を省略する
+        if self._editor.is_editable and change.version != self._analyzed_version:
+            self._run_seo_analysis(change.deltas)
+
+    def _on_title_change(self) -> None:
+        """タイトル変更時のハンドラ。"""
+        title = self._title_entry.get() if self._title_entry else ""
+        # 読み込み時に一時的に空になる場合と、空のタイトルは反映しない
+        if title:
+            self._update_metadata(title=title)
+
+    def _on_tags_change(self, tags: list[str]) -> None:
+        """タグ変更時のハンドラ。"""
+        self._update_metadata(tags=tags)
+
+    def _on_meta_modified(self, event: object) -> None:
+        """メタディスクリプション変更時（<<Modified>>）のハンドラ。"""
+        if self._meta_textbox is None or not self._meta_textbox.edit_modified():
+            return
+        # 次の変更でもイベントが発生するよう、変更フラグを戻す
+        self._meta_textbox.edit_modified(False)
+        self._update_metadata(meta_description=self._meta_textbox.get("1.0", "end-1c"))
+
+    def _update_metadata(self, **fields: Any) -> None:
+        """タイトル・タグ・メタディスクリプションの変更を記事に反映する。
+
+        記事を更新して自動保存の対象にするだけで、SEO分析は行わない。
+        記事と同じ値（記事データの読み込みによる変更）は反映しない。
+
+        Args:
+            **fields: 更新する項目（update_article の引数）。
+        """
+        article_controller = self.navigation.context.get("article_controller")
+        if article_controller is None or article_controller.current_article is None:
+            return
+        article = article_controller.current_article
+        changed = {
+            name: value
+            for name, value in fields.items()
+            if getattr(article, name) != value
+        }
+        if not changed:
+            return
+        try:
+            article_controller.update_article(**changed)
+        except ValidationError as e:
+            logger.debug("記事を更新できません: %s", e)
+
+    def _run_seo_analysis(self, deltas: tuple[EditDelta, ...] | None = None) -> None:
+        """SEO分析を実行する。
+
+        Args:
+            deltas: 前回の分析以降のエディタの編集差分（不明な場合None）。
+        """
         article_controller = self.navigation.context.get("article_controller")
         if article_controller is None or article_controller.current_article is None:
             return
@@ -171,85 +260,97 @@ class EditorView(BaseView):
             body = self._editor.get_text() if self._editor else ""
             meta = self._meta_textbox.get("1.0", "end-1c") if self._meta_textbox else ""
             tags = self._tag_input.get_tags() if self._tag_input else []
+            self._analyzed_version = self._editor.version if self._editor else None
 
             article_controller.update_article(
                 title=title or None,
                 body=body or None,
                 tags=tags or None,
                 meta_description=meta or None,
+                deltas=deltas,
             )
 
-            result = article_controller.analyze_seo()
-            self._display_seo_result(result)
+            # 分析はワーカーで実行し、最新の結果だけをメインスレッドに戻す
+            article_controller.request_seo_analysis(
+                on_success=self._on_seo_analyzed,
+                on_error=lambda err: logger.debug("SEO分析エラー: %s", err),
+            )
         except Exception:
             pass  # SEO分析失敗は無視
 
+    def _on_seo_analyzed(self, result: Any) -> None:
+        """SEO分析完了時（ワーカースレッドから呼ばれる）。"""
+        if self.frame is not None:
+            self.frame.after(0, self._display_seo_result, result)
+
     def _display_seo_result(self, result: Any) -> None:
         """SEO分析結果を表示する。"""
-        if self._seo_score_label:
-            score = result.score
-            self._seo_score_label.configure(text=f"{score}/100")
-
-            # 色分け
-            if score >= 80:
-                color = "#4CAF50"
-            elif score >= 60:
-                color = "#8BC34A"
-            elif score >= 40:
-                color = "#FFC107"
-            else:
-                color = "#F44336"
-            self._seo_score_label.configure(text_color=color)
-
-        if self._seo_items_frame:
-            for widget in self._seo_items_frame.winfo_children():
-                widget.destroy()
-
-            for item in result.items:
-                status_icon = {"pass": "OK", "warn": "!!", "fail": "NG"}.get(
-                    item.status, "?"
-                )
-                status_color = {
-                    "pass": "#4CAF50",
-                    "warn": "#FFC107",
-                    "fail": "#F44336",
-                }.get(item.status, "gray")
-
-                item_frame = ctk.CTkFrame(self._seo_items_frame, fg_color="transparent")
-                item_frame.pack(fill="x", pady=1)
-
-                ctk.CTkLabel(
-                    item_frame,
-                    text=status_icon,
-                    font=ctk.CTkFont(size=12, weight="bold"),
-                    text_color=status_color,
-                    width=30,
-                ).pack(side="left")
-
-                ctk.CTkLabel(
-                    item_frame,
-                    text=f"{item.category}: {item.name}",
-                    font=ctk.CTkFont(size=11),
-                    anchor="w",
-                ).pack(side="left", fill="x", expand=True)
+        if self._seo_panel:
+            self._seo_panel.display(result)
 
     def _on_regenerate(self) -> None:
         """記事再生成。"""
+        self._generate_article(None)
+
+    def _generate_article(self, hearing_result: Any) -> None:
+        """記事をストリーミング生成し、受信した本文をエディタに追加する。
+
+        Args:
+            hearing_result: ヒアリング結果（Noneの場合は再生成）。
+        """
         article_controller = self.navigation.context.get("article_controller")
         if article_controller is None:
             return
-        try:
-            article_controller.regenerate_article(
-                on_success=lambda result: self._on_regenerate_success(),
-                on_error=lambda err: logger.error("再生成エラー: %s", err),
+
+        if self._editor:
+            self._editor.set_text("")
+            self._editor.set_editable(False)
+        if self._preview:
+            self._preview.update_preview(
+                "", self._editor.version if self._editor else None
             )
+
+        callbacks: dict[str, Any] = {
+            "on_chunk": self._on_generate_chunk,
+            "on_success": lambda result: self._on_generate_success(),
+            "on_error": self._on_generate_error,
+        }
+        try:
+            if hearing_result is None:
+                article_controller.regenerate_article(**callbacks)
+            else:
+                article_controller.generate_article(hearing_result, **callbacks)
         except Exception:
-            logger.exception("再生成の開始に失敗しました")
+            logger.exception("記事生成の開始に失敗しました")
+            if self._editor:
+                self._editor.set_editable(True)
+
+    def _on_generate_chunk(self, chunk: str) -> None:
+        """本文チャンク受信時（ワーカースレッドから呼ばれる）。"""
+        if self.frame is not None:
+            self.frame.after(0, self._append_chunk, chunk)
 
-    def _on_regenerate_success(self) -> None:
-        """再生成成功時。"""
+    def _append_chunk(self, chunk: str) -> None:
+        """受信した本文をエディタに追加する。"""
+        if self._editor:
+            self._editor.append_text(chunk)
+
+    def _on_generate_success(self) -> None:
+        """記事生成成功時。"""
         if self.frame is not None:
-            self.frame.after(0, self._load_article_data)
+            self.frame.after(0, self._finish_generation)
+
+    def _on_generate_error(self, error: Exception) -> None:
+        """記事生成エラー時。"""
+        logger.error("記事生成エラー: %s", error)
+        if self.frame is not None and self._editor is not None:
+            self.frame.after(0, self._editor.set_editable, True)
+
+    def _finish_generation(self) -> None:
+        """生成完了後にエディタを編集可能に戻し、記事データを反映する。"""
+        if self._editor:
+            self._editor.set_editable(True)
+        self._load_article_data()
 
     def _on_save_draft(self) -> None:
         """下書き保存。"""
@@ -258,8 +359,9 @@ class EditorView(BaseView):
             return
         try:
             self._sync_article_from_ui()
-            article_controller.save_draft()
-            logger.info("下書きを保存しました")
+            article_controller.request_save_draft(
+                on_error=lambda err: logger.error("下書き保存に失敗しました: %s", err),
+            )
         except Exception:
             logger.exception("下書き保存に失敗しました")
 
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from typing import Any
 
 import customtkinter as ctk
@@ -16,6 +17,9 @@ from postblog.gui.navigation import BaseView, NavigationManager
 
 logger = logging.getLogger(__name__)
 
+# ストリーミング中の吹き出し更新間隔（ミリ秒）
+STREAM_UPDATE_INTERVAL_MS = 50
+
 
 class HearingView(BaseView):
     """ヒアリング画面。"""
@@ -27,6 +31,10 @@ class HearingView(BaseView):
         self._send_btn: ctk.CTkButton | None = None
         self._progress_bar: ctk.CTkProgressBar | None = None
         self._progress_label: ctk.CTkLabel | None = None
+        self._stream_bubble: ChatBubble | None = None
+        self._stream_chunks: list[str] = []
+        self._stream_lock = threading.Lock()
+        self._stream_flush_scheduled = False
 
     def build(self) -> None:
         """画面を構築する。"""
@@ -118,16 +126,55 @@ class HearingView(BaseView):
         if controller is None:
             return
 
+        # 応答の吹き出しを先に作成し、受信したチャンクで更新する
+        self._stream_bubble = self._add_ai_message("...")
+        with self._stream_lock:
+            self._stream_chunks = []
+            self._stream_flush_scheduled = False
+
         try:
             controller.send_message(
                 message,
                 on_success=lambda resp: self._on_response(resp),
                 on_error=lambda err: self._on_error(err),
+                on_chunk=self._on_chunk,
             )
         except Exception as e:
-            self._add_ai_message(f"Error: {e}")
+            self._finish_stream(f"Error: {e}")
             self._set_input_enabled(True)
 
+    def _on_chunk(self, chunk: str) -> None:
+        """応答チャンク受信時（ワーカースレッドから呼ばれる）。
+
+        UI更新は STREAM_UPDATE_INTERVAL_MS ごとに最大1回にまとめる。
+        """
+        with self._stream_lock:
+            self._stream_chunks.append(chunk)
+            if self._stream_flush_scheduled or self.frame is None:
+                return
+            self._stream_flush_scheduled = True
+        self.frame.after(STREAM_UPDATE_INTERVAL_MS, self._flush_stream)
+
+    def _flush_stream(self) -> None:
+        """受信済みのチャンクを吹き出しに反映する。"""
+        with self._stream_lock:
+            self._stream_flush_scheduled = False
+            text = "".join(self._stream_chunks)
+        if self._stream_bubble is not None:
+            self._stream_bubble.update_message(text)
+
+    def _finish_stream(self, message: str) -> None:
+        """ストリーミング中の吹き出しを確定する。
+
+        Args:
+            message: 最終的に表示するメッセージ。
+        """
+        if self._stream_bubble is not None:
+            self._stream_bubble.update_message(message)
+            self._stream_bubble = None
+        else:
+            self._add_ai_message(message)
+
     def _on_response(self, response: str) -> None:
         """AIレスポンス受信時。"""
         if self.frame is not None:
@@ -135,7 +182,7 @@ class HearingView(BaseView):
 
     def _handle_response(self, response: str) -> None:
         """AIレスポンスをUIに反映する。"""
-        self._add_ai_message(response)
+        self._finish_stream(response)
         self._set_input_enabled(True)
         self._update_progress()
 
@@ -146,7 +193,7 @@ class HearingView(BaseView):
 
     def _handle_error(self, error_msg: str) -> None:
         """エラーをUIに反映する。"""
-        self._add_ai_message(f"Error occurred: {error_msg}")
+        self._finish_stream(f"Error occurred: {error_msg}")
         self._set_input_enabled(True)
 
     def _on_finish(self) -> None:
@@ -169,10 +216,11 @@ class HearingView(BaseView):
         if self.frame is not None:
             self.frame.after(0, lambda: self.navigation.navigate("summary"))
 
-    def _add_ai_message(self, message: str) -> None:
+    def _add_ai_message(self, message: str) -> ChatBubble | None:
         """AIメッセージを追加する。"""
-        if self._chat_area is not None:
-            ChatBubble(self._chat_area, message, is_user=False)
+        if self._chat_area is None:
+            return None
+        return ChatBubble(self._chat_area, message, is_user=False)
 
     def _add_user_message(self, message: str) -> None:
         """ユーザーメッセージを追加する。"""
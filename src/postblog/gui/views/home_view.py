@@ -1,22 +1,29 @@
 """ホーム画面（SCR-001）。
 
-下書き一覧と投稿履歴一覧を表示する。
+下書き一覧と投稿履歴一覧、直近の投稿統計を表示する。
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 import customtkinter as ctk
 
+from postblog.controllers.home_controller import STATS_DAYS
+from postblog.gui.components.virtual_list import VirtualList
 from postblog.gui.navigation import BaseView, NavigationManager
 
 
 class HomeView(BaseView):
     """ホーム画面。"""
 
+    retain = True
+
     def __init__(self, parent: ctk.CTkFrame, navigation: NavigationManager) -> None:
         super().__init__(parent, navigation)
+        # 投稿統計の取得要求の番号（古い要求の結果を破棄するため）
+        self._stats_request = 0
 
     def build(self) -> None:
         """画面を構築する。"""
@@ -40,6 +47,18 @@ class HomeView(BaseView):
         )
         new_btn.pack(pady=20, padx=40, fill="x")
 
+        # 投稿統計セクション
+        stats_label = ctk.CTkLabel(
+            self.frame,
+            text=f"Publish Stats (last {STATS_DAYS} days)",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            anchor="w",
+        )
+        stats_label.pack(padx=20, pady=(10, 5), anchor="w")
+
+        self._stats_frame = ctk.CTkFrame(self.frame, corner_radius=8)
+        self._stats_frame.pack(fill="x", padx=20, pady=(0, 10))
+
         # 下書き一覧セクション
         drafts_label = ctk.CTkLabel(
             self.frame,
@@ -49,8 +68,14 @@ class HomeView(BaseView):
         )
         drafts_label.pack(padx=20, pady=(20, 5), anchor="w")
 
-        self._drafts_frame = ctk.CTkScrollableFrame(self.frame, height=200)
-        self._drafts_frame.pack(fill="x", padx=20, pady=(0, 10))
+        self._drafts_list = VirtualList(
+            self.frame,
+            request_page=self._request_drafts,
+            format_row=self._format_draft_row,
+            on_click=self._on_draft_click,
+            empty_text="No drafts yet",
+        )
+        self._drafts_list.pack(fill="x", padx=20, pady=(0, 10))
 
         # 投稿履歴セクション
         history_label = ctk.CTkLabel(
@@ -61,9 +86,18 @@ class HomeView(BaseView):
         )
         history_label.pack(padx=20, pady=(10, 5), anchor="w")
 
-        self._history_frame = ctk.CTkScrollableFrame(self.frame, height=200)
-        self._history_frame.pack(fill="x", padx=20, pady=(0, 20))
+        self._history_list = VirtualList(
+            self.frame,
+            request_page=self._request_history,
+            format_row=self._format_history_row,
+            empty_text="No posts yet",
+        )
+        self._history_list.pack(fill="x", padx=20, pady=(0, 20))
+
+        self._load_data()
 
+    def refresh(self, **kwargs: Any) -> None:
+        """下書き一覧・投稿履歴・投稿統計を読み込み直す。"""
         self._load_data()
 
     def _load_data(self) -> None:
@@ -72,76 +106,115 @@ class HomeView(BaseView):
         if controller is None:
             return
 
-        # 下書き一覧
-        drafts = controller.get_recent_drafts()
-        if not drafts:
-            ctk.CTkLabel(
-                self._drafts_frame, text="No drafts yet", text_color="gray60"
-            ).pack(pady=10)
-        for draft in drafts:
-            self._create_draft_card(draft)
-
-        # 投稿履歴
-        history = controller.get_recent_history()
-        if not history:
-            ctk.CTkLabel(
-                self._history_frame, text="No posts yet", text_color="gray60"
-            ).pack(pady=10)
-        for record in history:
-            self._create_history_card(record)
-
-    def _create_draft_card(self, draft: dict[str, str]) -> None:
-        """下書きカードを作成する。"""
-        card = ctk.CTkFrame(self._drafts_frame, corner_radius=8)
-        card.pack(fill="x", pady=4, padx=4)
-
-        title = ctk.CTkLabel(
-            card,
-            text=draft.get("title", "Untitled"),
-            font=ctk.CTkFont(size=14, weight="bold"),
-            anchor="w",
+        # 投稿統計はワーカースレッドで集計し、取得中は読み込み中と表示する
+        self._stats_request += 1
+        request = self._stats_request
+        self._show_stats_placeholder("Loading...")
+        controller.request_publish_stats(
+            on_success=lambda stats: self._after(self._on_stats_loaded, request, stats),
+            on_error=lambda err: self._after(self._on_stats_failed, request),
         )
-        title.pack(padx=10, pady=(8, 2), anchor="w")
 
-        info = ctk.CTkLabel(
-            card,
-            text=draft.get("updated_at", ""),
-            font=ctk.CTkFont(size=11),
-            text_color="gray60",
-            anchor="w",
+        # 下書き一覧と投稿履歴は表示範囲に合わせてページ単位で取得する
+        self._drafts_list.reload()
+        self._history_list.reload()
+
+    def _after(self, callback: Callable[..., None], *args: Any) -> None:
+        """ワーカースレッドからの結果をGUIスレッドで処理する。"""
+        if self.frame is not None:
+            self.frame.after(0, callback, *args)
+
+    def _on_stats_loaded(self, request: int, stats: list[dict[str, Any]]) -> None:
+        """投稿統計の取得完了時（GUIスレッドで呼ばれる）。"""
+        if request == self._stats_request:
+            self._show_stats(stats)
+
+    def _on_stats_failed(self, request: int) -> None:
+        """投稿統計の取得失敗時（GUIスレッドで呼ばれる）。"""
+        if request == self._stats_request:
+            self._show_stats_placeholder("Failed to load stats")
+
+    def _show_stats_placeholder(self, text: str) -> None:
+        """投稿統計の欄に1行のメッセージを表示する。"""
+        for child in self._stats_frame.winfo_children():
+            child.destroy()
+        ctk.CTkLabel(self._stats_frame, text=text, text_color="gray60").pack(
+            padx=10, pady=10, anchor="w"
         )
-        info.pack(padx=10, pady=(0, 8), anchor="w")
 
-        card.bind(
-            "<Button-1>",
-            lambda e, d=draft: self._on_draft_click(d),
-        )
+    def _show_stats(self, stats: list[dict[str, Any]]) -> None:
+        """投稿統計を表示する。"""
+        if not stats:
+            self._show_stats_placeholder("No posts in this period")
+            return
 
-    def _create_history_card(self, record: dict[str, Any]) -> None:
-        """投稿履歴カードを作成する。"""
-        card = ctk.CTkFrame(self._history_frame, corner_radius=8)
-        card.pack(fill="x", pady=4, padx=4)
+        for child in self._stats_frame.winfo_children():
+            child.destroy()
 
-        title = ctk.CTkLabel(
-            card,
-            text=record.get("title", "Untitled"),
+        total = sum(int(s["total"]) for s in stats)
+        published = sum(int(s["published"]) for s in stats)
+        failed = sum(int(s["failed"]) for s in stats)
+        ctk.CTkLabel(
+            self._stats_frame,
+            text=f"{total} posts ({published} published / {failed} failed)",
             font=ctk.CTkFont(size=14, weight="bold"),
             anchor="w",
-        )
-        title.pack(padx=10, pady=(8, 2), anchor="w")
+        ).pack(padx=10, pady=(8, 2), anchor="w")
+
+        for stat in stats:
+            ctk.CTkLabel(
+                self._stats_frame,
+                text=(
+                    f"{stat['key']}: {stat['total']} "
+                    f"(published {stat['published']} / failed {stat['failed']})"
+                ),
+                font=ctk.CTkFont(size=12),
+                text_color="gray60",
+                anchor="w",
+            ).pack(padx=10, pady=(0, 2), anchor="w")
+        ctk.CTkFrame(self._stats_frame, height=6, fg_color="transparent").pack()
+
+    def _request_drafts(
+        self,
+        limit: int,
+        offset: int,
+        on_success: Callable[[list[dict[str, Any]]], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """下書き一覧の1ページの取得を開始する。"""
+        controller = self.navigation.context.get("home_controller")
+        if controller is None:
+            on_success([])
+            return
+        controller.request_recent_drafts(limit, offset, on_success, on_error)
+
+    def _request_history(
+        self,
+        limit: int,
+        offset: int,
+        on_success: Callable[[list[dict[str, Any]]], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        """投稿履歴一覧の1ページの取得を開始する。"""
+        controller = self.navigation.context.get("home_controller")
+        if controller is None:
+            on_success([])
+            return
+        controller.request_recent_history(limit, offset, on_success, on_error)
+
+    @staticmethod
+    def _format_draft_row(draft: dict[str, Any]) -> tuple[str, str]:
+        """下書きの行に表示するテキストを返す。"""
+        return draft.get("title", "Untitled"), draft.get("updated_at", "")
 
+    @staticmethod
+    def _format_history_row(record: dict[str, Any]) -> tuple[str, str]:
+        """投稿履歴の行に表示するテキストを返す。"""
         service_name = record.get("service_name", "")
         status = record.get("status", "")
-        info = ctk.CTkLabel(
-            card,
-            text=f"{service_name} - {status}",
-            font=ctk.CTkFont(size=11),
-            text_color="gray60",
-            anchor="w",
-        )
-        info.pack(padx=10, pady=(0, 8), anchor="w")
+        return record.get("title", "Untitled"), f"{service_name} - {status}"
 
-    def _on_draft_click(self, draft: dict[str, str]) -> None:
+    def _on_draft_click(self, draft: dict[str, Any]) -> None:
         """下書きカードクリック時の処理。"""
         draft_id = draft.get("id", "")
         if draft_id:
@@ -34,6 +34,7 @@ SERVICE_FIELDS: dict[str, list[tuple[str, str, bool]]] = {
     "Ameba": [
         ("sender_email", "From Email", False),
         ("recipient_email", "To Email", False),
+        ("smtp_password", "SMTP Password", True),
     ],
 }
 
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 import customtkinter as ctk
 
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 class SettingsView(BaseView):
     """設定画面。"""
 
+    retain = True
+
     def __init__(self, parent: ctk.CTkFrame, navigation: NavigationManager) -> None:
         super().__init__(parent, navigation)
 
@@ -36,9 +39,6 @@ class SettingsView(BaseView):
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=10)
 
         settings_controller = self.navigation.context.get("settings_controller")
-        settings = {}
-        if settings_controller:
-            settings = settings_controller.get_app_settings()
 
         # AI設定セクション
         self._create_section_header(scroll_frame, "AI Settings")
@@ -52,11 +52,6 @@ class SettingsView(BaseView):
         self._api_key_entry = ctk.CTkEntry(api_frame, show="*")
         self._api_key_entry.pack(side="left", fill="x", expand=True)
 
-        if settings_controller:
-            display = settings_controller.get_api_key_display()
-            if display:
-                self._api_key_entry.insert(0, display)
-
         ctk.CTkButton(
             api_frame, text="Save", width=60, command=self._save_api_key
         ).pack(side="left", padx=(5, 0))
@@ -67,7 +62,7 @@ class SettingsView(BaseView):
         ctk.CTkLabel(model_frame, text="Model:", width=150, anchor="w").pack(
             side="left"
         )
-        self._model_var = ctk.StringVar(value=str(settings.get("model", "gpt-4o")))
+        self._model_var = ctk.StringVar(value="gpt-4o")
         ctk.CTkOptionMenu(
             model_frame,
             values=["gpt-4o", "gpt-4o-mini", "gpt-4-turbo"],
@@ -83,7 +78,7 @@ class SettingsView(BaseView):
         ctk.CTkLabel(theme_frame, text="Theme:", width=150, anchor="w").pack(
             side="left"
         )
-        self._theme_var = ctk.StringVar(value=str(settings.get("theme", "dark")))
+        self._theme_var = ctk.StringVar(value="dark")
         ctk.CTkOptionMenu(
             theme_frame,
             values=["dark", "light"],
@@ -96,7 +91,7 @@ class SettingsView(BaseView):
         ctk.CTkLabel(font_frame, text="Font Size:", width=150, anchor="w").pack(
             side="left"
         )
-        self._font_var = ctk.StringVar(value=str(settings.get("font_size", 14)))
+        self._font_var = ctk.StringVar(value="14")
         ctk.CTkOptionMenu(
             font_frame,
             values=["12", "14", "16", "18", "20"],
@@ -112,9 +107,7 @@ class SettingsView(BaseView):
         ctk.CTkLabel(save_frame, text="Auto Save:", width=150, anchor="w").pack(
             side="left"
         )
-        self._save_var = ctk.StringVar(
-            value=str(settings.get("auto_save_interval", 30))
-        )
+        self._save_var = ctk.StringVar(value="30")
         ctk.CTkOptionMenu(
             save_frame,
             values=["15", "30", "60", "120"],
@@ -127,9 +120,7 @@ class SettingsView(BaseView):
         ctk.CTkLabel(
             preview_frame, text="Preview Position:", width=150, anchor="w"
         ).pack(side="left")
-        self._preview_var = ctk.StringVar(
-            value=str(settings.get("preview_position", "right"))
-        )
+        self._preview_var = ctk.StringVar(value="right")
         ctk.CTkOptionMenu(
             preview_frame,
             values=["right", "bottom"],
@@ -170,6 +161,30 @@ class SettingsView(BaseView):
             command=self.navigation.go_back,
         ).pack(side="right", padx=5)
 
+        self._load_settings()
+
+    def refresh(self, **kwargs: Any) -> None:
+        """保存済みの設定値を読み込み直す（未保存の変更は破棄する）。"""
+        self._load_settings()
+
+    def _load_settings(self) -> None:
+        """保存済みの設定値を各入力欄に反映する。"""
+        settings_controller = self.navigation.context.get("settings_controller")
+        if settings_controller is None:
+            return
+
+        settings = settings_controller.get_app_settings()
+        self._model_var.set(str(settings.get("model", "gpt-4o")))
+        self._theme_var.set(str(settings.get("theme", "dark")))
+        self._font_var.set(str(settings.get("font_size", 14)))
+        self._save_var.set(str(settings.get("auto_save_interval", 30)))
+        self._preview_var.set(str(settings.get("preview_position", "right")))
+
+        self._api_key_entry.delete(0, "end")
+        display = settings_controller.get_api_key_display()
+        if display:
+            self._api_key_entry.insert(0, display)
+
     @staticmethod
     def _create_section_header(parent: ctk.CTkFrame, title: str) -> None:
         """セクションヘッダーを作成する。"""
@@ -222,8 +237,8 @@ class SettingsView(BaseView):
 
         try:
             settings_controller.reset_to_defaults()
-            # 画面を再構築
-            self.show()
+            # 初期値を画面に反映
+            self._load_settings()
             logger.info("設定をリセットしました")
         except Exception:
             logger.exception("設定のリセットに失敗しました")
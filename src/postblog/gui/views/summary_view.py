@@ -131,20 +131,6 @@ class SummaryView(BaseView):
         if hearing_result is None:
             return
 
-        try:
-            article_controller.generate_article(
-                hearing_result,
-                on_success=lambda result: self._on_generate_success(),
-                on_error=lambda err: self._on_generate_error(err),
-            )
-            self.navigation.navigate("editor")
-        except Exception:
-            logger.exception("記事生成の開始に失敗しました")
-
-    def _on_generate_success(self) -> None:
-        """記事生成成功時。"""
-        logger.info("記事生成が完了しました")
-
-    def _on_generate_error(self, error: Exception) -> None:
-        """記事生成エラー時。"""
-        logger.error("記事生成エラー: %s", error)
+        # 生成は記事エディタ画面で開始し、本文をストリーミング表示する
+        self.navigation.context["generate_hearing_result"] = hearing_result
+        self.navigation.navigate("editor")
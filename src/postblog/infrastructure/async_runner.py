@@ -25,6 +25,7 @@ class AsyncRunner:
     def __init__(self) -> None:
         self._loop: asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None = None
+        self._shutdown_hooks: list[Callable[[], Coroutine[Any, Any, Any]]] = []
 
     def start(self) -> None:
         """バックグラウンドイベントループを開始する。"""
@@ -43,8 +44,30 @@ class AsyncRunner:
         asyncio.set_event_loop(self._loop)
         self._loop.run_forever()
 
+    def add_shutdown_hook(self, hook: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+        """停止時にイベントループ上で実行する後始末処理を登録する。
+
+        ループ上で生成した共有リソース（HTTPクライアント等）を閉じるために使用する。
+
+        Args:
+            hook: コルーチンを返す関数。
+        """
+        self._shutdown_hooks.append(hook)
+
+    def _run_shutdown_hooks(self) -> None:
+        """登録された後始末処理をイベントループ上で実行する。"""
+        if self._loop is None or not self._loop.is_running():
+            return
+        for hook in self._shutdown_hooks:
+            future = asyncio.run_coroutine_threadsafe(hook(), self._loop)
+            try:
+                future.result(timeout=5.0)
+            except Exception as e:
+                logger.error("停止処理でエラーが発生しました: %s", e)
+
     def stop(self) -> None:
         """イベントループを停止する。"""
+        self._run_shutdown_hooks()
         if self._loop is not None:
             self._loop.call_soon_threadsafe(self._loop.stop)
             self._loop = None
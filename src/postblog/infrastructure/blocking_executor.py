@@ -0,0 +1,89 @@
+"""ブロッキング処理のオフロード。
+
+SMTP送信やGit操作などのブロッキング処理をスレッドプールで実行し、
+AsyncRunner のイベントループを止めないようにする。
+"""
+
+import asyncio
+import functools
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """ブロッキング処理を専用スレッドプールで実行するクラス。
+
+    投稿クライアントごとにインスタンスを持ち、スレッド数を個別に設定する。
+    待機中にタスクがキャンセルまたはタイムアウトした場合、未開始の処理は
+    実行されずに破棄される。実行中の処理はスレッドを中断できないため、
+    処理側でもソケットタイムアウト等を設定すること。
+
+    Args:
+        max_workers: スレッド数。
+        name: スレッド名の接頭辞。
+    """
+
+    def __init__(self, max_workers: int = 1, name: str = "blocking") -> None:
+        self._max_workers = max_workers
+        self._name = name
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def max_workers(self) -> int:
+        """スレッド数を返す。"""
+        return self._max_workers
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """スレッドプールを取得する。未生成の場合は生成する。
+
+        Returns:
+            スレッドプール。
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix=self._name
+            )
+        return self._executor
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> T:
+        """ブロッキング関数をスレッドプールで実行し、完了を待つ。
+
+        Args:
+            func: 実行する関数。
+            *args: 関数に渡す引数。
+            timeout: タイムアウト（秒）。Noneの場合は無制限。
+
+        Returns:
+            関数の戻り値。
+
+        Raises:
+            TimeoutError: タイムアウトした場合。
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._get_executor(), functools.partial(func, *args)
+        )
+        try:
+            async with asyncio.timeout(timeout):
+                return await future
+        except TimeoutError:
+            logger.warning("ブロッキング処理がタイムアウトしました: %s", self._name)
+            raise
+
+    def shutdown(self) -> None:
+        """スレッドプールを停止する。未開始の処理は破棄する。"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -2,12 +2,11 @@
 
 OS標準のキーチェーン（keyring）を使用して、
 APIキーやトークンなどの機密情報を安全に管理する。
+keyring の読み込みには時間がかかるため、最初の操作時に読み込む。
 """
 
 import logging
 
-import keyring
-
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +28,8 @@ class CredentialManager:
             credential_type: 認証情報の種類（例: "api_token"）。
             value: 認証情報の値。
         """
+        import keyring
+
         key = self._build_key(service_name, credential_type)
         keyring.set_password(SERVICE_PREFIX, key, value)
         logger.info(
@@ -45,6 +46,8 @@ class CredentialManager:
         Returns:
             認証情報の値。存在しない場合はNone。
         """
+        import keyring
+
         key = self._build_key(service_name, credential_type)
         value = keyring.get_password(SERVICE_PREFIX, key)
         if value is None:
@@ -65,6 +68,9 @@ class CredentialManager:
         Returns:
             削除に成功した場合True。
         """
+        import keyring
+        import keyring.errors
+
         key = self._build_key(service_name, credential_type)
         try:
             keyring.delete_password(SERVICE_PREFIX, key)
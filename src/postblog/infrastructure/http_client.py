@@ -0,0 +1,120 @@
+"""共有HTTPクライアント。
+
+投稿クライアント間で1つの httpx.AsyncClient を共有し、
+接続プール・Keep-Alive・HTTP/2（h2 がインストールされている場合）を利用する。
+クライアントは AsyncRunner のイベントループ上で生成・破棄される。
+"""
+
+import importlib.util
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import httpx
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HttpClientConfig:
+    """共有HTTPクライアントの設定。
+
+    Args:
+        max_connections: 全体の最大同時接続数。
+        max_keepalive_connections: Keep-Aliveで保持する最大接続数。
+        keepalive_expiry: Keep-Alive接続を保持する秒数。
+        timeout: デフォルトのタイムアウト（秒）。
+        connect_timeout: 接続確立のタイムアウト（秒）。
+        http2: HTTP/2を使用するか（h2 がない場合は無視される）。
+    """
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    http2: bool = True
+
+
+def is_http2_available() -> bool:
+    """HTTP/2 に必要な h2 パッケージが利用可能かを返す。
+
+    Returns:
+        利用可能な場合True。
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+class SharedHttpClient:
+    """投稿クライアント間で共有する httpx.AsyncClient の管理クラス。
+
+    httpx の接続プールは接続先（スキーム・ホスト・ポート）ごとに接続を保持するため、
+    同じサービスへの投稿や接続テストは確立済みの接続を再利用する。
+    クライアントは最初に使用したイベントループに結び付くため、
+    AsyncRunner のループ上でのみ使用すること。
+
+    Args:
+        config: HTTPクライアント設定（Noneの場合はデフォルト）。
+    """
+
+    def __init__(self, config: HttpClientConfig | None = None) -> None:
+        self._config = config or HttpClientConfig()
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def config(self) -> HttpClientConfig:
+        """HTTPクライアント設定を返す。"""
+        return self._config
+
+    def get(self) -> httpx.AsyncClient:
+        """共有クライアントを取得する。未生成の場合は生成する。
+
+        Returns:
+            httpx.AsyncClient。
+        """
+        if self._client is None or self._client.is_closed:
+            config = self._config
+            http2 = config.http2 and is_http2_available()
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_keepalive_connections,
+                    keepalive_expiry=config.keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            )
+            logger.info("共有HTTPクライアントを生成しました: http2=%s", http2)
+        return self._client
+
+    async def aclose(self) -> None:
+        """共有クライアントを閉じる。"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info("共有HTTPクライアントを閉じました")
+
+
+@asynccontextmanager
+async def http_session(
+    shared: SharedHttpClient | None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTPクライアントを取得するコンテキストマネージャ。
+
+    共有クライアントが指定されている場合はそれを返し（終了時に閉じない）、
+    指定されていない場合は一時的なクライアントを生成して終了時に閉じる。
+
+    Args:
+        shared: 共有HTTPクライアント。
+
+    Yields:
+        httpx.AsyncClient。
+    """
+    if shared is not None:
+        yield shared.get()
+        return
+
+    async with httpx.AsyncClient() as client:
+        yield client
@@ -16,6 +16,8 @@ class LLMClient(ABC):
         messages: list[dict[str, str]],
         model: str | None = None,
         temperature: float = 0.7,
+        *,
+        use_cache: bool = True,
     ) -> str:
         """チャット補完を実行する。
 
@@ -23,6 +25,8 @@ class LLMClient(ABC):
             messages: メッセージリスト（role, content）。
             model: 使用するモデル名（Noneの場合はデフォルト）。
             temperature: 生成時の温度パラメータ。
+            use_cache: Falseの場合は応答キャッシュを参照しない
+                （キャッシュを持たない実装では無視する）。
 
         Returns:
             LLMの応答テキスト。
@@ -34,6 +38,8 @@ class LLMClient(ABC):
         messages: list[dict[str, str]],
         model: str | None = None,
         temperature: float = 0.7,
+        *,
+        use_cache: bool = True,
     ) -> AsyncIterator[str]:
         """ストリーミングでチャット補完を実行する。
 
@@ -41,6 +47,8 @@ class LLMClient(ABC):
             messages: メッセージリスト（role, content）。
             model: 使用するモデル名（Noneの場合はデフォルト）。
             temperature: 生成時の温度パラメータ。
+            use_cache: Falseの場合は応答キャッシュを参照しない
+                （キャッシュを持たない実装では無視する）。
 
         Yields:
             応答テキストのチャンク。
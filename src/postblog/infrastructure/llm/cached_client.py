@@ -0,0 +1,292 @@
+"""LLM応答キャッシュ。
+
+同一のモデル・温度・メッセージに対する応答を ~/.postblog/llm_cache.db に
+保存し、LLMClient をラップして再利用する。有効期限（TTL）と
+最大件数による LRU 方式の削除に対応する。
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from postblog.infrastructure.llm.base import LLMClient
+
+
+logger = logging.getLogger(__name__)
+
+# デフォルトキャッシュDBパス
+DEFAULT_CACHE_PATH = Path.home() / ".postblog" / "llm_cache.db"
+
+# デフォルトの有効期限（秒）
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# デフォルトの最大保持件数
+DEFAULT_MAX_ENTRIES = 500
+
+CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at ON llm_cache (accessed_at);
+"""
+
+
+def make_cache_key(
+    messages: list[dict[str, str]], model: str, temperature: float
+) -> str:
+    """キャッシュキーを生成する。
+
+    メッセージは role と content のみを対象とし、改行コードと前後の空白を
+    正規化してからハッシュ化する。
+
+    Args:
+        messages: メッセージリスト（role, content）。
+        model: モデル名。
+        temperature: 温度パラメータ。
+
+    Returns:
+        SHA-256 ハッシュの16進文字列。
+    """
+    normalized = [
+        {
+            "role": msg.get("role", ""),
+            "content": msg.get("content", "").replace("\r\n", "\n").strip(),
+        }
+        for msg in messages
+    ]
+    payload = json.dumps(
+        {"model": model, "temperature": temperature, "messages": normalized},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLiteを使用したLLM応答キャッシュ。
+
+    Args:
+        db_path: キャッシュDBのパス（":memory:" でインメモリDB）。
+        ttl_seconds: 有効期限（秒）。
+        max_entries: 最大保持件数。超えた分は最終参照が古い順に削除する。
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._db_path = str(db_path)
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """キャッシュDBに接続する（初回のみスキーマを作成する）。
+
+        Returns:
+            SQLite接続オブジェクト。
+        """
+        if self._connection is not None:
+            return self._connection
+
+        if self._db_path != ":memory:":
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._connection.executescript(CACHE_SCHEMA_SQL)
+        self._connection.commit()
+        logger.info("LLM応答キャッシュに接続しました: %s", self._db_path)
+        return self._connection
+
+    def get(self, key: str) -> str | None:
+        """キャッシュされた応答を取得する。
+
+        有効期限切れのエントリは削除してNoneを返す。
+
+        Args:
+            key: キャッシュキー。
+
+        Returns:
+            応答テキスト。存在しない場合はNone。
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            if now - created_at > self._ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+
+            conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            conn.commit()
+            return str(response)
+
+    def put(self, key: str, response: str) -> None:
+        """応答をキャッシュに保存し、上限を超えた分を削除する。
+
+        Args:
+            key: キャッシュキー。
+            response: 応答テキスト。
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除する。"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+        logger.info("LLM応答キャッシュを削除しました")
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """キャッシュDBの接続を閉じる。"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class CachedLLMClient(LLMClient):
+    """応答をキャッシュするLLMクライアント。
+
+    他の LLMClient をラップし、同一入力に対する応答をキャッシュから返す。
+    キャッシュDBの読み書きはイベントループを止めないようワーカースレッドで行う。
+
+    Args:
+        client: ラップするLLMクライアント。
+        cache: 応答キャッシュ。
+        default_model: modelが指定されない場合にキャッシュキーに使うモデル名。
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: LLMResponseCache,
+        default_model: str = "",
+    ) -> None:
+        self._client = client
+        self._cache = cache
+        self._default_model = default_model
+
+    def _key(
+        self, messages: list[dict[str, str]], model: str | None, temperature: float
+    ) -> str:
+        """キャッシュキーを生成する。"""
+        return make_cache_key(messages, model or self._default_model, temperature)
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        *,
+        use_cache: bool = True,
+    ) -> str:
+        """チャット補完を実行する（キャッシュがあれば再利用する）。
+
+        Args:
+            messages: メッセージリスト（role, content）。
+            model: 使用するモデル名（Noneの場合はデフォルト）。
+            temperature: 生成時の温度パラメータ。
+            use_cache: Falseの場合はキャッシュを参照せずに問い合わせる
+                （応答はキャッシュに保存し直す）。
+
+        Returns:
+            LLMの応答テキスト。
+        """
+        key = self._key(messages, model, temperature)
+        if use_cache:
+            cached = await asyncio.to_thread(self._cache.get, key)
+            if cached is not None:
+                logger.debug("LLM応答をキャッシュから返します")
+                return cached
+
+        response = await self._client.chat(messages, model, temperature)
+        await asyncio.to_thread(self._cache.put, key, response)
+        return response
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        *,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """ストリーミングでチャット補完を実行する（キャッシュがあれば再利用する）。
+
+        キャッシュがある場合は応答全体を1チャンクとして返す。
+        ストリームが最後まで受信できた場合のみキャッシュに保存する。
+
+        Args:
+            messages: メッセージリスト（role, content）。
+            model: 使用するモデル名（Noneの場合はデフォルト）。
+            temperature: 生成時の温度パラメータ。
+            use_cache: Falseの場合はキャッシュを参照せずに問い合わせる
+                （応答はキャッシュに保存し直す）。
+
+        Yields:
+            応答テキストのチャンク。
+        """
+        key = self._key(messages, model, temperature)
+        if use_cache:
+            cached = await asyncio.to_thread(self._cache.get, key)
+            if cached is not None:
+                logger.debug("LLM応答をキャッシュから返します（ストリーミング）")
+                yield cached
+                return
+
+        chunks: list[str] = []
+        async for chunk in self._client.chat_stream(messages, model, temperature):
+            chunks.append(chunk)
+            yield chunk
+        await asyncio.to_thread(self._cache.put, key, "".join(chunks))
+
+    async def test_connection(self) -> bool:
+        """接続テストを実行する（キャッシュは使用しない）。
+
+        Returns:
+            接続成功の場合True。
+        """
+        return await self._client.test_connection()
@@ -0,0 +1,122 @@
+"""遅延生成LLMクライアント。
+
+プロバイダーのSDK（openai 等）の読み込みとAPIキーの取得は起動時間の
+大半を占めるため、ラップ先のクライアントを最初に必要になった時点、
+またはバックグラウンドでの warm_up() 呼び出し時に生成する。
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable
+
+from postblog.infrastructure.llm.base import LLMClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class LazyLLMClient(LLMClient):
+    """ラップ先のクライアントを遅延生成するLLMクライアント。
+
+    Args:
+        factory: ラップ先のLLMクライアントを生成する関数。
+    """
+
+    def __init__(self, factory: Callable[[], LLMClient]) -> None:
+        self._factory = factory
+        self._client: LLMClient | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_ready(self) -> bool:
+        """ラップ先のクライアントが生成済みの場合True。"""
+        return self._client is not None
+
+    def warm_up(self) -> None:
+        """ラップ先のクライアントを生成する（バックグラウンドスレッドから呼ぶ）。
+
+        生成に失敗した場合はログに記録し、次回の使用時に再度生成を試みる。
+        """
+        try:
+            self._get()
+        except Exception:
+            logger.exception("LLMクライアントの事前生成に失敗しました")
+
+    def _get(self) -> LLMClient:
+        """ラップ先のクライアントを取得する。未生成の場合は生成する。
+
+        Returns:
+            ラップ先のLLMクライアント。
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = self._factory()
+                logger.info("LLMクライアントを生成しました")
+            return self._client
+
+    async def _aget(self) -> LLMClient:
+        """イベントループを止めずにラップ先のクライアントを取得する。
+
+        Returns:
+            ラップ先のLLMクライアント。
+        """
+        if self._client is not None:
+            return self._client
+        return await asyncio.to_thread(self._get)
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        *,
+        use_cache: bool = True,
+    ) -> str:
+        """チャット補完を実行する。
+
+        Args:
+            messages: メッセージリスト（role, content）。
+            model: 使用するモデル名（Noneの場合はデフォルト）。
+            temperature: 生成時の温度パラメータ。
+            use_cache: Falseの場合は応答キャッシュを参照しない。
+
+        Returns:
+            LLMの応答テキスト。
+        """
+        client = await self._aget()
+        return await client.chat(messages, model, temperature, use_cache=use_cache)
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None = None,
+        temperature: float = 0.7,
+        *,
+        use_cache: bool = True,
+    ) -> AsyncIterator[str]:
+        """ストリーミングでチャット補完を実行する。
+
+        Args:
+            messages: メッセージリスト（role, content）。
+            model: 使用するモデル名（Noneの場合はデフォルト）。
+            temperature: 生成時の温度パラメータ。
+            use_cache: Falseの場合は応答キャッシュを参照しない。
+
+        Yields:
+            応答テキストのチャンク。
+        """
+        client = await self._aget()
+        async for chunk in client.chat_stream(
+            messages, model, temperature, use_cache=use_cache
+        ):
+            yield chunk
+
+    async def test_connection(self) -> bool:
+        """接続テストを実行する。
+
+        Returns:
+            接続成功の場合True。
+        """
+        client = await self._aget()
+        return await client.test_connection()
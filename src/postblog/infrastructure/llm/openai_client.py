@@ -30,6 +30,8 @@ class OpenAIClient(LLMClient):
         messages: list[dict[str, str]],
         model: str | None = None,
         temperature: float = 0.7,
+        *,
+        use_cache: bool = True,  # noqa: ARG002
     ) -> str:
         """チャット補完を実行する。
 
@@ -37,6 +39,7 @@ class OpenAIClient(LLMClient):
             messages: メッセージリスト。
             model: 使用するモデル名。
             temperature: 温度パラメータ。
+            use_cache: 応答キャッシュの使用有無（キャッシュを持たないため無視する）。
 
         Returns:
             LLMの応答テキスト。
@@ -61,6 +64,8 @@ class OpenAIClient(LLMClient):
         messages: list[dict[str, str]],
         model: str | None = None,
         temperature: float = 0.7,
+        *,
+        use_cache: bool = True,  # noqa: ARG002
     ) -> AsyncIterator[str]:
         """ストリーミングでチャット補完を実行する。
 
@@ -68,6 +73,7 @@ class OpenAIClient(LLMClient):
             messages: メッセージリスト。
             model: 使用するモデル名。
             temperature: 温度パラメータ。
+            use_cache: 応答キャッシュの使用有無（キャッシュを持たないため無視する）。
 
         Yields:
             応答テキストのチャンク。
@@ -7,12 +7,19 @@ import logging
 import smtplib
 from email.mime.text import MIMEText
 
+from postblog.infrastructure.blocking_executor import BlockingExecutor
 from postblog.infrastructure.publishers.base import BlogPublisher
 from postblog.models.publish_result import PublishRequest, PublishResult
 
 
 logger = logging.getLogger(__name__)
 
+# SMTP処理のタイムアウト（秒）
+SMTP_TIMEOUT = 30.0
+
+# 接続テストのタイムアウト（秒）
+TEST_CONNECTION_TIMEOUT = 10.0
+
 
 class AmebaPublisher(BlogPublisher):
     """Amebaブログへの記事投稿クライアント（メール投稿）。
@@ -23,6 +30,8 @@ class AmebaPublisher(BlogPublisher):
         smtp_server: SMTPサーバーアドレス。
         smtp_port: SMTPポート番号。
         smtp_password: SMTPパスワード。
+        executor: SMTP処理を実行するスレッドプール（Noneの場合は2スレッドで生成する）。
+        timeout: SMTP処理のタイムアウト（秒）。
     """
 
     def __init__(
@@ -32,12 +41,17 @@ class AmebaPublisher(BlogPublisher):
         smtp_server: str = "smtp.gmail.com",
         smtp_port: int = 587,
         smtp_password: str = "",
+        *,
+        executor: BlockingExecutor | None = None,
+        timeout: float = SMTP_TIMEOUT,
     ) -> None:
         self._from_email = from_email
         self._posting_email = posting_email
         self._smtp_server = smtp_server
         self._smtp_port = smtp_port
         self._smtp_password = smtp_password
+        self._executor = executor or BlockingExecutor(max_workers=2, name="ameba")
+        self._timeout = timeout
 
     @property
     def service_name(self) -> str:
@@ -59,10 +73,7 @@ class AmebaPublisher(BlogPublisher):
             msg["From"] = self._from_email
             msg["To"] = self._posting_email
 
-            with smtplib.SMTP(self._smtp_server, self._smtp_port) as server:
-                server.starttls()
-                server.login(self._from_email, self._smtp_password)
-                server.send_message(msg)
+            await self._executor.run(self._send, msg, timeout=self._timeout)
 
             logger.info("Amebaブログにメール投稿しました")
             return PublishResult(
@@ -80,10 +91,29 @@ class AmebaPublisher(BlogPublisher):
     async def test_connection(self) -> bool:
         """接続テストを実行する。"""
         try:
-            with smtplib.SMTP(self._smtp_server, self._smtp_port, timeout=10) as server:
-                server.starttls()
-                server.login(self._from_email, self._smtp_password)
+            await self._executor.run(self._login_check, timeout=TEST_CONNECTION_TIMEOUT)
             return True
         except Exception:
             logger.exception("Amebaブログ接続テストに失敗しました")
             return False
+
+    def _send(self, msg: MIMEText) -> None:
+        """SMTPでメールを送信する（スレッドプールで実行される）。
+
+        Args:
+            msg: 送信するメール。
+        """
+        with smtplib.SMTP(
+            self._smtp_server, self._smtp_port, timeout=self._timeout
+        ) as server:
+            server.starttls()
+            server.login(self._from_email, self._smtp_password)
+            server.send_message(msg)
+
+    def _login_check(self) -> None:
+        """SMTPサーバーにログインできるか確認する（スレッドプールで実行される）。"""
+        with smtplib.SMTP(
+            self._smtp_server, self._smtp_port, timeout=TEST_CONNECTION_TIMEOUT
+        ) as server:
+            server.starttls()
+            server.login(self._from_email, self._smtp_password)
@@ -9,8 +9,7 @@ import secrets
 from base64 import b64encode
 from datetime import UTC, datetime
 
-import httpx
-
+from postblog.infrastructure.http_client import SharedHttpClient, http_session
 from postblog.infrastructure.publishers.base import BlogPublisher
 from postblog.models.publish_result import PublishRequest, PublishResult
 
@@ -25,12 +24,20 @@ class HatenaPublisher(BlogPublisher):
         hatena_id: はてなID。
         blog_id: ブログID。
         api_key: APIキー。
+        http_client: 共有HTTPクライアント（Noneの場合は呼び出しごとに生成する）。
     """
 
-    def __init__(self, hatena_id: str, blog_id: str, api_key: str) -> None:
+    def __init__(
+        self,
+        hatena_id: str,
+        blog_id: str,
+        api_key: str,
+        http_client: SharedHttpClient | None = None,
+    ) -> None:
         self._hatena_id = hatena_id
         self._blog_id = blog_id
         self._api_key = api_key
+        self._http_client = http_client
 
     @property
     def service_name(self) -> str:
@@ -89,7 +96,7 @@ class HatenaPublisher(BlogPublisher):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_session(self._http_client) as client:
                 response = await client.post(
                     url, content=xml_body, headers=headers, timeout=30.0
                 )
@@ -115,7 +122,7 @@ class HatenaPublisher(BlogPublisher):
             "X-WSSE": self._build_wsse_header(),
         }
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_session(self._http_client) as client:
                 response = await client.get(url, headers=headers, timeout=10.0)
                 return response.status_code == 200
         except Exception:
@@ -5,8 +5,7 @@ Qiita API v2を使用した記事投稿。
 
 import logging
 
-import httpx
-
+from postblog.infrastructure.http_client import SharedHttpClient, http_session
 from postblog.infrastructure.publishers.base import BlogPublisher
 from postblog.models.publish_result import PublishRequest, PublishResult
 
@@ -21,10 +20,14 @@ class QiitaPublisher(BlogPublisher):
 
     Args:
         api_token: Qiita個人用アクセストークン。
+        http_client: 共有HTTPクライアント（Noneの場合は呼び出しごとに生成する）。
     """
 
-    def __init__(self, api_token: str) -> None:
+    def __init__(
+        self, api_token: str, http_client: SharedHttpClient | None = None
+    ) -> None:
         self._api_token = api_token
+        self._http_client = http_client
 
     @property
     def service_name(self) -> str:
@@ -52,7 +55,7 @@ class QiitaPublisher(BlogPublisher):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_session(self._http_client) as client:
                 response = await client.post(
                     f"{QIITA_API_BASE}/items",
                     json=payload,
@@ -80,7 +83,7 @@ class QiitaPublisher(BlogPublisher):
         """接続テストを実行する。"""
         headers = {"Authorization": f"Bearer {self._api_token}"}
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_session(self._http_client) as client:
                 response = await client.get(
                     f"{QIITA_API_BASE}/authenticated_user",
                     headers=headers,
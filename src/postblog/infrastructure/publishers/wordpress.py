@@ -5,9 +5,9 @@ WordPress REST APIを使用した記事投稿。
 
 import logging
 
-import httpx
 import mistune
 
+from postblog.infrastructure.http_client import SharedHttpClient, http_session
 from postblog.infrastructure.publishers.base import BlogPublisher
 from postblog.models.publish_result import PublishRequest, PublishResult
 
@@ -22,12 +22,20 @@ class WordPressPublisher(BlogPublisher):
         site_url: WordPressサイトのURL。
         username: ユーザー名。
         password: アプリケーションパスワード。
+        http_client: 共有HTTPクライアント（Noneの場合は呼び出しごとに生成する）。
     """
 
-    def __init__(self, site_url: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        site_url: str,
+        username: str,
+        password: str,
+        http_client: SharedHttpClient | None = None,
+    ) -> None:
         self._site_url = site_url.rstrip("/")
         self._username = username
         self._password = password
+        self._http_client = http_client
 
     @property
     def service_name(self) -> str:
@@ -54,7 +62,7 @@ class WordPressPublisher(BlogPublisher):
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_session(self._http_client) as client:
                 response = await client.post(
                     f"{self._site_url}/wp-json/wp/v2/posts",
                     json=payload,
@@ -81,7 +89,7 @@ class WordPressPublisher(BlogPublisher):
     async def test_connection(self) -> bool:
         """接続テストを実行する。"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with http_session(self._http_client) as client:
                 response = await client.get(
                     f"{self._site_url}/wp-json/wp/v2/users/me",
                     auth=(self._username, self._password),
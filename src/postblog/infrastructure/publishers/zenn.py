@@ -8,12 +8,25 @@ from pathlib import Path
 
 import git
 
+from postblog.infrastructure.blocking_executor import BlockingExecutor
 from postblog.infrastructure.publishers.base import BlogPublisher
 from postblog.models.publish_result import PublishRequest, PublishResult
 
 
 logger = logging.getLogger(__name__)
 
+# commit・pushのタイムアウト（秒）
+GIT_TIMEOUT = 120.0
+
+# 接続テストのタイムアウト（秒）
+TEST_CONNECTION_TIMEOUT = 10.0
+
+# 認証情報の入力待ちでワーカーが止まらないよう、gitを対話なしで実行する環境変数
+NON_INTERACTIVE_GIT_ENV = {
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_SSH_COMMAND": "ssh -o BatchMode=yes",
+}
+
 
 class ZennPublisher(BlogPublisher):
     """Zennへの記事投稿クライアント。
@@ -21,11 +34,24 @@ class ZennPublisher(BlogPublisher):
     Args:
         repo_path: Zenn CLIリポジトリのローカルパス。
         github_token: GitHubアクセストークン。
+        executor: Git操作を実行するスレッドプール（Noneの場合は1スレッドで生成する。
+            同じリポジトリへの操作を直列化するため1スレッドを推奨）。
+        timeout: commit・pushのタイムアウト（秒）。超えた場合はgitのプロセスを
+            終了する。PublishService のZennの投稿タイムアウトより短くすること。
     """
 
-    def __init__(self, repo_path: str, github_token: str) -> None:
+    def __init__(
+        self,
+        repo_path: str,
+        github_token: str,
+        *,
+        executor: BlockingExecutor | None = None,
+        timeout: float = GIT_TIMEOUT,
+    ) -> None:
         self._repo_path = Path(repo_path)
         self._github_token = github_token
+        self._executor = executor or BlockingExecutor(max_workers=1, name="zenn")
+        self._timeout = timeout
 
     @property
     def service_name(self) -> str:
@@ -42,36 +68,11 @@ class ZennPublisher(BlogPublisher):
             投稿結果。
         """
         try:
-            articles_dir = self._repo_path / "articles"
-            articles_dir.mkdir(parents=True, exist_ok=True)
-
-            # スラッグ生成（簡易版）
-            slug = request.title.lower().replace(" ", "-")[:50]
-            article_path = articles_dir / f"{slug}.md"
-
-            # フロントマター生成
-            tags_str = "\n".join(f'  - "{tag}"' for tag in request.tags[:5])
-            published = "true" if request.status == "publish" else "false"
-            content = f"""---
-title: "{request.title}"
-emoji: "📝"
-type: "tech"
-topics:
-{tags_str}
-published: {published}
----
-
-{request.body}
-"""
-            article_path.write_text(content, encoding="utf-8")
-
-            # Git操作
-            repo = git.Repo(self._repo_path)
-            repo.index.add([str(article_path.relative_to(self._repo_path))])
-            repo.index.commit(f"Add article: {request.title}")
-            repo.remotes.origin.push()
+            slug = await self._executor.run(
+                self._commit_and_push, request, timeout=self._timeout
+            )
 
-            logger.info("Zennに投稿しました: %s", article_path.name)
+            logger.info("Zennに投稿しました: %s", slug)
             return PublishResult(
                 success=True,
                 service_name=self.service_name,
@@ -88,8 +89,63 @@ published: {published}
     async def test_connection(self) -> bool:
         """接続テストを実行する。"""
         try:
-            repo = git.Repo(self._repo_path)
-            return repo.remotes.origin.exists()
+            return await self._executor.run(
+                self._origin_exists, timeout=TEST_CONNECTION_TIMEOUT
+            )
         except Exception:
             logger.exception("Zenn接続テストに失敗しました")
             return False
+
+    def _commit_and_push(self, request: PublishRequest) -> str:
+        """記事ファイルを書き出してcommit・pushする（スレッドプールで実行される）。
+
+        Args:
+            request: 投稿リクエスト。
+
+        Returns:
+            記事のスラッグ。
+
+        Raises:
+            git.GitCommandError: pushに失敗した場合（タイムアウトを含む）。
+        """
+        articles_dir = self._repo_path / "articles"
+        articles_dir.mkdir(parents=True, exist_ok=True)
+
+        # スラッグ生成（簡易版）
+        slug = request.title.lower().replace(" ", "-")[:50]
+        article_path = articles_dir / f"{slug}.md"
+
+        # フロントマター生成
+        tags_str = "\n".join(f'  - "{tag}"' for tag in request.tags[:5])
+        published = "true" if request.status == "publish" else "false"
+        content = f"""---
+title: "{request.title}"
+emoji: "📝"
+type: "tech"
+topics:
+{tags_str}
+published: {published}
+---
+
+{request.body}
+"""
+        article_path.write_text(content, encoding="utf-8")
+
+        # Git操作
+        repo = git.Repo(self._repo_path)
+        repo.index.add([str(article_path.relative_to(self._repo_path))])
+        repo.index.commit(f"Add article: {request.title}")
+        # ワーカーは1スレッドのため、応答しないpushは後続の投稿を止めてしまう。
+        # 待機側のタイムアウトだけでなく、gitのプロセス自体を打ち切る
+        with repo.git.custom_environment(**NON_INTERACTIVE_GIT_ENV):
+            repo.remotes.origin.push(kill_after_timeout=self._timeout).raise_if_error()
+        return slug
+
+    def _origin_exists(self) -> bool:
+        """リモートoriginが存在するか確認する（スレッドプールで実行される）。
+
+        Returns:
+            存在する場合True。
+        """
+        repo = git.Repo(self._repo_path)
+        return bool(repo.remotes.origin.exists())
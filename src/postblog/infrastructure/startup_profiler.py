@@ -0,0 +1,112 @@
+"""起動時間の計測。
+
+起動処理をフェーズごとに計測し、最初の画面が表示されるまでの時間を
+起動時間の目標（STARTUP_BUDGET_SECONDS）と比較して報告する。
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+# 最初の画面が表示されるまでの目標時間（秒）
+STARTUP_BUDGET_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """起動フェーズの計測結果。
+
+    Args:
+        name: フェーズ名。
+        seconds: 所要時間（秒）。
+        background: 最初の画面表示後にバックグラウンドで実行したフェーズの場合True。
+    """
+
+    name: str
+    seconds: float
+    background: bool = False
+
+
+class StartupProfiler:
+    """起動処理のフェーズごとの所要時間を計測する。
+
+    バックグラウンドスレッドからのフェーズ記録にも対応する。
+
+    Args:
+        clock: 経過時間の計測に使う時計関数（秒）。
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._started_at = clock()
+        self._first_frame: float | None = None
+        self._timings: list[PhaseTiming] = []
+        self._lock = threading.Lock()
+
+    @property
+    def timings(self) -> list[PhaseTiming]:
+        """記録済みのフェーズの計測結果（記録順）。"""
+        with self._lock:
+            return list(self._timings)
+
+    @property
+    def first_frame_seconds(self) -> float | None:
+        """起動開始から最初の画面表示までの時間（秒）。未表示の場合はNone。"""
+        return self._first_frame
+
+    @contextmanager
+    def phase(self, name: str, *, background: bool = False) -> Iterator[None]:
+        """with ブロックの所要時間をフェーズとして記録する。
+
+        Args:
+            name: フェーズ名。
+            background: バックグラウンドで実行するフェーズの場合True。
+
+        Yields:
+            None。
+        """
+        started_at = self._clock()
+        try:
+            yield
+        finally:
+            timing = PhaseTiming(name, self._clock() - started_at, background)
+            with self._lock:
+                self._timings.append(timing)
+
+    def mark_first_frame(self) -> float:
+        """最初の画面が表示された時点を記録する。
+
+        Returns:
+            起動開始からの経過時間（秒）。
+        """
+        if self._first_frame is None:
+            self._first_frame = self._clock() - self._started_at
+        return self._first_frame
+
+    def report(self, budget: float = STARTUP_BUDGET_SECONDS) -> str:
+        """計測結果を表形式の文字列にする。
+
+        Args:
+            budget: 最初の画面表示までの目標時間（秒）。
+
+        Returns:
+            フェーズごとの所要時間と目標との比較を含む複数行の文字列。
+        """
+        timings = self.timings
+        width = max([len(t.name) for t in timings] + [len("first frame")]) + 2
+        lines = ["startup profile:"]
+        for timing in timings:
+            suffix = "  (background)" if timing.background else ""
+            lines.append(
+                f"  {timing.name:<{width}}{timing.seconds * 1000:8.1f} ms{suffix}"
+            )
+        if self._first_frame is not None:
+            verdict = "OK" if self._first_frame <= budget else "OVER BUDGET"
+            lines.append(
+                f"  {'first frame':<{width}}{self._first_frame * 1000:8.1f} ms"
+                f"  [{verdict}: budget {budget * 1000:.0f} ms]"
+            )
+        return "\n".join(lines)
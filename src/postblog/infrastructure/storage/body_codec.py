@@ -0,0 +1,62 @@
+"""下書き本文の保存形式（圧縮コーデック）モジュール。
+
+閾値を超える本文を zlib 圧縮して drafts.body_compressed 列（BLOB）に保存し、
+その場合 drafts.body 列は空文字列にする。
+"""
+
+import zlib
+from dataclasses import dataclass
+
+
+# 圧縮する本文の最小サイズ（UTF-8 のバイト数）
+COMPRESSION_THRESHOLD = 4096
+
+# zlib の圧縮レベル
+COMPRESSION_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class BodyCodec:
+    """下書き本文の圧縮コーデック。
+
+    Args:
+        threshold: 圧縮する本文の最小サイズ（UTF-8 のバイト数）。
+        level: zlib の圧縮レベル（1〜9）。
+    """
+
+    threshold: int = COMPRESSION_THRESHOLD
+    level: int = COMPRESSION_LEVEL
+
+    def encode(self, body: str) -> tuple[str, bytes | None]:
+        """本文を保存形式に変換する。
+
+        圧縮しても小さくならない場合は圧縮しない。
+
+        Args:
+            body: 本文。
+
+        Returns:
+            body 列と body_compressed 列に保存する値のタプル。
+        """
+        raw = body.encode("utf-8")
+        if len(raw) < self.threshold:
+            return body, None
+        compressed = zlib.compress(raw, self.level)
+        if len(compressed) >= len(raw):
+            return body, None
+        return "", compressed
+
+
+def decode_body(body: str | None, compressed: bytes | None) -> str:
+    """保存形式の本文を展開する。
+
+    Args:
+        body: body 列の値。
+        compressed: body_compressed 列の値。
+
+    Returns:
+        本文。
+    """
+    if compressed is not None:
+        return zlib.decompress(compressed).decode("utf-8")
+    return body or ""
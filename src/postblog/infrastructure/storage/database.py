@@ -1,99 +1,235 @@
 """SQLiteデータベース接続管理モジュール。
 
 ~/.postblog/postblog.db にSQLiteデータベースを作成・管理する。
+読み込みはスレッドごとの接続（WALモード）で行い、書き込みは専用の
+書き込みスレッドがキューから順番に実行する。
 """
 
+import contextlib
 import logging
+import queue
 import sqlite3
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Any, TypeVar
+
+from postblog.infrastructure.storage.migrations import apply_migrations
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # デフォルトDBパス
 DEFAULT_DB_PATH = Path.home() / ".postblog" / "postblog.db"
 
-# スキーマ定義
-SCHEMA_SQL = """
-CREATE TABLE IF NOT EXISTS drafts (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    title TEXT NOT NULL DEFAULT '',
-    body TEXT NOT NULL DEFAULT '',
-    tags TEXT NOT NULL DEFAULT '[]',
-    blog_type_id TEXT NOT NULL DEFAULT '',
-    hearing_data TEXT NOT NULL DEFAULT '',
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-
-CREATE TABLE IF NOT EXISTS publish_history (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    title TEXT NOT NULL DEFAULT '',
-    body_preview TEXT NOT NULL DEFAULT '',
-    blog_type_id TEXT NOT NULL DEFAULT '',
-    service_name TEXT NOT NULL DEFAULT '',
-    article_url TEXT DEFAULT NULL,
-    status TEXT NOT NULL DEFAULT 'published',
-    published_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
-"""
+# 書き込みスレッドの停止指示
+_STOP = object()
 
 
 class Database:
     """SQLiteデータベース接続管理クラス。
 
+    ファイルDBの場合、読み込み用の接続はスレッドごとに生成し（WALモードのため
+    書き込み中も待たされない）、書き込みは専用スレッドの接続で直列に実行する。
+    インメモリDBは接続ごとに別のDBになるため、1つの接続をロックで保護して共有する。
+
     Args:
         db_path: データベースファイルのパス（":memory:" でインメモリDB）。
     """
 
     def __init__(self, db_path: Path | str = DEFAULT_DB_PATH) -> None:
         self._db_path = str(db_path)
-        self._connection: sqlite3.Connection | None = None
+        self._in_memory = self._db_path == ":memory:"
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._shared: sqlite3.Connection | None = None
+        self._shared_lock = threading.RLock()
+        self._state_lock = threading.Lock()
+        self._jobs: queue.Queue[Any] | None = None
+        self._writer: threading.Thread | None = None
+        self._writer_connection: sqlite3.Connection | None = None
 
     @property
     def db_path(self) -> str:
         """データベースファイルのパスを返す。"""
         return self._db_path
 
-    def connect(self) -> sqlite3.Connection:
-        """データベースに接続する。
+    def _open_connection(self) -> sqlite3.Connection:
+        """新しい接続を開く。
 
         Returns:
             SQLite接続オブジェクト。
         """
-        if self._connection is not None:
-            return self._connection
-
-        if self._db_path != ":memory:":
+        if not self._in_memory:
             Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self._connection = sqlite3.connect(self._db_path)
-        self._connection.row_factory = sqlite3.Row
-        self._connection.execute("PRAGMA journal_mode=WAL")
-        logger.info("データベースに接続しました: %s", self._db_path)
-        return self._connection
+        # 接続は生成したスレッドでのみ使用するが、close() で他スレッドから
+        # 閉じられるよう check_same_thread を無効にする
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
-    def initialize(self) -> None:
-        """スキーマを初期化する。"""
-        conn = self.connect()
-        conn.executescript(SCHEMA_SQL)
-        conn.commit()
-        logger.info("データベーススキーマを初期化しました")
+    def connect(self) -> sqlite3.Connection:
+        """呼び出し元スレッドの読み込み用接続を取得する。未接続の場合は接続する。
 
-    def close(self) -> None:
-        """データベース接続を閉じる。"""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
-            logger.info("データベース接続を閉じました")
+        Returns:
+            SQLite接続オブジェクト（インメモリDBの場合は共有接続）。
+        """
+        if self._in_memory:
+            with self._state_lock:
+                if self._shared is None:
+                    self._shared = self._open_connection()
+                    logger.info("データベースに接続しました: %s", self._db_path)
+                return self._shared
+
+        conn: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if conn is not None:
+            return conn
+
+        conn = self._open_connection()
+        self._local.connection = conn
+        with self._state_lock:
+            self._readers.append(conn)
+        logger.info(
+            "データベースに接続しました: %s (thread=%s)",
+            self._db_path,
+            threading.current_thread().name,
+        )
+        return conn
 
     def get_connection(self) -> sqlite3.Connection:
-        """現在の接続を取得する。未接続の場合は接続する。
+        """呼び出し元スレッドの読み込み用接続を取得する。
 
         Returns:
             SQLite接続オブジェクト。
         """
-        if self._connection is None:
-            return self.connect()
-        return self._connection
+        return self.connect()
+
+    def _read_lock(self) -> contextlib.AbstractContextManager[Any]:
+        """読み込み時に取得するロックを返す（共有接続の場合のみ排他する）。"""
+        return self._shared_lock if self._in_memory else contextlib.nullcontext()
+
+    def read(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """呼び出し元スレッドの接続で読み込み処理を実行する。
+
+        Args:
+            func: 接続を受け取って結果を返す関数。
+
+        Returns:
+            関数の戻り値。
+        """
+        conn = self.connect()
+        with self._read_lock():
+            return func(conn)
+
+    def submit_write(self, func: Callable[[sqlite3.Connection], T]) -> Future[T]:
+        """書き込み処理を書き込みスレッドのキューに追加する。
+
+        関数は1つのトランザクション内で実行され、正常終了時にコミット、
+        例外発生時にロールバックされる。
+
+        Args:
+            func: 書き込み用接続を受け取って結果を返す関数。
+
+        Returns:
+            処理結果のFuture。
+        """
+        future: Future[T] = Future()
+        self._ensure_writer().put((func, future))
+        return future
+
+    def write(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """書き込み処理を書き込みスレッドで実行し、完了を待つ。
+
+        書き込みスレッド上から呼ばれた場合はその場で実行する。
+
+        Args:
+            func: 書き込み用接続を受け取って結果を返す関数。
+
+        Returns:
+            関数の戻り値。
+        """
+        conn = self._writer_connection
+        if conn is not None and threading.current_thread() is self._writer:
+            return func(conn)
+        return self.submit_write(func).result()
+
+    def _ensure_writer(self) -> queue.Queue[Any]:
+        """書き込みスレッドを取得する。未起動の場合は起動する。
+
+        Returns:
+            書き込みジョブのキュー。
+        """
+        with self._state_lock:
+            if self._jobs is None or self._writer is None:
+                self._jobs = queue.Queue()
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    args=(self._jobs,),
+                    name="postblog-db-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+            return self._jobs
+
+    def _writer_loop(self, jobs: queue.Queue[Any]) -> None:
+        """書き込みスレッドの処理。停止指示を受け取るまでジョブを順番に実行する。
+
+        Args:
+            jobs: 書き込みジョブのキュー。
+        """
+        conn = self.connect() if self._in_memory else self._open_connection()
+        self._writer_connection = conn
+        try:
+            while True:
+                item = jobs.get()
+                if item is _STOP:
+                    break
+                func, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    with self._read_lock(), conn:
+                        result = func(conn)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            self._writer_connection = None
+            if not self._in_memory:
+                conn.close()
+
+    def initialize(self) -> None:
+        """スキーマを初期化する（未適用のマイグレーションを適用する）。"""
+        version = self.write(apply_migrations)
+        logger.info("データベーススキーマを初期化しました: version=%s", version)
+
+    def close(self) -> None:
+        """書き込みスレッドを停止し、すべての接続を閉じる。
+
+        キューに残っている書き込みは停止前にすべて実行される。
+        """
+        with self._state_lock:
+            jobs, writer = self._jobs, self._writer
+            self._jobs = None
+            self._writer = None
+            readers, self._readers = self._readers, []
+            shared, self._shared = self._shared, None
+            self._local = threading.local()
+
+        if jobs is not None and writer is not None:
+            jobs.put(_STOP)
+            writer.join()
+
+        for conn in readers:
+            conn.close()
+        if shared is not None:
+            shared.close()
+        if jobs is not None or readers or shared is not None:
+            logger.info("データベース接続を閉じました")
@@ -5,73 +5,151 @@ SQLiteを使用した下書きのCRUD操作を提供する。
 
 import json
 import logging
+import sqlite3
 from datetime import datetime
 
+from postblog.infrastructure.storage import fts, revisions
+from postblog.infrastructure.storage.body_codec import BodyCodec, decode_body
 from postblog.infrastructure.storage.database import Database
-from postblog.models.draft import Draft
+from postblog.models.draft import (
+    Draft,
+    DraftRevision,
+    DraftRevisionSummary,
+    DraftSummary,
+    content_hash,
+)
+from postblog.models.search import SearchResult
 
 
 logger = logging.getLogger(__name__)
 
+# 一覧表示用プレビューの文字数
+PREVIEW_LENGTH = 100
+
 
 class DraftRepository:
     """下書きのCRUD操作を提供する。
 
+    本文は codec を指定した場合に閾値を超えるものを圧縮して保存する。
+    圧縮された本文は下書き本体を読み込むときだけ展開し、一覧表示用の
+    要約は保存時に切り出したプレビュー列だけを読み込む。
+
     Args:
         database: データベース接続管理オブジェクト。
+        codec: 本文の圧縮コーデック（Noneの場合は圧縮しない）。
     """
 
-    def __init__(self, database: Database) -> None:
+    def __init__(self, database: Database, codec: BodyCodec | None = None) -> None:
         self._db = database
+        self._codec = codec
 
     def save(self, draft: Draft) -> Draft:
         """下書きを保存する。新規の場合はINSERT、既存の場合はUPDATE。
 
+        既存の下書きは内容ハッシュが保存済みの値と同じ場合は書き込まず、
+        異なる場合も変更された列だけを更新する。内容が変わった場合は
+        同じトランザクションで版履歴に新しい版を追加する。
+
         Args:
             draft: 保存する下書き。
 
         Returns:
             保存後の下書き（IDが設定される）。
         """
-        conn = self._db.get_connection()
+        self.save_many([draft])
+        return draft
+
+    def save_many(self, drafts: list[Draft]) -> list[Draft]:
+        """複数の下書きを1つのトランザクションでまとめて保存する。
+
+        新規の下書きは executemany でまとめて挿入する。既存の下書きの扱いは
+        save() と同じ（変更がなければ書き込まず、変更された列だけを更新する）。
+
+        Args:
+            drafts: 保存する下書きのリスト。
+
+        Returns:
+            保存後の下書きのリスト（IDが設定される）。
+
+        Raises:
+            sqlite3.Error: 保存に失敗した場合（1件も保存されない）。
+        """
         now = datetime.now().isoformat()
-        tags_json = json.dumps(draft.tags, ensure_ascii=False)
+        digests = [content_hash(draft) for draft in drafts]
+        new = [
+            (draft, digest)
+            for draft, digest in zip(drafts, digests, strict=True)
+            if draft.id is None
+        ]
+        stored = self._find_content_hashes(
+            [draft.id for draft in drafts if draft.id is not None]
+        )
+        updates: list[tuple[int, Draft, str]] = []
+        for draft, digest in zip(drafts, digests, strict=True):
+            if draft.id is None:
+                continue
+            if stored.get(draft.id) == digest:
+                logger.debug(
+                    "下書きに変更がないため保存を省略しました: id=%s", draft.id
+                )
+                continue
+            updates.append((draft.id, draft, digest))
+        if not new and not updates:
+            return drafts
 
-        if draft.id is None:
-            cursor = conn.execute(
-                """INSERT INTO drafts (title, body, tags, blog_type_id, hearing_data, created_at, updated_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        params = []
+        for draft, digest in new:
+            body, body_compressed = self._encode_body(draft.body)
+            params.append(
                 (
                     draft.title,
-                    draft.body,
-                    tags_json,
+                    body,
+                    body_compressed,
+                    _preview(draft.body),
+                    json.dumps(draft.tags, ensure_ascii=False),
                     draft.blog_type_id,
                     draft.hearing_data,
+                    digest,
                     now,
                     now,
-                ),
+                )
             )
-            conn.commit()
-            draft.id = cursor.lastrowid
-            logger.info("下書きを新規作成しました: id=%s", draft.id)
-        else:
-            conn.execute(
-                """UPDATE drafts SET title=?, body=?, tags=?, blog_type_id=?, hearing_data=?, updated_at=?
-                   WHERE id=?""",
-                (
-                    draft.title,
-                    draft.body,
-                    tags_json,
-                    draft.blog_type_id,
-                    draft.hearing_data,
-                    now,
-                    draft.id,
-                ),
-            )
-            conn.commit()
-            logger.info("下書きを更新しました: id=%s", draft.id)
 
-        return draft
+        def _write(conn: sqlite3.Connection) -> tuple[int, list[list[str]]]:
+            first_id = 0
+            if params:
+                conn.executemany(
+                    """INSERT INTO drafts
+                       (title, body, body_compressed, preview, tags, blog_type_id,
+                        hearing_data, content_hash, created_at, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    params,
+                )
+                # 同じトランザクションで連続して挿入するため、IDは連番になる
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                first_id = last_id - len(params) + 1
+                for offset, (draft, _) in enumerate(new):
+                    if params[offset][2] is not None:
+                        _index_compressed(
+                            conn, first_id + offset, draft.title, draft.body
+                        )
+                    revisions.append_revision(conn, first_id + offset, draft, now)
+            changed = [
+                self._update_row(conn, draft_id, draft, digest, now)
+                for draft_id, draft, digest in updates
+            ]
+            return first_id, changed
+
+        first_id, changed_columns = self._db.write(_write)
+        for offset, (draft, _) in enumerate(new):
+            draft.id = first_id + offset
+            logger.info("下書きを新規作成しました: id=%s", draft.id)
+        for (draft_id, _, _), columns in zip(updates, changed_columns, strict=True):
+            if columns:
+                logger.info(
+                    "下書きを更新しました: id=%s, columns=%s", draft_id, columns
+                )
+        return drafts
 
     def find_by_id(self, draft_id: int) -> Draft | None:
         """IDで下書きを検索する。
@@ -82,8 +160,11 @@ class DraftRepository:
         Returns:
             下書き。見つからない場合はNone。
         """
-        conn = self._db.get_connection()
-        row = conn.execute("SELECT * FROM drafts WHERE id = ?", (draft_id,)).fetchone()
+        row = self._db.read(
+            lambda conn: conn.execute(
+                "SELECT * FROM drafts WHERE id = ?", (draft_id,)
+            ).fetchone()
+        )
         if row is None:
             return None
         return self._row_to_draft(row)
@@ -94,10 +175,74 @@ class DraftRepository:
         Returns:
             下書きのリスト。
         """
-        conn = self._db.get_connection()
-        rows = conn.execute("SELECT * FROM drafts ORDER BY updated_at DESC").fetchall()
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                "SELECT * FROM drafts ORDER BY updated_at DESC"
+            ).fetchall()
+        )
         return [self._row_to_draft(row) for row in rows]
 
+    def find_summaries(self, limit: int, offset: int = 0) -> list[DraftSummary]:
+        """一覧表示用の下書き要約を取得する（更新日時の降順）。
+
+        並び替えと件数制限はSQLで行い、本文は読み込まずに保存時に切り出した
+        プレビュー列を使用する。
+
+        Args:
+            limit: 取得件数上限。
+            offset: 読み飛ばす件数。
+
+        Returns:
+            下書き要約のリスト。
+        """
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                """SELECT id, title, preview, blog_type_id, updated_at
+                   FROM drafts ORDER BY updated_at DESC, id DESC LIMIT ? OFFSET ?""",
+                (limit, offset),
+            ).fetchall()
+        )
+        return [self._row_to_summary(row) for row in rows]
+
+    def search(self, query: str, limit: int = 20) -> list[SearchResult]:
+        """下書きのタイトルと本文を全文検索する（関連度順）。
+
+        Args:
+            query: 検索文字列（空白区切りでAND検索）。
+            limit: 取得件数上限。
+
+        Returns:
+            一致箇所の抜粋を含む検索結果のリスト。
+        """
+        return self._db.read(
+            lambda conn: fts.search(conn, fts.DRAFTS_FTS, query, limit)
+        )
+
+    def find_revisions(self, draft_id: int) -> list[DraftRevisionSummary]:
+        """下書きの版の一覧を取得する（新しい順）。
+
+        Args:
+            draft_id: 下書きID。
+
+        Returns:
+            版の要約のリスト。
+        """
+        return self._db.read(lambda conn: revisions.list_revisions(conn, draft_id))
+
+    def find_revision(self, draft_id: int, revision: int) -> DraftRevision | None:
+        """下書きの指定した版を取得する。
+
+        Args:
+            draft_id: 下書きID。
+            revision: 版番号。
+
+        Returns:
+            復元した版。見つからない場合はNone。
+        """
+        return self._db.read(
+            lambda conn: revisions.load_revision(conn, draft_id, revision)
+        )
+
     def delete(self, draft_id: int) -> bool:
         """下書きを削除する。
 
@@ -107,14 +252,125 @@ class DraftRepository:
         Returns:
             削除に成功した場合True。
         """
-        conn = self._db.get_connection()
-        cursor = conn.execute("DELETE FROM drafts WHERE id = ?", (draft_id,))
-        conn.commit()
-        deleted = cursor.rowcount > 0
+
+        def _delete(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                "SELECT title, body_compressed FROM drafts WHERE id = ?", (draft_id,)
+            ).fetchone()
+            if row is not None and row["body_compressed"] is not None:
+                _unindex_compressed(
+                    conn,
+                    draft_id,
+                    row["title"],
+                    decode_body("", row["body_compressed"]),
+                )
+            return (
+                conn.execute("DELETE FROM drafts WHERE id = ?", (draft_id,)).rowcount
+                > 0
+            )
+
+        deleted = self._db.write(_delete)
         if deleted:
             logger.info("下書きを削除しました: id=%s", draft_id)
         return deleted
 
+    def _find_content_hashes(self, draft_ids: list[int]) -> dict[int, str]:
+        """保存済みの内容ハッシュを取得する。
+
+        Args:
+            draft_ids: 下書きIDのリスト。
+
+        Returns:
+            下書きIDから内容ハッシュへの辞書（存在しない下書きは含まない）。
+        """
+        if not draft_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in draft_ids)
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                f"SELECT id, content_hash FROM drafts WHERE id IN ({placeholders})",
+                draft_ids,
+            ).fetchall()
+        )
+        return {row[0]: row[1] for row in rows}
+
+    def _update_row(
+        self,
+        conn: sqlite3.Connection,
+        draft_id: int,
+        draft: Draft,
+        digest: str,
+        now: str,
+    ) -> list[str]:
+        """既存の下書きの変更された列だけを更新する（書き込みスレッドで呼ぶこと）。
+
+        Args:
+            conn: SQLite接続オブジェクト。
+            draft_id: 下書きID。
+            draft: 保存する下書き。
+            digest: 下書きの内容ハッシュ。
+            now: 更新日時（ISO 8601形式）。
+
+        Returns:
+            更新した列名のリスト（内容ハッシュ・更新日時を除く）。
+        """
+        row = conn.execute(
+            """SELECT title, body, body_compressed, tags, blog_type_id, hearing_data
+               FROM drafts WHERE id = ?""",
+            (draft_id,),
+        ).fetchone()
+        if row is None:
+            return []
+
+        values = {
+            "title": draft.title,
+            "tags": json.dumps(draft.tags, ensure_ascii=False),
+            "blog_type_id": draft.blog_type_id,
+            "hearing_data": draft.hearing_data,
+        }
+        changed: dict[str, object] = {
+            column: value for column, value in values.items() if row[column] != value
+        }
+        stored_body = decode_body(row["body"], row["body_compressed"])
+        if stored_body != draft.body:
+            body, body_compressed = self._encode_body(draft.body)
+            changed["body"] = body
+            changed["body_compressed"] = body_compressed
+            changed["preview"] = _preview(draft.body)
+        if not changed:
+            # 内容ハッシュが未設定の既存行は、ハッシュだけを設定する
+            conn.execute(
+                "UPDATE drafts SET content_hash=? WHERE id=?", (digest, draft_id)
+            )
+            return []
+
+        # 圧縮された本文の索引はトリガーでは更新できないため、ここで入れ替える
+        reindex = "title" in changed or "body" in changed
+        if reindex and row["body_compressed"] is not None:
+            _unindex_compressed(conn, draft_id, row["title"], stored_body)
+        assignments = "".join(f"{column}=?, " for column in changed)
+        conn.execute(
+            f"UPDATE drafts SET {assignments}content_hash=?, updated_at=? WHERE id=?",
+            (*changed.values(), digest, now, draft_id),
+        )
+        if reindex and changed.get("body_compressed", row["body_compressed"]):
+            _index_compressed(conn, draft_id, draft.title, draft.body)
+        revisions.append_revision(conn, draft_id, draft, now)
+        return list(changed)
+
+    def _encode_body(self, body: str) -> tuple[str, bytes | None]:
+        """本文を保存形式に変換する。
+
+        Args:
+            body: 本文。
+
+        Returns:
+            body 列と body_compressed 列に保存する値のタプル。
+        """
+        if self._codec is None:
+            return body, None
+        return self._codec.encode(body)
+
     @staticmethod
     def _row_to_draft(row: object) -> Draft:
         """データベースの行をDraftオブジェクトに変換する。
@@ -140,10 +396,91 @@ class DraftRepository:
         return Draft(
             id=row["id"],  # type: ignore[index]
             title=row["title"] or "",  # type: ignore[index]
-            body=row["body"] or "",  # type: ignore[index]
+            body=decode_body(row["body"], row["body_compressed"]),  # type: ignore[index]
             tags=tags,
             blog_type_id=row["blog_type_id"] or "",  # type: ignore[index]
             hearing_data=row["hearing_data"] or "",  # type: ignore[index]
             created_at=created_at,
             updated_at=updated_at,
         )
+
+    @staticmethod
+    def _row_to_summary(row: object) -> DraftSummary:
+        """データベースの行をDraftSummaryオブジェクトに変換する。
+
+        Args:
+            row: sqlite3.Rowオブジェクト。
+
+        Returns:
+            DraftSummaryインスタンス。
+        """
+        preview = row["preview"] or ""  # type: ignore[index]
+        if len(preview) > PREVIEW_LENGTH:
+            preview = preview[:PREVIEW_LENGTH] + "..."
+        updated_at = (
+            datetime.fromisoformat(row["updated_at"])  # type: ignore[index]
+            if row["updated_at"]  # type: ignore[index]
+            else datetime.now()
+        )
+
+        return DraftSummary(
+            id=row["id"],  # type: ignore[index]
+            title=row["title"] or "",  # type: ignore[index]
+            preview=preview,
+            blog_type_id=row["blog_type_id"] or "",  # type: ignore[index]
+            updated_at=updated_at,
+        )
+
+
+def _index_compressed(
+    conn: sqlite3.Connection, draft_id: int, title: str, body: str
+) -> None:
+    """圧縮して保存した下書きを全文検索の索引に追加する（書き込みスレッドで呼ぶこと）。
+
+    索引は本文を保持せず、同期トリガーは圧縮されていない行だけを扱うため、
+    圧縮された行は展開済みの本文で索引に追加する。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        draft_id: 下書きID。
+        title: タイトル。
+        body: 展開済みの本文。
+    """
+    conn.execute(
+        "INSERT INTO drafts_fts (rowid, title, body) VALUES (?, ?, ?)",
+        (draft_id, title, body),
+    )
+
+
+def _unindex_compressed(
+    conn: sqlite3.Connection, draft_id: int, title: str, body: str
+) -> None:
+    """圧縮して保存した下書きを全文検索の索引から削除する（書き込みスレッドで呼ぶこと）。
+
+    本文を保持しない索引からの削除には、索引に追加したときの値が必要になる。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        draft_id: 下書きID。
+        title: 索引に追加したときのタイトル。
+        body: 索引に追加したときの展開済みの本文。
+    """
+    conn.execute(
+        "INSERT INTO drafts_fts (drafts_fts, rowid, title, body) "
+        "VALUES ('delete', ?, ?, ?)",
+        (draft_id, title, body),
+    )
+
+
+def _preview(body: str) -> str:
+    """一覧表示用プレビュー列に保存する本文の先頭部分を切り出す。
+
+    表示時に省略記号を付けるか判定できるよう、1文字多く切り出す。
+
+    Args:
+        body: 本文。
+
+    Returns:
+        本文の先頭 PREVIEW_LENGTH + 1 文字。
+    """
+    return body[: PREVIEW_LENGTH + 1]
@@ -0,0 +1,344 @@
+"""全文検索（FTS5）の補助モジュール。
+
+trigram トークナイザを使用した FTS5 テーブルへの検索クエリ生成と、
+本文を保持しない索引や3文字未満の語を含む検索で使用する抜粋生成を提供する。
+"""
+
+import re
+import sqlite3
+from dataclasses import dataclass
+
+from postblog.infrastructure.storage.body_codec import decode_body
+from postblog.models.search import SearchResult
+
+
+# trigram トークナイザで検索できる最小文字数
+MIN_TRIGRAM_LENGTH = 3
+
+# 抜粋内で一致箇所を囲む文字列
+HIGHLIGHT_START = "【"
+HIGHLIGHT_END = "】"
+
+# 抜粋の省略記号
+ELLIPSIS = "…"
+
+# 抜粋の最大トークン数（FTS5 の snippet 関数に渡す値）
+SNIPPET_TOKENS = 32
+
+# 抜粋の一致箇所前後の文字数（Pythonで抜粋を作る場合に使用）
+SNIPPET_CONTEXT_CHARS = 30
+
+# 関連度計算でのタイトル列の重み（本文列は1.0）
+TITLE_WEIGHT = 10.0
+
+# ASCII の英大文字を小文字にする変換表（LIKE と同じ照合に使用）
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+@dataclass(frozen=True)
+class FtsTable:
+    """全文検索の対象テーブル定義。
+
+    Args:
+        fts_table: FTS5 仮想テーブル名。
+        content_table: 検索対象の元テーブル名。
+        body_column: 本文列名（タイトル列は title 固定）。
+        order_column: FTS5 で検索できない場合の並び順に使う列名（降順）。
+        compressed_column: 圧縮された本文の列名。指定した場合、索引は本文を
+            保持しない（contentless）ものとし、タイトルと抜粋は元テーブルの
+            展開した本文から作る。
+    """
+
+    fts_table: str
+    content_table: str
+    body_column: str
+    order_column: str
+    compressed_column: str | None = None
+
+
+DRAFTS_FTS = FtsTable(
+    fts_table="drafts_fts",
+    content_table="drafts",
+    body_column="body",
+    order_column="updated_at",
+    compressed_column="body_compressed",
+)
+
+HISTORY_FTS = FtsTable(
+    fts_table="publish_history_fts",
+    content_table="publish_history",
+    body_column="body_preview",
+    order_column="published_at",
+)
+
+
+def split_terms(query: str) -> list[str]:
+    """検索文字列を空白（全角空白を含む）で語に分割する。
+
+    Args:
+        query: 検索文字列。
+
+    Returns:
+        語のリスト。
+    """
+    return query.split()
+
+
+def build_match_query(terms: list[str]) -> str | None:
+    """FTS5 の MATCH 句に渡すクエリを生成する。
+
+    各語をフレーズとして引用符で囲み、AND 検索にする。
+    trigram トークナイザは3文字未満の語に一致しないため、
+    そのような語を含む場合はNoneを返す。
+
+    Args:
+        terms: 検索語のリスト。
+
+    Returns:
+        MATCH クエリ。FTS5 で検索できない場合はNone。
+    """
+    if not terms or any(len(term) < MIN_TRIGRAM_LENGTH for term in terms):
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def escape_like(term: str) -> str:
+    """LIKE 句のパターン用に特殊文字をエスケープする（ESCAPE '\\' を使用すること）。
+
+    Args:
+        term: 検索語。
+
+    Returns:
+        エスケープ済みの文字列。
+    """
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def make_snippet(text: str, terms: list[str]) -> str:
+    """最初の一致箇所の前後を抜粋し、一致箇所を強調する。
+
+    Args:
+        text: 抜粋元のテキスト。
+        terms: 検索語のリスト。
+
+    Returns:
+        抜粋。一致しない場合は先頭部分。
+    """
+    flat = " ".join(text.split())
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    match = pattern.search(flat)
+    if match is None:
+        head = flat[: SNIPPET_CONTEXT_CHARS * 2]
+        return head + ELLIPSIS if len(flat) > len(head) else head
+
+    start = max(0, match.start() - SNIPPET_CONTEXT_CHARS)
+    end = min(len(flat), match.end() + SNIPPET_CONTEXT_CHARS)
+    excerpt = pattern.sub(
+        lambda m: f"{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_END}", flat[start:end]
+    )
+    prefix = ELLIPSIS if start > 0 else ""
+    suffix = ELLIPSIS if end < len(flat) else ""
+    return f"{prefix}{excerpt}{suffix}"
+
+
+def search(
+    conn: sqlite3.Connection, table: FtsTable, query: str, limit: int
+) -> list[SearchResult]:
+    """タイトルと本文を全文検索する。
+
+    すべての語が3文字以上の場合は FTS5 の索引を使い、BM25 で関連度順に並べる。
+    3文字未満の語を含む場合は元テーブルを LIKE で走査し、新しい順に並べる。
+    本文が圧縮されうるテーブルでは、抜粋は展開した本文からPythonで作る。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        table: 検索対象のテーブル定義。
+        query: 検索文字列（空白区切りでAND検索）。
+        limit: 取得件数上限。
+
+    Returns:
+        検索結果のリスト。
+    """
+    terms = split_terms(query)
+    if not terms:
+        return []
+
+    match = build_match_query(terms)
+    if table.compressed_column is not None:
+        if match is None:
+            return _search_like_decoded(conn, table, terms, limit)
+        return _search_contentless(conn, table, terms, match, limit)
+    if match is None:
+        return _search_like(conn, table, terms, limit)
+
+    rows = conn.execute(
+        f"""SELECT rowid, title,
+                   snippet({table.fts_table}, -1, ?, ?, ?, ?),
+                   bm25({table.fts_table}, ?, 1.0) AS rank
+            FROM {table.fts_table}
+            WHERE {table.fts_table} MATCH ?
+            ORDER BY rank LIMIT ?""",
+        (
+            HIGHLIGHT_START,
+            HIGHLIGHT_END,
+            ELLIPSIS,
+            SNIPPET_TOKENS,
+            TITLE_WEIGHT,
+            match,
+            limit,
+        ),
+    ).fetchall()
+    return [
+        SearchResult(id=row[0], title=row[1] or "", snippet=row[2] or "", score=-row[3])
+        for row in rows
+    ]
+
+
+def _like_condition(table: FtsTable, terms: list[str]) -> tuple[str, list[object]]:
+    """全ての語がタイトルか本文に含まれる条件の LIKE 句を生成する。
+
+    Args:
+        table: 検索対象のテーブル定義。
+        terms: 検索語のリスト。
+
+    Returns:
+        (WHERE 句の条件, パラメータのリスト) のタプル。
+    """
+    condition = " AND ".join(
+        f"(title LIKE ? ESCAPE '\\' OR {table.body_column} LIKE ? ESCAPE '\\')"
+        for _ in terms
+    )
+    params: list[object] = []
+    for term in terms:
+        pattern = f"%{escape_like(term)}%"
+        params.extend([pattern, pattern])
+    return condition, params
+
+
+def _search_like(
+    conn: sqlite3.Connection, table: FtsTable, terms: list[str], limit: int
+) -> list[SearchResult]:
+    """LIKE による走査で検索する（3文字未満の語を含む場合）。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        table: 検索対象のテーブル定義。
+        terms: 検索語のリスト。
+        limit: 取得件数上限。
+
+    Returns:
+        検索結果のリスト（スコアは0）。
+    """
+    condition, params = _like_condition(table, terms)
+    params.append(limit)
+
+    rows = conn.execute(
+        f"""SELECT id, title, {table.body_column}
+            FROM {table.content_table}
+            WHERE {condition}
+            ORDER BY {table.order_column} DESC, id DESC LIMIT ?""",
+        params,
+    ).fetchall()
+    return [
+        SearchResult(
+            id=row[0],
+            title=row[1] or "",
+            snippet=make_snippet(row[2] or row[1] or "", terms),
+        )
+        for row in rows
+    ]
+
+
+def _search_contentless(
+    conn: sqlite3.Connection,
+    table: FtsTable,
+    terms: list[str],
+    match: str,
+    limit: int,
+) -> list[SearchResult]:
+    """本文を保持しない索引で検索し、元テーブルの本文から抜粋を作る。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        table: 検索対象のテーブル定義（compressed_column を指定したもの）。
+        terms: 検索語のリスト。
+        match: MATCH クエリ。
+        limit: 取得件数上限。
+
+    Returns:
+        検索結果のリスト。
+    """
+    rows = conn.execute(
+        f"""SELECT c.id, c.title, c.{table.body_column}, c.{table.compressed_column},
+                   bm25({table.fts_table}, ?, 1.0) AS rank
+            FROM {table.fts_table}
+            JOIN {table.content_table} AS c ON c.id = {table.fts_table}.rowid
+            WHERE {table.fts_table} MATCH ?
+            ORDER BY rank LIMIT ?""",
+        (TITLE_WEIGHT, match, limit),
+    ).fetchall()
+    return [
+        SearchResult(
+            id=row[0],
+            title=row[1] or "",
+            snippet=make_snippet(decode_body(row[2], row[3]) or row[1] or "", terms),
+            score=-row[4],
+        )
+        for row in rows
+    ]
+
+
+def _search_like_decoded(
+    conn: sqlite3.Connection, table: FtsTable, terms: list[str], limit: int
+) -> list[SearchResult]:
+    """圧縮された本文を展開しながら走査して検索する（3文字未満の語を含む場合）。
+
+    圧縮されていない行は LIKE で絞り込み、圧縮された行だけを展開して照合する。
+    照合は LIKE と同じく ASCII の大文字・小文字を区別しない。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        table: 検索対象のテーブル定義（compressed_column を指定したもの）。
+        terms: 検索語のリスト。
+        limit: 取得件数上限。
+
+    Returns:
+        検索結果のリスト（スコアは0）。
+    """
+    condition, params = _like_condition(table, terms)
+    cursor = conn.execute(
+        f"""SELECT id, title, {table.body_column}, {table.compressed_column}
+            FROM {table.content_table}
+            WHERE {table.compressed_column} IS NOT NULL OR ({condition})
+            ORDER BY {table.order_column} DESC, id DESC""",
+        params,
+    )
+    folded = [_fold_ascii(term) for term in terms]
+    results: list[SearchResult] = []
+    for row in cursor:
+        title = row[1] or ""
+        body = decode_body(row[2], row[3])
+        if row[3] is not None:
+            haystack = _fold_ascii(f"{title}\n{body}")
+            if not all(term in haystack for term in folded):
+                continue
+        results.append(
+            SearchResult(
+                id=row[0], title=title, snippet=make_snippet(body or title, terms)
+            )
+        )
+        if len(results) >= limit:
+            break
+    return results
+
+
+def _fold_ascii(text: str) -> str:
+    """ASCII の英大文字だけを小文字にする（LIKE と同じ照合のため）。
+
+    Args:
+        text: 文字列。
+
+    Returns:
+        変換後の文字列。
+    """
+    return text.translate(_ASCII_LOWER)
@@ -4,14 +4,24 @@ SQLiteを使用した投稿履歴のCRUD操作を提供する。
 """
 
 import logging
+import sqlite3
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 
+from postblog.infrastructure.storage import fts
 from postblog.infrastructure.storage.database import Database
+from postblog.models.search import SearchResult
 
 
 logger = logging.getLogger(__name__)
 
+# 投稿統計の集計単位と日次集計テーブルの列の対応
+STATS_GROUP_COLUMNS = {
+    "service": "service_name",
+    "status": "status",
+    "day": "day",
+}
+
 
 @dataclass
 class HistoryRecord:
@@ -40,6 +50,44 @@ class HistoryRecord:
     created_at: datetime = field(default_factory=datetime.now)
 
 
+@dataclass
+class HistorySummary:
+    """一覧表示用の投稿履歴要約。
+
+    Args:
+        id: レコードID。
+        title: 記事タイトル。
+        service_name: サービス名。
+        status: ステータス（"published" | "draft" | "failed"）。
+        article_url: 記事URL。
+        published_at: 投稿日時。
+    """
+
+    id: int
+    title: str = ""
+    service_name: str = ""
+    status: str = "published"
+    article_url: str | None = None
+    published_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class PublishStat:
+    """投稿統計の集計結果（1グループ分）。
+
+    Args:
+        key: グループのキー（サービス名・ステータス・日付 "YYYY-MM-DD" のいずれか）。
+        total: 投稿数。
+        published: 投稿に成功した数。
+        failed: 投稿に失敗した数。
+    """
+
+    key: str
+    total: int = 0
+    published: int = 0
+    failed: int = 0
+
+
 class HistoryRepository:
     """投稿履歴のCRUD操作を提供する。
 
@@ -59,13 +107,26 @@ class HistoryRepository:
         Returns:
             保存後のレコード（IDが設定される）。
         """
-        conn = self._db.get_connection()
-        now = datetime.now().isoformat()
+        self.save_many([record])
+        return record
+
+    def save_many(self, records: list[HistoryRecord]) -> list[HistoryRecord]:
+        """複数の投稿履歴を1つのトランザクションでまとめて保存する。
+
+        Args:
+            records: 保存する投稿履歴レコードのリスト。
+
+        Returns:
+            保存後のレコードのリスト（IDが設定される）。
+
+        Raises:
+            sqlite3.Error: 保存に失敗した場合（1件も保存されない）。
+        """
+        if not records:
+            return records
 
-        cursor = conn.execute(
-            """INSERT INTO publish_history
-               (title, body_preview, blog_type_id, service_name, article_url, status, published_at, created_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        now = datetime.now().isoformat()
+        params = [
             (
                 record.title,
                 record.body_preview,
@@ -75,14 +136,30 @@ class HistoryRepository:
                 record.status,
                 record.published_at.isoformat() if record.published_at else now,
                 now,
-            ),
-        )
-        conn.commit()
-        record.id = cursor.lastrowid
-        logger.info(
-            "投稿履歴を保存しました: id=%s, service=%s", record.id, record.service_name
-        )
-        return record
+            )
+            for record in records
+        ]
+
+        def _insert(conn: sqlite3.Connection) -> int:
+            conn.executemany(
+                """INSERT INTO publish_history
+                   (title, body_preview, blog_type_id, service_name, article_url, status, published_at, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                params,
+            )
+            return int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+
+        # 書き込みスレッドが同じトランザクションで連続して挿入するため、IDは連番になる
+        last_id = self._db.write(_insert)
+        first_id = last_id - len(records) + 1
+        for offset, record in enumerate(records):
+            record.id = first_id + offset
+            logger.info(
+                "投稿履歴を保存しました: id=%s, service=%s",
+                record.id,
+                record.service_name,
+            )
+        return records
 
     def find_all(self) -> list[HistoryRecord]:
         """全ての投稿履歴を取得する（投稿日時の降順）。
@@ -90,12 +167,83 @@ class HistoryRepository:
         Returns:
             投稿履歴レコードのリスト。
         """
-        conn = self._db.get_connection()
-        rows = conn.execute(
-            "SELECT * FROM publish_history ORDER BY published_at DESC"
-        ).fetchall()
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                "SELECT * FROM publish_history ORDER BY published_at DESC"
+            ).fetchall()
+        )
         return [self._row_to_record(row) for row in rows]
 
+    def find_summaries(self, limit: int, offset: int = 0) -> list[HistorySummary]:
+        """一覧表示用の投稿履歴要約を取得する（投稿日時の降順）。
+
+        並び替えと件数制限はSQLで行い、本文プレビューは読み込まない。
+
+        Args:
+            limit: 取得件数上限。
+            offset: 読み飛ばす件数。
+
+        Returns:
+            投稿履歴要約のリスト。
+        """
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                """SELECT id, title, service_name, status, article_url, published_at
+                   FROM publish_history ORDER BY published_at DESC, id DESC
+                   LIMIT ? OFFSET ?""",
+                (limit, offset),
+            ).fetchall()
+        )
+        return [self._row_to_summary(row) for row in rows]
+
+    def find_stats(
+        self,
+        group_by: str,
+        since: date | None = None,
+        until: date | None = None,
+    ) -> list[PublishStat]:
+        """日次集計テーブルから投稿統計を取得する。
+
+        集計テーブルは投稿履歴の追加・更新・削除時にトリガーで更新されるため、
+        投稿履歴の件数によらず期間内の日数とサービス数に比例する行だけを読む。
+
+        Args:
+            group_by: 集計単位（STATS_GROUP_COLUMNS のキー）。
+            since: 集計期間の開始日（含む、Noneの場合は制限なし）。
+            until: 集計期間の終了日（含む、Noneの場合は制限なし）。
+
+        Returns:
+            投稿統計のリスト（日付単位は日付の昇順、それ以外は投稿数の降順）。
+
+        Raises:
+            KeyError: 未対応の集計単位が指定された場合。
+        """
+        column = STATS_GROUP_COLUMNS[group_by]
+        order = "key" if group_by == "day" else "total DESC, key"
+        rows = self._db.read(
+            lambda conn: conn.execute(
+                f"""SELECT {column} AS key, sum(count) AS total,
+                           sum(CASE WHEN status = 'published' THEN count ELSE 0 END) AS published,
+                           sum(CASE WHEN status = 'failed' THEN count ELSE 0 END) AS failed
+                    FROM publish_stats_daily
+                    WHERE day >= ? AND day <= ?
+                    GROUP BY key ORDER BY {order}""",
+                (
+                    since.isoformat() if since else "",
+                    until.isoformat() if until else "9999-12-31",
+                ),
+            ).fetchall()
+        )
+        return [
+            PublishStat(
+                key=row["key"],
+                total=row["total"],
+                published=row["published"],
+                failed=row["failed"],
+            )
+            for row in rows
+        ]
+
     def find_by_id(self, record_id: int) -> HistoryRecord | None:
         """IDで投稿履歴を検索する。
 
@@ -105,14 +253,29 @@ class HistoryRepository:
         Returns:
             投稿履歴レコード。見つからない場合はNone。
         """
-        conn = self._db.get_connection()
-        row = conn.execute(
-            "SELECT * FROM publish_history WHERE id = ?", (record_id,)
-        ).fetchone()
+        row = self._db.read(
+            lambda conn: conn.execute(
+                "SELECT * FROM publish_history WHERE id = ?", (record_id,)
+            ).fetchone()
+        )
         if row is None:
             return None
         return self._row_to_record(row)
 
+    def search(self, query: str, limit: int = 20) -> list[SearchResult]:
+        """投稿履歴のタイトルと本文を全文検索する（関連度順）。
+
+        Args:
+            query: 検索文字列（空白区切りでAND検索）。
+            limit: 取得件数上限。
+
+        Returns:
+            一致箇所の抜粋を含む検索結果のリスト。
+        """
+        return self._db.read(
+            lambda conn: fts.search(conn, fts.HISTORY_FTS, query, limit)
+        )
+
     def delete(self, record_id: int) -> bool:
         """投稿履歴を削除する。
 
@@ -122,10 +285,14 @@ class HistoryRepository:
         Returns:
             削除に成功した場合True。
         """
-        conn = self._db.get_connection()
-        cursor = conn.execute("DELETE FROM publish_history WHERE id = ?", (record_id,))
-        conn.commit()
-        deleted = cursor.rowcount > 0
+        deleted = self._db.write(
+            lambda conn: (
+                conn.execute(
+                    "DELETE FROM publish_history WHERE id = ?", (record_id,)
+                ).rowcount
+                > 0
+            )
+        )
         if deleted:
             logger.info("投稿履歴を削除しました: id=%s", record_id)
         return deleted
@@ -162,3 +329,28 @@ class HistoryRepository:
             published_at=published_at,
             created_at=created_at,
         )
+
+    @staticmethod
+    def _row_to_summary(row: object) -> HistorySummary:
+        """データベースの行をHistorySummaryオブジェクトに変換する。
+
+        Args:
+            row: sqlite3.Rowオブジェクト。
+
+        Returns:
+            HistorySummaryインスタンス。
+        """
+        published_at = (
+            datetime.fromisoformat(row["published_at"])  # type: ignore[index]
+            if row["published_at"]  # type: ignore[index]
+            else datetime.now()
+        )
+
+        return HistorySummary(
+            id=row["id"],  # type: ignore[index]
+            title=row["title"] or "",  # type: ignore[index]
+            service_name=row["service_name"] or "",  # type: ignore[index]
+            status=row["status"] or "published",  # type: ignore[index]
+            article_url=row["article_url"],  # type: ignore[index]
+            published_at=published_at,
+        )
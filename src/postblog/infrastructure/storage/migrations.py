@@ -0,0 +1,319 @@
+"""スキーママイグレーションモジュール。
+
+`PRAGMA user_version` にスキーマのバージョンを記録し、
+未適用のマイグレーションを順番に適用する。
+"""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """スキーママイグレーション。
+
+    Args:
+        version: 適用後のスキーマバージョン（1から連番）。
+        description: マイグレーションの説明。
+        sql: 実行するSQLスクリプト。
+    """
+
+    version: int
+    description: str
+    sql: str
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        description="下書き・投稿履歴テーブルの作成",
+        # バージョン管理導入前に作成されたDB（user_version=0）にも適用できるよう
+        # IF NOT EXISTS を付けている
+        sql="""
+CREATE TABLE IF NOT EXISTS drafts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL DEFAULT '',
+    body TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '[]',
+    blog_type_id TEXT NOT NULL DEFAULT '',
+    hearing_data TEXT NOT NULL DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS publish_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL DEFAULT '',
+    body_preview TEXT NOT NULL DEFAULT '',
+    blog_type_id TEXT NOT NULL DEFAULT '',
+    service_name TEXT NOT NULL DEFAULT '',
+    article_url TEXT DEFAULT NULL,
+    status TEXT NOT NULL DEFAULT 'published',
+    published_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+""",
+    ),
+    Migration(
+        version=2,
+        description="一覧表示・集計用インデックスの追加",
+        sql="""
+CREATE INDEX IF NOT EXISTS idx_drafts_updated_at ON drafts (updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_publish_history_published_at
+    ON publish_history (published_at);
+
+CREATE INDEX IF NOT EXISTS idx_publish_history_service_status
+    ON publish_history (service_name, status);
+""",
+    ),
+    Migration(
+        version=3,
+        description="全文検索（FTS5 trigram）テーブルと同期トリガーの追加",
+        sql="""
+CREATE VIRTUAL TABLE IF NOT EXISTS drafts_fts USING fts5(
+    title, body, content='drafts', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS drafts_fts_insert AFTER INSERT ON drafts BEGIN
+    INSERT INTO drafts_fts (rowid, title, body)
+    VALUES (new.id, new.title, new.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS drafts_fts_delete AFTER DELETE ON drafts BEGIN
+    INSERT INTO drafts_fts (drafts_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+END;
+
+CREATE TRIGGER IF NOT EXISTS drafts_fts_update
+AFTER UPDATE OF title, body ON drafts BEGIN
+    INSERT INTO drafts_fts (drafts_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO drafts_fts (rowid, title, body)
+    VALUES (new.id, new.title, new.body);
+END;
+
+INSERT INTO drafts_fts (drafts_fts) VALUES ('rebuild');
+
+CREATE VIRTUAL TABLE IF NOT EXISTS publish_history_fts USING fts5(
+    title, body_preview,
+    content='publish_history', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS publish_history_fts_insert
+AFTER INSERT ON publish_history BEGIN
+    INSERT INTO publish_history_fts (rowid, title, body_preview)
+    VALUES (new.id, new.title, new.body_preview);
+END;
+
+CREATE TRIGGER IF NOT EXISTS publish_history_fts_delete
+AFTER DELETE ON publish_history BEGIN
+    INSERT INTO publish_history_fts (publish_history_fts, rowid, title, body_preview)
+    VALUES ('delete', old.id, old.title, old.body_preview);
+END;
+
+CREATE TRIGGER IF NOT EXISTS publish_history_fts_update
+AFTER UPDATE OF title, body_preview ON publish_history BEGIN
+    INSERT INTO publish_history_fts (publish_history_fts, rowid, title, body_preview)
+    VALUES ('delete', old.id, old.title, old.body_preview);
+    INSERT INTO publish_history_fts (rowid, title, body_preview)
+    VALUES (new.id, new.title, new.body_preview);
+END;
+
+INSERT INTO publish_history_fts (publish_history_fts) VALUES ('rebuild');
+""",
+    ),
+    Migration(
+        version=4,
+        description="下書きの版履歴テーブルの追加",
+        sql="""
+CREATE TABLE IF NOT EXISTS draft_revisions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    draft_id INTEGER NOT NULL,
+    revision INTEGER NOT NULL,
+    is_snapshot INTEGER NOT NULL DEFAULT 0,
+    title TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '[]',
+    payload BLOB NOT NULL,
+    content_hash TEXT NOT NULL DEFAULT '',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (draft_id, revision)
+);
+
+CREATE TRIGGER IF NOT EXISTS drafts_revisions_delete AFTER DELETE ON drafts BEGIN
+    DELETE FROM draft_revisions WHERE draft_id = old.id;
+END;
+""",
+    ),
+    Migration(
+        version=5,
+        description="下書きの内容ハッシュ列の追加",
+        # 既存の行は空文字列のままにし、次回の保存時に設定する
+        sql="""
+ALTER TABLE drafts ADD COLUMN content_hash TEXT NOT NULL DEFAULT '';
+""",
+    ),
+    Migration(
+        version=6,
+        description="本文の圧縮列・プレビュー列の追加と全文検索の索引の変更",
+        # 本文を二重に保存しないよう、全文検索は本文を保持しない索引（contentless）に
+        # する。圧縮されていない本文はトリガーで索引に反映し、圧縮された本文は
+        # アプリ（DraftRepository）が展開済みの本文で索引に追加・削除する
+        sql="""
+ALTER TABLE drafts ADD COLUMN body_compressed BLOB DEFAULT NULL;
+ALTER TABLE drafts ADD COLUMN preview TEXT NOT NULL DEFAULT '';
+UPDATE drafts SET preview = substr(body, 1, 101);
+
+DROP TRIGGER IF EXISTS drafts_fts_insert;
+DROP TRIGGER IF EXISTS drafts_fts_delete;
+DROP TRIGGER IF EXISTS drafts_fts_update;
+DROP TABLE IF EXISTS drafts_fts;
+
+CREATE VIRTUAL TABLE drafts_fts USING fts5(
+    title, body, content='', tokenize='trigram'
+);
+
+INSERT INTO drafts_fts (rowid, title, body) SELECT id, title, body FROM drafts;
+
+CREATE TRIGGER drafts_fts_insert AFTER INSERT ON drafts
+WHEN new.body_compressed IS NULL BEGIN
+    INSERT INTO drafts_fts (rowid, title, body)
+    VALUES (new.id, new.title, new.body);
+END;
+
+CREATE TRIGGER drafts_fts_delete AFTER DELETE ON drafts
+WHEN old.body_compressed IS NULL BEGIN
+    INSERT INTO drafts_fts (drafts_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+END;
+
+CREATE TRIGGER drafts_fts_update
+AFTER UPDATE OF title, body, body_compressed ON drafts BEGIN
+    INSERT INTO drafts_fts (drafts_fts, rowid, title, body)
+    SELECT 'delete', old.id, old.title, old.body WHERE old.body_compressed IS NULL;
+    INSERT INTO drafts_fts (rowid, title, body)
+    SELECT new.id, new.title, new.body WHERE new.body_compressed IS NULL;
+END;
+""",
+    ),
+    Migration(
+        version=7,
+        description="投稿統計の日次集計テーブルと集計トリガーの追加",
+        sql="""
+CREATE TABLE IF NOT EXISTS publish_stats_daily (
+    day TEXT NOT NULL,
+    service_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, service_name, status)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS publish_stats_insert
+AFTER INSERT ON publish_history BEGIN
+    INSERT INTO publish_stats_daily (day, service_name, status, count)
+    VALUES (coalesce(date(new.published_at), ''), new.service_name, new.status, 1)
+    ON CONFLICT (day, service_name, status) DO UPDATE SET count = count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS publish_stats_delete
+AFTER DELETE ON publish_history BEGIN
+    UPDATE publish_stats_daily SET count = count - 1
+    WHERE day = coalesce(date(old.published_at), '')
+      AND service_name = old.service_name AND status = old.status;
+    DELETE FROM publish_stats_daily
+    WHERE day = coalesce(date(old.published_at), '')
+      AND service_name = old.service_name AND status = old.status AND count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS publish_stats_update
+AFTER UPDATE OF published_at, service_name, status ON publish_history BEGIN
+    UPDATE publish_stats_daily SET count = count - 1
+    WHERE day = coalesce(date(old.published_at), '')
+      AND service_name = old.service_name AND status = old.status;
+    DELETE FROM publish_stats_daily
+    WHERE day = coalesce(date(old.published_at), '')
+      AND service_name = old.service_name AND status = old.status AND count <= 0;
+    INSERT INTO publish_stats_daily (day, service_name, status, count)
+    VALUES (coalesce(date(new.published_at), ''), new.service_name, new.status, 1)
+    ON CONFLICT (day, service_name, status) DO UPDATE SET count = count + 1;
+END;
+
+INSERT INTO publish_stats_daily (day, service_name, status, count)
+SELECT coalesce(date(published_at), ''), service_name, status, count(*)
+FROM publish_history WHERE true
+GROUP BY 1, 2, 3
+ON CONFLICT (day, service_name, status) DO NOTHING;
+""",
+    ),
+)
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """現在のスキーマバージョンを取得する。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+
+    Returns:
+        スキーマバージョン（未設定の場合は0）。
+    """
+    row = conn.execute("PRAGMA user_version").fetchone()
+    return int(row[0])
+
+
+def apply_migrations(
+    conn: sqlite3.Connection,
+    migrations: tuple[Migration, ...] = MIGRATIONS,
+) -> int:
+    """未適用のマイグレーションを順番に適用する。
+
+    各マイグレーションはバージョン番号の更新と同じトランザクションで実行し、
+    失敗した場合はそのマイグレーションをロールバックする。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        migrations: マイグレーション一覧（バージョンの昇順）。
+
+    Returns:
+        適用後のスキーマバージョン。
+
+    Raises:
+        sqlite3.Error: マイグレーションの実行に失敗した場合。
+    """
+    current = get_schema_version(conn)
+    latest = migrations[-1].version if migrations else 0
+    if current > latest:
+        logger.warning(
+            "DBのスキーマバージョンがアプリより新しいため移行をスキップします: "
+            "db=%s, app=%s",
+            current,
+            latest,
+        )
+        return current
+
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+        try:
+            conn.executescript(
+                f"BEGIN;\n{migration.sql}\n"
+                f"PRAGMA user_version = {migration.version:d};\nCOMMIT;"
+            )
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            logger.exception(
+                "マイグレーションに失敗しました: version=%s", migration.version
+            )
+            raise
+        current = migration.version
+        logger.info(
+            "マイグレーションを適用しました: version=%s (%s)",
+            migration.version,
+            migration.description,
+        )
+    return current
@@ -0,0 +1,279 @@
+"""下書きの版履歴の保存形式を扱うモジュール。
+
+各版の本文は直前の版からの行単位の差分として zlib 圧縮して保存し、
+SNAPSHOT_INTERVAL 版ごとに本文全体（スナップショット）を保存する。
+任意の版の復元は直近のスナップショットから最大 SNAPSHOT_INTERVAL - 1 個の
+差分を適用するだけで済む。
+"""
+
+import difflib
+import json
+import sqlite3
+import zlib
+from datetime import datetime
+
+from postblog.models.draft import (
+    Draft,
+    DraftRevision,
+    DraftRevisionSummary,
+    content_hash,
+)
+
+
+# スナップショットを保存する間隔（版数）
+SNAPSHOT_INTERVAL = 20
+
+# 差分の操作種別（直前の版の行をコピー / 読み飛ばし / 新しい行を挿入）
+OP_COPY = "="
+OP_SKIP = "-"
+OP_INSERT = "+"
+
+
+def encode_delta(old: str, new: str) -> bytes:
+    """2つの本文の行単位の差分を圧縮した形式にエンコードする。
+
+    Args:
+        old: 直前の版の本文。
+        new: 新しい版の本文。
+
+    Returns:
+        zlib 圧縮した差分（JSON）。
+    """
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    # 編集は局所的なことが多いため、先頭と末尾の共通行を除いた範囲だけを比較する
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    ops: list[list[object]] = [[OP_COPY, prefix]] if prefix else []
+    old_middle = old_lines[prefix : len(old_lines) - suffix]
+    new_middle = new_lines[prefix : len(new_lines) - suffix]
+    matcher = difflib.SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([OP_COPY, i2 - i1])
+            continue
+        if i2 > i1:
+            ops.append([OP_SKIP, i2 - i1])
+        if j2 > j1:
+            ops.append([OP_INSERT, new_middle[j1:j2]])
+    if suffix:
+        ops.append([OP_COPY, suffix])
+    return zlib.compress(json.dumps(ops, ensure_ascii=False).encode("utf-8"))
+
+
+def apply_delta(old: str, delta: bytes) -> str:
+    """差分を適用して新しい版の本文を復元する。
+
+    Args:
+        old: 直前の版の本文。
+        delta: encode_delta() でエンコードした差分。
+
+    Returns:
+        新しい版の本文。
+    """
+    old_lines = old.splitlines(keepends=True)
+    ops = json.loads(zlib.decompress(delta).decode("utf-8"))
+
+    lines: list[str] = []
+    position = 0
+    for op, value in ops:
+        if op == OP_COPY:
+            lines.extend(old_lines[position : position + value])
+            position += value
+        elif op == OP_SKIP:
+            position += value
+        else:
+            lines.extend(value)
+    return "".join(lines)
+
+
+def encode_snapshot(body: str) -> bytes:
+    """本文全体を圧縮する。
+
+    Args:
+        body: 本文。
+
+    Returns:
+        zlib 圧縮した本文。
+    """
+    return zlib.compress(body.encode("utf-8"))
+
+
+def decode_snapshot(payload: bytes) -> str:
+    """圧縮した本文全体を展開する。
+
+    Args:
+        payload: encode_snapshot() で圧縮した本文。
+
+    Returns:
+        本文。
+    """
+    return zlib.decompress(payload).decode("utf-8")
+
+
+def append_revision(
+    conn: sqlite3.Connection, draft_id: int, draft: Draft, saved_at: str
+) -> int | None:
+    """下書きの新しい版を追加する（下書きの保存と同じトランザクションで呼ぶこと）。
+
+    内容が最新の版と同じ場合は追加しない。前回のスナップショットから
+    SNAPSHOT_INTERVAL 版経過した場合、または本文の大半を書き換えて差分が
+    小さくならない場合はスナップショットとして保存する。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        draft_id: 下書きID。
+        draft: 保存した下書き。
+        saved_at: 保存日時（ISO 8601形式）。
+
+    Returns:
+        追加した版番号。追加しなかった場合はNone。
+    """
+    digest = content_hash(draft)
+    latest = conn.execute(
+        """SELECT revision, content_hash FROM draft_revisions
+           WHERE draft_id = ? ORDER BY revision DESC LIMIT 1""",
+        (draft_id,),
+    ).fetchone()
+    if latest is not None and latest[1] == digest:
+        return None
+
+    revision = 1 if latest is None else latest[0] + 1
+    payload: bytes | None = None
+    if latest is not None:
+        snapshot_revision, previous_body = _reconstruct(conn, draft_id, latest[0])
+        if revision - snapshot_revision < SNAPSHOT_INTERVAL:
+            delta = encode_delta(previous_body, draft.body)
+            # 本文の大半を書き換えた場合は差分を使わない（圧縮前の本文の半分を目安にする）
+            if len(delta) * 2 < len(draft.body.encode("utf-8")):
+                payload = delta
+    is_snapshot = payload is None
+    if payload is None:
+        payload = encode_snapshot(draft.body)
+
+    conn.execute(
+        """INSERT INTO draft_revisions
+           (draft_id, revision, is_snapshot, title, tags, payload, content_hash, created_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            draft_id,
+            revision,
+            int(is_snapshot),
+            draft.title,
+            json.dumps(draft.tags, ensure_ascii=False),
+            payload,
+            digest,
+            saved_at,
+        ),
+    )
+    return revision
+
+
+def list_revisions(
+    conn: sqlite3.Connection, draft_id: int
+) -> list[DraftRevisionSummary]:
+    """下書きの版の一覧を取得する（新しい順）。本文は復元しない。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        draft_id: 下書きID。
+
+    Returns:
+        版の要約のリスト。
+    """
+    rows = conn.execute(
+        """SELECT revision, title, is_snapshot, length(payload) AS stored_size, created_at
+           FROM draft_revisions WHERE draft_id = ? ORDER BY revision DESC""",
+        (draft_id,),
+    ).fetchall()
+    return [
+        DraftRevisionSummary(
+            revision=row["revision"],
+            title=row["title"] or "",
+            is_snapshot=bool(row["is_snapshot"]),
+            stored_size=row["stored_size"] or 0,
+            created_at=_parse_datetime(row["created_at"]),
+        )
+        for row in rows
+    ]
+
+
+def load_revision(
+    conn: sqlite3.Connection, draft_id: int, revision: int
+) -> DraftRevision | None:
+    """下書きの指定した版を復元する。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        draft_id: 下書きID。
+        revision: 版番号。
+
+    Returns:
+        復元した版。見つからない場合はNone。
+    """
+    row = conn.execute(
+        """SELECT title, tags, created_at FROM draft_revisions
+           WHERE draft_id = ? AND revision = ?""",
+        (draft_id, revision),
+    ).fetchone()
+    if row is None:
+        return None
+
+    _, body = _reconstruct(conn, draft_id, revision)
+    return DraftRevision(
+        draft_id=draft_id,
+        revision=revision,
+        title=row["title"] or "",
+        body=body,
+        tags=json.loads(row["tags"]) if row["tags"] else [],
+        created_at=_parse_datetime(row["created_at"]),
+    )
+
+
+def _reconstruct(
+    conn: sqlite3.Connection, draft_id: int, revision: int
+) -> tuple[int, str]:
+    """直近のスナップショットから差分を順に適用して本文を復元する。
+
+    Args:
+        conn: SQLite接続オブジェクト。
+        draft_id: 下書きID。
+        revision: 復元する版番号（存在すること）。
+
+    Returns:
+        起点にしたスナップショットの版番号と、復元した本文のタプル。
+    """
+    rows = conn.execute(
+        """SELECT revision, is_snapshot, payload FROM draft_revisions
+           WHERE draft_id = ? AND revision <= ? AND revision >= (
+               SELECT max(revision) FROM draft_revisions
+               WHERE draft_id = ? AND revision <= ? AND is_snapshot = 1
+           )
+           ORDER BY revision""",
+        (draft_id, revision, draft_id, revision),
+    ).fetchall()
+
+    snapshot_revision = rows[0][0]
+    body = decode_snapshot(rows[0][2])
+    for row in rows[1:]:
+        body = apply_delta(body, row[2])
+    return snapshot_revision, body
+
+
+def _parse_datetime(value: str | None) -> datetime:
+    """保存日時の文字列を変換する。
+
+    Args:
+        value: ISO 8601形式の日時文字列。
+
+    Returns:
+        日時。未設定の場合は現在日時。
+    """
+    return datetime.fromisoformat(value) if value else datetime.now()
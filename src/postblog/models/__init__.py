@@ -5,9 +5,15 @@
 
 from postblog.models.article import Article
 from postblog.models.blog_type import BlogType, HearingItem
-from postblog.models.draft import Draft
+from postblog.models.draft import (
+    Draft,
+    DraftRevision,
+    DraftRevisionSummary,
+    DraftSummary,
+)
 from postblog.models.hearing import HearingMessage, HearingResult
 from postblog.models.publish_result import PublishRequest, PublishResult
+from postblog.models.search import SearchResult
 from postblog.models.seo import (
     SeoAdvice,
     SeoAdviceItem,
@@ -21,11 +27,15 @@ __all__ = [
     "Article",
     "BlogType",
     "Draft",
+    "DraftRevision",
+    "DraftRevisionSummary",
+    "DraftSummary",
     "HearingItem",
     "HearingMessage",
     "HearingResult",
     "PublishRequest",
     "PublishResult",
+    "SearchResult",
     "SeoAdvice",
     "SeoAdviceItem",
     "SeoAnalysisResult",
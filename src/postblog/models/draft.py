@@ -1,5 +1,7 @@
 """下書きデータモデル。"""
 
+import hashlib
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -27,3 +29,84 @@ class Draft:
     hearing_data: str = ""
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class DraftSummary:
+    """一覧表示用の下書き要約データ。
+
+    本文全体やヒアリング結果を含まず、一覧表示に必要な列のみを保持する。
+
+    Args:
+        id: 下書きID。
+        title: 記事タイトル。
+        preview: 本文プレビュー（長い場合は末尾に "..." を付与）。
+        blog_type_id: ブログ種別ID。
+        updated_at: 更新日時。
+    """
+
+    id: int
+    title: str = ""
+    preview: str = ""
+    blog_type_id: str = ""
+    updated_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class DraftRevision:
+    """下書きの保存済みの版。
+
+    Args:
+        draft_id: 下書きID。
+        revision: 版番号（下書きごとに1から連番）。
+        title: 記事タイトル。
+        body: 記事本文（Markdown形式）。
+        tags: タグリスト。
+        created_at: 保存日時。
+    """
+
+    draft_id: int
+    revision: int
+    title: str = ""
+    body: str = ""
+    tags: list[str] = field(default_factory=list)
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class DraftRevisionSummary:
+    """一覧表示用の下書きの版の要約データ。
+
+    本文を復元せず、保存形式の情報のみを保持する。
+
+    Args:
+        revision: 版番号。
+        title: 記事タイトル。
+        is_snapshot: 本文全体を保存した版の場合True（Falseは差分）。
+        stored_size: 本文の保存サイズ（圧縮後のバイト数）。
+        created_at: 保存日時。
+    """
+
+    revision: int
+    title: str = ""
+    is_snapshot: bool = False
+    stored_size: int = 0
+    created_at: datetime = field(default_factory=datetime.now)
+
+
+def content_hash(draft: Draft) -> str:
+    """下書きの保存対象の内容からハッシュ値を計算する。
+
+    ID・日時を除く内容が同じ下書きは同じハッシュ値になる。
+
+    Args:
+        draft: 下書き。
+
+    Returns:
+        SHA-256 ハッシュの16進文字列。
+    """
+    payload = json.dumps(
+        [draft.title, draft.body, draft.tags, draft.blog_type_id, draft.hearing_data],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
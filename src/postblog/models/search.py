@@ -0,0 +1,20 @@
+"""全文検索結果のデータモデル。"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class SearchResult:
+    """全文検索の結果。
+
+    Args:
+        id: 該当レコードのID（下書きIDまたは投稿履歴ID）。
+        title: 記事タイトル。
+        snippet: 一致箇所を含む抜粋（一致箇所は【】で囲む）。
+        score: 関連度スコア（大きいほど関連度が高い）。
+    """
+
+    id: int
+    title: str
+    snippet: str
+    score: float = 0.0
@@ -5,8 +5,10 @@ LLMを使用した記事生成とSEO対策ポイント解説のパースを提
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
 
+from postblog.exceptions import LLMError
 from postblog.infrastructure.llm.base import LLMClient
 from postblog.models.article import Article
 from postblog.models.hearing import HearingResult
@@ -32,45 +34,227 @@ class ArticleService:
         self._llm = llm_client
 
     async def generate(
-        self, hearing_result: HearingResult
+        self, hearing_result: HearingResult, *, use_cache: bool = True
     ) -> tuple[Article, SeoAdvice]:
         """ヒアリング結果から記事とSEO対策ポイントを生成する。
 
         Args:
             hearing_result: ヒアリング結果。
+            use_cache: Falseの場合はLLMの応答キャッシュを使わずに生成する。
 
         Returns:
             (Article, SeoAdvice) のタプル。
         """
-        prompt = ARTICLE_GENERATION_PROMPT.format(
-            hearing_summary=hearing_result.summary,
-            seo_keywords=hearing_result.seo_keywords,
-            seo_target_audience=hearing_result.seo_target_audience,
-            seo_search_intent=hearing_result.seo_search_intent,
+        response = await self._llm.chat(
+            _build_messages(hearing_result), use_cache=use_cache
         )
+        article_body, seo_advice = parse_article_response(response)
 
-        messages = [
-            {
-                "role": "system",
-                "content": "あなたはSEO対策に詳しいプロのブログライターです。",
-            },
-            {"role": "user", "content": prompt},
-        ]
+        article = _build_article(article_body, hearing_result)
+        logger.info("記事を生成しました: title=%s", article.title)
+        return article, seo_advice
 
-        response = await self._llm.chat(messages)
-        article_body, seo_advice = parse_article_response(response)
+    def generate_stream(
+        self, hearing_result: HearingResult, *, use_cache: bool = True
+    ) -> "ArticleStream":
+        """ヒアリング結果から記事をストリーミング生成する。
+
+        返り値を ``async for`` で反復すると記事本文のチャンクが順に得られる。
+        SEO対策ポイントは本文として返さず、ストリーム終了後に
+        ``ArticleStream.result`` から取得する。
+
+        Args:
+            hearing_result: ヒアリング結果。
+            use_cache: Falseの場合はLLMの応答キャッシュを使わずに生成する。
 
-        article = Article(
-            title=_extract_title(article_body),
-            body=article_body,
-            blog_type_id=hearing_result.blog_type_id,
-            seo_keywords=hearing_result.seo_keywords,
-            seo_target_audience=hearing_result.seo_target_audience,
-            seo_search_intent=hearing_result.seo_search_intent,
+        Returns:
+            記事本文のチャンクを返す非同期イテレータ。
+        """
+        chunks = self._llm.chat_stream(
+            _build_messages(hearing_result), use_cache=use_cache
         )
+        return ArticleStream(chunks, hearing_result)
 
-        logger.info("記事を生成しました: title=%s", article.title)
-        return article, seo_advice
+
+class ArticleStream:
+    """ストリーミング生成中の記事。
+
+    LLMの応答チャンクから SEO_ADVICE_START_MARKER をチャンク境界を
+    またいで検出し、マーカーより前の本文だけを返す。本文の前後の空白は
+    ``parse_article_response`` と同様に除去される。
+
+    Args:
+        chunks: LLMの応答チャンク。
+        hearing_result: ヒアリング結果。
+    """
+
+    def __init__(
+        self, chunks: AsyncIterator[str], hearing_result: HearingResult
+    ) -> None:
+        self._chunks = chunks
+        self._hearing_result = hearing_result
+        self._pending = ""
+        self._body_parts: list[str] = []
+        self._advice_parts: list[str] | None = None
+        self._result: tuple[Article, SeoAdvice] | None = None
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iterate()
+
+    @property
+    def result(self) -> tuple[Article, SeoAdvice]:
+        """生成結果の (Article, SeoAdvice) タプル。
+
+        Raises:
+            LLMError: ストリームが終了していない場合。
+        """
+        if self._result is None:
+            raise LLMError("記事の生成が完了していません。")
+        return self._result
+
+    async def _iterate(self) -> AsyncIterator[str]:
+        """本文チャンクを返し、終了時に生成結果を確定する。"""
+        async for chunk in self._chunks:
+            body = self._feed(chunk)
+            if body:
+                yield body
+
+        body = self._close()
+        if body:
+            yield body
+
+        article = _build_article("".join(self._body_parts), self._hearing_result)
+        self._result = (article, self._parse_advice())
+        logger.info("記事をストリーミング生成しました: title=%s", article.title)
+
+    def _feed(self, chunk: str) -> str:
+        """チャンクを受け取り、確定した本文を返す。
+
+        マーカーの先頭部分に一致する末尾と、末尾の空白は次のチャンクまで保留する。
+
+        Args:
+            chunk: LLMの応答チャンク。
+
+        Returns:
+            確定した本文（なければ空文字列）。
+        """
+        if self._advice_parts is not None:
+            self._advice_parts.append(chunk)
+            return ""
+
+        text = self._pending + chunk
+        if not self._body_parts:
+            text = text.lstrip()
+
+        index = text.find(SEO_ADVICE_START_MARKER)
+        if index >= 0:
+            self._advice_parts = [text[index + len(SEO_ADVICE_START_MARKER) :]]
+            self._pending = ""
+            return self._emit(text[:index].rstrip())
+
+        held = _marker_prefix_length(text)
+        body = text[: len(text) - held].rstrip()
+        self._pending = text[len(body) :]
+        return self._emit(body)
+
+    def _close(self) -> str:
+        """ストリーム終了時に保留中の本文を返す。
+
+        Returns:
+            確定した本文（なければ空文字列）。
+        """
+        if self._advice_parts is not None:
+            return ""
+        text = self._pending.strip() if not self._body_parts else self._pending
+        self._pending = ""
+        return self._emit(text.rstrip())
+
+    def _emit(self, body: str) -> str:
+        """本文を確定する。
+
+        Args:
+            body: 確定する本文。
+
+        Returns:
+            確定した本文。
+        """
+        if body:
+            self._body_parts.append(body)
+        return body
+
+    def _parse_advice(self) -> SeoAdvice:
+        """マーカー以降の応答からSEO対策ポイントをパースする。
+
+        Returns:
+            SeoAdviceインスタンス。マーカーがない場合は空。
+        """
+        if self._advice_parts is None:
+            return SeoAdvice()
+        advice = "".join(self._advice_parts)
+        end = advice.find(SEO_ADVICE_END_MARKER)
+        if end >= 0:
+            advice = advice[:end]
+        return _parse_seo_advice(advice.strip())
+
+
+def _build_messages(hearing_result: HearingResult) -> list[dict[str, str]]:
+    """記事生成用のメッセージリストを作成する。
+
+    Args:
+        hearing_result: ヒアリング結果。
+
+    Returns:
+        メッセージリスト。
+    """
+    prompt = ARTICLE_GENERATION_PROMPT.format(
+        hearing_summary=hearing_result.summary,
+        seo_keywords=hearing_result.seo_keywords,
+        seo_target_audience=hearing_result.seo_target_audience,
+        seo_search_intent=hearing_result.seo_search_intent,
+    )
+
+    return [
+        {
+            "role": "system",
+            "content": "あなたはSEO対策に詳しいプロのブログライターです。",
+        },
+        {"role": "user", "content": prompt},
+    ]
+
+
+def _build_article(article_body: str, hearing_result: HearingResult) -> Article:
+    """記事本文とヒアリング結果から記事を作成する。
+
+    Args:
+        article_body: 記事本文。
+        hearing_result: ヒアリング結果。
+
+    Returns:
+        記事。
+    """
+    return Article(
+        title=_extract_title(article_body),
+        body=article_body,
+        blog_type_id=hearing_result.blog_type_id,
+        seo_keywords=hearing_result.seo_keywords,
+        seo_target_audience=hearing_result.seo_target_audience,
+        seo_search_intent=hearing_result.seo_search_intent,
+    )
+
+
+def _marker_prefix_length(text: str) -> int:
+    """テキスト末尾がマーカーの先頭部分と一致する長さを返す。
+
+    Args:
+        text: 対象テキスト。
+
+    Returns:
+        一致する長さ（一致しない場合は0）。
+    """
+    for length in range(min(len(SEO_ADVICE_START_MARKER) - 1, len(text)), 0, -1):
+        if text.endswith(SEO_ADVICE_START_MARKER[:length]):
+            return length
+    return 0
 
 
 def parse_article_response(response: str) -> tuple[str, SeoAdvice]:
@@ -0,0 +1,313 @@
+"""自動保存サービス。
+
+編集中の下書きを専用スレッドで保存する。編集が止まってから一定時間が
+経過した時点、または最初の未保存の編集から自動保存間隔が経過した時点の
+うち早い方で保存し、内容が前回の保存から変わっていない場合は書き込みを省略する。
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from postblog.models.draft import Draft, content_hash
+from postblog.services.draft_service import DraftService
+
+
+logger = logging.getLogger(__name__)
+
+# デフォルトの自動保存間隔（秒）
+DEFAULT_AUTOSAVE_INTERVAL = 30.0
+
+# 編集が止まってから保存するまでの時間（秒）
+DEFAULT_IDLE_DELAY = 3.0
+
+
+@dataclass
+class _PendingSave:
+    """保存待ちの下書き。
+
+    Args:
+        generation: 編集対象の世代（reset() のたびに増える）。
+        draft: 保存する下書きのスナップショット。
+        first_dirty_at: 最初の未保存の編集時刻（time.monotonic）。
+        last_edit_at: 最後の編集時刻（time.monotonic）。
+        saved_hash: 編集対象が切り替わった時点の保存済み内容のハッシュ値。
+    """
+
+    generation: int
+    draft: Draft
+    first_dirty_at: float
+    last_edit_at: float
+    saved_hash: str | None = None
+
+
+class AutosaveService:
+    """編集中の下書きを自動保存するサービス。
+
+    mark_dirty() で通知された最新のスナップショットだけを保存するため、
+    連続した編集は1回の書き込みにまとめられる。同じ編集対象の保存は
+    最初の保存で採番された下書きIDへの更新になる。
+
+    Args:
+        draft_service: 下書き管理サービス。
+        interval: 自動保存間隔（秒）。
+        idle_delay: 編集が止まってから保存するまでの時間（秒）。
+        on_saved: 保存完了時コールバック（保存したスレッドから呼ばれる）。
+    """
+
+    def __init__(
+        self,
+        draft_service: DraftService,
+        interval: float = DEFAULT_AUTOSAVE_INTERVAL,
+        idle_delay: float = DEFAULT_IDLE_DELAY,
+        on_saved: Callable[[Draft], None] | None = None,
+    ) -> None:
+        self._draft_service = draft_service
+        self._interval = interval
+        self._idle_delay = idle_delay
+        self._on_saved = on_saved
+        self._condition = threading.Condition()
+        self._save_lock = threading.Lock()
+        self._pending: _PendingSave | None = None
+        self._backlog: list[_PendingSave] = []
+        self._generation = 0
+        self._draft_id: int | None = None
+        self._saved_hash: str | None = None
+        self._flush_requested = False
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval(self) -> float:
+        """自動保存間隔（秒）。"""
+        return self._interval
+
+    @property
+    def draft_id(self) -> int | None:
+        """編集中の下書きID（未保存の場合はNone）。"""
+        with self._condition:
+            return self._draft_id
+
+    @property
+    def is_dirty(self) -> bool:
+        """未保存の編集があるかを返す。"""
+        with self._condition:
+            return self._pending is not None or bool(self._backlog)
+
+    def set_interval(self, seconds: float) -> None:
+        """自動保存間隔を変更する。
+
+        Args:
+            seconds: 自動保存間隔（秒）。
+        """
+        with self._condition:
+            self._interval = seconds
+            self._condition.notify()
+
+    def set_on_saved(self, callback: Callable[[Draft], None] | None) -> None:
+        """保存完了時コールバックを設定する。
+
+        Args:
+            callback: 保存された下書きを受け取るコールバック。
+        """
+        self._on_saved = callback
+
+    def start(self) -> None:
+        """ワーカースレッドを起動する。"""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="postblog-autosave", daemon=True
+            )
+            self._thread.start()
+        logger.info("自動保存を開始しました: interval=%s秒", self._interval)
+
+    def stop(self) -> None:
+        """ワーカースレッドを停止し、未保存の編集を呼び出し元スレッドで保存する。"""
+        with self._condition:
+            thread = self._thread
+            self._thread = None
+            self._stopped = True
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+        self.flush()
+        logger.info("自動保存を停止しました")
+
+    def reset(self, draft: Draft | None = None) -> None:
+        """編集対象を切り替える。
+
+        切り替え前の未保存の編集は破棄せず、ワーカースレッドで直ちに保存する。
+
+        Args:
+            draft: 読み込んだ保存済みの下書き（新規の記事の場合はNone）。
+        """
+        with self._condition:
+            if self._pending is not None:
+                self._pending.saved_hash = self._saved_hash
+                self._backlog.append(self._pending)
+                self._pending = None
+                self._flush_requested = True
+            self._generation += 1
+            self._draft_id = draft.id if draft is not None else None
+            self._saved_hash = content_hash(draft) if draft is not None else None
+            self._condition.notify()
+
+    def mark_dirty(self, draft: Draft) -> None:
+        """編集があったことを通知する。
+
+        Args:
+            draft: 編集後の下書きのスナップショット（呼び出し後に変更しないこと）。
+        """
+        now = time.monotonic()
+        with self._condition:
+            if draft.id is None:
+                draft.id = self._draft_id
+            if self._pending is not None:
+                self._pending.draft = draft
+                self._pending.last_edit_at = now
+            else:
+                self._pending = _PendingSave(
+                    generation=self._generation,
+                    draft=draft,
+                    first_dirty_at=now,
+                    last_edit_at=now,
+                )
+            self._condition.notify()
+
+    def request_flush(self) -> None:
+        """未保存の編集をワーカースレッドで直ちに保存するよう要求する。"""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify()
+
+    def flush(self) -> Draft | None:
+        """未保存の編集を呼び出し元スレッドで保存する。
+
+        Returns:
+            最後に保存した下書き。保存しなかった場合はNone。
+        """
+        with self._condition:
+            items = self._take_all()
+        saved = None
+        for item in items:
+            saved = self._save(item) or saved
+        return saved
+
+    def save(self, draft: Draft) -> Draft:
+        """下書きを現在の編集対象として直ちに保存する（手動保存用）。
+
+        呼び出し元スレッドで保存するため、GUIスレッドから呼ばないこと。
+
+        Args:
+            draft: 保存する下書き。
+
+        Returns:
+            保存された下書き。内容が変わっていない場合は書き込まずに返す。
+        """
+        now = time.monotonic()
+        with self._condition:
+            if draft.id is None:
+                draft.id = self._draft_id
+            # 保存待ちの編集はこの保存で置き換える
+            self._pending = None
+            item = _PendingSave(
+                generation=self._generation,
+                draft=draft,
+                first_dirty_at=now,
+                last_edit_at=now,
+            )
+        return self._save(item) or draft
+
+    def _take_all(self) -> list[_PendingSave]:
+        """保存待ちをすべて取り出す（_condition 取得中に呼ぶこと）。
+
+        Returns:
+            切り替え前の編集対象から順に並べた保存待ちのリスト。
+        """
+        items = self._backlog
+        if self._pending is not None:
+            items.append(self._pending)
+        self._backlog = []
+        self._pending = None
+        self._flush_requested = False
+        return items
+
+    def _wait_for_due(self) -> list[_PendingSave] | None:
+        """保存時刻になるまで待機し、保存する編集を取り出す（_condition 取得中に呼ぶこと）。
+
+        Returns:
+            保存待ちのリスト。停止が要求された場合はNone。
+        """
+        while not self._stopped:
+            if self._flush_requested:
+                return self._take_all()
+            pending = self._pending
+            if pending is None:
+                self._condition.wait()
+                continue
+            due = min(
+                pending.last_edit_at + self._idle_delay,
+                pending.first_dirty_at + self._interval,
+            )
+            remaining = due - time.monotonic()
+            if remaining <= 0:
+                return self._take_all()
+            self._condition.wait(remaining)
+        return None
+
+    def _run(self) -> None:
+        """ワーカースレッドの処理。保存時刻になった編集を保存する。"""
+        while True:
+            with self._condition:
+                items = self._wait_for_due()
+            if items is None:
+                return
+            for item in items:
+                try:
+                    self._save(item)
+                except Exception:
+                    logger.exception("自動保存に失敗しました")
+
+    def _save(self, item: _PendingSave) -> Draft | None:
+        """保存待ちの下書きを保存する。内容が保存済みと同じ場合は省略する。
+
+        Args:
+            item: 保存待ちの下書き。
+
+        Returns:
+            保存した下書き。省略した場合はNone。
+        """
+        with self._save_lock:
+            digest = content_hash(item.draft)
+            with self._condition:
+                current = item.generation == self._generation
+                if current and item.draft.id is None:
+                    # 同じ編集対象の最初の保存が完了していれば、その下書きIDを使う
+                    item.draft.id = self._draft_id
+                saved_hash = self._saved_hash if current else item.saved_hash
+            if digest == saved_hash:
+                logger.debug("内容が変わっていないため保存を省略しました")
+                return None
+
+            saved = self._draft_service.save(item.draft)
+            with self._condition:
+                if item.generation == self._generation:
+                    self._draft_id = saved.id
+                    self._saved_hash = digest
+                for other in [*self._backlog, self._pending]:
+                    if (
+                        other is not None
+                        and other.generation == item.generation
+                        and other.draft.id is None
+                    ):
+                        other.draft.id = saved.id
+            logger.info("下書きを保存しました: id=%s", saved.id)
+
+        if self._on_saved is not None:
+            self._on_saved(saved)
+        return saved
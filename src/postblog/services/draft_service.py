@@ -1,9 +1,12 @@
 """下書き管理サービス。"""
 
+import difflib
 import logging
 
+from postblog.exceptions import ValidationError
 from postblog.infrastructure.storage.draft_repository import DraftRepository
-from postblog.models.draft import Draft
+from postblog.models.draft import Draft, DraftRevisionSummary, DraftSummary
+from postblog.models.search import SearchResult
 
 
 logger = logging.getLogger(__name__)
@@ -51,6 +54,101 @@ class DraftService:
         """
         return self._repo.find_all()
 
+    def search(self, query: str, limit: int = 20) -> list[SearchResult]:
+        """下書きを全文検索する。
+
+        Args:
+            query: 検索文字列（空白区切りでAND検索）。
+            limit: 取得件数上限。
+
+        Returns:
+            関連度順の検索結果のリスト。
+        """
+        return self._repo.search(query, limit)
+
+    def get_summaries(self, limit: int, offset: int = 0) -> list[DraftSummary]:
+        """一覧表示用の下書き要約を更新日時の降順で取得する。
+
+        Args:
+            limit: 取得件数上限。
+            offset: 読み飛ばす件数。
+
+        Returns:
+            下書き要約のリスト。
+        """
+        return self._repo.find_summaries(limit, offset)
+
+    def get_revisions(self, draft_id: int) -> list[DraftRevisionSummary]:
+        """下書きの版の一覧を新しい順で取得する。
+
+        Args:
+            draft_id: 下書きID。
+
+        Returns:
+            版の要約のリスト。
+        """
+        return self._repo.find_revisions(draft_id)
+
+    def diff_revisions(
+        self, draft_id: int, old_revision: int, new_revision: int
+    ) -> str:
+        """下書きの2つの版の本文を比較する。
+
+        Args:
+            draft_id: 下書きID。
+            old_revision: 比較元の版番号。
+            new_revision: 比較先の版番号。
+
+        Returns:
+            unified diff 形式の差分（差分がない場合は空文字列）。
+
+        Raises:
+            ValidationError: 指定した版が存在しない場合。
+        """
+        old = self._repo.find_revision(draft_id, old_revision)
+        new = self._repo.find_revision(draft_id, new_revision)
+        if old is None or new is None:
+            missing = old_revision if old is None else new_revision
+            msg = f"下書きの版が見つかりません: id={draft_id}, revision={missing}"
+            raise ValidationError(msg)
+
+        return "".join(
+            difflib.unified_diff(
+                old.body.splitlines(keepends=True),
+                new.body.splitlines(keepends=True),
+                fromfile=f"r{old_revision}",
+                tofile=f"r{new_revision}",
+            )
+        )
+
+    def restore_revision(self, draft_id: int, revision: int) -> Draft:
+        """下書きを指定した版の内容に戻して保存する。
+
+        復元も新しい版として記録されるため、復元前の内容にも戻せる。
+
+        Args:
+            draft_id: 下書きID。
+            revision: 復元する版番号。
+
+        Returns:
+            保存後の下書き。
+
+        Raises:
+            ValidationError: 下書きまたは指定した版が存在しない場合。
+        """
+        draft = self._repo.find_by_id(draft_id)
+        restored = self._repo.find_revision(draft_id, revision)
+        if draft is None or restored is None:
+            msg = f"下書きの版が見つかりません: id={draft_id}, revision={revision}"
+            raise ValidationError(msg)
+
+        draft.title = restored.title
+        draft.body = restored.body
+        draft.tags = restored.tags
+        saved = self._repo.save(draft)
+        logger.info("下書きを復元しました: id=%s, revision=%s", draft_id, revision)
+        return saved
+
     def delete(self, draft_id: int) -> bool:
         """下書きを削除する。
 
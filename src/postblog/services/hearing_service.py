@@ -5,6 +5,7 @@ LLMを使用したインタラクティブなヒアリングフローを管理
 
 import json
 import logging
+from collections.abc import AsyncIterator
 
 from postblog.infrastructure.llm.base import LLMClient
 from postblog.models.blog_type import BlogType
@@ -51,26 +52,7 @@ class HearingService:
         Returns:
             AIの応答テキスト。
         """
-        hearing_result.messages.append(
-            HearingMessage(role="user", content=user_message)
-        )
-
-        # ヒアリング項目の文字列生成
-        items_text = "\n".join(
-            f"- {item.question}（{'必須' if item.required else '任意'}）"
-            for item in blog_type.hearing_items
-        )
-
-        system_prompt = HEARING_SYSTEM_PROMPT.format(
-            hearing_policy=blog_type.hearing_policy,
-            hearing_items=items_text,
-        )
-
-        messages = [{"role": "system", "content": system_prompt}]
-        messages.extend(
-            {"role": msg.role, "content": msg.content}
-            for msg in hearing_result.messages
-        )
+        messages = _build_messages(hearing_result, user_message, blog_type)
 
         response = await self._llm.chat(messages)
         hearing_result.messages.append(
@@ -80,6 +62,33 @@ class HearingService:
         logger.debug("ヒアリングメッセージを送受信しました")
         return response
 
+    async def send_message_stream(
+        self, hearing_result: HearingResult, user_message: str, blog_type: BlogType
+    ) -> AsyncIterator[str]:
+        """ユーザーメッセージを送信し、AIの応答をストリーミングで取得する。
+
+        応答全文はストリーム終了時にヒアリング結果へ追加される。
+
+        Args:
+            hearing_result: 現在のヒアリング結果。
+            user_message: ユーザーのメッセージ。
+            blog_type: ブログ種別。
+
+        Yields:
+            AIの応答テキストのチャンク。
+        """
+        messages = _build_messages(hearing_result, user_message, blog_type)
+
+        chunks: list[str] = []
+        async for chunk in self._llm.chat_stream(messages):
+            chunks.append(chunk)
+            yield chunk
+
+        hearing_result.messages.append(
+            HearingMessage(role="assistant", content="".join(chunks))
+        )
+        logger.debug("ヒアリングメッセージをストリーミングで送受信しました")
+
     async def generate_summary(self, hearing_result: HearingResult) -> HearingResult:
         """ヒアリング結果のサマリーを生成する。
 
@@ -114,3 +123,36 @@ class HearingService:
         hearing_result.completed = True
         logger.info("ヒアリングサマリーを生成しました")
         return hearing_result
+
+
+def _build_messages(
+    hearing_result: HearingResult, user_message: str, blog_type: BlogType
+) -> list[dict[str, str]]:
+    """ユーザーメッセージを履歴に追加し、LLMへ送るメッセージリストを作成する。
+
+    Args:
+        hearing_result: 現在のヒアリング結果。
+        user_message: ユーザーのメッセージ。
+        blog_type: ブログ種別。
+
+    Returns:
+        メッセージリスト。
+    """
+    hearing_result.messages.append(HearingMessage(role="user", content=user_message))
+
+    # ヒアリング項目の文字列生成
+    items_text = "\n".join(
+        f"- {item.question}（{'必須' if item.required else '任意'}）"
+        for item in blog_type.hearing_items
+    )
+
+    system_prompt = HEARING_SYSTEM_PROMPT.format(
+        hearing_policy=blog_type.hearing_policy,
+        hearing_items=items_text,
+    )
+
+    messages = [{"role": "system", "content": system_prompt}]
+    messages.extend(
+        {"role": msg.role, "content": msg.content} for msg in hearing_result.messages
+    )
+    return messages
@@ -1,11 +1,17 @@
 """投稿履歴サービス。"""
 
 import logging
+from datetime import date
 
+from postblog.exceptions import ValidationError
 from postblog.infrastructure.storage.history_repository import (
+    STATS_GROUP_COLUMNS,
     HistoryRecord,
     HistoryRepository,
+    HistorySummary,
+    PublishStat,
 )
+from postblog.models.search import SearchResult
 
 
 logger = logging.getLogger(__name__)
@@ -36,6 +42,40 @@ class HistoryService:
         )
         return saved
 
+    def save_many(self, records: list[HistoryRecord]) -> list[HistoryRecord]:
+        """複数の投稿履歴を1つのトランザクションでまとめて保存する。
+
+        Args:
+            records: 保存する投稿履歴のリスト。
+
+        Returns:
+            保存後のレコードのリスト。
+        """
+        return self._repo.save_many(records)
+
+    def get_stats(
+        self,
+        date_range: tuple[date, date] | None = None,
+        group_by: str = "service",
+    ) -> list[PublishStat]:
+        """投稿統計を取得する。
+
+        Args:
+            date_range: 集計期間の開始日と終了日（両端を含む、Noneの場合は全期間）。
+            group_by: 集計単位（"service" | "status" | "day"）。
+
+        Returns:
+            投稿統計のリスト。
+
+        Raises:
+            ValidationError: 未対応の集計単位が指定された場合。
+        """
+        if group_by not in STATS_GROUP_COLUMNS:
+            msg = f"未対応の集計単位です: {group_by}"
+            raise ValidationError(msg)
+        since, until = date_range if date_range is not None else (None, None)
+        return self._repo.find_stats(group_by, since, until)
+
     def get_all(self) -> list[HistoryRecord]:
         """全ての投稿履歴を取得する。
 
@@ -44,6 +84,30 @@ class HistoryService:
         """
         return self._repo.find_all()
 
+    def search(self, query: str, limit: int = 20) -> list[SearchResult]:
+        """投稿履歴を全文検索する。
+
+        Args:
+            query: 検索文字列（空白区切りでAND検索）。
+            limit: 取得件数上限。
+
+        Returns:
+            関連度順の検索結果のリスト。
+        """
+        return self._repo.search(query, limit)
+
+    def get_summaries(self, limit: int, offset: int = 0) -> list[HistorySummary]:
+        """一覧表示用の投稿履歴要約を投稿日時の降順で取得する。
+
+        Args:
+            limit: 取得件数上限。
+            offset: 読み飛ばす件数。
+
+        Returns:
+            投稿履歴要約のリスト。
+        """
+        return self._repo.find_summaries(limit, offset)
+
     def get(self, record_id: int) -> HistoryRecord | None:
         """投稿履歴を取得する。
 
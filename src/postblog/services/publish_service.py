@@ -1,9 +1,12 @@
 """投稿サービス。
 
-複数のブログサービスへの投稿を管理する。
+複数のブログサービスへの投稿を並行して管理する。
 """
 
+import asyncio
 import logging
+import threading
+from collections.abc import Callable
 
 from postblog.infrastructure.publishers.base import BlogPublisher
 from postblog.models.publish_result import PublishRequest, PublishResult
@@ -11,12 +14,53 @@ from postblog.models.publish_result import PublishRequest, PublishResult
 
 logger = logging.getLogger(__name__)
 
+# 同時に投稿するサービス数のデフォルト上限
+DEFAULT_MAX_CONCURRENCY = 4
+
+# サービスごとの投稿タイムアウトのデフォルト（秒）
+DEFAULT_PUBLISH_TIMEOUT = 60.0
+
+# サービス名ごとの投稿タイムアウトのデフォルト（秒）
+# Zenn は git push の完了を待つため、ZennPublisher の GIT_TIMEOUT より長くする
+DEFAULT_SERVICE_TIMEOUTS: dict[str, float] = {"zenn": 180.0}
+
+# 投稿クライアントの生成関数（認証情報が未設定の場合はNoneを返す）
+PublisherFactory = Callable[[], BlogPublisher | None]
+
 
 class PublishService:
-    """ブログ投稿を管理するサービス。"""
+    """ブログ投稿を管理するサービス。
+
+    複数サービスへの投稿は並行して実行する。投稿クライアントは生成関数で
+    登録しておき、最初に使用する時点で生成することもできる。生成関数が
+    None を返したサービス（認証情報が未設定など）は、invalidate() が
+    呼ばれるまで未設定として扱い、生成関数を呼び直さない。
+
+    Args:
+        max_concurrency: 同時に投稿するサービス数の上限。
+        default_timeout: サービスごとの投稿タイムアウト（秒）。Noneの場合は無制限。
+        timeouts: サービス名ごとの投稿タイムアウト（秒）。default_timeoutより優先し、
+            DEFAULT_SERVICE_TIMEOUTS の値を上書きする。
+
+    Raises:
+        ValueError: max_concurrency が1未満の場合。
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        default_timeout: float | None = DEFAULT_PUBLISH_TIMEOUT,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency は1以上を指定してください。")
         self._publishers: dict[str, BlogPublisher] = {}
+        self._factories: dict[str, PublisherFactory] = {}
+        self._unconfigured: set[str] = set()
+        self._lock = threading.Lock()
+        self._max_concurrency = max_concurrency
+        self._default_timeout = default_timeout
+        self._timeouts = {**DEFAULT_SERVICE_TIMEOUTS, **(timeouts or {})}
 
     def register_publisher(self, publisher: BlogPublisher) -> None:
         """投稿クライアントを登録する。
@@ -24,60 +68,179 @@ class PublishService:
         Args:
             publisher: 投稿クライアント。
         """
-        self._publishers[publisher.service_name] = publisher
+        with self._lock:
+            self._factories.pop(publisher.service_name, None)
+            self._unconfigured.discard(publisher.service_name)
+            self._publishers[publisher.service_name] = publisher
         logger.info("投稿クライアントを登録しました: %s", publisher.service_name)
 
+    def register_factory(self, service_name: str, factory: PublisherFactory) -> None:
+        """投稿クライアントの生成関数を登録する。
+
+        生成関数は投稿クライアントが最初に必要になった時点で呼び出す。
+        None を返した場合（認証情報が未設定など）は未設定として記録し、
+        invalidate() が呼ばれるまで再度呼び出さない。
+
+        Args:
+            service_name: サービス名。
+            factory: 投稿クライアントの生成関数。
+        """
+        with self._lock:
+            self._publishers.pop(service_name, None)
+            self._unconfigured.discard(service_name)
+            self._factories[service_name] = factory
+        logger.debug("投稿クライアントの生成関数を登録しました: %s", service_name)
+
+    def invalidate(self, service_name: str) -> None:
+        """生成関数で生成した投稿クライアントと未設定の記録を破棄する。
+
+        認証情報を変更した後に呼び出すと、次回の使用時に生成関数を呼び直す。
+        register_publisher() で登録した投稿クライアントは破棄しない。
+
+        Args:
+            service_name: サービス名。
+        """
+        with self._lock:
+            if service_name not in self._factories:
+                return
+            self._publishers.pop(service_name, None)
+            self._unconfigured.discard(service_name)
+        logger.debug("投稿クライアントを破棄しました: %s", service_name)
+
     def get_publishers(self) -> dict[str, BlogPublisher]:
         """登録済みの投稿クライアントを取得する。
 
+        未生成の投稿クライアントはこの時点で生成する。
+
         Returns:
             サービス名をキーとする投稿クライアントの辞書。
         """
-        return dict(self._publishers)
+        for name in self._pending_names():
+            self._build_publisher(name)
+        with self._lock:
+            return dict(self._publishers)
+
+    def _pending_names(self) -> list[str]:
+        """生成関数を呼ぶ必要があるサービス名を返す。
+
+        Returns:
+            未生成かつ未設定として記録されていないサービス名のリスト。
+        """
+        with self._lock:
+            return [
+                name
+                for name in self._factories
+                if name not in self._publishers and name not in self._unconfigured
+            ]
+
+    async def _aget_publisher(self, name: str) -> BlogPublisher | None:
+        """投稿クライアントを取得する（イベントループ用）。
+
+        生成関数は認証情報の読み出しやモジュールの読み込みを伴うため、
+        未生成の場合はワーカースレッドで生成する。
+
+        Args:
+            name: サービス名。
+
+        Returns:
+            投稿クライアント。未登録・生成できない場合はNone。
+        """
+        if name in self._pending_names():
+            await asyncio.to_thread(self._build_publisher, name)
+        with self._lock:
+            return self._publishers.get(name)
+
+    def _build_publisher(self, name: str) -> None:
+        """生成関数から投稿クライアントを生成して登録する。
+
+        生成中はロックを保持しないため、他のサービスの取得や投稿を妨げない。
+
+        Args:
+            name: サービス名。
+        """
+        with self._lock:
+            factory = self._factories.get(name)
+        if factory is None:
+            return
+        try:
+            publisher = factory()
+        except Exception:
+            logger.exception("投稿クライアントの生成に失敗しました: %s", name)
+            return
+
+        with self._lock:
+            # 生成中に登録し直された場合は結果を破棄する
+            if self._factories.get(name) is not factory:
+                return
+            if publisher is None:
+                self._unconfigured.add(name)
+                logger.debug("投稿クライアントの認証情報が未設定です: %s", name)
+                return
+            self._publishers.setdefault(name, publisher)
+        logger.info("投稿クライアントを生成しました: %s", name)
 
     async def publish(
         self, request: PublishRequest, service_names: list[str]
     ) -> list[PublishResult]:
-        """指定されたサービスに記事を投稿する。
+        """指定されたサービスに記事を並行して投稿する。
+
+        同時実行数は max_concurrency までに制限し、各サービスには
+        タイムアウトを適用する。1つのサービスの失敗や遅延は他のサービスに
+        影響しない。
 
         Args:
             request: 投稿リクエスト。
             service_names: 投稿先サービス名のリスト。
 
         Returns:
-            各サービスの投稿結果リスト。
+            各サービスの投稿結果リスト（service_names と同じ順序）。
         """
-        results: list[PublishResult] = []
+        semaphore = asyncio.Semaphore(self._max_concurrency)
 
-        for name in service_names:
-            publisher = self._publishers.get(name)
-            if publisher is None:
-                results.append(
-                    PublishResult(
-                        success=False,
-                        service_name=name,
-                        error_message=f"未登録のサービス: {name}",
-                    )
-                )
-                continue
-
-            try:
+        async def _limited(name: str) -> PublishResult:
+            async with semaphore:
+                return await self._publish_one(request, name)
+
+        return list(await asyncio.gather(*(_limited(name) for name in service_names)))
+
+    async def _publish_one(self, request: PublishRequest, name: str) -> PublishResult:
+        """1つのサービスに投稿する。
+
+        Args:
+            request: 投稿リクエスト。
+            name: 投稿先サービス名。
+
+        Returns:
+            投稿結果。失敗・タイムアウト時も例外は送出せず失敗結果を返す。
+        """
+        publisher = await self._aget_publisher(name)
+        if publisher is None:
+            return PublishResult(
+                success=False,
+                service_name=name,
+                error_message=f"未登録のサービス: {name}",
+            )
+
+        timeout = self._timeouts.get(name, self._default_timeout)
+        try:
+            async with asyncio.timeout(timeout):
                 result = await publisher.publish(request)
-                results.append(result)
-                logger.info("投稿結果: service=%s, success=%s", name, result.success)
-            except Exception as e:
-                logger.error(
-                    "投稿中にエラーが発生しました: service=%s, error=%s", name, e
-                )
-                results.append(
-                    PublishResult(
-                        success=False,
-                        service_name=name,
-                        error_message=str(e),
-                    )
-                )
-
-        return results
+            logger.info("投稿結果: service=%s, success=%s", name, result.success)
+            return result
+        except TimeoutError:
+            logger.error("投稿がタイムアウトしました: service=%s", name)
+            return PublishResult(
+                success=False,
+                service_name=name,
+                error_message=f"タイムアウトしました（{timeout}秒）",
+            )
+        except Exception as e:
+            logger.error("投稿中にエラーが発生しました: service=%s, error=%s", name, e)
+            return PublishResult(
+                success=False,
+                service_name=name,
+                error_message=str(e),
+            )
 
     async def test_connection(self, service_name: str) -> bool:
         """指定されたサービスの接続テストを実行する。
@@ -88,7 +251,7 @@ class PublishService:
         Returns:
             接続成功の場合True。
         """
-        publisher = self._publishers.get(service_name)
+        publisher = await self._aget_publisher(service_name)
         if publisher is None:
             return False
         return await publisher.test_connection()
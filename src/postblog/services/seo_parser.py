@@ -0,0 +1,461 @@
+"""SEO分析用のMarkdownパーサー。
+
+記事本文を1回だけ解析し、見出し・段落・リスト・テーブル・リンク・
+プレーンテキストを記録する。SEOの各チェック項目はこの解析結果を共有して参照する。
+
+編集時は reparse_article で編集範囲を含む段落だけを再解析し、
+集計値を差分更新する。
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+
+_MARKDOWN_SYMBOLS_RE = re.compile(r"[#*_`\[\]()!|>-]+")
+_HEADING_RE = re.compile(r"^(#{1,6})(?:[^\S\n]+(.+)|[^\S\n]*)$", re.MULTILINE)
+_LIST_ITEM_RE = re.compile(r"^[^\S\n]*(?:[-*+]|\d+\.)(?:[^\S\n]|$)", re.MULTILINE)
+_TABLE_ROW_RE = re.compile(r"^.*\|", re.MULTILINE)
+_EXTERNAL_LINK_RE = re.compile(r"\[(.*?)\]\((https?://.*?)\)")
+
+# 段落の区切り
+PARAGRAPH_SEPARATOR = "\n\n"
+
+# 冒頭キーワードチェックの対象文字数
+LEAD_LENGTH = 100
+
+# 長すぎる段落とみなす句点数（これを超えると長い段落）
+LONG_PARAGRAPH_SENTENCES = 5
+
+
+@dataclass
+class Heading:
+    """見出し。
+
+    Args:
+        level: 見出しレベル（1〜6）。
+        text: 見出しテキスト。
+        offset: 本文中のオフセット。
+    """
+
+    level: int
+    text: str
+    offset: int
+
+
+@dataclass
+class Paragraph:
+    """空行で区切られた段落。
+
+    Args:
+        offset: 本文中のオフセット。
+        length: 段落の文字数。
+        sentence_count: 句点（。）の数。
+    """
+
+    offset: int
+    length: int
+    sentence_count: int
+
+    @property
+    def is_long(self) -> bool:
+        """長すぎる段落の場合True。"""
+        return self.sentence_count > LONG_PARAGRAPH_SENTENCES
+
+
+@dataclass
+class Link:
+    """外部リンク。
+
+    Args:
+        text: リンクテキスト。
+        url: リンク先URL。
+        offset: 本文中のオフセット。
+    """
+
+    text: str
+    url: str
+    offset: int
+
+
+@dataclass
+class ParsedArticle:
+    """解析済みの記事本文。
+
+    SEOチェックが参照する集計値は解析時に算出し、
+    プレーンテキストと見出し・段落・リンクの位置情報は
+    初回参照時に算出してキャッシュする。
+
+    Args:
+        body: 記事本文（Markdown）。
+        plain_length: プレーンテキストの文字数（空白・改行を除く）。
+        heading_levels: 見出しレベルごとの出現数。
+        heading_texts: 見出しテキストごとの出現数（空の見出しを除く）。
+        paragraph_count: 段落数（見出しで始まるブロックを除く）。
+        long_paragraph_count: 長すぎる段落の数。
+        list_items: 箇条書き・番号付きリストの行数。
+        table_rows: "|" を含む行数。
+        rule_count: "---" の出現数。
+        link_count: 外部リンク数。
+    """
+
+    body: str
+    plain_length: int = 0
+    heading_levels: dict[int, int] = field(default_factory=dict)
+    heading_texts: dict[str, int] = field(default_factory=dict)
+    paragraph_count: int = 0
+    long_paragraph_count: int = 0
+    list_items: int = 0
+    table_rows: int = 0
+    rule_count: int = 0
+    link_count: int = 0
+
+    @property
+    def lead(self) -> str:
+        """冒頭部分（小文字化済み）。"""
+        return self.body[:LEAD_LENGTH].lower()
+
+    @property
+    def has_headings(self) -> bool:
+        """見出しが1つ以上ある場合True。"""
+        return any(self.heading_levels.values())
+
+    @property
+    def has_list(self) -> bool:
+        """リストが使用されている場合True。"""
+        return self.list_items > 0
+
+    @property
+    def has_table(self) -> bool:
+        """テーブル（"|" と "---"）が使用されている場合True。"""
+        return self.table_rows > 0 and self.rule_count > 0
+
+    @cached_property
+    def plain_text(self) -> str:
+        """Markdown記法を除去し小文字化した本文。"""
+        return _MARKDOWN_SYMBOLS_RE.sub("", self.body).lower()
+
+    @cached_property
+    def headings(self) -> list[Heading]:
+        """見出し一覧（出現順）。"""
+        if "#" not in self.body:
+            return []
+        return [
+            Heading(level=len(m.group(1)), text=m.group(2) or "", offset=m.start())
+            for m in _HEADING_RE.finditer(self.body)
+        ]
+
+    @cached_property
+    def paragraphs(self) -> list[Paragraph]:
+        """段落一覧（見出しで始まるブロックを除く）。"""
+        paragraphs: list[Paragraph] = []
+        offset = 0
+        for chunk in self.body.split(PARAGRAPH_SEPARATOR):
+            stripped = chunk.strip()
+            if stripped and not stripped.startswith("#"):
+                paragraphs.append(
+                    Paragraph(
+                        offset=offset,
+                        length=len(chunk),
+                        sentence_count=stripped.count("。"),
+                    )
+                )
+            offset += len(chunk) + len(PARAGRAPH_SEPARATOR)
+        return paragraphs
+
+    @cached_property
+    def links(self) -> list[Link]:
+        """外部リンク一覧（出現順）。"""
+        if "](http" not in self.body:
+            return []
+        return [
+            Link(text=m.group(1), url=m.group(2), offset=m.start())
+            for m in _EXTERNAL_LINK_RE.finditer(self.body)
+        ]
+
+    def keyword_count(self, keyword: str) -> int:
+        """プレーンテキスト中のキーワード出現数を数える。
+
+        Args:
+            keyword: キーワード（小文字化済み）。
+
+        Returns:
+            出現数。
+        """
+        return self.plain_text.count(keyword)
+
+    def heading_keyword_count(self, keyword: str) -> int:
+        """キーワードを含む見出しの数を数える。
+
+        Args:
+            keyword: キーワード（小文字化済み）。
+
+        Returns:
+            見出し数。
+        """
+        return sum(
+            count
+            for text, count in self.heading_texts.items()
+            if keyword in text.lower()
+        )
+
+    def _merge(self, other: "ParsedArticle", sign: int) -> None:
+        """他の解析結果の集計値を加算（sign=-1の場合は減算）する。
+
+        Args:
+            other: 加算する解析結果。
+            sign: 1で加算、-1で減算。
+        """
+        self.plain_length += sign * other.plain_length
+        _merge_counts(self.heading_levels, other.heading_levels, sign)
+        _merge_counts(self.heading_texts, other.heading_texts, sign)
+        self.paragraph_count += sign * other.paragraph_count
+        self.long_paragraph_count += sign * other.long_paragraph_count
+        self.list_items += sign * other.list_items
+        self.table_rows += sign * other.table_rows
+        self.rule_count += sign * other.rule_count
+        self.link_count += sign * other.link_count
+
+
+@dataclass
+class ArticleEdit:
+    """編集による再解析の結果。
+
+    Args:
+        parsed: 編集後の本文全体の解析結果。
+        removed: 再解析範囲の編集前の解析結果。
+        inserted: 再解析範囲の編集後の解析結果。
+    """
+
+    parsed: ParsedArticle
+    removed: ParsedArticle
+    inserted: ParsedArticle
+
+
+def parse_article(body: str) -> ParsedArticle:
+    """記事本文を解析する。
+
+    Args:
+        body: 記事本文（Markdown）。
+
+    Returns:
+        解析結果。
+    """
+    plain_text = _MARKDOWN_SYMBOLS_RE.sub("", body)
+    parsed = ParsedArticle(
+        body=body,
+        plain_length=len(plain_text) - plain_text.count(" ") - plain_text.count("\n"),
+        list_items=len(_LIST_ITEM_RE.findall(body)),
+        table_rows=len(_TABLE_ROW_RE.findall(body)) if "|" in body else 0,
+        rule_count=body.count("---"),
+    )
+
+    if "#" in body:
+        levels = parsed.heading_levels
+        texts = parsed.heading_texts
+        for marks, text in _HEADING_RE.findall(body):
+            levels[len(marks)] = levels.get(len(marks), 0) + 1
+            if text:
+                texts[text] = texts.get(text, 0) + 1
+
+    if "](http" in body:
+        parsed.link_count = len(_EXTERNAL_LINK_RE.findall(body))
+
+    for chunk in body.split(PARAGRAPH_SEPARATOR):
+        stripped = chunk.strip()
+        if stripped and stripped[0] != "#":
+            parsed.paragraph_count += 1
+            if stripped.count("。") > LONG_PARAGRAPH_SENTENCES:
+                parsed.long_paragraph_count += 1
+
+    parsed.plain_text = plain_text.lower()
+    return parsed
+
+
+def reparse_article(
+    previous: ParsedArticle,
+    body: str,
+    start: int,
+    old_end: int,
+    new_end: int,
+) -> ArticleEdit:
+    """編集範囲を含む段落だけを再解析する。
+
+    編集前の本文の ``[start, old_end)`` が編集後の本文の ``[start, new_end)`` に
+    置き換わったものとして、前後の段落境界までを再解析し集計値を差分更新する。
+    処理量は本文全体ではなく編集範囲周辺の段落の長さに比例する。
+
+    Args:
+        previous: 編集前の本文の解析結果。
+        body: 編集後の本文。
+        start: 編集開始オフセット。
+        old_end: 編集前の本文における編集終了オフセット。
+        new_end: 編集後の本文における編集終了オフセット。
+
+    Returns:
+        再解析の結果。
+
+    Raises:
+        ValueError: 編集範囲が本文と矛盾する場合。
+    """
+    old_body = previous.body
+    delta = new_end - old_end
+    if (
+        not 0 <= start <= old_end <= len(old_body)
+        or new_end < start
+        or len(body) != len(old_body) + delta
+    ):
+        raise ValueError(
+            f"編集範囲が不正です: start={start}, old_end={old_end}, new_end={new_end}"
+        )
+
+    region_start = _paragraph_start(old_body, start)
+    region_end = _paragraph_end(old_body, old_end)
+
+    removed = parse_article(old_body[region_start:region_end])
+    inserted = parse_article(body[region_start : region_end + delta])
+
+    parsed = ParsedArticle(
+        body=body,
+        plain_length=previous.plain_length,
+        heading_levels=dict(previous.heading_levels),
+        heading_texts=dict(previous.heading_texts),
+        paragraph_count=previous.paragraph_count,
+        long_paragraph_count=previous.long_paragraph_count,
+        list_items=previous.list_items,
+        table_rows=previous.table_rows,
+        rule_count=previous.rule_count,
+        link_count=previous.link_count,
+    )
+    parsed._merge(removed, -1)
+    parsed._merge(inserted, 1)
+    return ArticleEdit(parsed=parsed, removed=removed, inserted=inserted)
+
+
+def find_edit_range(old: str, new: str) -> tuple[int, int, int]:
+    """2つの本文の差分範囲を求める。
+
+    共通の先頭部分と末尾部分を二分探索で求め、変更された範囲を返す。
+
+    Args:
+        old: 編集前の本文。
+        new: 編集後の本文。
+
+    Returns:
+        (start, old_end, new_end) のタプル。
+    """
+    limit = min(len(old), len(new))
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[:mid] == new[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    start = low
+
+    low, high = 0, limit - start
+    while low < high:
+        mid = (low + high + 1) // 2
+        if old[len(old) - mid :] == new[len(new) - mid :]:
+            low = mid
+        else:
+            high = mid - 1
+    return start, len(old) - low, len(new) - low
+
+
+def merge_edit_ranges(edits: Iterable[tuple[int, int, int]]) -> tuple[int, int, int]:
+    """連続する編集をまとめた差分範囲を求める。
+
+    各編集は直前の編集を適用した後の本文に対する
+    (編集位置, 削除した文字数, 挿入した文字数) で表す。
+    文書を比較せずに求めるため、コストは編集の件数にだけ比例する。
+
+    Args:
+        edits: 編集（発生順）。
+
+    Returns:
+        最初の編集前の本文と最後の編集後の本文に対する
+        (start, old_end, new_end) のタプル。編集がない場合は (0, 0, 0)。
+    """
+    merged: tuple[int, int, int] | None = None
+    for offset, removed, inserted in edits:
+        end = offset + removed
+        if merged is None:
+            merged = (offset, end, offset + inserted)
+            continue
+        start, old_end, new_end = merged
+        merged = (
+            min(start, offset),
+            old_end + max(0, end - new_end),
+            max(new_end, end) + inserted - removed,
+        )
+    return merged or (0, 0, 0)
+
+
+def _paragraph_start(body: str, position: int) -> int:
+    """position より前で、編集の影響を受けない段落の開始位置を求める。
+
+    Args:
+        body: 本文。
+        position: 編集開始オフセット。
+
+    Returns:
+        段落の開始オフセット。
+    """
+    # 改行以外の最後の文字を含む段落から再解析する
+    anchor = position - 1
+    while anchor >= 0 and body[anchor] == "\n":
+        anchor -= 1
+    if anchor < 0:
+        return 0
+
+    separator = body.rfind(PARAGRAPH_SEPARATOR, 0, anchor)
+    if separator < 0:
+        return 0
+
+    # 連続する改行は先頭から2文字ずつ区切りとして扱われるため、奇数個なら1文字戻る
+    run_start = separator
+    while run_start > 0 and body[run_start - 1] == "\n":
+        run_start -= 1
+    run_end = separator + len(PARAGRAPH_SEPARATOR)
+    return run_end - (run_end - run_start) % 2
+
+
+def _paragraph_end(body: str, position: int) -> int:
+    """position 以降で、編集の影響を受けない段落区切りの位置を求める。
+
+    Args:
+        body: 本文。
+        position: 編集前の本文における編集終了オフセット。
+
+    Returns:
+        段落区切りのオフセット（区切りがない場合は本文の長さ）。
+    """
+    # 改行以外の最初の文字を含む段落までを再解析する
+    anchor = position
+    while anchor < len(body) and body[anchor] == "\n":
+        anchor += 1
+    if anchor >= len(body):
+        return len(body)
+
+    separator = body.find(PARAGRAPH_SEPARATOR, anchor)
+    return len(body) if separator < 0 else separator
+
+
+def _merge_counts(target: dict[Any, int], source: dict[Any, int], sign: int) -> None:
+    """出現数の辞書を加算（sign=-1の場合は減算）する。
+
+    Args:
+        target: 更新する辞書。
+        source: 加算する辞書。
+        sign: 1で加算、-1で減算。
+    """
+    for key, count in source.items():
+        remaining = target.get(key, 0) + sign * count
+        if remaining:
+            target[key] = remaining
+        else:
+            target.pop(key, None)
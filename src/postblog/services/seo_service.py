@@ -1,22 +1,55 @@
 """SEO分析サービス。
 
 ルールベースのSEO分析（13項目、100点満点）を提供する。
+本文は parse_article で1回だけ解析し、各チェック項目は解析結果を共有する。
+編集時は analyze_seo_incremental で編集範囲の段落だけを再評価できる。
 """
 
 import logging
-import re
+from dataclasses import dataclass
 
 from postblog.models.seo import SeoAnalysisResult, SeoCheckItem
+from postblog.services.seo_parser import (
+    ParsedArticle,
+    parse_article,
+    reparse_article,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# タイトル・メタディスクリプションに関するチェック項目数（分析結果の先頭に並ぶ）
+_TITLE_META_CHECKS = 5
+
+
+@dataclass
+class SeoParseState:
+    """インクリメンタルSEO分析のための解析状態。
+
+    Args:
+        parsed: 本文の解析結果。
+        title: 分析時の記事タイトル。
+        keyword: 分析時のターゲットキーワード（小文字化済み）。
+        meta_description: 分析時のメタディスクリプション。
+        keyword_hits: 本文中のキーワード出現数。
+        heading_keyword_hits: キーワードを含む見出しの数。
+    """
+
+    parsed: ParsedArticle
+    title: str
+    keyword: str
+    meta_description: str
+    keyword_hits: int
+    heading_keyword_hits: int
+
+
 def analyze_seo(
     title: str,
     body: str,
     keyword: str,
     meta_description: str = "",
+    parsed: ParsedArticle | None = None,
 ) -> SeoAnalysisResult:
     """SEO分析を実行する。
 
@@ -25,51 +58,179 @@ def analyze_seo(
         body: 記事本文（Markdown）。
         keyword: ターゲットキーワード。
         meta_description: メタディスクリプション。
+        parsed: 解析済みの本文（Noneの場合は body を解析する）。
 
     Returns:
         SEO分析結果。
     """
-    items: list[SeoCheckItem] = []
+    result, _ = analyze_seo_with_state(title, body, keyword, meta_description, parsed)
+    return result
+
+
+def analyze_seo_with_state(
+    title: str,
+    body: str,
+    keyword: str,
+    meta_description: str = "",
+    parsed: ParsedArticle | None = None,
+) -> tuple[SeoAnalysisResult, SeoParseState]:
+    """SEO分析を実行し、インクリメンタル分析用の状態も返す。
+
+    Args:
+        title: 記事タイトル。
+        body: 記事本文（Markdown）。
+        keyword: ターゲットキーワード。
+        meta_description: メタディスクリプション。
+        parsed: 解析済みの本文（Noneの場合は body を解析する）。
+
+    Returns:
+        (SEO分析結果, 解析状態) のタプル。
+    """
+    if parsed is None or parsed.body != body:
+        parsed = parse_article(body)
+
     keyword_lower = keyword.lower()
+    state = SeoParseState(
+        parsed=parsed,
+        title=title,
+        keyword=keyword_lower,
+        meta_description=meta_description,
+        keyword_hits=parsed.keyword_count(keyword_lower),
+        heading_keyword_hits=parsed.heading_keyword_count(keyword_lower),
+    )
+    return _evaluate(state), state
 
-    # 1. タイトルキーワード含有（15点）
-    items.append(_check_title_keyword(title, keyword_lower))
 
-    # 2. タイトル文字数（5点）
-    items.append(_check_title_length(title))
+def analyze_seo_incremental(
+    previous: SeoAnalysisResult,
+    state: SeoParseState,
+    title: str,
+    body: str,
+    keyword: str,
+    *,
+    start: int,
+    old_end: int,
+    new_end: int,
+    meta_description: str = "",
+) -> tuple[SeoAnalysisResult, SeoParseState]:
+    """本文の編集範囲だけを再解析してSEO分析を更新する。
+
+    編集前の本文の ``[start, old_end)`` が ``body`` の ``[start, new_end)`` に
+    置き換わったものとして、影響を受ける段落・見出しだけを再評価し、
+    キーワード出現数・文字数・長い段落数などの集計値を前回から引き継ぐ。
+
+    Args:
+        previous: 前回のSEO分析結果。
+        state: 前回の解析状態。
+        title: 記事タイトル。
+        body: 編集後の記事本文（Markdown）。
+        keyword: ターゲットキーワード。
+        start: 編集開始オフセット。
+        old_end: 編集前の本文における編集終了オフセット。
+        new_end: 編集後の本文における編集終了オフセット。
+        meta_description: メタディスクリプション。
+
+    Returns:
+        (SEO分析結果, 解析状態) のタプル。
+
+    Raises:
+        ValueError: 編集範囲が本文と矛盾する場合。
+    """
+    edit = reparse_article(state.parsed, body, start, old_end, new_end)
+    parsed = edit.parsed
+    keyword_lower = keyword.lower()
 
-    # 3. メタディスクリプション存在（5点）
-    items.append(_check_meta_description_exists(meta_description))
+    if keyword_lower == state.keyword:
+        keyword_hits = (
+            state.keyword_hits
+            - edit.removed.keyword_count(keyword_lower)
+            + edit.inserted.keyword_count(keyword_lower)
+        )
+        heading_keyword_hits = (
+            state.heading_keyword_hits
+            - edit.removed.heading_keyword_count(keyword_lower)
+            + edit.inserted.heading_keyword_count(keyword_lower)
+        )
+    else:
+        keyword_hits = parsed.keyword_count(keyword_lower)
+        heading_keyword_hits = parsed.heading_keyword_count(keyword_lower)
+
+    new_state = SeoParseState(
+        parsed=parsed,
+        title=title,
+        keyword=keyword_lower,
+        meta_description=meta_description,
+        keyword_hits=keyword_hits,
+        heading_keyword_hits=heading_keyword_hits,
+    )
 
-    # 4. メタディスクリプション文字数（5点）
-    items.append(_check_meta_description_length(meta_description))
+    # タイトル・メタディスクリプション・キーワードが変わっていなければ前回の結果を流用する
+    reusable = (
+        previous.items[:_TITLE_META_CHECKS]
+        if (title, keyword_lower, meta_description)
+        == (state.title, state.keyword, state.meta_description)
+        and len(previous.items) >= _TITLE_META_CHECKS
+        else None
+    )
+    return _evaluate(new_state, reusable), new_state
 
-    # 5. メタディスクリプションキーワード含有（5点）
-    items.append(_check_meta_description_keyword(meta_description, keyword_lower))
+
+def _evaluate(
+    state: SeoParseState, title_meta_items: list[SeoCheckItem] | None = None
+) -> SeoAnalysisResult:
+    """解析状態から各チェック項目を評価する。
+
+    Args:
+        state: 解析状態。
+        title_meta_items: 流用するタイトル・メタディスクリプションの評価結果。
+
+    Returns:
+        SEO分析結果。
+    """
+    parsed = state.parsed
+    title = state.title
+    keyword_lower = state.keyword
+    meta_description = state.meta_description
+
+    if title_meta_items is not None:
+        items = list(title_meta_items)
+    else:
+        items = [
+            # 1. タイトルキーワード含有（15点）
+            _check_title_keyword(title, keyword_lower),
+            # 2. タイトル文字数（5点）
+            _check_title_length(title),
+            # 3. メタディスクリプション存在（5点）
+            _check_meta_description_exists(meta_description),
+            # 4. メタディスクリプション文字数（5点）
+            _check_meta_description_length(meta_description),
+            # 5. メタディスクリプションキーワード含有（5点）
+            _check_meta_description_keyword(meta_description, keyword_lower),
+        ]
 
     # 6. 見出し階層チェック（10点）
-    items.append(_check_heading_hierarchy(body))
+    items.append(_check_heading_hierarchy(parsed))
 
     # 7. 見出しキーワード含有（5点）
-    items.append(_check_heading_keyword(body, keyword_lower))
+    items.append(_check_heading_keyword(parsed, state.heading_keyword_hits))
 
     # 8. 本文キーワード密度（10点）
-    items.append(_check_keyword_density(body, keyword_lower))
+    items.append(_check_keyword_density(parsed, keyword_lower, state.keyword_hits))
 
     # 9. 本文文字数（10点）
-    items.append(_check_body_length(body))
+    items.append(_check_body_length(parsed))
 
     # 10. 冒頭キーワード含有（5点）
-    items.append(_check_first_paragraph_keyword(body, keyword_lower))
+    items.append(_check_first_paragraph_keyword(parsed, keyword_lower))
 
     # 11. 段落長チェック（5点）
-    items.append(_check_paragraph_length(body))
+    items.append(_check_paragraph_length(parsed))
 
     # 12. リスト・テーブル使用（5点）
-    items.append(_check_lists_tables(body))
+    items.append(_check_lists_tables(parsed))
 
     # 13. 外部リンク（5点）— Markdown記法チェック
-    items.append(_check_external_links(body))
+    items.append(_check_external_links(parsed))
 
     total_score = sum(item.score for item in items)
     suggestions = [item.suggestion for item in items if item.suggestion]
@@ -209,9 +370,8 @@ def _check_meta_description_keyword(meta: str, keyword: str) -> SeoCheckItem:
     )
 
 
-def _check_heading_hierarchy(body: str) -> SeoCheckItem:
-    headings = re.findall(r"^(#{1,6})\s", body, re.MULTILINE)
-    if not headings:
+def _check_heading_hierarchy(parsed: ParsedArticle) -> SeoCheckItem:
+    if not parsed.has_headings:
         return SeoCheckItem(
             category="見出し",
             name="見出し階層",
@@ -221,9 +381,8 @@ def _check_heading_hierarchy(body: str) -> SeoCheckItem:
             message="見出しが使用されていません。",
             suggestion="H2, H3の見出しを使用して記事を構造化してください。",
         )
-    levels = [len(h) for h in headings]
-    has_h2 = 2 in levels
-    has_h3 = 3 in levels
+    has_h2 = parsed.heading_levels.get(2, 0) > 0
+    has_h3 = parsed.heading_levels.get(3, 0) > 0
     if has_h2 and has_h3:
         return SeoCheckItem(
             category="見出し",
@@ -254,9 +413,8 @@ def _check_heading_hierarchy(body: str) -> SeoCheckItem:
     )
 
 
-def _check_heading_keyword(body: str, keyword: str) -> SeoCheckItem:
-    headings = re.findall(r"^#{1,6}\s+(.+)$", body, re.MULTILINE)
-    if not headings:
+def _check_heading_keyword(parsed: ParsedArticle, keyword_hits: int) -> SeoCheckItem:
+    if not parsed.heading_texts:
         return SeoCheckItem(
             category="見出し",
             name="キーワード含有",
@@ -266,8 +424,7 @@ def _check_heading_keyword(body: str, keyword: str) -> SeoCheckItem:
             message="見出しがないためチェックできません。",
             suggestion="見出しにキーワードを含めてください。",
         )
-    has_keyword = any(keyword in h.lower() for h in headings)
-    if has_keyword:
+    if keyword_hits > 0:
         return SeoCheckItem(
             category="見出し",
             name="キーワード含有",
@@ -287,10 +444,11 @@ def _check_heading_keyword(body: str, keyword: str) -> SeoCheckItem:
     )
 
 
-def _check_keyword_density(body: str, keyword: str) -> SeoCheckItem:
+def _check_keyword_density(
+    parsed: ParsedArticle, keyword: str, keyword_count: int
+) -> SeoCheckItem:
     # Markdownの記法を除去した本文で計算
-    plain_text = re.sub(r"[#*_`\[\]()!|>-]", "", body).lower()
-    total_chars = len(plain_text.replace(" ", "").replace("\n", ""))
+    total_chars = parsed.plain_length
     if total_chars == 0:
         return SeoCheckItem(
             category="本文",
@@ -301,7 +459,6 @@ def _check_keyword_density(body: str, keyword: str) -> SeoCheckItem:
             message="本文がありません。",
             suggestion="本文にキーワードを自然に含めてください。",
         )
-    keyword_count = plain_text.count(keyword)
     keyword_chars = len(keyword) * keyword_count
     density = (keyword_chars / total_chars) * 100 if total_chars > 0 else 0
 
@@ -335,9 +492,8 @@ def _check_keyword_density(body: str, keyword: str) -> SeoCheckItem:
     )
 
 
-def _check_body_length(body: str) -> SeoCheckItem:
-    plain_text = re.sub(r"[#*_`\[\]()!|>-]", "", body)
-    length = len(plain_text.replace(" ", "").replace("\n", ""))
+def _check_body_length(parsed: ParsedArticle) -> SeoCheckItem:
+    length = parsed.plain_length
     if length >= 1500:
         return SeoCheckItem(
             category="本文",
@@ -368,9 +524,8 @@ def _check_body_length(body: str) -> SeoCheckItem:
     )
 
 
-def _check_first_paragraph_keyword(body: str, keyword: str) -> SeoCheckItem:
-    first_100 = body[:100].lower()
-    if keyword in first_100:
+def _check_first_paragraph_keyword(parsed: ParsedArticle, keyword: str) -> SeoCheckItem:
+    if keyword in parsed.lead:
         return SeoCheckItem(
             category="本文",
             name="冒頭キーワード",
@@ -390,13 +545,8 @@ def _check_first_paragraph_keyword(body: str, keyword: str) -> SeoCheckItem:
     )
 
 
-def _check_paragraph_length(body: str) -> SeoCheckItem:
-    paragraphs = [
-        p.strip()
-        for p in body.split("\n\n")
-        if p.strip() and not p.strip().startswith("#")
-    ]
-    if not paragraphs:
+def _check_paragraph_length(parsed: ParsedArticle) -> SeoCheckItem:
+    if parsed.paragraph_count == 0:
         return SeoCheckItem(
             category="本文",
             name="段落長",
@@ -407,7 +557,7 @@ def _check_paragraph_length(body: str) -> SeoCheckItem:
             suggestion="適切な段落分けを行ってください。",
         )
     # 3-4文を目安（句点で分割）
-    long_paragraphs = sum(1 for p in paragraphs if p.count("。") > 5)
+    long_paragraphs = parsed.long_paragraph_count
     if long_paragraphs == 0:
         return SeoCheckItem(
             category="本文",
@@ -428,12 +578,8 @@ def _check_paragraph_length(body: str) -> SeoCheckItem:
     )
 
 
-def _check_lists_tables(body: str) -> SeoCheckItem:
-    has_list = bool(re.search(r"^[\s]*[-*+]\s", body, re.MULTILINE))
-    has_numbered_list = bool(re.search(r"^[\s]*\d+\.\s", body, re.MULTILINE))
-    has_table = "|" in body and "---" in body
-
-    if has_list or has_numbered_list or has_table:
+def _check_lists_tables(parsed: ParsedArticle) -> SeoCheckItem:
+    if parsed.has_list or parsed.has_table:
         return SeoCheckItem(
             category="構成要素",
             name="リスト・テーブル",
@@ -453,16 +599,16 @@ def _check_lists_tables(body: str) -> SeoCheckItem:
     )
 
 
-def _check_external_links(body: str) -> SeoCheckItem:
-    links = re.findall(r"\[.*?\]\(https?://.*?\)", body)
-    if links:
+def _check_external_links(parsed: ParsedArticle) -> SeoCheckItem:
+    link_count = parsed.link_count
+    if link_count:
         return SeoCheckItem(
             category="構成要素",
             name="外部リンク",
             status="pass",
             score=5,
             max_score=5,
-            message=f"{len(links)}個の外部リンクがあります。",
+            message=f"{link_count}個の外部リンクがあります。",
         )
     return SeoCheckItem(
         category="構成要素",
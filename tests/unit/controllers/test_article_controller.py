@@ -1,15 +1,22 @@
 """記事コントローラのテスト。"""
 
-from unittest.mock import MagicMock
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from postblog.controllers.article_controller import ArticleController
 from postblog.exceptions import ValidationError
+from postblog.gui.components.text_changes import EditDelta
 from postblog.models.article import Article
 from postblog.models.draft import Draft
 from postblog.models.hearing import HearingResult
 from postblog.models.seo import SeoAdvice, SeoAdviceItem
+from postblog.services.seo_parser import find_edit_range
+from postblog.services.seo_service import analyze_seo
 
 
 class TestGenerateArticle:
@@ -77,6 +84,41 @@ class TestGenerateArticle:
         assert controller.current_seo_advice is seo_advice
         user_callback.assert_called_once()
 
+    def test_generate_article_streams_chunks(self) -> None:
+        """on_chunk指定時にストリーミング生成され本文チャンクが通知されることを確認する。"""
+        article = Article(title="テスト記事", body="# テスト記事\n\n本文")
+        seo_advice = SeoAdvice(summary="SEO OK")
+
+        class _Stream:
+            result = (article, seo_advice)
+
+            async def __aiter__(self) -> AsyncIterator[str]:
+                for chunk in ["# テスト記事", "\n\n本文"]:
+                    yield chunk
+
+        article_service = MagicMock()
+        article_service.generate_stream.return_value = _Stream()
+        async_runner = MagicMock()
+        controller = ArticleController(article_service, MagicMock(), async_runner)
+        on_chunk = MagicMock()
+        on_success = MagicMock()
+
+        controller.generate_article(
+            HearingResult(blog_type_id="tech", summary="サマリー", completed=True),
+            on_success=on_success,
+            on_chunk=on_chunk,
+        )
+        args, kwargs = async_runner.run.call_args
+        kwargs["on_success"](asyncio.run(args[0]))
+
+        assert [c.args[0] for c in on_chunk.call_args_list] == [
+            "# テスト記事",
+            "\n\n本文",
+        ]
+        assert controller.current_article is article
+        on_success.assert_called_once_with((article, seo_advice))
+        article_service.generate.assert_not_called()
+
 
 class TestRegenerateArticle:
     """regenerate_article メソッドのテスト。"""
@@ -108,6 +150,29 @@ class TestRegenerateArticle:
 
         async_runner.run.assert_called_once()
 
+    def test_regenerate_bypasses_llm_cache(self) -> None:
+        """再生成ではLLMの応答キャッシュを使わず、初回の生成では使うことを確認する。"""
+        article_service = MagicMock()
+        article_service.generate = MagicMock(
+            side_effect=lambda *args, **kwargs: asyncio.sleep(
+                0, (Article(title="t", body="b"), None)
+            )
+        )
+        async_runner = MagicMock()
+        controller = ArticleController(article_service, MagicMock(), async_runner)
+        hearing_result = HearingResult(
+            blog_type_id="tech", summary="サマリー", completed=True
+        )
+
+        controller.generate_article(hearing_result)
+        asyncio.run(async_runner.run.call_args.args[0])
+        controller.regenerate_article()
+        asyncio.run(async_runner.run.call_args.args[0])
+
+        first, second = article_service.generate.call_args_list
+        assert first.kwargs["use_cache"] is True
+        assert second.kwargs["use_cache"] is False
+
 
 class TestUpdateArticle:
     """update_article メソッドのテスト。"""
@@ -231,6 +296,28 @@ class TestAnalyzeSeo:
         assert result.score >= 0
         assert len(result.items) == 13
 
+    def test_analyze_seo_after_edit_matches_full_analysis(self) -> None:
+        """編集後の再分析が全体分析と同じ結果になることを確認する。"""
+        controller = ArticleController(MagicMock(), MagicMock(), MagicMock())
+        controller._current_article = Article(
+            title="Python入門",
+            body="# Python入門\n\n## 概要\n\n本文です。",
+            seo_keywords="python",
+        )
+        controller.analyze_seo()
+
+        controller.update_article(
+            body="# Python入門\n\n## Pythonの概要\n\n本文です。\n\n- 項目"
+        )
+        result = controller.analyze_seo()
+
+        expected = analyze_seo(
+            title="Python入門",
+            body="# Python入門\n\n## Pythonの概要\n\n本文です。\n\n- 項目",
+            keyword="python",
+        )
+        assert result == expected
+
     def test_analyze_seo_without_article_raises_error(self) -> None:
         """記事なしでValidationErrorが発生することを確認する。"""
         article_service = MagicMock()
@@ -242,6 +329,164 @@ class TestAnalyzeSeo:
             controller.analyze_seo()
 
 
+class TestRequestSeoAnalysis:
+    """request_seo_analysis メソッドのテスト。"""
+
+    @staticmethod
+    def _complete(async_runner: MagicMock, index: int) -> None:
+        """index番目に投入された分析を実行し、完了コールバックを呼ぶ。"""
+        args, kwargs = async_runner.run.call_args_list[index]
+        kwargs["on_success"](asyncio.run(args[0]))
+
+    def test_runs_analysis_on_async_runner(self) -> None:
+        """分析がAsyncRunner経由で実行され結果が通知されることを確認する。"""
+        async_runner = MagicMock()
+        controller = ArticleController(MagicMock(), MagicMock(), async_runner)
+        controller._current_article = Article(title="Python入門", body="# Python入門")
+        callback = MagicMock()
+
+        controller.request_seo_analysis(on_success=callback)
+        self._complete(async_runner, 0)
+
+        callback.assert_called_once()
+        assert len(callback.call_args[0][0].items) == 13
+
+    def test_coalesces_pending_requests(self) -> None:
+        """分析中の要求は最新のものだけが実行・通知されることを確認する。"""
+        async_runner = MagicMock()
+        controller = ArticleController(MagicMock(), MagicMock(), async_runner)
+        controller._current_article = Article(title="T", body="本文1")
+        first, second, third = MagicMock(), MagicMock(), MagicMock()
+
+        controller.request_seo_analysis(on_success=first)
+        controller.update_article(body="本文2")
+        controller.request_seo_analysis(on_success=second)
+        controller.update_article(body="# 見出し\n\n本文3")
+        controller.request_seo_analysis(on_success=third)
+
+        # 実行中は新たに投入されない
+        assert async_runner.run.call_count == 1
+
+        self._complete(async_runner, 0)
+        assert async_runner.run.call_count == 2
+        self._complete(async_runner, 1)
+
+        first.assert_not_called()
+        second.assert_not_called()
+        third.assert_called_once()
+        result = third.call_args[0][0]
+        assert result == analyze_seo(title="T", body="# 見出し\n\n本文3", keyword="")
+
+    def test_request_without_article_raises_error(self) -> None:
+        """記事なしでValidationErrorが発生することを確認する。"""
+        controller = ArticleController(MagicMock(), MagicMock(), MagicMock())
+
+        with pytest.raises(ValidationError, match="分析対象の記事がありません"):
+            controller.request_seo_analysis()
+
+
+class TestSeoEditRange:
+    """編集差分によるSEO分析の編集範囲のテスト。"""
+
+    BODY = "# Python入門\n\n## 概要\n\n本文です。"
+
+    def _edit(
+        self, controller: ArticleController, old: str, new: str, version: int
+    ) -> None:
+        """本文の最初の old を new に置き換え、差分とともに記事を更新する。"""
+        body = controller.current_article.body  # type: ignore[union-attr]
+        delta = EditDelta(body.index(old), old, new, version)
+        controller.update_article(body=delta.apply(body), deltas=[delta])
+
+    def _analyzed_controller(self) -> ArticleController:
+        """バージョン1の本文を分析済みのコントローラを作成する。"""
+        controller = ArticleController(MagicMock(), MagicMock(), MagicMock())
+        controller._current_article = Article(
+            title="Python入門", body="", seo_keywords="python"
+        )
+        controller.update_article(
+            body=self.BODY, deltas=[EditDelta(0, "", self.BODY, 1)]
+        )
+        controller.analyze_seo()
+        return controller
+
+    def test_uses_deltas_instead_of_comparing_bodies(self) -> None:
+        """連続した差分がある場合は本文を比較しないことを確認する。"""
+        controller = self._analyzed_controller()
+        self._edit(controller, "概要", "Pythonの概要", 2)
+        self._edit(controller, "本文です。", "本文です。\n\n- 項目", 3)
+
+        with patch(
+            "postblog.controllers.article_controller.find_edit_range"
+        ) as find_edit_range:
+            result = controller.analyze_seo()
+
+        find_edit_range.assert_not_called()
+        assert result == analyze_seo(
+            title="Python入門",
+            body="# Python入門\n\n## Pythonの概要\n\n本文です。\n\n- 項目",
+            keyword="python",
+        )
+
+    def test_version_gap_falls_back_to_comparison(self) -> None:
+        """差分のバージョンが途切れた場合は本文を比較することを確認する。"""
+        controller = self._analyzed_controller()
+        self._edit(controller, "概要", "Pythonの概要", 3)
+
+        with patch(
+            "postblog.controllers.article_controller.find_edit_range",
+            wraps=find_edit_range,
+        ) as spy:
+            result = controller.analyze_seo()
+
+        spy.assert_called_once()
+        assert result == analyze_seo(
+            title="Python入門",
+            body="# Python入門\n\n## Pythonの概要\n\n本文です。",
+            keyword="python",
+        )
+
+    def test_body_without_deltas_falls_back_to_comparison(self) -> None:
+        """差分なしで本文が変わった場合は本文を比較することを確認する。"""
+        controller = self._analyzed_controller()
+        controller.update_article(body=self.BODY + "追記")
+        self._edit(controller, "概要", "Pythonの概要", 2)
+
+        with patch(
+            "postblog.controllers.article_controller.find_edit_range",
+            wraps=find_edit_range,
+        ) as spy:
+            controller.analyze_seo()
+
+        spy.assert_called_once()
+
+    def test_coalesced_requests_keep_deltas(self) -> None:
+        """破棄された要求の差分が次の要求に引き継がれることを確認する。"""
+        async_runner = MagicMock()
+        controller = self._analyzed_controller()
+        controller._async_runner = async_runner
+        callback = MagicMock()
+
+        controller.request_seo_analysis()
+        self._edit(controller, "概要", "Pythonの概要", 2)
+        controller.request_seo_analysis()
+        self._edit(controller, "本文です。", "本文です。\n\n- 項目", 3)
+        controller.request_seo_analysis(on_success=callback)
+
+        with patch(
+            "postblog.controllers.article_controller.find_edit_range"
+        ) as find_edit_range:
+            TestRequestSeoAnalysis._complete(async_runner, 0)
+            TestRequestSeoAnalysis._complete(async_runner, 1)
+
+        find_edit_range.assert_not_called()
+        assert callback.call_args[0][0] == analyze_seo(
+            title="Python入門",
+            body="# Python入門\n\n## Pythonの概要\n\n本文です。\n\n- 項目",
+            keyword="python",
+        )
+
+
 class TestSaveDraft:
     """save_draft メソッドのテスト。"""
 
@@ -321,3 +566,103 @@ class TestReset:
 
         assert controller.current_article is None
         assert controller.current_seo_advice is None
+
+
+class TestRequestSaveDraft:
+    """request_save_draft メソッドのテスト。"""
+
+    def test_saves_snapshot_off_calling_thread(self) -> None:
+        """要求時点の記事がワーカースレッドで保存されることを確認する。"""
+        draft_service = MagicMock()
+        save_threads: list[threading.Thread] = []
+
+        def _save(draft: Draft) -> Draft:
+            save_threads.append(threading.current_thread())
+            draft.id = 1
+            return draft
+
+        draft_service.save.side_effect = _save
+        async_runner = MagicMock()
+        controller = ArticleController(MagicMock(), draft_service, async_runner)
+        controller._current_article = Article(title="保存前", body="本文")
+        on_success = MagicMock()
+
+        controller.request_save_draft(on_success=on_success)
+        controller._current_article.title = "保存後の編集"
+        args, kwargs = async_runner.run.call_args
+        saved = asyncio.run(args[0])
+
+        assert saved.title == "保存前"
+        assert save_threads[0] is not threading.current_thread()
+        assert kwargs["on_success"] is on_success
+
+    def test_without_article_raises_error(self) -> None:
+        """記事なしでValidationErrorが発生することを確認する。"""
+        async_runner = MagicMock()
+        controller = ArticleController(MagicMock(), MagicMock(), async_runner)
+
+        with pytest.raises(ValidationError, match="保存する記事がありません"):
+            controller.request_save_draft()
+        async_runner.run.assert_not_called()
+
+
+class TestAutosaveIntegration:
+    """自動保存サービスとの連携のテスト。"""
+
+    def test_update_article_marks_dirty(self) -> None:
+        """記事の更新が自動保存サービスに通知されることを確認する。"""
+        autosave = MagicMock()
+        controller = ArticleController(MagicMock(), MagicMock(), MagicMock(), autosave)
+        controller._current_article = Article(title="記事", body="本文")
+
+        controller.update_article(body="編集後")
+
+        draft = autosave.mark_dirty.call_args.args[0]
+        assert draft.body == "編集後"
+
+    @pytest.mark.parametrize(
+        "fields",
+        [{"title": "新しい題"}, {"tags": ["python"]}, {"meta_description": "概要"}],
+    )
+    def test_metadata_update_marks_dirty_without_seo(
+        self, fields: dict[str, Any]
+    ) -> None:
+        """本文以外の更新も自動保存に通知され、SEO分析は実行されないことを確認する。"""
+        autosave = MagicMock()
+        async_runner = MagicMock()
+        controller = ArticleController(MagicMock(), MagicMock(), async_runner, autosave)
+        controller._current_article = Article(title="記事", body="本文")
+
+        controller.update_article(**fields)
+
+        autosave.mark_dirty.assert_called_once()
+        async_runner.run.assert_not_called()
+
+    def test_load_draft_resets_autosave(self) -> None:
+        """下書きの読み込みで自動保存の編集対象が切り替わることを確認する。"""
+        draft_service = MagicMock()
+        loaded = Draft(id=3, title="記事", body="本文")
+        draft_service.get.return_value = loaded
+        autosave = MagicMock()
+        controller = ArticleController(
+            MagicMock(), draft_service, MagicMock(), autosave
+        )
+
+        controller.load_draft(3)
+
+        autosave.reset.assert_called_once_with(loaded)
+
+    def test_save_draft_uses_autosave(self) -> None:
+        """手動保存が自動保存サービス経由で同じ下書きに保存されることを確認する。"""
+        draft_service = MagicMock()
+        autosave = MagicMock()
+        autosave.save.return_value = Draft(id=5, title="記事")
+        controller = ArticleController(
+            MagicMock(), draft_service, MagicMock(), autosave
+        )
+        controller._current_article = Article(title="記事", body="本文")
+
+        saved = controller.save_draft()
+
+        assert saved.id == 5
+        draft_service.save.assert_not_called()
@@ -1,5 +1,7 @@
 """ヒアリングコントローラのテスト。"""
 
+import asyncio
+from collections.abc import AsyncIterator
 from unittest.mock import MagicMock
 
 import pytest
@@ -141,6 +143,29 @@ class TestSendMessage:
         assert kwargs["on_success"] is not None
         assert kwargs["on_error"] is on_error
 
+    def test_send_message_streams_chunks(self) -> None:
+        """on_chunk指定時にストリーミングで応答チャンクが通知されることを確認する。"""
+
+        async def _stream(*args: object) -> AsyncIterator[str]:
+            for chunk in ["応答", "です。"]:
+                yield chunk
+
+        hearing_service = MagicMock()
+        hearing_service.send_message_stream = _stream
+        async_runner = MagicMock()
+        hearing_service.start_hearing.return_value = HearingResult(blog_type_id="tech")
+        controller = HearingController(hearing_service, async_runner)
+        controller.start_hearing("tech")
+        on_chunk = MagicMock()
+
+        controller.send_message("テスト", on_chunk=on_chunk)
+        args, _ = async_runner.run.call_args
+        response = asyncio.run(args[0])
+
+        assert response == "応答です。"
+        assert [c.args[0] for c in on_chunk.call_args_list] == ["応答", "です。"]
+        hearing_service.send_message.assert_not_called()
+
 
 class TestFinishHearing:
     """finish_hearing メソッドのテスト。"""
@@ -1,54 +1,67 @@
 """ホームコントローラのテスト。"""
 
+import threading
 from datetime import datetime
+from typing import Any
 from unittest.mock import MagicMock
 
 from postblog.controllers.home_controller import HomeController
-from postblog.infrastructure.storage.history_repository import HistoryRecord
-from postblog.models.draft import Draft
+from postblog.infrastructure.async_runner import AsyncRunner
+from postblog.infrastructure.storage.history_repository import (
+    HistorySummary,
+    PublishStat,
+)
+from postblog.models.draft import DraftSummary
 
 
 class TestGetRecentDrafts:
     """get_recent_drafts メソッドのテスト。"""
 
-    def test_returns_drafts_sorted_by_updated_at(self) -> None:
-        """下書きが更新日時の降順で返されることを確認する。"""
+    def test_returns_draft_summaries(self) -> None:
+        """下書き要約が辞書に変換されて返されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        draft_service.get_all.return_value = [
-            Draft(
-                id=1, title="古い記事", body="本文1", updated_at=datetime(2024, 1, 1)
-            ),
-            Draft(
-                id=2, title="新しい記事", body="本文2", updated_at=datetime(2024, 6, 1)
+        draft_service.get_summaries.return_value = [
+            DraftSummary(
+                id=2,
+                title="新しい記事",
+                preview="本文2",
+                blog_type_id="tech",
+                updated_at=datetime(2024, 6, 1),
             ),
+            DraftSummary(id=1, title="古い記事", updated_at=datetime(2024, 1, 1)),
         ]
         controller = HomeController(draft_service, history_service)
 
         result = controller.get_recent_drafts()
 
         assert len(result) == 2
-        assert result[0]["title"] == "新しい記事"
+        assert result[0] == {
+            "id": "2",
+            "title": "新しい記事",
+            "blog_type_id": "tech",
+            "updated_at": "2024-06-01T00:00:00",
+            "preview": "本文2",
+        }
         assert result[1]["title"] == "古い記事"
 
-    def test_returns_limited_drafts(self) -> None:
-        """件数制限が適用されることを確認する。"""
+    def test_passes_limit_and_offset(self) -> None:
+        """件数上限とオフセットがサービスに渡されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        draft_service.get_all.return_value = [
-            Draft(id=i, title=f"記事{i}", body=f"本文{i}") for i in range(5)
-        ]
+        draft_service.get_summaries.return_value = []
         controller = HomeController(draft_service, history_service)
 
-        result = controller.get_recent_drafts(limit=3)
+        controller.get_recent_drafts(limit=3, offset=6)
 
-        assert len(result) == 3
+        draft_service.get_summaries.assert_called_once_with(3, 6)
+        draft_service.get_all.assert_not_called()
 
     def test_returns_empty_list_when_no_drafts(self) -> None:
         """下書きがない場合に空リストが返されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        draft_service.get_all.return_value = []
+        draft_service.get_summaries.return_value = []
         controller = HomeController(draft_service, history_service)
 
         result = controller.get_recent_drafts()
@@ -59,7 +72,7 @@ class TestGetRecentDrafts:
         """例外発生時に空リストが返されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        draft_service.get_all.side_effect = RuntimeError("DB error")
+        draft_service.get_summaries.side_effect = RuntimeError("DB error")
         controller = HomeController(draft_service, history_service)
 
         result = controller.get_recent_drafts()
@@ -70,49 +83,23 @@ class TestGetRecentDrafts:
         """タイトルなしの下書きが「無題」と表示されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        draft_service.get_all.return_value = [Draft(id=1, title="", body="本文")]
+        draft_service.get_summaries.return_value = [DraftSummary(id=1, title="")]
         controller = HomeController(draft_service, history_service)
 
         result = controller.get_recent_drafts()
 
         assert result[0]["title"] == "無題"
 
-    def test_long_body_is_truncated_with_preview(self) -> None:
-        """長い本文がプレビューで切り詰められることを確認する。"""
-        draft_service = MagicMock()
-        history_service = MagicMock()
-        long_body = "あ" * 200
-        draft_service.get_all.return_value = [Draft(id=1, title="記事", body=long_body)]
-        controller = HomeController(draft_service, history_service)
-
-        result = controller.get_recent_drafts()
-
-        assert result[0]["preview"].endswith("...")
-        assert len(result[0]["preview"]) == 103  # 100文字 + "..."
-
-    def test_short_body_is_not_truncated(self) -> None:
-        """短い本文がそのまま返されることを確認する。"""
-        draft_service = MagicMock()
-        history_service = MagicMock()
-        draft_service.get_all.return_value = [
-            Draft(id=1, title="記事", body="短い本文")
-        ]
-        controller = HomeController(draft_service, history_service)
-
-        result = controller.get_recent_drafts()
-
-        assert result[0]["preview"] == "短い本文"
-
 
 class TestGetRecentHistory:
     """get_recent_history メソッドのテスト。"""
 
-    def test_returns_history_records(self) -> None:
-        """投稿履歴が返されることを確認する。"""
+    def test_returns_history_summaries(self) -> None:
+        """投稿履歴要約が返されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        history_service.get_all.return_value = [
-            HistoryRecord(
+        history_service.get_summaries.return_value = [
+            HistorySummary(
                 id=1,
                 title="記事1",
                 service_name="Qiita",
@@ -129,26 +116,25 @@ class TestGetRecentHistory:
         assert result[0]["title"] == "記事1"
         assert result[0]["service_name"] == "Qiita"
         assert result[0]["article_url"] == "https://qiita.com/1"
+        assert result[0]["published_at"] == "2024-06-01T00:00:00"
 
-    def test_returns_limited_history(self) -> None:
-        """件数制限が適用されることを確認する。"""
+    def test_passes_limit_and_offset(self) -> None:
+        """件数上限とオフセットがサービスに渡されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        history_service.get_all.return_value = [
-            HistoryRecord(id=i, title=f"記事{i}", service_name="Qiita")
-            for i in range(5)
-        ]
+        history_service.get_summaries.return_value = []
         controller = HomeController(draft_service, history_service)
 
-        result = controller.get_recent_history(limit=2)
+        controller.get_recent_history(limit=2, offset=4)
 
-        assert len(result) == 2
+        history_service.get_summaries.assert_called_once_with(2, 4)
+        history_service.get_all.assert_not_called()
 
     def test_returns_empty_list_on_exception(self) -> None:
         """例外発生時に空リストが返されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        history_service.get_all.side_effect = RuntimeError("DB error")
+        history_service.get_summaries.side_effect = RuntimeError("DB error")
         controller = HomeController(draft_service, history_service)
 
         result = controller.get_recent_history()
@@ -159,8 +145,8 @@ class TestGetRecentHistory:
         """タイトルなしの履歴が「無題」と表示されることを確認する。"""
         draft_service = MagicMock()
         history_service = MagicMock()
-        history_service.get_all.return_value = [
-            HistoryRecord(id=1, title="", service_name="Qiita")
+        history_service.get_summaries.return_value = [
+            HistorySummary(id=1, title="", service_name="Qiita")
         ]
         controller = HomeController(draft_service, history_service)
 
@@ -169,6 +155,80 @@ class TestGetRecentHistory:
         assert result[0]["title"] == "無題"
 
 
+class TestRequestPages:
+    """一覧のページ取得要求のテスト。"""
+
+    def test_fetches_drafts_off_the_calling_thread(self) -> None:
+        """下書き一覧がワーカースレッドで取得されることを確認する。"""
+        draft_service = MagicMock()
+        fetch_threads: list[threading.Thread] = []
+
+        def _get_summaries(limit: int, offset: int) -> list[DraftSummary]:
+            fetch_threads.append(threading.current_thread())
+            return [DraftSummary(id=offset + 1, title="記事")]
+
+        draft_service.get_summaries.side_effect = _get_summaries
+        runner = AsyncRunner()
+        controller = HomeController(draft_service, MagicMock(), runner)
+        done = threading.Event()
+        result: list[Any] = []
+
+        def _on_success(page: list[dict[str, str]]) -> None:
+            result.extend(page)
+            done.set()
+
+        try:
+            controller.request_recent_drafts(5, 10, _on_success)
+            assert done.wait(timeout=5.0)
+        finally:
+            runner.stop()
+
+        draft_service.get_summaries.assert_called_once_with(5, 10)
+        assert fetch_threads[0] is not threading.current_thread()
+        assert result[0]["id"] == "11"
+
+    def test_history_without_runner_calls_back_synchronously(self) -> None:
+        """非同期ランナーがない場合は呼び出し元で取得することを確認する。"""
+        history_service = MagicMock()
+        history_service.get_summaries.return_value = []
+        controller = HomeController(MagicMock(), history_service)
+        on_success = MagicMock()
+
+        controller.request_recent_history(5, 0, on_success)
+
+        history_service.get_summaries.assert_called_once_with(5, 0)
+        on_success.assert_called_once_with([])
+
+    def test_fetches_publish_stats_off_the_calling_thread(self) -> None:
+        """投稿統計がワーカースレッドで集計されることを確認する。"""
+        history_service = MagicMock()
+        fetch_threads: list[threading.Thread] = []
+
+        def _get_stats(period: Any, group_by: str) -> list[PublishStat]:
+            fetch_threads.append(threading.current_thread())
+            return [PublishStat(key="zenn", total=2, published=2, failed=0)]
+
+        history_service.get_stats.side_effect = _get_stats
+        runner = AsyncRunner()
+        controller = HomeController(MagicMock(), history_service, runner)
+        done = threading.Event()
+        result: list[Any] = []
+
+        def _on_success(stats: list[dict[str, str | int]]) -> None:
+            result.extend(stats)
+            done.set()
+
+        try:
+            controller.request_publish_stats(_on_success, group_by="status")
+            assert done.wait(timeout=5.0)
+        finally:
+            runner.stop()
+
+        assert fetch_threads[0] is not threading.current_thread()
+        assert history_service.get_stats.call_args.args[1] == "status"
+        assert result == [{"key": "zenn", "total": 2, "published": 2, "failed": 0}]
+
+
 class TestDeleteDraft:
     """delete_draft メソッドのテスト。"""
 
@@ -222,3 +282,30 @@ class TestDeleteHistory:
         controller = HomeController(draft_service, history_service)
 
         assert controller.delete_history(1) is False
+
+
+class TestGetPublishStats:
+    """get_publish_stats メソッドのテスト。"""
+
+    def test_returns_stats_for_recent_days(self) -> None:
+        """直近の期間の統計が辞書に変換されて返されることを確認する。"""
+        history_service = MagicMock()
+        history_service.get_stats.return_value = [
+            PublishStat(key="Qiita", total=3, published=2, failed=1)
+        ]
+        controller = HomeController(MagicMock(), history_service)
+
+        result = controller.get_publish_stats(days=7)
+
+        assert result == [{"key": "Qiita", "total": 3, "published": 2, "failed": 1}]
+        (since, until), group_by = history_service.get_stats.call_args.args
+        assert (until - since).days == 6
+        assert group_by == "service"
+
+    def test_returns_empty_list_on_error(self) -> None:
+        """例外発生時に空リストが返されることを確認する。"""
+        history_service = MagicMock()
+        history_service.get_stats.side_effect = RuntimeError("DB error")
+        controller = HomeController(MagicMock(), history_service)
+
+        assert controller.get_publish_stats() == []
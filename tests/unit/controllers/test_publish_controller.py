@@ -163,7 +163,7 @@ class TestPublish:
         ]
         kwargs["on_success"](results)
 
-        history_service.save.assert_called_once()
+        history_service.save_many.assert_called_once()
 
     def test_publish_with_custom_status(self) -> None:
         """カスタムステータスで投稿できることを確認する。"""
@@ -264,8 +264,8 @@ class TestSummarizeResults:
 class TestSaveHistory:
     """_save_history メソッドのテスト。"""
 
-    def test_saves_history_for_each_result(self) -> None:
-        """各結果に対して履歴が保存されることを確認する。"""
+    def test_saves_history_for_each_result_in_one_batch(self) -> None:
+        """全ての結果の履歴が1回の一括保存で保存されることを確認する。"""
         publish_service = MagicMock()
         history_service = MagicMock()
         async_runner = MagicMock()
@@ -280,13 +280,18 @@ class TestSaveHistory:
 
         controller._save_history(article, results)
 
-        assert history_service.save.call_count == 2
+        history_service.save_many.assert_called_once()
+        records = history_service.save_many.call_args.args[0]
+        assert [r.service_name for r in records] == ["Qiita", "Zenn"]
+        assert [r.status for r in records] == ["published", "failed"]
+        history_service.save.assert_not_called()
 
     def test_save_history_continues_on_error(self) -> None:
-        """1件の保存失敗でも残りが保存されることを確認する。"""
+        """一括保存の失敗時は1件ずつ保存し、1件の失敗でも残りが保存されることを確認する。"""
         publish_service = MagicMock()
         history_service = MagicMock()
         async_runner = MagicMock()
+        history_service.save_many.side_effect = RuntimeError("DB error")
         # 最初のsaveでエラー、2回目は成功
         history_service.save.side_effect = [RuntimeError("DB error"), MagicMock()]
         controller = PublishController(publish_service, history_service, async_runner)
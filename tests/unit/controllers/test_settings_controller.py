@@ -81,6 +81,20 @@ class TestUpdateAppSettings:
         config_manager.update.assert_called_once_with(theme="light")
         config_manager.save.assert_called_once()
 
+    def test_update_auto_save_interval_updates_autosave(self) -> None:
+        """自動保存間隔の変更が自動保存サービスに反映されることを確認する。"""
+        config_manager = MagicMock(spec=ConfigManager)
+        config_manager.config = AppConfig(auto_save_interval=60)
+        config_manager.config_path = Path("~/.postblog/config.toml")
+        autosave = MagicMock()
+        controller = SettingsController(
+            config_manager, MagicMock(), MagicMock(), MagicMock(), autosave
+        )
+
+        controller.update_app_settings(auto_save_interval=60)
+
+        autosave.set_interval.assert_called_once_with(60)
+
     def test_update_invalid_font_size_raises_error(self) -> None:
         """不正なフォントサイズでValidationErrorが発生することを確認する。"""
         controller, _ = self._create_controller()
@@ -256,6 +270,19 @@ class TestServiceCredentialManagement:
 
         assert result is True
 
+    def test_credential_changes_invalidate_publisher(self) -> None:
+        """認証情報の保存・削除で投稿クライアントが生成し直されることを確認する。"""
+        controller, _ = self._create_controller()
+        publish_service = controller._publish_service
+
+        controller.save_service_credential("qiita", "api_token", "token123")
+        controller.delete_service_credential("hatena", "api_key")
+
+        assert [c.args for c in publish_service.invalidate.call_args_list] == [
+            ("qiita",),
+            ("hatena",),
+        ]
+
 
 class TestTestConnection:
     """test_connection メソッドのテスト。"""
@@ -0,0 +1,183 @@
+"""仮想化リストの表示範囲と行の割り当てのテスト。"""
+
+from typing import Any
+
+import pytest
+
+from postblog.gui.components.list_window import ListWindow, PageRequest
+
+
+ROW_HEIGHT = 10
+HEIGHT = 30
+
+
+def _items(start: int, count: int) -> list[dict[str, Any]]:
+    """連番の項目を作成する。"""
+    return [{"id": i} for i in range(start, start + count)]
+
+
+def _load_all(window: ListWindow, total: int, height: int = HEIGHT) -> int:
+    """表示範囲が埋まるまでページを取得し、取得回数を返す。"""
+    fetched = 0
+    while (request := window.next_page(height)) is not None:
+        remaining = max(0, total - request.offset)
+        window.add_page(request, _items(request.offset, min(request.limit, remaining)))
+        fetched += 1
+    return fetched
+
+
+class TestPaging:
+    """ページ取得のテスト。"""
+
+    def test_requests_pages_until_window_filled(self) -> None:
+        """表示範囲と前後の保持分が埋まるまでページを要求することを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=2, buffer_rows=1)
+
+        fetched = _load_all(window, total=100)
+
+        # 表示4行（30px / 10px + 部分表示1行）+ 保持1行 = 位置5まで必要
+        assert len(window.items) == 6
+        assert fetched == 3
+
+    def test_only_one_request_in_flight(self) -> None:
+        """取得中は次の要求を返さないことを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=2, buffer_rows=1)
+
+        first = window.next_page(HEIGHT)
+
+        assert first == PageRequest(limit=2, offset=0, generation=0)
+        assert window.is_loading
+        assert window.next_page(HEIGHT) is None
+
+    def test_short_page_stops_fetching(self) -> None:
+        """件数上限に満たないページで取得を終えることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+
+        assert _load_all(window, total=3) == 1
+        window.scroll_to(1000, HEIGHT)
+
+        assert window.next_page(HEIGHT) is None
+        assert len(window.items) == 3
+
+    def test_scrolling_requests_next_page(self) -> None:
+        """スクロールで取得済みの範囲を越えると次のページを要求することを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=10, buffer_rows=1)
+        _load_all(window, total=100)
+
+        window.scroll_to(80, HEIGHT)
+        request = window.next_page(HEIGHT)
+
+        assert request is not None
+        assert (request.limit, request.offset) == (10, 10)
+
+    def test_stale_page_after_reset_is_ignored(self) -> None:
+        """読み込み直し前の要求の結果が破棄されることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=2, buffer_rows=1)
+        stale = window.next_page(HEIGHT)
+        assert stale is not None
+
+        window.reset()
+        fresh = window.next_page(HEIGHT)
+
+        assert fresh is not None and fresh.generation == stale.generation + 1
+        assert window.add_page(stale, _items(100, 2)) is False
+        assert window.add_page(fresh, _items(0, 2)) is True
+        assert [item["id"] for item in window.items] == [0, 1]
+
+    def test_failed_page_stops_fetching(self) -> None:
+        """取得失敗後は要求を繰り返さないことを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=2, buffer_rows=1)
+        request = window.next_page(HEIGHT)
+        assert request is not None
+
+        window.fail_page(request)
+
+        assert not window.is_loading
+        assert window.next_page(HEIGHT) is None
+
+    def test_invalid_arguments_raise(self) -> None:
+        """行の高さや取得件数が1未満の場合に ValueError となることを確認する。"""
+        with pytest.raises(ValueError, match="row_height"):
+            ListWindow(0, page_size=10, buffer_rows=1)
+        with pytest.raises(ValueError, match="page_size"):
+            ListWindow(ROW_HEIGHT, page_size=0, buffer_rows=1)
+
+
+class TestLayout:
+    """行ウィジェットの割り当てのテスト。"""
+
+    def test_slots_follow_index_modulo_pool(self) -> None:
+        """項目の位置ごとに index % pool の行が割り当てられることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+        _load_all(window, total=100)
+        pool = window.pool_size(HEIGHT)
+
+        window.scroll_to(45, HEIGHT)
+        placements = window.layout(HEIGHT, pool)
+
+        assert [p.index for p in placements] == [3, 4, 5, 6, 7, 8]
+        assert [p.slot for p in placements] == [i % pool for i in range(3, 9)]
+        assert len({p.slot for p in placements}) == len(placements)
+        assert placements[0].y == 3 * ROW_HEIGHT - 45
+
+    def test_one_row_scroll_rewrites_only_entering_row(self) -> None:
+        """1行分のスクロールでは新しく表示範囲に入った行だけが変わることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+        _load_all(window, total=100)
+        pool = window.pool_size(HEIGHT)
+        window.scroll_to(20, HEIGHT)
+        window.layout(HEIGHT, pool)
+
+        window.scroll_rows(1, HEIGHT)
+        changed = [p.index for p in window.layout(HEIGHT, pool) if p.changed]
+
+        assert changed == [7]
+
+    def test_reset_clears_slot_assignments(self) -> None:
+        """読み込み直し後は全ての行が書き換え対象になることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+        _load_all(window, total=10)
+        pool = window.pool_size(HEIGHT)
+        window.layout(HEIGHT, pool)
+
+        window.reset()
+        _load_all(window, total=10)
+        placements = window.layout(HEIGHT, pool)
+
+        assert placements and all(p.changed for p in placements)
+
+    def test_item_at_slot(self) -> None:
+        """行に割り当てられた項目が返されることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+        _load_all(window, total=100)
+        pool = window.pool_size(HEIGHT)
+        window.scroll_to(100, HEIGHT)
+        placements = window.layout(HEIGHT, pool)
+
+        for placement in placements:
+            assert window.item_at_slot(placement.slot) == {"id": placement.index}
+        assert window.item_at_slot(pool + 1) is None
+
+
+class TestScrolling:
+    """スクロール位置のテスト。"""
+
+    def test_offset_is_clamped(self) -> None:
+        """スクロール位置が取得済みの範囲に収まることを確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+        _load_all(window, total=10)
+
+        window.scroll_to(-5, HEIGHT)
+        assert window.offset == 0
+        window.scroll_to(1000, HEIGHT)
+        assert window.offset == 10 * ROW_HEIGHT - HEIGHT
+
+    def test_scrollbar_range(self) -> None:
+        """スクロールバーの表示範囲の割合を確認する。"""
+        window = ListWindow(ROW_HEIGHT, page_size=50, buffer_rows=1)
+        assert window.scrollbar_range(HEIGHT) == (0.0, 1.0)
+
+        _load_all(window, total=10)
+        window.scroll_to(20, HEIGHT)
+
+        assert window.scrollbar_range(HEIGHT) == (0.2, 0.5)
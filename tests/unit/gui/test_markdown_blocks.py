@@ -0,0 +1,282 @@
+"""Markdownブロックレンダラーのテスト。"""
+
+from unittest.mock import patch
+
+import pytest
+
+from postblog.gui.components.markdown_blocks import (
+    TAG_BOLD,
+    TAG_BOLD_ITALIC,
+    TAG_CODE,
+    TAG_CODE_BLOCK,
+    TAG_H1,
+    TAG_H3,
+    TAG_LIST,
+    TAG_QUOTE,
+    BlockDocument,
+    MarkdownBlockRenderer,
+    RenderedBlock,
+    diff_blocks,
+    split_blocks,
+)
+from postblog.gui.components.text_changes import EditDelta
+
+
+def _text(block: RenderedBlock) -> str:
+    """ブロックの表示テキストを返す。"""
+    return "".join(text for text, _tags in block.segments)
+
+
+def _tags_of(block: RenderedBlock, text: str) -> tuple[str, ...]:
+    """指定したテキストを含むセグメントのタグを返す。"""
+    return next(tags for chunk, tags in block.segments if text in chunk)
+
+
+class TestSplitBlocks:
+    """split_blocks 関数のテスト。"""
+
+    def test_splits_on_blank_lines_and_headings(self) -> None:
+        """空行と見出しでブロックが分割されることを確認する。"""
+        text = "# 見出し\n段落1\n続き\n\n\n段落2\n## 小見出し"
+
+        assert split_blocks(text) == ["# 見出し", "段落1\n続き", "段落2", "## 小見出し"]
+
+    def test_fenced_code_is_single_block(self) -> None:
+        """空行や見出し記号を含むコードブロックが1ブロックになることを確認する。"""
+        text = "前\n```python\nx = 1\n\n# コメント\n```\n後"
+
+        assert split_blocks(text) == [
+            "前",
+            "```python\nx = 1\n\n# コメント\n```",
+            "後",
+        ]
+
+    def test_unclosed_fence_runs_to_end(self) -> None:
+        """閉じられていないコードブロックは末尾までになることを確認する。"""
+        assert split_blocks("```\ncode\n\nmore") == ["```\ncode\n\nmore"]
+
+    def test_empty_text(self) -> None:
+        """空文字列はブロックなしになることを確認する。"""
+        assert split_blocks("") == []
+
+
+class TestMarkdownBlockRenderer:
+    """MarkdownBlockRenderer のテスト。"""
+
+    def test_heading_and_inline_tags(self) -> None:
+        """見出しとインライン要素にタグが付くことを確認する。"""
+        renderer = MarkdownBlockRenderer()
+
+        heading, paragraph = renderer.render(
+            "# タイトル\n\n**太字** と ***両方*** と `コード`"
+        )
+
+        assert _text(heading) == "タイトル\n\n"
+        assert _tags_of(heading, "タイトル") == (TAG_H1,)
+        assert _tags_of(paragraph, "太字") == (TAG_BOLD,)
+        assert _tags_of(paragraph, "両方") == (TAG_BOLD_ITALIC,)
+        assert _tags_of(paragraph, "コード") == (TAG_CODE,)
+
+    def test_deep_heading_uses_h3(self) -> None:
+        """レベル3以上の見出しが TAG_H3 で表示されることを確認する。"""
+        (block,) = MarkdownBlockRenderer().render("#### 小見出し")
+
+        assert _tags_of(block, "小見出し") == (TAG_H3,)
+
+    def test_lists(self) -> None:
+        """リストが記号・番号付きで表示されることを確認する。"""
+        renderer = MarkdownBlockRenderer()
+
+        bullets, numbers = renderer.render("- a\n- b\n  - c\n\n3. x\n4. y")
+
+        assert _text(bullets) == "• a\n• b\n    • c\n\n"
+        assert _text(numbers) == "3. x\n4. y\n\n"
+        assert _tags_of(bullets, "• a") == (TAG_LIST,)
+
+    def test_code_block_and_quote(self) -> None:
+        """コードブロックと引用にタグが付くことを確認する。"""
+        renderer = MarkdownBlockRenderer()
+
+        code, quote = renderer.render("```\nx = 1\n```\n\n> 引用")
+
+        assert _text(code) == "x = 1\n\n"
+        assert _tags_of(code, "x = 1") == (TAG_CODE_BLOCK,)
+        assert _tags_of(quote, "引用") == (TAG_QUOTE,)
+
+    def test_line_count(self) -> None:
+        """行数がブロック間の空行を含めて数えられることを確認する。"""
+        (block,) = MarkdownBlockRenderer().render("1行目\n2行目")
+
+        assert block.line_count == 3
+
+    def test_unchanged_blocks_are_not_parsed_again(self) -> None:
+        """変更されていないブロックはキャッシュから返されることを確認する。"""
+        renderer = MarkdownBlockRenderer()
+        text = "\n\n".join(f"段落{i}" for i in range(20))
+        first = renderer.render(text)
+
+        with patch.object(renderer, "_markdown", wraps=renderer._markdown) as markdown:
+            second = renderer.render(text.replace("段落5", "段落5を編集"))
+
+        assert markdown.call_count == 1
+        assert second[4] is first[4]
+
+    def test_cache_size_is_limited(self) -> None:
+        """キャッシュ件数が上限を超えないことを確認する。"""
+        renderer = MarkdownBlockRenderer(cache_size=3)
+
+        renderer.render("\n\n".join(f"段落{i}" for i in range(10)))
+
+        assert renderer.cached_count == 3
+
+
+class TestDiffBlocks:
+    """diff_blocks 関数のテスト。"""
+
+    def test_single_changed_block(self) -> None:
+        """1ブロックの変更がそのブロックだけの差分になることを確認する。"""
+        renderer = MarkdownBlockRenderer()
+        old = renderer.render("a\n\nb\n\nc")
+        new = renderer.render("a\n\nB\n\nc")
+
+        patch_ = diff_blocks(old, new)
+
+        assert patch_.start == 1
+        assert patch_.removed == 1
+        assert patch_.inserted == (new[1],)
+
+    def test_inserted_block(self) -> None:
+        """ブロックの挿入が削除なしの差分になることを確認する。"""
+        renderer = MarkdownBlockRenderer()
+        old = renderer.render("a\n\nc")
+        new = renderer.render("a\n\nb\n\nc")
+
+        patch_ = diff_blocks(old, new)
+
+        assert (patch_.start, patch_.removed) == (1, 0)
+        assert patch_.inserted == (new[1],)
+
+    def test_repeated_blocks(self) -> None:
+        """同じ内容のブロックが続く場合も差分が範囲外にならないことを確認する。"""
+        renderer = MarkdownBlockRenderer()
+        old = renderer.render("a\n\na")
+        new = renderer.render("a\n\na\n\na")
+
+        patch_ = diff_blocks(old, new)
+
+        assert (patch_.start, patch_.removed, len(patch_.inserted)) == (2, 0, 1)
+
+    def test_no_change(self) -> None:
+        """変更がない場合は空の差分になることを確認する。"""
+        renderer = MarkdownBlockRenderer()
+        blocks = renderer.render("a\n\nb")
+
+        assert diff_blocks(blocks, renderer.render("a\n\nb")).is_empty
+
+
+def _edit(text: str, old: str, new: str, version: int) -> EditDelta:
+    """text 中の最初の old を new に置き換える差分を作成する。"""
+    offset = text.index(old)
+    return EditDelta(offset, old, new, version)
+
+
+class TestBlockDocument:
+    """BlockDocument クラスのテスト。"""
+
+    @pytest.mark.parametrize(
+        ("text", "old", "new"),
+        [
+            ("a\n\nb\n\nc", "b", "B"),
+            ("a\n\nb\n\nc", "\n\nb", ""),
+            ("a\n\nb\n\nc", "b", "b\n\nx"),
+            # 見出しを本文にすると直前の段落につながる
+            ("段落\n# 見出し\n\n後", "# ", ""),
+            # フェンスを開くと以降がコードブロックになる
+            ("a\n\nb\n\n```py\n\nc", "b", "```"),
+            # フェンスを閉じる行を消すと以降もコードブロックになる
+            ("```\nx\n```\n\ny\n\nz", "```\n\ny", "\ny"),
+            ("\n\na", "\n", "b"),
+            ("a", "a", ""),
+        ],
+    )
+    def test_matches_full_render(self, text: str, old: str, new: str) -> None:
+        """差分の適用結果が全体を分割し直した結果と一致することを確認する。"""
+        document = BlockDocument()
+        document.reset(text, version=0)
+        blocks = list(document.blocks)
+
+        patches = document.apply([_edit(text, old, new, 1)])
+
+        assert patches is not None
+        for patch_ in patches:
+            blocks[patch_.start : patch_.start + patch_.removed] = patch_.inserted
+        expected = MarkdownBlockRenderer().render(document.text)
+        assert document.text == text.replace(old, new, 1)
+        assert [b.key for b in document.blocks] == [b.key for b in expected]
+        assert [b.key for b in blocks] == [b.key for b in expected]
+
+    def test_edit_renders_only_neighbouring_blocks(self) -> None:
+        """編集位置の周辺のブロックだけが分割・レンダリングし直されることを確認する。"""
+        renderer = MarkdownBlockRenderer()
+        text = "\n\n".join(f"段落{i}" for i in range(200))
+        document = BlockDocument(renderer)
+        document.reset(text, version=0)
+
+        with patch.object(
+            renderer, "render_block", wraps=renderer.render_block
+        ) as render_block:
+            patches = document.apply([_edit(text, "段落100", "段落100を編集", 1)])
+
+        assert render_block.call_count <= 3
+        assert patches is not None
+        (patch_,) = patches
+        assert (patch_.start, patch_.removed, len(patch_.inserted)) == (100, 1, 1)
+        assert len(document.blocks) == 200
+
+    def test_sequential_deltas(self) -> None:
+        """複数の差分が発生順に適用されることを確認する。"""
+        document = BlockDocument()
+        document.reset("a\n\nb", version=3)
+
+        patches = document.apply(
+            [EditDelta(0, "a", "x", 4), EditDelta(3, "b", "y\n\nz", 5)]
+        )
+
+        assert patches is not None and len(patches) == 2
+        assert document.text == "x\n\ny\n\nz"
+        assert document.version == 5
+
+    def test_applied_versions_are_skipped(self) -> None:
+        """適用済みのバージョンの差分は読み飛ばされることを確認する。"""
+        document = BlockDocument()
+        document.reset("ab", version=2)
+
+        patches = document.apply([EditDelta(0, "", "a", 1), EditDelta(1, "", "b", 2)])
+
+        assert patches == []
+        assert document.text == "ab"
+
+    @pytest.mark.parametrize(
+        "deltas",
+        [
+            # バージョンが飛んでいる
+            [EditDelta(0, "a", "x", 3)],
+            # 文書と一致しない
+            [EditDelta(0, "a", "x", 2), EditDelta(0, "a", "y", 3)],
+        ],
+    )
+    def test_gap_is_not_applied(self, deltas: list[EditDelta]) -> None:
+        """適用できない差分がある場合は何も適用せずNoneを返すことを確認する。"""
+        document = BlockDocument()
+        document.reset("a\n\nb", version=1)
+
+        assert document.apply(deltas) is None
+        assert document.text == "a\n\nb"
+        assert document.version == 1
+
+    def test_unknown_version_is_not_applied(self) -> None:
+        """バージョン不明の文書には差分を適用しないことを確認する。"""
+        document = BlockDocument()
+        document.reset("a")
+
+        assert document.apply([EditDelta(0, "a", "b", 1)]) is None
@@ -0,0 +1,178 @@
+"""Markdownエディタの編集差分記録のテスト。
+
+表示環境がなくても実行できるよう、Tkのテキストウィジェットのコマンドを
+Pythonで模したオブジェクトに対して中継処理を呼び出す。
+"""
+
+import re
+from types import SimpleNamespace
+from typing import Any
+
+from postblog.gui.components.markdown_editor import MarkdownEditor
+from postblog.gui.components.text_changes import AstralPositions, ChangeLog
+
+
+class _FakeTextCommand:
+    """Tcl 8.6 のテキストウィジェットのコマンドを模したもの。
+
+    ``count -chars`` は Tcl 8.6 と同様にBMP外の文字を2文字と数える。
+    """
+
+    def __init__(self) -> None:
+        # Tkのテキストウィジェットは常に末尾に改行を持つ
+        self.content = "\n"
+        # get サブコマンドで取り出した文字数の合計
+        self.copied = 0
+
+    def __call__(self, command: str, *args: str) -> Any:
+        return getattr(self, f"_{command}")(*args)
+
+    def _units(self, text: str) -> int:
+        return len(text.encode("utf-16-le")) // 2
+
+    def _pos(self, index: str) -> int:
+        match = re.fullmatch(r"(.+?)([+-]\d+)c", index)
+        if match:
+            base, delta = match.groups()
+            return max(0, min(self._pos(base) + int(delta), len(self.content)))
+        if index == "end":
+            return len(self.content)
+        line, column = (int(part) for part in index.split("."))
+        lines = self.content.split("\n")
+        start = sum(len(text) + 1 for text in lines[: line - 1])
+        return min(start + min(column, len(lines[line - 1])), len(self.content))
+
+    def _format(self, pos: int) -> str:
+        before = self.content[:pos]
+        return f"{before.count(chr(10)) + 1}.{len(before) - before.rfind(chr(10)) - 1}"
+
+    def _index(self, index: str) -> str:
+        return self._format(self._pos(index))
+
+    def _compare(self, a: str, op: str, b: str) -> bool:
+        x, y = self._pos(a), self._pos(b)
+        return {"<": x < y, ">": x > y, "==": x == y}[op]
+
+    def _get(self, start: str, end: str) -> str:
+        text = self.content[self._pos(start) : self._pos(end)]
+        self.copied += len(text)
+        return text
+
+    def _count(self, option: str, start: str, end: str) -> int:
+        assert option == "-chars"
+        return self._units(self.content[self._pos(start) : self._pos(end)])
+
+    def _cget(self, option: str) -> str:
+        return "normal"
+
+    def _insert(self, index: str, *chars_and_tags: str) -> None:
+        pos = min(self._pos(index), len(self.content) - 1)
+        text = "".join(chars_and_tags[::2])
+        self.content = self.content[:pos] + text + self.content[pos:]
+
+    def _delete(self, *indexes: str) -> None:
+        # 複数範囲は位置順に並べ、後ろから削除する（Tkと同じ結果になる）
+        ranges = []
+        for i in range(0, len(indexes), 2):
+            a = self._pos(indexes[i])
+            b = self._pos(indexes[i + 1]) if i + 1 < len(indexes) else a + 1
+            ranges.append((a, min(b, len(self.content) - 1)))
+        removed = [False] * len(self.content)
+        for a, b in ranges:
+            for pos in range(a, b):
+                removed[pos] = True
+        self.content = "".join(
+            char for char, gone in zip(self.content, removed, strict=True) if not gone
+        )
+
+
+def _create_editor() -> tuple[MarkdownEditor, _FakeTextCommand]:
+    """ウィジェットを生成せずに、模擬コマンドにつないだエディタを作成する。"""
+    command = _FakeTextCommand()
+    editor = object.__new__(MarkdownEditor)
+    editor._changes = ChangeLog()
+    editor._astral = AstralPositions()
+    editor._original_command = "text_original"
+    editor._text = SimpleNamespace(
+        tk=SimpleNamespace(
+            call=lambda _name, *args: command(*args),
+            getboolean=bool,
+        )
+    )
+    return editor, command
+
+
+def _mirror(editor: MarkdownEditor) -> str:
+    """記録された差分を空の文書に順に適用した結果を返す。"""
+    change = editor._changes.drain()
+    text = ""
+    for delta in change.deltas if change else ():
+        text = delta.apply(text)
+    return text
+
+
+class TestChangeTracking:
+    """ウィジェットコマンドの中継による差分記録のテスト。"""
+
+    def test_insert_and_delete(self) -> None:
+        """挿入・削除・置換の差分から文書が再現されることを確認する。"""
+        editor, command = _create_editor()
+
+        editor._intercept("insert", "1.0", "# 見出し\n本文")
+        editor._intercept("delete", "2.0", "2.1")
+        editor._intercept("insert", "end-1c", "です", "")
+
+        assert _mirror(editor) == command.content[:-1] == "# 見出し\n文です"
+        assert editor.version == 3
+
+    def test_offsets_after_surrogate_pairs(self) -> None:
+        """BMP外の文字（絵文字）の後ろの編集でも差分の位置がずれないことを確認する。"""
+        editor, command = _create_editor()
+
+        editor._intercept("insert", "1.0", "旅行😀🎉記\n次の行👍")
+        editor._intercept("insert", "1.3", "!")
+        editor._intercept("delete", "1.5")
+        editor._intercept("delete", "2.3", "end-1c")
+        editor._intercept("insert", "end-1c", "🙂")
+
+        change_text = _mirror(editor)
+        assert change_text == command.content[:-1] == "旅行😀!🎉\n次の行🙂"
+
+    def test_multi_range_delete(self) -> None:
+        """複数範囲の削除（重なりを含む）が範囲ごとの差分として記録されることを確認する。"""
+        editor, command = _create_editor()
+        editor._intercept("insert", "1.0", "ab😀cdef\nghij")
+        editor._changes.drain()
+        base = "ab😀cdef\nghij"
+
+        editor._intercept("delete", "2.1", "2.3", "1.1", "1.4", "1.3", "1.5")
+
+        change = editor._changes.drain()
+        assert change is not None
+        text = base
+        for delta in change.deltas:
+            text = delta.apply(text)
+        assert text == command.content[:-1] == "aef\ngj"
+
+    def test_edits_do_not_copy_the_document(self) -> None:
+        """挿入・削除で文書の先頭からのテキストを取り出さないことを確認する。"""
+        editor, command = _create_editor()
+        editor._intercept("insert", "1.0", "行\n" * 1000 + "😀末尾")
+        command.copied = 0
+
+        editor._intercept("insert", "end-1c", "!")
+        editor._intercept("delete", "1000.0", "1001.1")
+        editor._intercept("insert", "1001.0", "x")
+
+        # 削除された文字列だけを取り出す
+        assert command.copied == len("行\n😀")
+        assert _mirror(editor) == command.content[:-1]
+
+    def test_noop_edits_are_not_recorded(self) -> None:
+        """内容が変わらない操作ではバージョンが増えないことを確認する。"""
+        editor, _command = _create_editor()
+
+        editor._intercept("insert", "1.0", "")
+        editor._intercept("delete", "1.0", "end")
+
+        assert editor.version == 0
@@ -0,0 +1,162 @@
+"""画面遷移マネージャのテスト。"""
+
+from typing import Any
+from unittest.mock import MagicMock
+
+from postblog.gui.navigation import BaseView, NavigationManager
+
+
+class _RebuildView(BaseView):
+    """表示のたびに再構築する画面。"""
+
+    def __init__(self, parent: Any, navigation: NavigationManager) -> None:
+        super().__init__(parent, navigation)
+        self.build_count = 0
+        self.refresh_kwargs: list[dict[str, Any]] = []
+
+    def build(self) -> None:
+        self.frame = MagicMock()
+        self.build_count += 1
+
+    def refresh(self, **kwargs: Any) -> None:
+        self.refresh_kwargs.append(kwargs)
+
+
+class _RetainView(_RebuildView):
+    """構築済みの画面を再表示する画面。"""
+
+    retain = True
+
+
+def _create_manager(max_retained_views: int = 4) -> NavigationManager:
+    """画面を登録したマネージャを作成する。"""
+    manager = NavigationManager(MagicMock(), max_retained_views=max_retained_views)
+    manager.register("rebuild", _RebuildView)
+    for name in ("a", "b", "c"):
+        manager.register(name, _RetainView)
+    return manager
+
+
+def _view(manager: NavigationManager, name: str) -> Any:
+    """生成済みの画面インスタンスを返す。"""
+    return manager._view_instances.get(name)
+
+
+class TestRetainedViews:
+    """構築済み画面の再利用のテスト。"""
+
+    def test_retained_view_is_refreshed_instead_of_rebuilt(self) -> None:
+        """retain の画面は再表示時に再構築されず refresh されることを確認する。"""
+        manager = _create_manager()
+        manager.navigate("a")
+        view = _view(manager, "a")
+        frame = view.frame
+        manager.navigate("b")
+        manager.navigate("a", draft_id=1)
+
+        assert view.build_count == 1
+        assert view.frame is frame
+        assert view.refresh_kwargs == [{"draft_id": 1}]
+        frame.pack_forget.assert_called_once()
+        assert frame.pack.call_count == 2
+
+    def test_go_back_refreshes_retained_view(self) -> None:
+        """戻る操作でも構築済みの画面が再利用されることを確認する。"""
+        manager = _create_manager()
+        manager.navigate("a")
+        manager.navigate("b")
+        manager.go_back()
+
+        view = _view(manager, "a")
+        assert manager.current_view_name == "a"
+        assert view.build_count == 1
+        assert view.refresh_kwargs == [{}]
+
+    def test_non_retained_view_is_destroyed_on_hide(self) -> None:
+        """retain でない画面は非表示時に破棄され、再表示時に作り直されることを確認する。"""
+        manager = _create_manager()
+        manager.navigate("rebuild")
+        view = _view(manager, "rebuild")
+        old_frame = view.frame
+        manager.navigate("a")
+
+        assert _view(manager, "rebuild") is None
+        assert view.frame is None
+        old_frame.destroy.assert_called_once()
+
+        manager.navigate("rebuild")
+
+        new_view = _view(manager, "rebuild")
+        assert new_view is not view
+        assert new_view.build_count == 1
+        assert new_view.refresh_kwargs == []
+
+
+class TestEviction:
+    """保持数上限による画面破棄のテスト。"""
+
+    def test_least_recently_used_view_is_destroyed(self) -> None:
+        """上限を超えると最も長く使われていない画面が破棄されることを確認する。"""
+        manager = _create_manager(max_retained_views=2)
+        manager.navigate("a")
+        view_a = _view(manager, "a")
+        frame_a = view_a.frame
+        manager.navigate("b")
+        manager.navigate("c")
+
+        assert _view(manager, "a") is None
+        assert view_a.frame is None
+        frame_a.destroy.assert_called_once()
+        assert list(manager._view_instances) == ["b", "c"]
+
+    def test_revisited_view_is_kept(self) -> None:
+        """再表示した画面は最近使った画面として保持されることを確認する。"""
+        manager = _create_manager(max_retained_views=2)
+        manager.navigate("a")
+        manager.navigate("b")
+        manager.navigate("a")
+        manager.navigate("c")
+
+        assert list(manager._view_instances) == ["a", "c"]
+
+    def test_go_back_recreates_evicted_view(self) -> None:
+        """破棄された画面へ戻る場合は作り直されることを確認する。"""
+        manager = _create_manager(max_retained_views=1)
+        manager.navigate("a")
+        manager.navigate("b")
+        manager.go_back()
+
+        view = _view(manager, "a")
+        assert manager.current_view_name == "a"
+        assert view.build_count == 1
+        assert list(manager._view_instances) == ["a"]
+
+    def test_non_retained_views_do_not_count_toward_limit(self) -> None:
+        """retain でない画面が保持数に数えられず、主要な画面遷移で再構築されないことを確認する。"""
+        manager = NavigationManager(MagicMock(), max_retained_views=4)
+        for name in ("home", "blog_type", "editor", "settings"):
+            manager.register(name, _RetainView)
+        for name in ("hearing", "summary", "publish", "result"):
+            manager.register(name, _RebuildView)
+
+        flow = ["home", "blog_type", "hearing", "summary", "editor", "publish"]
+        for name in [*flow, "result", "home", "editor"]:
+            manager.navigate(name)
+
+        assert _view(manager, "home").build_count == 1
+        assert _view(manager, "editor").build_count == 1
+        assert list(manager._view_instances) == ["blog_type", "home", "editor"]
+
+
+class TestLazyRegistration:
+    """完全修飾名による画面登録のテスト。"""
+
+    def test_view_class_is_imported_on_first_navigation(self) -> None:
+        """文字列で登録した画面クラスが遷移時に読み込まれることを確認する。"""
+        manager = NavigationManager(MagicMock())
+        manager.register("lazy", f"{__name__}._RetainView")
+
+        manager.navigate("lazy")
+
+        assert isinstance(_view(manager, "lazy"), _RetainView)
+        assert manager._views["lazy"] is _RetainView
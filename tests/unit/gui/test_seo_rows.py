@@ -0,0 +1,132 @@
+"""SEOパネルのチェック項目行の差分計算のテスト。"""
+
+from postblog.gui.components.seo_rows import (
+    SeoRowContent,
+    diff_seo_rows,
+    row_content,
+)
+from postblog.models.seo import SeoCheckItem
+
+
+def _item(name: str, status: str = "pass", category: str = "title") -> SeoCheckItem:
+    """チェック項目を作成する。"""
+    return SeoCheckItem(
+        category=category, name=name, status=status, score=0, max_score=10, message=""
+    )
+
+
+def _shown(*items: SeoCheckItem) -> dict[tuple[str, str], SeoRowContent]:
+    """項目を表示済みとした場合の行の内容を返す。"""
+    return {(item.category, item.name): row_content(item) for item in items}
+
+
+class TestRowContent:
+    """row_content 関数のテスト。"""
+
+    def test_status_icon_and_color(self) -> None:
+        """ステータスに応じたアイコンと色になることを確認する。"""
+        content = row_content(_item("length", "fail"))
+
+        assert content == SeoRowContent(
+            icon="NG", color="#F44336", text="title: length"
+        )
+
+    def test_unknown_status(self) -> None:
+        """未知のステータスは既定のアイコンと色になることを確認する。"""
+        content = row_content(_item("length", "skip"))
+
+        assert (content.icon, content.color) == ("?", "gray")
+
+
+class TestDiffSeoRows:
+    """diff_seo_rows 関数のテスト。"""
+
+    def test_initial_display_creates_all_rows(self) -> None:
+        """初回表示では全ての行が作成され、並び順が設定されることを確認する。"""
+        items = [_item("length"), _item("keyword", "warn")]
+
+        diff = diff_seo_rows({}, (), items)
+
+        assert [u.key for u in diff.updates] == [
+            ("title", "length"),
+            ("title", "keyword"),
+        ]
+        assert all(
+            u.created and u.status_changed and u.text_changed for u in diff.updates
+        )
+        assert diff.order == (("title", "length"), ("title", "keyword"))
+        assert diff.reorder is True
+
+    def test_unchanged_result_produces_no_updates(self) -> None:
+        """同じ結果を再表示しても更新が発生しないことを確認する。"""
+        items = [_item("length"), _item("keyword", "warn")]
+        order = [(item.category, item.name) for item in items]
+
+        diff = diff_seo_rows(_shown(*items), order, items)
+
+        assert diff.updates == ()
+        assert diff.reorder is False
+
+    def test_status_change_updates_only_that_row(self) -> None:
+        """ステータスが変わった行だけがアイコンの更新対象になることを確認する。"""
+        before = [_item("length"), _item("keyword", "warn")]
+        after = [_item("length"), _item("keyword", "pass")]
+        order = [(item.category, item.name) for item in before]
+
+        diff = diff_seo_rows(_shown(*before), order, after)
+
+        assert len(diff.updates) == 1
+        update = diff.updates[0]
+        assert update.key == ("title", "keyword")
+        assert (update.created, update.status_changed, update.text_changed) == (
+            False,
+            True,
+            False,
+        )
+        assert update.content.icon == "OK"
+        assert diff.reorder is False
+
+    def test_reorder_without_content_change(self) -> None:
+        """並び順だけが変わった場合は行を更新せず再配置することを確認する。"""
+        items = [_item("length"), _item("keyword")]
+        order = [(item.category, item.name) for item in items]
+
+        diff = diff_seo_rows(_shown(*items), order, list(reversed(items)))
+
+        assert diff.updates == ()
+        assert diff.reorder is True
+        assert diff.order == (("title", "keyword"), ("title", "length"))
+
+    def test_hidden_row_is_reused(self) -> None:
+        """結果から外れて隠れた行は、再び現れたときに作り直さないことを確認する。"""
+        length, keyword = _item("length"), _item("keyword")
+
+        diff = diff_seo_rows(_shown(length, keyword), [("title", "length")], [keyword])
+
+        assert diff.updates == ()
+        assert diff.reorder is True
+        assert diff.order == (("title", "keyword"),)
+
+    def test_removed_rows_are_dropped_from_order(self) -> None:
+        """結果に含まれない行が並び順から除かれることを確認する。"""
+        items = [_item("length"), _item("keyword")]
+        order = [(item.category, item.name) for item in items]
+
+        diff = diff_seo_rows(_shown(*items), order, [])
+
+        assert diff.updates == ()
+        assert diff.order == ()
+        assert diff.reorder is True
+
+    def test_same_name_in_other_category_is_separate_row(self) -> None:
+        """カテゴリが異なる同名の項目は別の行として作成されることを確認する。"""
+        title_length = _item("length")
+        body_length = _item("length", category="body")
+
+        diff = diff_seo_rows(
+            _shown(title_length), [("title", "length")], [title_length, body_length]
+        )
+
+        assert [(u.key, u.created) for u in diff.updates] == [
+            (("body", "length"), True)
+        ]
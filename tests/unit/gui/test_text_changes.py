@@ -0,0 +1,156 @@
+"""テキスト変更の差分管理のテスト。"""
+
+import random
+
+import pytest
+
+from postblog.gui.components.text_changes import (
+    AstralPositions,
+    ChangeLog,
+    EditDelta,
+    diff_text,
+)
+
+
+class TestEditDelta:
+    """EditDelta のテスト。"""
+
+    def test_apply_replaces_range(self) -> None:
+        """差分の範囲が置き換えられることを確認する。"""
+        delta = EditDelta(offset=2, removed="cd", inserted="XYZ", version=1)
+
+        assert delta.apply("abcdef") == "abXYZef"
+
+    def test_apply_insert_at_end(self) -> None:
+        """末尾への挿入が適用できることを確認する。"""
+        delta = EditDelta(offset=3, removed="", inserted="!", version=1)
+
+        assert delta.apply("abc") == "abc!"
+
+    def test_apply_mismatch_raises(self) -> None:
+        """削除される文字列が一致しない場合に ValueError となることを確認する。"""
+        delta = EditDelta(offset=0, removed="zz", inserted="", version=3)
+
+        with pytest.raises(ValueError, match="version=3"):
+            delta.apply("abc")
+
+
+class TestDiffText:
+    """diff_text 関数のテスト。"""
+
+    def test_identical(self) -> None:
+        """同じ文字列の差分は空になることを確認する。"""
+        assert diff_text("abc", "abc") == (3, "", "")
+
+    def test_middle_replacement(self) -> None:
+        """中間の置換が最小の範囲で求まることを確認する。"""
+        assert diff_text("# 見出し\n本文", "# 題名\n本文") == (2, "見出し", "題名")
+
+    def test_repeated_characters(self) -> None:
+        """同じ文字が続く場合も範囲が重ならないことを確認する。"""
+        offset, removed, inserted = diff_text("aaa", "aaaa")
+
+        assert (removed, inserted) == ("", "a")
+        assert EditDelta(offset, removed, inserted, 1).apply("aaa") == "aaaa"
+
+
+class TestChangeLog:
+    """ChangeLog のテスト。"""
+
+    def test_record_increments_version(self) -> None:
+        """編集を記録するたびにバージョンが増えることを確認する。"""
+        log = ChangeLog()
+
+        first = log.record(0, "", "abc")
+        second = log.record(1, "b", "")
+
+        assert first is not None and first.version == 1
+        assert second is not None and second.version == 2
+        assert log.version == 2
+
+    def test_noop_edits_are_skipped(self) -> None:
+        """内容が変わらない編集は記録されないことを確認する。"""
+        log = ChangeLog()
+
+        assert log.record(0, "", "") is None
+        assert log.record(0, "abc", "abc") is None
+        assert log.version == 0
+        assert log.drain() is None
+
+    def test_drain_returns_pending_deltas(self) -> None:
+        """未通知の差分がまとめて取り出され、取り出し後は空になることを確認する。"""
+        log = ChangeLog()
+        log.record(0, "", "ab")
+        log.record(2, "", "c")
+
+        change = log.drain()
+
+        assert change is not None
+        assert change.version == 2
+        assert [d.inserted for d in change.deltas] == ["ab", "c"]
+        assert log.drain() is None
+
+    def test_deltas_reconstruct_text(self) -> None:
+        """差分を順に適用すると編集後の文書が再現されることを確認する。"""
+        rng = random.Random(0)
+        log = ChangeLog()
+        text = ""
+        for _ in range(200):
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + 5))
+            inserted = rng.choice(["", "a", "\n", "## ", "テキスト"])
+            log.record(start, text[start:end], inserted)
+            text = text[:start] + inserted + text[end:]
+
+        change = log.drain()
+        mirror = ""
+        assert change is not None
+        for delta in change.deltas:
+            mirror = delta.apply(mirror)
+
+        assert mirror == text
+        assert change.version == log.version
+
+
+class TestAstralPositions:
+    """AstralPositions のテスト。"""
+
+    def test_converts_utf16_units(self) -> None:
+        """UTF-16 単位の位置が文字数に換算されることを確認する。"""
+        positions = AstralPositions()
+        positions.apply(0, "", "a😀b🎉c")
+
+        # a=0, 😀=1-2, b=3, 🎉=4-5, c=6, 末尾=7
+        assert [positions.to_offset(u) for u in (0, 1, 3, 4, 6, 7)] == [
+            0,
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+
+    def test_follows_random_edits(self) -> None:
+        """編集を繰り返しても換算結果が文書と一致することを確認する。"""
+        rng = random.Random(1)
+        positions = AstralPositions()
+        text = ""
+        for _ in range(300):
+            start = rng.randint(0, len(text))
+            end = rng.randint(start, min(len(text), start + 4))
+            inserted = rng.choice(["", "a", "😀", "x🎉y", "\n"])
+            positions.apply(start, text[start:end], inserted)
+            text = text[:start] + inserted + text[end:]
+
+            offset = rng.randint(0, len(text))
+            units = len(text[:offset].encode("utf-16-le")) // 2
+            assert positions.to_offset(units) == offset
+        assert len(positions) == sum(ord(c) > 0xFFFF for c in text)
+
+    def test_bmp_only_text_is_not_tracked(self) -> None:
+        """BMP外の文字がない場合は何も保持しないことを確認する。"""
+        positions = AstralPositions()
+        positions.apply(0, "", "日本語のテキスト")
+
+        assert len(positions) == 0
+        assert positions.to_offset(5) == 5
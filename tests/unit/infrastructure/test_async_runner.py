@@ -1,5 +1,6 @@
 """非同期ランナーのテスト。"""
 
+import asyncio
 import time
 
 from postblog.infrastructure.async_runner import AsyncRunner
@@ -96,3 +97,32 @@ class TestAsyncRunner:
         """開始前はis_runningがFalseであることを確認する。"""
         runner = AsyncRunner()
         assert runner.is_running is False
+
+    def test_shutdown_hooks_run_on_loop(self) -> None:
+        """停止時に後始末処理がイベントループ上で実行されることを確認する。"""
+        runner = AsyncRunner()
+        runner.start()
+        loop = runner._loop
+        called: list[bool] = []
+
+        async def hook() -> None:
+            called.append(asyncio.get_running_loop() is loop)
+
+        runner.add_shutdown_hook(hook)
+        runner.stop()
+
+        assert called == [True]
+
+    def test_shutdown_hook_error_is_ignored(self) -> None:
+        """後始末処理のエラーで停止が妨げられないことを確認する。"""
+        runner = AsyncRunner()
+        runner.start()
+
+        async def hook() -> None:
+            msg = "hook error"
+            raise RuntimeError(msg)
+
+        runner.add_shutdown_hook(hook)
+        runner.stop()
+
+        assert runner._loop is None
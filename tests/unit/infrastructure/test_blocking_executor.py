@@ -0,0 +1,84 @@
+"""ブロッキング処理オフロードのテスト。"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from postblog.infrastructure.blocking_executor import BlockingExecutor
+
+
+class TestBlockingExecutor:
+    """BlockingExecutorのテスト。"""
+
+    @pytest.mark.asyncio()
+    async def test_run_returns_value_in_worker_thread(self) -> None:
+        """関数がワーカースレッドで実行され戻り値が返ることを確認する。"""
+        executor = BlockingExecutor(max_workers=1, name="test")
+        loop_thread = threading.current_thread().name
+
+        def work(value: int) -> tuple[int, str]:
+            return value * 2, threading.current_thread().name
+
+        result, thread_name = await executor.run(work, 21)
+
+        assert result == 42
+        assert thread_name != loop_thread
+        assert thread_name.startswith("test")
+        executor.shutdown()
+
+    @pytest.mark.asyncio()
+    async def test_run_propagates_exception(self) -> None:
+        """関数の例外が呼び出し元に伝播することを確認する。"""
+        executor = BlockingExecutor()
+
+        def fail() -> None:
+            raise ValueError("error")
+
+        with pytest.raises(ValueError, match="error"):
+            await executor.run(fail)
+        executor.shutdown()
+
+    @pytest.mark.asyncio()
+    async def test_run_timeout(self) -> None:
+        """タイムアウトした場合にTimeoutErrorが送出されることを確認する。"""
+        executor = BlockingExecutor()
+        release = threading.Event()
+
+        with pytest.raises(TimeoutError):
+            await executor.run(release.wait, 5, timeout=0.05)
+        release.set()
+        executor.shutdown()
+
+    @pytest.mark.asyncio()
+    async def test_queued_work_is_dropped_on_timeout(self) -> None:
+        """待機中にタイムアウトした処理が実行されないことを確認する。"""
+        executor = BlockingExecutor(max_workers=1)
+        release = threading.Event()
+        executed: list[str] = []
+        blocker = executor.run(release.wait, 5)
+
+        blocking_task = asyncio.ensure_future(blocker)
+        await asyncio.sleep(0.01)
+        with pytest.raises(TimeoutError):
+            await executor.run(executed.append, "queued", timeout=0.05)
+        release.set()
+        await blocking_task
+        time.sleep(0.05)
+
+        assert executed == []
+        executor.shutdown()
+
+    @pytest.mark.asyncio()
+    async def test_shutdown_recreates_pool(self) -> None:
+        """停止後に再度実行するとスレッドプールが再生成されることを確認する。"""
+        executor = BlockingExecutor(max_workers=2)
+        await executor.run(lambda: None)
+
+        executor.shutdown()
+        result = await executor.run(lambda: "ok")
+
+        assert result == "ok"
+        assert executor.max_workers == 2
+        executor.shutdown()
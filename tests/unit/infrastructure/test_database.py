@@ -1,5 +1,11 @@
 """データベース接続管理のテスト。"""
 
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
 from postblog.infrastructure.storage.database import Database
 
 
@@ -75,3 +81,111 @@ class TestDatabase:
         assert db_path.parent.exists()
 
         db.close()
+
+
+def _count_drafts(db: Database) -> int:
+    """下書きの件数を返す。"""
+    return int(
+        db.read(lambda conn: conn.execute("SELECT COUNT(*) FROM drafts").fetchone()[0])
+    )
+
+
+class TestDatabaseThreading:
+    """スレッド間での接続管理のテスト。"""
+
+    def test_each_thread_gets_own_connection(self, tmp_path: Path) -> None:
+        """ファイルDBではスレッドごとに別の読み込み用接続が使われることを確認する。"""
+        db = Database(tmp_path / "test.db")
+        main_conn = db.connect()
+        other: list[sqlite3.Connection] = []
+
+        thread = threading.Thread(target=lambda: other.append(db.connect()))
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main_conn
+        db.close()
+
+    def test_write_runs_on_writer_thread(self, tmp_path: Path) -> None:
+        """書き込みが専用スレッドで実行され結果が返ることを確認する。"""
+        db = Database(tmp_path / "test.db")
+        db.initialize()
+
+        thread_name = db.write(lambda conn: threading.current_thread().name)
+
+        assert thread_name == "postblog-db-writer"
+        db.close()
+
+    def test_write_is_visible_to_other_threads(self, tmp_path: Path) -> None:
+        """別スレッドから書き込んだ内容が読み込めることを確認する。"""
+        db = Database(tmp_path / "test.db")
+        db.initialize()
+        errors: list[Exception] = []
+
+        def _insert(i: int) -> None:
+            try:
+                db.write(
+                    lambda conn: conn.execute(
+                        "INSERT INTO drafts (title) VALUES (?)", (f"記事{i}",)
+                    )
+                )
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_insert, args=(i,)) for i in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert _count_drafts(db) == 10
+        db.close()
+
+    def test_failed_write_is_rolled_back(self, tmp_path: Path) -> None:
+        """書き込み中の例外でロールバックされ、例外が伝播することを確認する。"""
+        db = Database(tmp_path / "test.db")
+        db.initialize()
+
+        def _fail(conn: sqlite3.Connection) -> None:
+            conn.execute("INSERT INTO drafts (title) VALUES ('記事')")
+            raise ValueError("error")
+
+        with pytest.raises(ValueError, match="error"):
+            db.write(_fail)
+
+        assert _count_drafts(db) == 0
+        db.close()
+
+    def test_close_flushes_queued_writes(self, tmp_path: Path) -> None:
+        """停止前にキュー内の書き込みが実行されることを確認する。"""
+        db_path = tmp_path / "test.db"
+        db = Database(db_path)
+        db.initialize()
+        futures = [
+            db.submit_write(
+                lambda conn: conn.execute("INSERT INTO drafts (title) VALUES ('記事')")
+            )
+            for _ in range(5)
+        ]
+
+        db.close()
+
+        assert all(future.done() for future in futures)
+        reopened = Database(db_path)
+        assert _count_drafts(reopened) == 5
+        reopened.close()
+
+    def test_in_memory_database_is_shared_across_threads(self) -> None:
+        """インメモリDBが別スレッドからも同じ内容で読み込めることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        db.write(lambda conn: conn.execute("INSERT INTO drafts (title) VALUES ('a')"))
+        counts: list[int] = []
+
+        thread = threading.Thread(target=lambda: counts.append(_count_drafts(db)))
+        thread.start()
+        thread.join()
+
+        assert counts == [1]
+        db.close()
@@ -2,8 +2,12 @@
 
 import pytest
 
+from postblog.infrastructure.storage.body_codec import BodyCodec
 from postblog.infrastructure.storage.database import Database
-from postblog.infrastructure.storage.draft_repository import DraftRepository
+from postblog.infrastructure.storage.draft_repository import (
+    PREVIEW_LENGTH,
+    DraftRepository,
+)
 from postblog.models.draft import Draft
 
 
@@ -66,6 +70,32 @@ class TestDraftRepository:
         drafts = draft_repo.find_all()
         assert drafts == []
 
+    def test_find_summaries_orders_and_limits(
+        self, draft_repo: DraftRepository
+    ) -> None:
+        """要約が更新日時の降順で件数上限とオフセットを適用して返されることを確認する。"""
+        for i in range(5):
+            draft_repo.save(Draft(title=f"記事{i}", body=f"本文{i}"))
+
+        first_page = draft_repo.find_summaries(limit=2)
+        second_page = draft_repo.find_summaries(limit=2, offset=2)
+
+        assert [s.title for s in first_page] == ["記事4", "記事3"]
+        assert [s.title for s in second_page] == ["記事2", "記事1"]
+        assert first_page[0].preview == "本文4"
+
+    def test_find_summaries_truncates_preview(
+        self, draft_repo: DraftRepository
+    ) -> None:
+        """長い本文のプレビューが100文字に切り詰められることを確認する。"""
+        draft_repo.save(Draft(title="長文", body="あ" * 200))
+        draft_repo.save(Draft(title="ちょうど", body="い" * 100))
+
+        summaries = {s.title: s for s in draft_repo.find_summaries(limit=10)}
+
+        assert summaries["長文"].preview == "あ" * 100 + "..."
+        assert summaries["ちょうど"].preview == "い" * 100
+
     def test_update_existing_draft(self, draft_repo: DraftRepository) -> None:
         """既存の下書きが更新されることを確認する。"""
         draft = Draft(title="元のタイトル", body="元の本文")
@@ -108,3 +138,211 @@ class TestDraftRepository:
 
         assert found is not None
         assert found.hearing_data == '{"blog_type_id": "tech", "completed": true}'
+
+
+class TestDraftChangeTracking:
+    """DraftRepository.saveの変更検出のテスト。"""
+
+    @staticmethod
+    def _trace(db: Database) -> list[str]:
+        """実行されたSQL文を記録するリストを返す。"""
+        statements: list[str] = []
+        db.connect().set_trace_callback(statements.append)
+        return statements
+
+    def test_unchanged_save_skips_write(self) -> None:
+        """内容が変わらない保存では書き込みが行われないことを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = DraftRepository(db)
+        draft = repo.save(Draft(title="記事", body="本文", tags=["a"]))
+        statements = self._trace(db)
+
+        repo.save(draft)
+
+        assert not any(s.startswith(("UPDATE", "INSERT", "BEGIN")) for s in statements)
+
+    def test_updates_only_changed_columns(self) -> None:
+        """変更された列だけが更新されることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = DraftRepository(db)
+        draft = repo.save(Draft(title="記事", body="本文", tags=["a"]))
+        statements = self._trace(db)
+
+        draft.tags = ["a", "b"]
+        repo.save(draft)
+
+        updates = [s for s in statements if s.startswith("UPDATE drafts")]
+        assert len(updates) == 1
+        assert "tags=" in updates[0]
+        assert "body=" not in updates[0]
+        assert "title=" not in updates[0]
+        found = repo.find_by_id(draft.id)  # type: ignore[arg-type]
+        assert found is not None
+        assert found.tags == ["a", "b"]
+        assert found.body == "本文"
+
+    def test_backfills_missing_hash_without_touching_content(self) -> None:
+        """内容ハッシュ未設定の既存行は更新日時を変えずにハッシュだけ設定されることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = DraftRepository(db)
+        draft = repo.save(Draft(title="記事", body="本文"))
+        db.write(lambda conn: conn.execute("UPDATE drafts SET content_hash = ''"))
+        before = repo.find_by_id(draft.id)  # type: ignore[arg-type]
+
+        repo.save(draft)
+
+        after = repo.find_by_id(draft.id)  # type: ignore[arg-type]
+        assert before is not None
+        assert after is not None
+        assert after.updated_at == before.updated_at
+        assert len(repo.find_revisions(draft.id)) == 1  # type: ignore[arg-type]
+
+
+class TestDraftBodyCompression:
+    """本文の圧縮保存のテスト。"""
+
+    LONG_BODY = "".join(
+        f"## 見出し{i}\n\nPythonで記事を書く段落{i}です。\n\n" for i in range(300)
+    )
+
+    @pytest.fixture()
+    def database(self) -> Database:
+        """テスト用のデータベースフィクスチャ。"""
+        db = Database(":memory:")
+        db.initialize()
+        return db
+
+    def test_codec_skips_short_body(self) -> None:
+        """閾値未満の本文は圧縮されないことを確認する。"""
+        assert BodyCodec().encode("短い本文") == ("短い本文", None)
+
+    def test_long_body_is_stored_compressed(self, database: Database) -> None:
+        """長い本文が圧縮して保存され、読み込み時に展開されることを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        draft = repo.save(Draft(title="長い記事", body=self.LONG_BODY))
+
+        row = database.read(
+            lambda conn: conn.execute(
+                "SELECT body, length(body_compressed) FROM drafts WHERE id = ?",
+                (draft.id,),
+            ).fetchone()
+        )
+        found = repo.find_by_id(draft.id)  # type: ignore[arg-type]
+
+        assert row[0] == ""
+        assert row[1] * 5 < len(self.LONG_BODY.encode("utf-8"))
+        assert found is not None
+        assert found.body == self.LONG_BODY
+
+    def test_summary_uses_preview_column(self, database: Database) -> None:
+        """要約のプレビューが圧縮された本文から作られることを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        repo.save(Draft(title="長い記事", body=self.LONG_BODY))
+
+        summaries = repo.find_summaries(limit=10)
+
+        assert summaries[0].preview == self.LONG_BODY[:PREVIEW_LENGTH] + "..."
+
+    def test_search_finds_compressed_body(self, database: Database) -> None:
+        """圧縮された本文が全文検索・短い語の検索の対象になることを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        draft = repo.save(Draft(title="長い記事", body=self.LONG_BODY))
+
+        assert [r.id for r in repo.search("段落299")] == [draft.id]
+        assert [r.id for r in repo.search("段落 299")] == [draft.id]
+
+    def test_title_update_keeps_compressed_body_indexed(
+        self, database: Database
+    ) -> None:
+        """圧縮された下書きのタイトルだけを更新しても本文が検索できることを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        draft = repo.save(Draft(title="長い記事", body=self.LONG_BODY))
+
+        draft.title = "改題した記事"
+        repo.save(draft)
+
+        results = repo.search("段落299")
+        assert [r.id for r in results] == [draft.id]
+        assert results[0].title == "改題した記事"
+
+    def test_switching_between_plain_and_compressed(self, database: Database) -> None:
+        """本文の長さの変化で保存形式が切り替わっても検索が追従することを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        draft = repo.save(Draft(title="記事", body="短い本文です"))
+
+        draft.body = self.LONG_BODY
+        repo.save(draft)
+        assert repo.search("短い本文") == []
+        assert len(repo.search("段落150")) == 1
+
+        draft.body = "また短い本文です"
+        repo.save(draft)
+        found = repo.find_by_id(draft.id)  # type: ignore[arg-type]
+        assert found is not None
+        assert found.body == "また短い本文です"
+        assert repo.search("段落150") == []
+        assert len(repo.search("短い本文")) == 1
+
+    def test_delete_removes_compressed_body_from_index(
+        self, database: Database
+    ) -> None:
+        """圧縮された下書きを削除すると索引からも削除されることを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        draft = repo.save(Draft(title="長い記事", body=self.LONG_BODY))
+        kept = repo.save(Draft(title="残す記事", body="段落299の話"))
+
+        repo.delete(draft.id)  # type: ignore[arg-type]
+
+        assert [r.id for r in repo.search("段落299")] == [kept.id]
+        database.write(
+            lambda conn: conn.execute(
+                "INSERT INTO drafts_fts (drafts_fts) VALUES ('integrity-check')"
+            )
+        )
+
+    def test_index_does_not_store_body(self, database: Database) -> None:
+        """索引が本文を保持せず、抜粋は展開した本文から作られることを確認する。"""
+        repo = DraftRepository(database, codec=BodyCodec())
+        repo.save(Draft(title="長い記事", body=self.LONG_BODY))
+
+        tables = database.read(
+            lambda conn: conn.execute(
+                "SELECT name FROM sqlite_master WHERE name = 'drafts_fts_content'"
+            ).fetchall()
+        )
+        results = repo.search("段落150")
+
+        assert tables == []
+        assert "【段落150】" in results[0].snippet
+
+
+class TestDraftSaveMany:
+    """DraftRepository.save_manyのテスト。"""
+
+    def test_save_many_mixes_inserts_and_updates(self) -> None:
+        """新規と既存の下書きが1つのトランザクションで保存されることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = DraftRepository(db)
+        existing = repo.save(Draft(title="既存", body="本文"))
+        unchanged = repo.save(Draft(title="変更なし", body="本文"))
+        existing.body = "更新後の本文"
+        statements: list[str] = []
+        db.connect().set_trace_callback(statements.append)
+
+        saved = repo.save_many(
+            [Draft(title="新規1"), existing, unchanged, Draft(title="新規2")]
+        )
+
+        assert sum(s.startswith("BEGIN") for s in statements) == 1
+        assert len({d.id for d in saved}) == 4
+        found = repo.find_by_id(existing.id)  # type: ignore[arg-type]
+        assert found is not None
+        assert found.body == "更新後の本文"
+        new = repo.find_by_id(saved[3].id)  # type: ignore[arg-type]
+        assert new is not None
+        assert new.title == "新規2"
+        assert len(repo.find_revisions(unchanged.id)) == 1  # type: ignore[arg-type]
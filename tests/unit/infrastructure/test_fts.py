@@ -0,0 +1,161 @@
+"""全文検索のテスト。"""
+
+import pytest
+
+from postblog.infrastructure.storage.database import Database
+from postblog.infrastructure.storage.draft_repository import DraftRepository
+from postblog.infrastructure.storage.fts import build_match_query, make_snippet
+from postblog.infrastructure.storage.history_repository import (
+    HistoryRecord,
+    HistoryRepository,
+)
+from postblog.models.draft import Draft
+
+
+@pytest.fixture()
+def database() -> Database:
+    """テスト用のデータベースフィクスチャ。"""
+    db = Database(":memory:")
+    db.initialize()
+    return db
+
+
+class TestBuildMatchQuery:
+    """build_match_query関数のテスト。"""
+
+    def test_quotes_terms(self) -> None:
+        """各語が引用符で囲まれ、引用符がエスケープされることを確認する。"""
+        assert build_match_query(["非同期", 'a"bc']) == '"非同期" "a""bc"'
+
+    def test_short_term_returns_none(self) -> None:
+        """3文字未満の語を含む場合にNoneが返されることを確認する。"""
+        assert build_match_query(["非同期", "猫"]) is None
+        assert build_match_query([]) is None
+
+
+class TestMakeSnippet:
+    """make_snippet関数のテスト。"""
+
+    def test_highlights_match(self) -> None:
+        """一致箇所が強調され前後が省略されることを確認する。"""
+        text = "あ" * 50 + "猫" + "い" * 50
+
+        snippet = make_snippet(text, ["猫"])
+
+        assert snippet == "…" + "あ" * 30 + "【猫】" + "い" * 30 + "…"
+
+    def test_no_match_returns_head(self) -> None:
+        """一致しない場合は先頭部分が返されることを確認する。"""
+        assert make_snippet("短い本文", ["猫"]) == "短い本文"
+
+
+class TestDraftSearch:
+    """DraftRepository.searchのテスト。"""
+
+    def test_search_ranks_title_matches_first(self, database: Database) -> None:
+        """タイトルの一致が本文の一致より上位になることを確認する。"""
+        repo = DraftRepository(database)
+        body_hit = repo.save(Draft(title="Rust入門", body="非同期処理の基本"))
+        title_hit = repo.save(Draft(title="非同期処理入門", body="asyncの使い方"))
+        repo.save(Draft(title="無関係", body="関係のない記事"))
+
+        results = repo.search("非同期処理")
+
+        assert [r.id for r in results] == [title_hit.id, body_hit.id]
+        assert "【非同期処理】" in results[1].snippet
+        assert results[0].score > results[1].score
+
+    def test_search_multiple_terms_is_and(self, database: Database) -> None:
+        """複数語の検索がAND検索になることを確認する。"""
+        repo = DraftRepository(database)
+        repo.save(Draft(title="Python", body="非同期処理とasyncio"))
+        repo.save(Draft(title="Python", body="型ヒント"))
+
+        results = repo.search("Python　asyncio")
+
+        assert len(results) == 1
+
+    def test_search_follows_updates_and_deletes(self, database: Database) -> None:
+        """更新・削除が検索索引に反映されることを確認する。"""
+        repo = DraftRepository(database)
+        draft = repo.save(Draft(title="古いタイトル", body="本文"))
+
+        draft.title = "新しいタイトル"
+        repo.save(draft)
+        assert repo.search("古いタイトル") == []
+        assert len(repo.search("新しいタイトル")) == 1
+
+        repo.delete(draft.id)  # type: ignore[arg-type]
+        assert repo.search("新しいタイトル") == []
+
+    def test_search_short_term_falls_back_to_like(self, database: Database) -> None:
+        """3文字未満の語でも検索できることを確認する。"""
+        repo = DraftRepository(database)
+        repo.save(Draft(title="ペット", body="猫を飼い始めた"))
+        repo.save(Draft(title="ペット", body="犬を飼い始めた"))
+
+        results = repo.search("猫")
+
+        assert len(results) == 1
+        assert results[0].snippet == "【猫】を飼い始めた"
+
+    def test_search_like_escapes_wildcards(self, database: Database) -> None:
+        """LIKE検索でワイルドカード文字がエスケープされることを確認する。"""
+        repo = DraftRepository(database)
+        repo.save(Draft(title="割合", body="100%達成"))
+        repo.save(Draft(title="割合", body="100点"))
+
+        assert len(repo.search("0%")) == 1
+
+    def test_search_empty_query(self, database: Database) -> None:
+        """空の検索文字列で空リストが返されることを確認する。"""
+        repo = DraftRepository(database)
+        repo.save(Draft(title="記事", body="本文"))
+
+        assert repo.search("  ") == []
+
+    def test_search_respects_limit(self, database: Database) -> None:
+        """件数上限が適用されることを確認する。"""
+        repo = DraftRepository(database)
+        for i in range(5):
+            repo.save(Draft(title=f"Python記事{i}"))
+
+        assert len(repo.search("Python", limit=3)) == 3
+
+
+class TestHistorySearch:
+    """HistoryRepository.searchのテスト。"""
+
+    def test_search_history(self, database: Database) -> None:
+        """投稿履歴のタイトルと本文プレビューを検索できることを確認する。"""
+        repo = HistoryRepository(database)
+        record = repo.save(
+            HistoryRecord(
+                title="投稿記事", body_preview="FastAPIの紹介", service_name="qiita"
+            )
+        )
+        repo.save(HistoryRecord(title="別の記事", service_name="zenn"))
+
+        results = repo.search("fastapi")
+
+        assert [r.id for r in results] == [record.id]
+        assert "【FastAPI】" in results[0].snippet
+
+    def test_search_existing_rows_after_migration(self) -> None:
+        """索引作成前に保存された行も検索できることを確認する。"""
+        db = Database(":memory:")
+        conn = db.connect()
+        conn.executescript(
+            "CREATE TABLE publish_history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "title TEXT NOT NULL DEFAULT '', body_preview TEXT NOT NULL DEFAULT '', "
+            "blog_type_id TEXT NOT NULL DEFAULT '', "
+            "service_name TEXT NOT NULL DEFAULT '', article_url TEXT DEFAULT NULL, "
+            "status TEXT NOT NULL DEFAULT 'published', "
+            "published_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+            "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);"
+            "INSERT INTO publish_history (title) VALUES ('移行前の記事');"
+        )
+
+        db.initialize()
+
+        assert len(HistoryRepository(db).search("移行前")) == 1
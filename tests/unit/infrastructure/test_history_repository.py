@@ -1,11 +1,14 @@
 """投稿履歴リポジトリのテスト。"""
 
+from datetime import date, datetime
+
 import pytest
 
 from postblog.infrastructure.storage.database import Database
 from postblog.infrastructure.storage.history_repository import (
     HistoryRecord,
     HistoryRepository,
+    PublishStat,
 )
 
 
@@ -68,6 +71,27 @@ class TestHistoryRepository:
 
         assert len(records) == 3
 
+    def test_find_summaries_orders_and_limits(
+        self, history_repo: HistoryRepository
+    ) -> None:
+        """要約が投稿日時の降順で件数上限とオフセットを適用して返されることを確認する。"""
+        for day in range(1, 6):
+            history_repo.save(
+                HistoryRecord(
+                    title=f"記事{day}",
+                    service_name="qiita",
+                    published_at=datetime(2024, 6, day),
+                )
+            )
+
+        first_page = history_repo.find_summaries(limit=2)
+        second_page = history_repo.find_summaries(limit=2, offset=4)
+
+        assert [s.title for s in first_page] == ["記事5", "記事4"]
+        assert [s.title for s in second_page] == ["記事1"]
+        assert first_page[0].service_name == "qiita"
+        assert first_page[0].published_at == datetime(2024, 6, 5)
+
     def test_find_all_empty(self, history_repo: HistoryRepository) -> None:
         """履歴がない場合に空リストが返されることを確認する。"""
         records = history_repo.find_all()
@@ -101,3 +125,107 @@ class TestHistoryRepository:
         assert found is not None
         assert found.status == "failed"
         assert found.article_url is None
+
+
+class TestHistorySaveMany:
+    """HistoryRepository.save_manyのテスト。"""
+
+    def test_save_many_assigns_ids_in_one_transaction(self) -> None:
+        """1つのトランザクションで保存され、各レコードにIDが設定されることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = HistoryRepository(db)
+        repo.save(HistoryRecord(title="既存", service_name="Qiita"))
+        statements: list[str] = []
+        db.connect().set_trace_callback(statements.append)
+        records = [
+            HistoryRecord(title="記事", service_name=name)
+            for name in ["Qiita", "Zenn", "Hatena"]
+        ]
+
+        saved = repo.save_many(records)
+
+        assert sum(s.startswith("BEGIN") for s in statements) == 1
+        for record in saved:
+            found = repo.find_by_id(record.id)  # type: ignore[arg-type]
+            assert found is not None
+            assert found.service_name == record.service_name
+
+    def test_save_many_empty(self) -> None:
+        """空のリストでは何も書き込まれないことを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = HistoryRepository(db)
+
+        assert repo.save_many([]) == []
+        assert repo.find_all() == []
+
+
+class TestPublishStats:
+    """投稿統計の集計のテスト。"""
+
+    @pytest.fixture()
+    def repo(self) -> HistoryRepository:
+        """集計用の投稿履歴を登録したリポジトリフィクスチャ。"""
+        db = Database(":memory:")
+        db.initialize()
+        repo = HistoryRepository(db)
+        repo.save_many(
+            [
+                HistoryRecord(
+                    service_name="Qiita", published_at=datetime(2024, 1, 1, 10)
+                ),
+                HistoryRecord(
+                    service_name="Qiita", published_at=datetime(2024, 1, 2, 23)
+                ),
+                HistoryRecord(
+                    service_name="Zenn",
+                    status="failed",
+                    published_at=datetime(2024, 1, 2, 9),
+                ),
+                HistoryRecord(
+                    service_name="Qiita", published_at=datetime(2024, 2, 1, 12)
+                ),
+            ]
+        )
+        return repo
+
+    def test_group_by_service(self, repo: HistoryRepository) -> None:
+        """サービス別の集計が投稿数の降順で返されることを確認する。"""
+        stats = repo.find_stats("service")
+
+        assert stats == [
+            PublishStat(key="Qiita", total=3, published=3, failed=0),
+            PublishStat(key="Zenn", total=1, published=0, failed=1),
+        ]
+
+    def test_group_by_day_with_range(self, repo: HistoryRepository) -> None:
+        """期間指定の日別集計が日付の昇順で返されることを確認する。"""
+        stats = repo.find_stats("day", date(2024, 1, 1), date(2024, 1, 31))
+
+        assert [(s.key, s.total) for s in stats] == [
+            ("2024-01-01", 1),
+            ("2024-01-02", 2),
+        ]
+
+    def test_rollup_follows_updates_and_deletes(self, repo: HistoryRepository) -> None:
+        """投稿履歴の更新・削除が集計に反映されることを確認する。"""
+        qiita = repo.find_all()[0]
+        repo._db.write(
+            lambda conn: conn.execute(
+                "UPDATE publish_history SET status = 'failed' WHERE id = ?",
+                (qiita.id,),
+            )
+        )
+        repo.delete(repo.find_all()[-1].id)  # type: ignore[arg-type]
+
+        stats = {s.key: s for s in repo.find_stats("status")}
+
+        assert stats["failed"].total == 2
+        assert stats["published"].total == 1
+        rows = repo._db.read(
+            lambda conn: conn.execute(
+                "SELECT count(*) FROM publish_stats_daily WHERE count <= 0"
+            ).fetchone()
+        )
+        assert rows[0] == 0
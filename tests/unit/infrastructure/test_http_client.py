@@ -0,0 +1,89 @@
+"""共有HTTPクライアントのテスト。"""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from postblog.infrastructure.http_client import (
+    HttpClientConfig,
+    SharedHttpClient,
+    http_session,
+)
+
+
+class TestSharedHttpClient:
+    """SharedHttpClientのテスト。"""
+
+    @pytest.mark.asyncio()
+    async def test_get_returns_same_client(self) -> None:
+        """同じクライアントが再利用されることを確認する。"""
+        shared = SharedHttpClient()
+
+        client = shared.get()
+
+        assert shared.get() is client
+        await shared.aclose()
+
+    @pytest.mark.asyncio()
+    async def test_applies_config(self) -> None:
+        """設定したタイムアウトがクライアントに反映されることを確認する。"""
+        shared = SharedHttpClient(HttpClientConfig(timeout=12.0, connect_timeout=3.0))
+
+        client = shared.get()
+
+        assert client.timeout.read == 12.0
+        assert client.timeout.connect == 3.0
+        await shared.aclose()
+
+    @pytest.mark.asyncio()
+    async def test_http2_disabled_without_h2(self) -> None:
+        """h2 がない場合はHTTP/2を使用しないことを確認する。"""
+        shared = SharedHttpClient(HttpClientConfig(http2=True))
+
+        with (
+            patch(
+                "postblog.infrastructure.http_client.is_http2_available",
+                return_value=False,
+            ),
+            patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls,
+        ):
+            shared.get()
+
+        assert cls.call_args.kwargs["http2"] is False
+
+    @pytest.mark.asyncio()
+    async def test_recreates_after_close(self) -> None:
+        """閉じた後は新しいクライアントが生成されることを確認する。"""
+        shared = SharedHttpClient()
+        client = shared.get()
+
+        await shared.aclose()
+
+        assert client.is_closed
+        new_client = shared.get()
+        assert new_client is not client
+        await shared.aclose()
+
+
+class TestHttpSession:
+    """http_sessionのテスト。"""
+
+    @pytest.mark.asyncio()
+    async def test_shared_client_is_not_closed(self) -> None:
+        """共有クライアントはセッション終了後も閉じられないことを確認する。"""
+        shared = SharedHttpClient()
+
+        async with http_session(shared) as client:
+            assert client is shared.get()
+
+        assert not client.is_closed
+        await shared.aclose()
+
+    @pytest.mark.asyncio()
+    async def test_temporary_client_is_closed(self) -> None:
+        """共有クライアントがない場合は一時クライアントが閉じられることを確認する。"""
+        async with http_session(None) as client:
+            assert isinstance(client, httpx.AsyncClient)
+
+        assert client.is_closed
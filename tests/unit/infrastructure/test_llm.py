@@ -1,9 +1,12 @@
 """LLMクライアントのテスト。"""
 
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from postblog.infrastructure.llm.base import LLMClient
+from postblog.infrastructure.llm.lazy_client import LazyLLMClient
 from postblog.infrastructure.llm.openai_client import OpenAIClient
 
 
@@ -136,3 +139,74 @@ class TestOpenAIClient:
             result = await client.test_connection()
 
         assert result is False
+
+
+class TestLazyLLMClient:
+    """LazyLLMClientのテスト。"""
+
+    @pytest.mark.asyncio()
+    async def test_creates_client_on_first_use(self) -> None:
+        """ラップ先のクライアントが最初の使用時に1度だけ生成されることを確認する。"""
+        inner = MagicMock(spec=LLMClient)
+        inner.chat = AsyncMock(return_value="応答")
+        factory = MagicMock(return_value=inner)
+        client = LazyLLMClient(factory)
+
+        assert client.is_ready is False
+        factory.assert_not_called()
+        assert await client.chat([{"role": "user", "content": "Hi"}]) == "応答"
+        assert await client.chat([{"role": "user", "content": "Hi"}]) == "応答"
+        factory.assert_called_once()
+        assert client.is_ready is True
+
+    @pytest.mark.asyncio()
+    async def test_chat_stream_delegates(self) -> None:
+        """ストリーミングがラップ先に委譲されることを確認する。"""
+        inner = MagicMock(spec=LLMClient)
+
+        async def _chat_stream(*args: object, **kwargs: object) -> AsyncIterator[str]:
+            for chunk in ["応", "答"]:
+                yield chunk
+
+        inner.chat_stream = MagicMock(side_effect=_chat_stream)
+        client = LazyLLMClient(lambda: inner)
+
+        chunks = [chunk async for chunk in client.chat_stream([])]
+
+        assert chunks == ["応", "答"]
+
+    @pytest.mark.asyncio()
+    async def test_forwards_use_cache(self) -> None:
+        """use_cache の指定がラップ先に渡されることを確認する。"""
+        inner = MagicMock(spec=LLMClient)
+        inner.chat = AsyncMock(return_value="応答")
+        client = LazyLLMClient(lambda: inner)
+
+        await client.chat([{"role": "user", "content": "Hi"}], use_cache=False)
+
+        assert inner.chat.await_args.kwargs["use_cache"] is False
+
+    def test_warm_up_creates_client(self) -> None:
+        """warm_up でラップ先のクライアントが生成されることを確認する。"""
+        factory = MagicMock(return_value=MagicMock(spec=LLMClient))
+        client = LazyLLMClient(factory)
+
+        client.warm_up()
+        client.warm_up()
+
+        factory.assert_called_once()
+        assert client.is_ready is True
+
+    @pytest.mark.asyncio()
+    async def test_warm_up_failure_is_retried_on_use(self) -> None:
+        """事前生成に失敗した場合は使用時に再度生成されることを確認する。"""
+        inner = MagicMock(spec=LLMClient)
+        inner.test_connection = AsyncMock(return_value=True)
+        factory = MagicMock(side_effect=[RuntimeError("keyring"), inner])
+        client = LazyLLMClient(factory)
+
+        client.warm_up()
+
+        assert client.is_ready is False
+        assert await client.test_connection() is True
+        assert factory.call_count == 2
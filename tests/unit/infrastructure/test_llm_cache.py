@@ -0,0 +1,224 @@
+"""LLM応答キャッシュのテスト。"""
+
+import threading
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from postblog.infrastructure.llm.base import LLMClient
+from postblog.infrastructure.llm.cached_client import (
+    CachedLLMClient,
+    LLMResponseCache,
+    make_cache_key,
+)
+
+
+MESSAGES = [{"role": "user", "content": "こんにちは"}]
+
+
+def _create_mock_llm(response: str = "応答") -> MagicMock:
+    """モックLLMクライアントを生成する。"""
+    mock = MagicMock(spec=LLMClient)
+    mock.chat = AsyncMock(return_value=response)
+
+    async def _chat_stream(*args: object, **kwargs: object) -> AsyncIterator[str]:
+        for chunk in ["応", "答"]:
+            yield chunk
+
+    mock.chat_stream = MagicMock(side_effect=_chat_stream)
+    return mock
+
+
+class TestMakeCacheKey:
+    """make_cache_key関数のテスト。"""
+
+    def test_normalizes_messages(self) -> None:
+        """改行コードと前後の空白の違いを無視することを確認する。"""
+        key1 = make_cache_key([{"role": "user", "content": "a\r\nb "}], "gpt-4o", 0.7)
+        key2 = make_cache_key([{"role": "user", "content": "a\nb"}], "gpt-4o", 0.7)
+
+        assert key1 == key2
+
+    def test_model_and_temperature_affect_key(self) -> None:
+        """モデルと温度がキーに含まれることを確認する。"""
+        base = make_cache_key(MESSAGES, "gpt-4o", 0.7)
+
+        assert base != make_cache_key(MESSAGES, "gpt-4o-mini", 0.7)
+        assert base != make_cache_key(MESSAGES, "gpt-4o", 0.3)
+
+
+class TestLLMResponseCache:
+    """LLMResponseCacheのテスト。"""
+
+    def test_put_and_get(self, tmp_path: Path) -> None:
+        """保存した応答を取得できることを確認する。"""
+        cache = LLMResponseCache(tmp_path / "cache.db")
+
+        cache.put("key", "応答")
+
+        assert cache.get("key") == "応答"
+        assert cache.get("missing") is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """ファイルに永続化されることを確認する。"""
+        cache = LLMResponseCache(tmp_path / "cache.db")
+        cache.put("key", "応答")
+        cache.close()
+
+        reopened = LLMResponseCache(tmp_path / "cache.db")
+
+        assert reopened.get("key") == "応答"
+        reopened.close()
+
+    def test_expired_entry_is_removed(self) -> None:
+        """有効期限切れのエントリが返されず削除されることを確認する。"""
+        cache = LLMResponseCache(":memory:", ttl_seconds=60)
+
+        with patch("postblog.infrastructure.llm.cached_client.time.time") as now:
+            now.return_value = 1000.0
+            cache.put("key", "応答")
+            now.return_value = 1061.0
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """上限を超えると最終参照が最も古いエントリが削除されることを確認する。"""
+        cache = LLMResponseCache(":memory:", max_entries=2)
+
+        with patch("postblog.infrastructure.llm.cached_client.time.time") as now:
+            now.return_value = 1.0
+            cache.put("a", "A")
+            now.return_value = 2.0
+            cache.put("b", "B")
+            now.return_value = 3.0
+            cache.get("a")
+            now.return_value = 4.0
+            cache.put("c", "C")
+
+            assert cache.get("a") == "A"
+            assert cache.get("b") is None
+            assert cache.get("c") == "C"
+
+    def test_clear(self) -> None:
+        """キャッシュをすべて削除できることを確認する。"""
+        cache = LLMResponseCache(":memory:")
+        cache.put("key", "応答")
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestCachedLLMClient:
+    """CachedLLMClientのテスト。"""
+
+    @pytest.mark.asyncio()
+    async def test_chat_uses_cache(self) -> None:
+        """同一入力の2回目はキャッシュから返されることを確認する。"""
+        inner = _create_mock_llm("応答")
+        client = CachedLLMClient(inner, LLMResponseCache(":memory:"), "gpt-4o")
+
+        first = await client.chat(MESSAGES)
+        second = await client.chat(MESSAGES)
+
+        assert first == second == "応答"
+        inner.chat.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_chat_different_temperature_misses(self) -> None:
+        """温度が異なる場合はキャッシュを使わないことを確認する。"""
+        inner = _create_mock_llm("応答")
+        client = CachedLLMClient(inner, LLMResponseCache(":memory:"), "gpt-4o")
+
+        await client.chat(MESSAGES)
+        await client.chat(MESSAGES, temperature=0.3)
+
+        assert inner.chat.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_chat_bypass(self) -> None:
+        """use_cache=Falseでキャッシュを参照せず、結果は保存されることを確認する。"""
+        inner = _create_mock_llm("応答")
+        cache = LLMResponseCache(":memory:")
+        client = CachedLLMClient(inner, cache, "gpt-4o")
+
+        await client.chat(MESSAGES)
+        await client.chat(MESSAGES, use_cache=False)
+
+        assert inner.chat.await_count == 2
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio()
+    async def test_chat_stream_bypass(self) -> None:
+        """ストリーミングでも use_cache=False でキャッシュを参照しないことを確認する。"""
+        inner = _create_mock_llm()
+        client = CachedLLMClient(inner, LLMResponseCache(":memory:"), "gpt-4o")
+
+        [chunk async for chunk in client.chat_stream(MESSAGES)]
+        chunks = [
+            chunk async for chunk in client.chat_stream(MESSAGES, use_cache=False)
+        ]
+
+        assert chunks == ["応", "答"]
+        assert inner.chat_stream.call_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_cache_io_runs_off_event_loop(self) -> None:
+        """キャッシュDBの読み書きがイベントループのスレッド外で行われることを確認する。"""
+        cache = LLMResponseCache(":memory:")
+        threads: list[int] = []
+        get, put = cache.get, cache.put
+
+        def _get(key: str) -> str | None:
+            threads.append(threading.get_ident())
+            return get(key)
+
+        def _put(key: str, response: str) -> None:
+            threads.append(threading.get_ident())
+            put(key, response)
+
+        client = CachedLLMClient(_create_mock_llm(), cache, "gpt-4o")
+        with patch.object(cache, "get", _get), patch.object(cache, "put", _put):
+            await client.chat(MESSAGES)
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio()
+    async def test_chat_stream_uses_cache(self) -> None:
+        """ストリーミングの応答がキャッシュされ再利用されることを確認する。"""
+        inner = _create_mock_llm()
+        client = CachedLLMClient(inner, LLMResponseCache(":memory:"), "gpt-4o")
+
+        first = [chunk async for chunk in client.chat_stream(MESSAGES)]
+        second = [chunk async for chunk in client.chat_stream(MESSAGES)]
+
+        assert first == ["応", "答"]
+        assert second == ["応答"]
+        inner.chat_stream.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_chat_and_stream_share_cache(self) -> None:
+        """通常の補完で保存した応答をストリーミングでも再利用することを確認する。"""
+        inner = _create_mock_llm("応答")
+        client = CachedLLMClient(inner, LLMResponseCache(":memory:"), "gpt-4o")
+
+        await client.chat(MESSAGES)
+        chunks = [chunk async for chunk in client.chat_stream(MESSAGES)]
+
+        assert chunks == ["応答"]
+        inner.chat_stream.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_test_connection_delegates(self) -> None:
+        """接続テストがラップ先に委譲されることを確認する。"""
+        inner = _create_mock_llm()
+        inner.test_connection = AsyncMock(return_value=True)
+        client = CachedLLMClient(inner, LLMResponseCache(":memory:"))
+
+        assert await client.test_connection() is True
+        inner.test_connection.assert_awaited_once()
@@ -0,0 +1,191 @@
+"""スキーママイグレーションのテスト。"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from postblog.infrastructure.storage.database import Database
+from postblog.infrastructure.storage.migrations import (
+    MIGRATIONS,
+    Migration,
+    apply_migrations,
+    get_schema_version,
+)
+
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def _index_names(conn: sqlite3.Connection) -> set[str]:
+    """インデックス名の集合を返す。"""
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall()
+    return {row[0] for row in rows}
+
+
+class TestApplyMigrations:
+    """apply_migrations関数のテスト。"""
+
+    def test_fresh_database_is_migrated_to_latest(self) -> None:
+        """新規DBが最新バージョンまで移行されることを確認する。"""
+        conn = sqlite3.connect(":memory:")
+
+        version = apply_migrations(conn)
+
+        assert version == LATEST_VERSION
+        assert get_schema_version(conn) == LATEST_VERSION
+        assert {
+            "idx_drafts_updated_at",
+            "idx_publish_history_published_at",
+            "idx_publish_history_service_status",
+        } <= _index_names(conn)
+
+    def test_is_idempotent(self) -> None:
+        """2回目の実行では何も適用されないことを確認する。"""
+        conn = sqlite3.connect(":memory:")
+        apply_migrations(conn)
+        conn.execute("INSERT INTO drafts (title) VALUES ('記事')")
+        conn.commit()
+
+        assert apply_migrations(conn) == LATEST_VERSION
+        assert conn.execute("SELECT COUNT(*) FROM drafts").fetchone()[0] == 1
+
+    def test_legacy_database_keeps_data(self, tmp_path: Path) -> None:
+        """バージョン管理導入前のDBがデータを保持したまま移行されることを確認する。"""
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(MIGRATIONS[0].sql)
+        conn.execute("INSERT INTO drafts (title) VALUES ('既存の記事')")
+        conn.commit()
+        assert get_schema_version(conn) == 0
+
+        apply_migrations(conn)
+
+        assert get_schema_version(conn) == LATEST_VERSION
+        row = conn.execute("SELECT title FROM drafts").fetchone()
+        assert row[0] == "既存の記事"
+        conn.close()
+
+    def test_existing_drafts_remain_searchable(self) -> None:
+        """本文圧縮への移行後も既存の下書きのプレビューと全文検索が使えることを確認する。"""
+        conn = sqlite3.connect(":memory:")
+        apply_migrations(conn, tuple(m for m in MIGRATIONS if m.version <= 5))
+        conn.execute(
+            "INSERT INTO drafts (title, body) VALUES ('既存の記事', '移行前の本文です')"
+        )
+        conn.commit()
+
+        apply_migrations(conn)
+
+        assert conn.execute("SELECT preview FROM drafts").fetchone()[0] == (
+            "移行前の本文です"
+        )
+        rows = conn.execute(
+            "SELECT rowid FROM drafts_fts WHERE drafts_fts MATCH '\"移行前\"'"
+        ).fetchall()
+        assert len(rows) == 1
+
+    def test_drafts_writable_without_app_functions(self, tmp_path: Path) -> None:
+        """アプリのSQL関数を登録していない接続でも下書きを更新・検索できることを確認する。"""
+        db_path = tmp_path / "postblog.db"
+        db = Database(str(db_path))
+        db.initialize()
+        db.close()
+        conn = sqlite3.connect(db_path)
+
+        conn.execute(
+            "INSERT INTO drafts (title, body) VALUES ('外部ツール', '外部から追加')"
+        )
+        conn.execute(
+            "UPDATE drafts SET body = '外部から更新' WHERE title = '外部ツール'"
+        )
+        rows = conn.execute("SELECT title, body FROM drafts").fetchall()
+        matched = conn.execute(
+            "SELECT rowid FROM drafts_fts WHERE drafts_fts MATCH '\"外部から更新\"'"
+        ).fetchall()
+        conn.execute("DELETE FROM drafts")
+        remaining = conn.execute("SELECT count(*) FROM drafts_fts").fetchone()[0]
+        conn.close()
+
+        assert rows == [("外部ツール", "外部から更新")]
+        assert len(matched) == 1
+        assert remaining == 0
+
+    def test_schema_does_not_reference_app_functions(self) -> None:
+        """トリガーがアプリのSQL関数を参照しないことを確認する。"""
+        conn = sqlite3.connect(":memory:")
+        apply_migrations(conn)
+
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE sql LIKE '%draft_body%'"
+        ).fetchall()
+
+        assert rows == []
+
+    def test_failed_migration_is_rolled_back(self) -> None:
+        """失敗したマイグレーションがロールバックされることを確認する。"""
+        conn = sqlite3.connect(":memory:")
+        migrations = (
+            Migration(1, "テーブル作成", "CREATE TABLE t (id INTEGER);"),
+            Migration(
+                2,
+                "不正なSQL",
+                "ALTER TABLE t ADD COLUMN name TEXT;\nINVALID SQL;",
+            ),
+        )
+
+        with pytest.raises(sqlite3.Error):
+            apply_migrations(conn, migrations)
+
+        assert get_schema_version(conn) == 1
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(t)")]
+        assert columns == ["id"]
+
+    def test_newer_database_is_left_untouched(self) -> None:
+        """アプリより新しいバージョンのDBは変更しないことを確認する。"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute(f"PRAGMA user_version = {LATEST_VERSION + 1}")
+
+        assert apply_migrations(conn) == LATEST_VERSION + 1
+
+
+class TestIndexes:
+    """インデックスが一覧取得で使用されることを確認するテスト。"""
+
+    def test_draft_list_uses_index(self) -> None:
+        """下書き一覧の並び替えにインデックスが使用されることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+
+        plan = (
+            db.get_connection()
+            .execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM drafts "
+                "ORDER BY updated_at DESC, id DESC LIMIT 10"
+            )
+            .fetchall()
+        )
+
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_drafts_updated_at" in details
+        assert "TEMP B-TREE" not in details
+        db.close()
+
+    def test_history_list_uses_index(self) -> None:
+        """投稿履歴一覧の並び替えにインデックスが使用されることを確認する。"""
+        db = Database(":memory:")
+        db.initialize()
+
+        plan = (
+            db.get_connection()
+            .execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM publish_history "
+                "ORDER BY published_at DESC, id DESC LIMIT 10"
+            )
+            .fetchall()
+        )
+
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_publish_history_published_at" in details
+        assert "TEMP B-TREE" not in details
+        db.close()
@@ -1,16 +1,23 @@
 """ブログ投稿クライアントのテスト。"""
 
+import contextlib
+import threading
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import git
 import pytest
 
+from postblog.infrastructure.http_client import SharedHttpClient
 from postblog.infrastructure.publishers.ameba import AmebaPublisher
 from postblog.infrastructure.publishers.hatena import HatenaPublisher
 from postblog.infrastructure.publishers.markdown_export import MarkdownExportPublisher
 from postblog.infrastructure.publishers.qiita import QiitaPublisher
 from postblog.infrastructure.publishers.wordpress import WordPressPublisher
-from postblog.infrastructure.publishers.zenn import ZennPublisher
+from postblog.infrastructure.publishers.zenn import (
+    NON_INTERACTIVE_GIT_ENV,
+    ZennPublisher,
+)
 from postblog.models.publish_result import PublishRequest
 
 
@@ -53,7 +60,7 @@ class TestQiitaPublisher:
         mock_response.json.return_value = {"url": "https://qiita.com/test/items/123"}
         mock_response.raise_for_status = MagicMock()
 
-        with patch("postblog.infrastructure.publishers.qiita.httpx.AsyncClient") as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(post_return=mock_response)
             result = await publisher.publish(request)
 
@@ -66,7 +73,7 @@ class TestQiitaPublisher:
         publisher = QiitaPublisher(api_token="invalid-token")
         request = PublishRequest(title="テスト", body="本文")
 
-        with patch("postblog.infrastructure.publishers.qiita.httpx.AsyncClient") as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(post_side_effect=Exception("401"))
             result = await publisher.publish(request)
 
@@ -80,7 +87,7 @@ class TestQiitaPublisher:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
 
-        with patch("postblog.infrastructure.publishers.qiita.httpx.AsyncClient") as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(get_return=mock_resp)
             result = await publisher.test_connection()
 
@@ -91,12 +98,28 @@ class TestQiitaPublisher:
         """接続テスト失敗を確認する。"""
         publisher = QiitaPublisher(api_token="invalid-token")
 
-        with patch("postblog.infrastructure.publishers.qiita.httpx.AsyncClient") as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(get_side_effect=Exception("error"))
             result = await publisher.test_connection()
 
         assert result is False
 
+    @pytest.mark.asyncio()
+    async def test_shared_http_client_is_reused(self) -> None:
+        """共有HTTPクライアントが投稿と接続テストで再利用されることを確認する。"""
+        mock_client = _mock_httpx_client(get_return=MagicMock(status_code=200))
+        shared = MagicMock(spec=SharedHttpClient)
+        shared.get.return_value = mock_client
+        publisher = QiitaPublisher(api_token="test-token", http_client=shared)
+
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
+            await publisher.test_connection()
+            await publisher.test_connection()
+
+        cls.assert_not_called()
+        assert mock_client.get.await_count == 2
+        mock_client.__aexit__.assert_not_called()
+
 
 class TestWordPressPublisher:
     """WordPressPublisherのテスト。"""
@@ -116,9 +139,7 @@ class TestWordPressPublisher:
         mock_resp.json.return_value = {"link": "https://example.com/?p=1"}
         mock_resp.raise_for_status = MagicMock()
 
-        with patch(
-            "postblog.infrastructure.publishers.wordpress.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(post_return=mock_resp)
             result = await publisher.publish(request)
 
@@ -131,9 +152,7 @@ class TestWordPressPublisher:
         publisher = WordPressPublisher("https://example.com", "user", "pass")
         request = PublishRequest(title="テスト", body="本文")
 
-        with patch(
-            "postblog.infrastructure.publishers.wordpress.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(post_side_effect=Exception("403"))
             result = await publisher.publish(request)
 
@@ -146,9 +165,7 @@ class TestWordPressPublisher:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
 
-        with patch(
-            "postblog.infrastructure.publishers.wordpress.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(get_return=mock_resp)
             result = await publisher.test_connection()
 
@@ -159,9 +176,7 @@ class TestWordPressPublisher:
         """接続テスト失敗を確認する。"""
         publisher = WordPressPublisher("https://example.com", "user", "pass")
 
-        with patch(
-            "postblog.infrastructure.publishers.wordpress.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(get_side_effect=Exception("err"))
             result = await publisher.test_connection()
 
@@ -196,9 +211,7 @@ class TestHatenaPublisher:
         mock_resp = MagicMock()
         mock_resp.raise_for_status = MagicMock()
 
-        with patch(
-            "postblog.infrastructure.publishers.hatena.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(post_return=mock_resp)
             result = await publisher.publish(request)
 
@@ -210,9 +223,7 @@ class TestHatenaPublisher:
         publisher = HatenaPublisher("user", "blog.example.com", "api_key")
         request = PublishRequest(title="テスト", body="本文")
 
-        with patch(
-            "postblog.infrastructure.publishers.hatena.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(post_side_effect=Exception("401"))
             result = await publisher.publish(request)
 
@@ -225,9 +236,7 @@ class TestHatenaPublisher:
         mock_resp = MagicMock()
         mock_resp.status_code = 200
 
-        with patch(
-            "postblog.infrastructure.publishers.hatena.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(get_return=mock_resp)
             result = await publisher.test_connection()
 
@@ -238,9 +247,7 @@ class TestHatenaPublisher:
         """接続テスト失敗を確認する。"""
         publisher = HatenaPublisher("user", "blog.example.com", "api_key")
 
-        with patch(
-            "postblog.infrastructure.publishers.hatena.httpx.AsyncClient"
-        ) as cls:
+        with patch("postblog.infrastructure.http_client.httpx.AsyncClient") as cls:
             cls.return_value = _mock_httpx_client(get_side_effect=Exception("err"))
             result = await publisher.test_connection()
 
@@ -321,6 +328,22 @@ class TestAmebaPublisher:
 
         assert result is False
 
+    @pytest.mark.asyncio()
+    async def test_publish_timeout(self) -> None:
+        """SMTP処理がタイムアウトした場合に失敗結果を返すことを確認する。"""
+        publisher = AmebaPublisher("from@example.com", "to@example.com", timeout=0.05)
+        request = PublishRequest(title="テスト", body="本文")
+        release = threading.Event()
+
+        with patch(
+            "postblog.infrastructure.publishers.ameba.smtplib.SMTP",
+            side_effect=lambda *args, **kwargs: release.wait(5),
+        ):
+            result = await publisher.publish(request)
+            release.set()
+
+        assert result.success is False
+
 
 class TestZennPublisher:
     """ZennPublisherのテスト。"""
@@ -351,6 +374,44 @@ class TestZennPublisher:
         articles_dir = tmp_dir / "articles"
         assert articles_dir.exists()
 
+    @pytest.mark.asyncio()
+    async def test_push_is_bounded_and_non_interactive(self, tmp_dir: Path) -> None:
+        """pushがタイムアウト付き・対話なしの環境で実行されることを確認する。"""
+        publisher = ZennPublisher(str(tmp_dir), "token", timeout=5.0)
+        request = PublishRequest(title="Test", body="Body")
+        environments: list[dict[str, str]] = []
+
+        with patch("postblog.infrastructure.publishers.zenn.git.Repo") as mock_repo_cls:
+            mock_repo = MagicMock()
+            mock_repo.git.custom_environment.side_effect = lambda **env: (
+                environments.append(env) or contextlib.nullcontext()
+            )
+            mock_repo_cls.return_value = mock_repo
+
+            result = await publisher.publish(request)
+
+        assert result.success is True
+        mock_repo.remotes.origin.push.assert_called_once_with(kill_after_timeout=5.0)
+        mock_repo.remotes.origin.push.return_value.raise_if_error.assert_called_once()
+        assert environments == [NON_INTERACTIVE_GIT_ENV]
+
+    @pytest.mark.asyncio()
+    async def test_publish_fails_when_push_fails(self, tmp_dir: Path) -> None:
+        """pushが失敗（タイムアウトでの終了を含む）した場合に失敗となることを確認する。"""
+        publisher = ZennPublisher(str(tmp_dir), "token")
+        request = PublishRequest(title="Test", body="Body")
+
+        with patch("postblog.infrastructure.publishers.zenn.git.Repo") as mock_repo_cls:
+            mock_repo = MagicMock()
+            mock_repo.remotes.origin.push.return_value.raise_if_error.side_effect = (
+                git.GitCommandError("push", 1)
+            )
+            mock_repo_cls.return_value = mock_repo
+
+            result = await publisher.publish(request)
+
+        assert result.success is False
+
     @pytest.mark.asyncio()
     async def test_publish_failure(self, tmp_dir: Path) -> None:
         """投稿失敗を確認する。"""
@@ -0,0 +1,134 @@
+"""下書きの版履歴のテスト。"""
+
+import random
+
+import pytest
+
+from postblog.infrastructure.storage import revisions
+from postblog.infrastructure.storage.database import Database
+from postblog.infrastructure.storage.draft_repository import DraftRepository
+from postblog.models.draft import Draft
+
+
+@pytest.fixture()
+def draft_repo() -> DraftRepository:
+    """テスト用の下書きリポジトリフィクスチャ。"""
+    db = Database(":memory:")
+    db.initialize()
+    return DraftRepository(db)
+
+
+_RNG = random.Random(0)
+
+# 圧縮が効きすぎないよう、ランダムなかな文字で段落を生成しておく
+_PARAGRAPHS = [
+    "".join(chr(_RNG.randint(0x3042, 0x3093)) for _ in range(60)) for _ in range(200)
+]
+
+
+def _article(paragraphs: int, edited: int = -1) -> str:
+    """テスト用の長い本文を生成する（edited 番目の段落だけ内容を変える）。"""
+    return "".join(
+        f"## 見出し{i}\n\n{_PARAGRAPHS[i]}{'（編集済み）' if i == edited else ''}\n\n"
+        for i in range(paragraphs)
+    )
+
+
+class TestDelta:
+    """差分のエンコードと適用のテスト。"""
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ("", "新しい本文\n"),
+            ("行1\n行2\n行3\n", "行1\n行2 改\n行3\n行4"),
+            ("行1\n行2\n行3", "行3\n行1\n"),
+            ("末尾改行なし", "末尾改行なし\n"),
+            ("行1\r\n行2\r\n", "行1\r\n"),
+        ],
+    )
+    def test_round_trip(self, old: str, new: str) -> None:
+        """差分を適用すると新しい本文が復元されることを確認する。"""
+        assert revisions.apply_delta(old, revisions.encode_delta(old, new)) == new
+
+    def test_delta_is_small_for_small_edit(self) -> None:
+        """小さな編集の差分が本文全体より十分小さいことを確認する。"""
+        old = _article(100)
+        new = _article(100, edited=50)
+
+        delta = revisions.encode_delta(old, new)
+
+        assert len(delta) * 10 < len(revisions.encode_snapshot(new))
+
+
+class TestDraftRevisions:
+    """DraftRepositoryの版履歴のテスト。"""
+
+    def test_save_appends_revisions(self, draft_repo: DraftRepository) -> None:
+        """保存のたびに版が追加されることを確認する。"""
+        draft = draft_repo.save(Draft(title="記事", body="版1"))
+        draft.body = "版2"
+        draft_repo.save(draft)
+
+        summaries = draft_repo.find_revisions(draft.id)  # type: ignore[arg-type]
+
+        assert [s.revision for s in summaries] == [2, 1]
+        assert summaries[1].is_snapshot is True
+
+    def test_unchanged_save_does_not_append(self, draft_repo: DraftRepository) -> None:
+        """内容が変わらない保存では版が追加されないことを確認する。"""
+        draft = draft_repo.save(Draft(title="記事", body="本文"))
+        draft_repo.save(draft)
+
+        assert len(draft_repo.find_revisions(draft.id)) == 1  # type: ignore[arg-type]
+
+    def test_find_revision_restores_every_version(
+        self, draft_repo: DraftRepository
+    ) -> None:
+        """スナップショットをまたいで全ての版が復元できることを確認する。"""
+        draft = Draft(title="記事", body=_article(20))
+        bodies = []
+        for i in range(revisions.SNAPSHOT_INTERVAL * 2 + 5):
+            draft.title = f"記事{i}"
+            draft.body = _article(20, edited=i % 20) + f"追記{i}\n"
+            draft_repo.save(draft)
+            bodies.append(draft.body)
+
+        for number, body in enumerate(bodies, start=1):
+            found = draft_repo.find_revision(draft.id, number)  # type: ignore[arg-type]
+            assert found is not None
+            assert found.body == body
+            assert found.title == f"記事{number - 1}"
+
+        snapshots = [
+            s.revision
+            for s in draft_repo.find_revisions(draft.id)  # type: ignore[arg-type]
+            if s.is_snapshot
+        ]
+        assert sorted(snapshots) == [1, 21, 41]
+
+    def test_history_is_compact(self, draft_repo: DraftRepository) -> None:
+        """大きな記事の100版の保存サイズが全版の本文の合計より十分小さいことを確認する。"""
+        draft = Draft(title="記事", body=_article(200))
+        for i in range(100):
+            draft.body = _article(200, edited=i)
+            draft_repo.save(draft)
+
+        summaries = draft_repo.find_revisions(draft.id)  # type: ignore[arg-type]
+        stored = sum(s.stored_size for s in summaries)
+
+        assert len(summaries) == 100
+        assert stored * 20 < len(draft.body.encode("utf-8")) * 100
+
+    def test_find_revision_nonexistent(self, draft_repo: DraftRepository) -> None:
+        """存在しない版でNoneが返されることを確認する。"""
+        draft = draft_repo.save(Draft(title="記事", body="本文"))
+
+        assert draft_repo.find_revision(draft.id, 99) is None  # type: ignore[arg-type]
+
+    def test_delete_removes_revisions(self, draft_repo: DraftRepository) -> None:
+        """下書きの削除で版履歴も削除されることを確認する。"""
+        draft = draft_repo.save(Draft(title="記事", body="本文"))
+        draft_repo.delete(draft.id)  # type: ignore[arg-type]
+
+        assert draft_repo.find_revisions(draft.id) == []  # type: ignore[arg-type]
@@ -0,0 +1,72 @@
+"""起動時間計測のテスト。"""
+
+from collections.abc import Callable
+
+import pytest
+
+from postblog.infrastructure.startup_profiler import PhaseTiming, StartupProfiler
+
+
+def _create_clock(times: list[float]) -> Callable[[], float]:
+    """呼ばれるたびに指定した時刻を順に返す時計関数を生成する。"""
+    values = iter(times)
+    return lambda: next(values)
+
+
+class TestStartupProfiler:
+    """StartupProfilerのテスト。"""
+
+    def test_records_phases_in_order(self) -> None:
+        """フェーズの所要時間が記録順に保持されることを確認する。"""
+        profiler = StartupProfiler(_create_clock([0.0, 0.0, 0.1, 0.1, 0.4]))
+
+        with profiler.phase("config"):
+            pass
+        with profiler.phase("window"):
+            pass
+
+        assert [t.name for t in profiler.timings] == ["config", "window"]
+        assert profiler.timings[1].seconds == pytest.approx(0.3)
+
+    def test_phase_is_recorded_when_exception_raised(self) -> None:
+        """例外が発生してもフェーズが記録されることを確認する。"""
+        profiler = StartupProfiler(_create_clock([0.0, 1.0, 3.0]))
+
+        try:
+            with profiler.phase("database"):
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        assert profiler.timings == [PhaseTiming("database", 2.0)]
+
+    def test_mark_first_frame_keeps_first_value(self) -> None:
+        """最初の画面表示の時刻が最初の呼び出しのみ記録されることを確認する。"""
+        profiler = StartupProfiler(_create_clock([10.0, 10.5, 12.0]))
+
+        assert profiler.first_frame_seconds is None
+        assert profiler.mark_first_frame() == 0.5
+        assert profiler.mark_first_frame() == 0.5
+
+    def test_report_within_budget(self) -> None:
+        """目標時間内の場合の報告内容を確認する。"""
+        profiler = StartupProfiler(_create_clock([0.0, 0.0, 0.25, 0.25, 0.5, 0.6]))
+        with profiler.phase("window"):
+            pass
+        with profiler.phase("llm client", background=True):
+            pass
+        profiler.mark_first_frame()
+
+        report = profiler.report()
+
+        assert "window" in report
+        assert "250.0 ms" in report
+        assert "(background)" in report
+        assert "[OK: budget 1000 ms]" in report
+
+    def test_report_over_budget(self) -> None:
+        """目標時間を超えた場合に報告されることを確認する。"""
+        profiler = StartupProfiler(_create_clock([0.0, 1.5]))
+        profiler.mark_first_frame()
+
+        assert "OVER BUDGET" in profiler.report(budget=1.0)
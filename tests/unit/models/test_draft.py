@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from postblog.models.draft import Draft
+from postblog.models.draft import Draft, content_hash
 
 
 class TestDraft:
@@ -82,3 +82,23 @@ class TestDraft:
         """ID付きの下書きが正しく作成されることを確認する。"""
         draft = Draft(id=100, title="保存済み", body="本文")
         assert draft.id == 100
+
+
+class TestContentHash:
+    """content_hash関数のテスト。"""
+
+    def test_ignores_id_and_timestamps(self) -> None:
+        """IDと日時がハッシュ値に影響しないことを確認する。"""
+        draft1 = Draft(id=1, title="記事", body="本文", updated_at=datetime(2024, 1, 1))
+        draft2 = Draft(id=2, title="記事", body="本文", updated_at=datetime(2024, 6, 1))
+
+        assert content_hash(draft1) == content_hash(draft2)
+
+    def test_content_changes_hash(self) -> None:
+        """内容の違いでハッシュ値が変わることを確認する。"""
+        base = Draft(title="記事", body="本文", tags=["a"])
+
+        assert content_hash(base) != content_hash(Draft(title="記事", body="本文"))
+        assert content_hash(base) != content_hash(
+            Draft(title="記事", body="本文2", tags=["a"])
+        )
@@ -1,8 +1,16 @@
 """記事生成サービスのテスト。"""
 
 import json
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from postblog.exceptions import LLMError
+from postblog.infrastructure.llm.base import LLMClient
+from postblog.models.hearing import HearingResult
 from postblog.services.article_service import (
+    ArticleService,
     _extract_title,
     _parse_seo_advice,
     parse_article_response,
@@ -10,6 +18,18 @@ from postblog.services.article_service import (
 from postblog.templates.prompts import SEO_ADVICE_END_MARKER, SEO_ADVICE_START_MARKER
 
 
+def _make_stream_llm(chunks: list[str]) -> MagicMock:
+    """指定チャンクをストリーミングで返すモックLLMクライアントを作成する。"""
+
+    async def _chat_stream(*args: object, **kwargs: object) -> AsyncIterator[str]:
+        for chunk in chunks:
+            yield chunk
+
+    mock = MagicMock(spec=LLMClient)
+    mock.chat_stream = _chat_stream
+    return mock
+
+
 class TestParseArticleResponse:
     """parse_article_response関数のテスト。"""
 
@@ -116,3 +136,92 @@ class TestExtractTitle:
         """複数のH1がある場合、最初のH1が抽出されることを確認する。"""
         body = "# 最初のタイトル\n\n## 中間\n\n# 二番目のタイトル"
         assert _extract_title(body) == "最初のタイトル"
+
+
+class TestGenerateStream:
+    """ArticleService.generate_stream のテスト。"""
+
+    HEARING = HearingResult(
+        blog_type_id="tech", summary="サマリー", seo_keywords="Python", completed=True
+    )
+
+    async def test_yields_body_chunks(self) -> None:
+        """本文チャンクが順に返され、終了後に記事が確定することを確認する。"""
+        stream = ArticleService(
+            _make_stream_llm(["\n# Python入門\n", "\n本文", "です。\n"])
+        ).generate_stream(self.HEARING)
+
+        chunks = [chunk async for chunk in stream]
+        article, seo_advice = stream.result
+
+        assert "".join(chunks) == "# Python入門\n\n本文です。"
+        assert article.title == "Python入門"
+        assert article.body == "# Python入門\n\n本文です。"
+        assert article.seo_keywords == "Python"
+        assert seo_advice.items == []
+
+    async def test_detects_marker_across_chunks(self) -> None:
+        """チャンク境界をまたぐマーカーを検出し、アドバイスを本文に含めないことを確認する。"""
+        advice_json = json.dumps({"items": [], "summary": "SEO対策済み"})
+        response = (
+            f"# テスト\n\n本文です。\n\n{SEO_ADVICE_START_MARKER}\n"
+            f"{advice_json}\n{SEO_ADVICE_END_MARKER}"
+        )
+        chunks = [response[i : i + 7] for i in range(0, len(response), 7)]
+        stream = ArticleService(_make_stream_llm(chunks)).generate_stream(self.HEARING)
+
+        body = "".join([chunk async for chunk in stream])
+        article, seo_advice = stream.result
+
+        assert body == "# テスト\n\n本文です。"
+        assert article.body == body
+        assert seo_advice.summary == "SEO対策済み"
+
+    async def test_matches_parse_article_response(self) -> None:
+        """チャンクの分割位置によらず一括パースと同じ結果になることを確認する。"""
+        response = (
+            f"  # T\n\n---\n\n本文 ---SEO\n\n{SEO_ADVICE_START_MARKER}"
+            f'{{"summary": "s"}}{SEO_ADVICE_END_MARKER}'
+        )
+        expected_body, expected_advice = parse_article_response(response)
+
+        for size in range(1, 12):
+            chunks = [response[i : i + size] for i in range(0, len(response), size)]
+            stream = ArticleService(_make_stream_llm(chunks)).generate_stream(
+                self.HEARING
+            )
+
+            body = "".join([chunk async for chunk in stream])
+
+            assert body == expected_body
+            assert stream.result[1].summary == expected_advice.summary
+
+    def test_result_before_completion_raises_error(self) -> None:
+        """ストリーム終了前に結果を取得するとLLMErrorが発生することを確認する。"""
+        stream = ArticleService(_make_stream_llm([])).generate_stream(self.HEARING)
+
+        with pytest.raises(LLMError, match="記事の生成が完了していません"):
+            _ = stream.result
+
+
+class TestGenerateUseCache:
+    """ArticleService の応答キャッシュ指定のテスト。"""
+
+    HEARING = HearingResult(blog_type_id="tech", summary="サマリー", completed=True)
+
+    async def test_generate_passes_use_cache(self) -> None:
+        """use_cache の指定がLLMクライアントに渡されることを確認する。"""
+        llm = MagicMock(spec=LLMClient)
+        llm.chat = AsyncMock(return_value="# タイトル\n\n本文")
+
+        await ArticleService(llm).generate(self.HEARING, use_cache=False)
+
+        assert llm.chat.await_args.kwargs["use_cache"] is False
+
+    def test_generate_stream_passes_use_cache(self) -> None:
+        """ストリーミング生成でも use_cache の指定が渡されることを確認する。"""
+        llm = MagicMock(spec=LLMClient)
+
+        ArticleService(llm).generate_stream(self.HEARING, use_cache=False)
+
+        assert llm.chat_stream.call_args.kwargs["use_cache"] is False
@@ -0,0 +1,185 @@
+"""自動保存サービスのテスト。"""
+
+import threading
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from postblog.models.draft import Draft
+from postblog.services.autosave_service import AutosaveService
+
+
+def _create_draft_service() -> MagicMock:
+    """保存時に連番のIDを採番するモック下書きサービスを生成する。"""
+    service = MagicMock()
+    next_id = iter(range(1, 100))
+
+    def _save(draft: Draft) -> Draft:
+        if draft.id is None:
+            draft.id = next(next_id)
+        return draft
+
+    service.save.side_effect = _save
+    return service
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float = 2.0) -> bool:
+    """条件を満たすまで待機する。"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestAutosaveScheduling:
+    """保存タイミングのテスト。"""
+
+    def test_saves_latest_snapshot_after_idle(self) -> None:
+        """編集が止まると最新の内容だけが1回保存されることを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service, interval=10.0, idle_delay=0.05)
+        autosave.start()
+
+        for i in range(5):
+            autosave.mark_dirty(Draft(title=f"タイトル{i}"))
+
+        assert _wait_until(lambda: service.save.call_count == 1)
+        time.sleep(0.1)
+        autosave.stop()
+
+        assert service.save.call_count == 1
+        assert service.save.call_args.args[0].title == "タイトル4"
+
+    def test_saves_on_interval_during_continuous_edits(self) -> None:
+        """編集が続いていても自動保存間隔で保存されることを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service, interval=0.1, idle_delay=10.0)
+        autosave.start()
+
+        deadline = time.monotonic() + 0.5
+        i = 0
+        while time.monotonic() < deadline and service.save.call_count == 0:
+            autosave.mark_dirty(Draft(body=f"本文{i}"))
+            i += 1
+            time.sleep(0.01)
+
+        assert service.save.call_count >= 1
+        autosave.stop()
+
+    def test_does_not_save_without_edits(self) -> None:
+        """編集がない場合は保存しないことを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service, interval=0.05, idle_delay=0.05)
+        autosave.start()
+
+        time.sleep(0.15)
+        autosave.stop()
+
+        service.save.assert_not_called()
+
+    def test_on_saved_is_called_from_worker_thread(self) -> None:
+        """保存完了時コールバックがワーカースレッドから呼ばれることを確認する。"""
+        service = _create_draft_service()
+        threads: list[threading.Thread] = []
+        autosave = AutosaveService(
+            service,
+            idle_delay=0.01,
+            on_saved=lambda _draft: threads.append(threading.current_thread()),
+        )
+        autosave.start()
+
+        autosave.mark_dirty(Draft(title="記事"))
+
+        assert _wait_until(lambda: len(threads) == 1)
+        autosave.stop()
+        assert threads[0] is not threading.current_thread()
+
+
+class TestAutosaveContent:
+    """保存内容のテスト。"""
+
+    def test_skips_unchanged_content(self) -> None:
+        """内容が前回の保存と同じ場合は書き込まないことを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service)
+
+        autosave.mark_dirty(Draft(title="記事", body="本文"))
+        autosave.flush()
+        autosave.mark_dirty(Draft(title="記事", body="本文"))
+        result = autosave.flush()
+
+        assert result is None
+        assert service.save.call_count == 1
+
+    def test_updates_same_draft(self) -> None:
+        """2回目以降の保存が同じ下書きIDへの更新になることを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service)
+
+        autosave.mark_dirty(Draft(body="1"))
+        first = autosave.flush()
+        autosave.mark_dirty(Draft(body="2"))
+        second = autosave.flush()
+
+        assert first is not None
+        assert second is not None
+        assert first.id == second.id == autosave.draft_id
+
+    def test_reset_with_loaded_draft(self) -> None:
+        """読み込んだ下書きと同じ内容は保存せず、変更は同じIDで保存することを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service)
+        loaded = Draft(id=42, title="記事", body="本文")
+
+        autosave.reset(loaded)
+        autosave.mark_dirty(Draft(title="記事", body="本文"))
+        assert autosave.flush() is None
+
+        autosave.mark_dirty(Draft(title="記事", body="変更後"))
+        saved = autosave.flush()
+
+        assert saved is not None
+        assert saved.id == 42
+
+    def test_reset_saves_previous_edits_under_previous_id(self) -> None:
+        """切り替え前の未保存の編集が切り替え前の下書きとして保存されることを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service)
+        autosave.reset(Draft(id=42, body="元の本文"))
+        autosave.mark_dirty(Draft(body="編集後"))
+
+        autosave.reset()
+        autosave.mark_dirty(Draft(body="新しい記事"))
+        autosave.flush()
+
+        saved = [call.args[0] for call in service.save.call_args_list]
+        assert [(d.id, d.body) for d in saved] == [(42, "編集後"), (1, "新しい記事")]
+        assert autosave.draft_id == 1
+
+    def test_stop_flushes_pending_edits(self) -> None:
+        """停止時に未保存の編集が保存されることを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service, interval=60.0, idle_delay=60.0)
+        autosave.start()
+        autosave.mark_dirty(Draft(title="未保存"))
+
+        autosave.stop()
+
+        service.save.assert_called_once()
+        assert autosave.is_dirty is False
+
+    def test_manual_save_replaces_pending(self) -> None:
+        """手動保存が保存待ちの編集を置き換えることを確認する。"""
+        service = _create_draft_service()
+        autosave = AutosaveService(service)
+        autosave.mark_dirty(Draft(body="編集中"))
+
+        saved = autosave.save(Draft(body="手動保存"))
+
+        assert saved.id == 1
+        assert autosave.is_dirty is False
+        assert autosave.flush() is None
+        assert autosave.save(Draft(body="手動保存")).id == 1
+        assert service.save.call_count == 1
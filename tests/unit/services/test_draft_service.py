@@ -2,6 +2,7 @@
 
 import pytest
 
+from postblog.exceptions import ValidationError
 from postblog.infrastructure.storage.database import Database
 from postblog.infrastructure.storage.draft_repository import DraftRepository
 from postblog.models.draft import Draft
@@ -42,6 +43,24 @@ class TestDraftService:
         drafts = draft_service.get_all()
         assert len(drafts) == 2
 
+    def test_search(self, draft_service: DraftService) -> None:
+        """全文検索ができることを確認する。"""
+        draft_service.save(Draft(title="非同期処理入門", body="本文"))
+
+        results = draft_service.search("非同期")
+
+        assert len(results) == 1
+        assert results[0].title == "非同期処理入門"
+
+    def test_get_summaries(self, draft_service: DraftService) -> None:
+        """要約を件数上限付きで取得できることを確認する。"""
+        draft_service.save(Draft(title="記事1", body="本文1"))
+        draft_service.save(Draft(title="記事2", body="本文2"))
+
+        summaries = draft_service.get_summaries(limit=1)
+
+        assert [s.title for s in summaries] == ["記事2"]
+
     def test_delete(self, draft_service: DraftService) -> None:
         """削除ができることを確認する。"""
         saved = draft_service.save(Draft(title="削除対象", body="本文"))
@@ -54,3 +73,43 @@ class TestDraftService:
     def test_delete_nonexistent(self, draft_service: DraftService) -> None:
         """存在しない下書きの削除でFalseが返されることを確認する。"""
         assert draft_service.delete(9999) is False
+
+
+class TestDraftRevisionService:
+    """DraftServiceの版履歴のテスト。"""
+
+    def test_diff_revisions(self, draft_service: DraftService) -> None:
+        """2つの版の差分が unified diff 形式で返されることを確認する。"""
+        draft = draft_service.save(Draft(title="記事", body="行1\n行2\n"))
+        draft.body = "行1\n行2 改\n"
+        draft_service.save(draft)
+
+        diff = draft_service.diff_revisions(draft.id, 1, 2)  # type: ignore[arg-type]
+
+        assert "-行2\n" in diff
+        assert "+行2 改\n" in diff
+
+    def test_diff_nonexistent_revision_raises(
+        self, draft_service: DraftService
+    ) -> None:
+        """存在しない版の比較でValidationErrorが発生することを確認する。"""
+        draft = draft_service.save(Draft(title="記事", body="本文"))
+
+        with pytest.raises(ValidationError):
+            draft_service.diff_revisions(draft.id, 1, 5)  # type: ignore[arg-type]
+
+    def test_restore_revision(self, draft_service: DraftService) -> None:
+        """版の復元が新しい版として保存されることを確認する。"""
+        draft = draft_service.save(Draft(title="初版", body="本文1", tags=["a"]))
+        draft.title = "第2版"
+        draft.body = "本文2"
+        draft.tags = []
+        draft_service.save(draft)
+
+        restored = draft_service.restore_revision(draft.id, 1)  # type: ignore[arg-type]
+
+        assert restored.title == "初版"
+        assert restored.body == "本文1"
+        assert restored.tags == ["a"]
+        revisions = draft_service.get_revisions(draft.id)  # type: ignore[arg-type]
+        assert [r.revision for r in revisions] == [3, 2, 1]
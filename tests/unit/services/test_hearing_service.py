@@ -1,6 +1,7 @@
 """ヒアリングサービスのテスト。"""
 
 import json
+from collections.abc import AsyncIterator
 from unittest.mock import AsyncMock
 
 import pytest
@@ -60,6 +61,30 @@ class TestHearingService:
 
         assert len(hearing_result.messages) == 4
 
+    @pytest.mark.asyncio()
+    async def test_send_message_stream(self) -> None:
+        """ストリーミング送信で応答チャンクが返され履歴に全文が追加されることを確認する。"""
+
+        async def _chat_stream(*args: object, **kwargs: object) -> AsyncIterator[str]:
+            for chunk in ["テーマに", "ついて", "教えてください。"]:
+                yield chunk
+
+        mock_llm = _create_mock_llm()
+        mock_llm.chat_stream = _chat_stream  # type: ignore[method-assign]
+        service = HearingService(mock_llm)
+        hearing_result = HearingResult(blog_type_id="tech")
+
+        chunks = [
+            chunk
+            async for chunk in service.send_message_stream(
+                hearing_result, "Pythonについて書きたい", TECH_BLOG
+            )
+        ]
+
+        assert chunks == ["テーマに", "ついて", "教えてください。"]
+        assert [m.role for m in hearing_result.messages] == ["user", "assistant"]
+        assert hearing_result.messages[1].content == "テーマについて教えてください。"
+
     @pytest.mark.asyncio()
     async def test_generate_summary_valid_json(self) -> None:
         """有効なJSONサマリーが生成されることを確認する。"""
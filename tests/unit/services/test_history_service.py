@@ -1,7 +1,10 @@
 """投稿履歴サービスのテスト。"""
 
+from datetime import date, datetime
+
 import pytest
 
+from postblog.exceptions import ValidationError
 from postblog.infrastructure.storage.database import Database
 from postblog.infrastructure.storage.history_repository import (
     HistoryRecord,
@@ -44,6 +47,26 @@ class TestHistoryService:
         records = history_service.get_all()
         assert len(records) == 2
 
+    def test_search(self, history_service: HistoryService) -> None:
+        """全文検索ができることを確認する。"""
+        history_service.save(
+            HistoryRecord(title="非同期処理入門", service_name="qiita")
+        )
+
+        results = history_service.search("非同期")
+
+        assert len(results) == 1
+        assert results[0].title == "非同期処理入門"
+
+    def test_get_summaries(self, history_service: HistoryService) -> None:
+        """要約を件数上限とオフセット付きで取得できることを確認する。"""
+        history_service.save(HistoryRecord(title="記事1", service_name="qiita"))
+        history_service.save(HistoryRecord(title="記事2", service_name="zenn"))
+
+        summaries = history_service.get_summaries(limit=5, offset=1)
+
+        assert len(summaries) == 1
+
     def test_delete(self, history_service: HistoryService) -> None:
         """削除ができることを確認する。"""
         saved = history_service.save(
@@ -58,3 +81,25 @@ class TestHistoryService:
     def test_delete_nonexistent(self, history_service: HistoryService) -> None:
         """存在しないレコードの削除でFalseが返されることを確認する。"""
         assert history_service.delete(9999) is False
+
+
+class TestGetStats:
+    """HistoryService.get_statsのテスト。"""
+
+    def test_get_stats_in_range(self, history_service: HistoryService) -> None:
+        """期間内の投稿だけが集計されることを確認する。"""
+        history_service.save_many(
+            [
+                HistoryRecord(service_name="Qiita", published_at=datetime(2024, 1, 5)),
+                HistoryRecord(service_name="Qiita", published_at=datetime(2023, 12, 1)),
+            ]
+        )
+
+        stats = history_service.get_stats((date(2024, 1, 1), date(2024, 1, 31)))
+
+        assert [(s.key, s.total) for s in stats] == [("Qiita", 1)]
+
+    def test_invalid_group_by_raises(self, history_service: HistoryService) -> None:
+        """未対応の集計単位でValidationErrorが発生することを確認する。"""
+        with pytest.raises(ValidationError):
+            history_service.get_stats(group_by="title")
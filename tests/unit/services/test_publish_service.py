@@ -1,12 +1,18 @@
 """投稿サービスのテスト。"""
 
-from unittest.mock import AsyncMock
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from postblog.infrastructure.publishers.base import BlogPublisher
+from postblog.infrastructure.publishers.zenn import GIT_TIMEOUT
 from postblog.models.publish_result import PublishRequest, PublishResult
-from postblog.services.publish_service import PublishService
+from postblog.services.publish_service import (
+    DEFAULT_SERVICE_TIMEOUTS,
+    PublishService,
+)
 
 
 def _create_mock_publisher(
@@ -100,6 +106,114 @@ class TestPublishService:
         assert len(results) == 1
         assert results[0].success is False
 
+    @pytest.mark.asyncio()
+    async def test_publish_runs_concurrently_in_order(self) -> None:
+        """投稿が並行して実行され、結果がservice_namesの順序になることを確認する。"""
+        service = PublishService()
+        running = 0
+        peak = 0
+
+        def _slow_publisher(name: str, delay: float) -> BlogPublisher:
+            async def _publish(request: PublishRequest) -> PublishResult:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(delay)
+                running -= 1
+                return PublishResult(success=True, service_name=name)
+
+            mock = _create_mock_publisher(name)
+            mock.publish = AsyncMock(side_effect=_publish)
+            return mock
+
+        service.register_publisher(_slow_publisher("qiita", 0.05))
+        service.register_publisher(_slow_publisher("zenn", 0.01))
+        service.register_publisher(_slow_publisher("hatena", 0.03))
+
+        request = PublishRequest(title="テスト", body="本文")
+        results = await service.publish(request, ["qiita", "unknown", "zenn", "hatena"])
+
+        assert [r.service_name for r in results] == [
+            "qiita",
+            "unknown",
+            "zenn",
+            "hatena",
+        ]
+        assert [r.success for r in results] == [True, False, True, True]
+        assert peak == 3
+
+    @pytest.mark.asyncio()
+    async def test_publish_respects_concurrency_cap(self) -> None:
+        """同時実行数がmax_concurrencyを超えないことを確認する。"""
+        service = PublishService(max_concurrency=1)
+        running = 0
+        peak = 0
+
+        async def _publish(request: PublishRequest) -> PublishResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return PublishResult(success=True, service_name="x")
+
+        for name in ["qiita", "zenn"]:
+            mock = _create_mock_publisher(name)
+            mock.publish = AsyncMock(side_effect=_publish)
+            service.register_publisher(mock)
+
+        await service.publish(PublishRequest(title="t", body="b"), ["qiita", "zenn"])
+
+        assert peak == 1
+
+    @pytest.mark.asyncio()
+    async def test_publish_timeout_does_not_block_others(self) -> None:
+        """タイムアウトしたサービスは失敗となり、他のサービスは成功することを確認する。"""
+        service = PublishService(timeouts={"slow": 0.01})
+
+        async def _hang(request: PublishRequest) -> PublishResult:
+            await asyncio.sleep(10)
+            return PublishResult(success=True, service_name="slow")
+
+        slow = _create_mock_publisher("slow")
+        slow.publish = AsyncMock(side_effect=_hang)
+        service.register_publisher(slow)
+        service.register_publisher(_create_mock_publisher("qiita"))
+
+        results = await service.publish(
+            PublishRequest(title="t", body="b"), ["slow", "qiita"]
+        )
+
+        assert results[0].success is False
+        assert "タイムアウト" in (results[0].error_message or "")
+        assert results[1].success is True
+
+    def test_zenn_timeout_exceeds_git_timeout(self) -> None:
+        """Zennの投稿タイムアウトがgit操作のタイムアウトより長いことを確認する。"""
+        assert DEFAULT_SERVICE_TIMEOUTS["zenn"] > GIT_TIMEOUT
+
+    @pytest.mark.asyncio()
+    async def test_service_default_timeout_applied(self) -> None:
+        """サービスごとの既定タイムアウトが全体の既定値より優先されることを確認する。"""
+        service = PublishService(default_timeout=0.01)
+
+        async def _slow(request: PublishRequest) -> PublishResult:
+            await asyncio.sleep(0.05)
+            return PublishResult(success=True, service_name="zenn")
+
+        zenn = _create_mock_publisher("zenn")
+        zenn.publish = AsyncMock(side_effect=_slow)
+        service.register_publisher(zenn)
+
+        results = await service.publish(PublishRequest(title="t", body="b"), ["zenn"])
+
+        assert results[0].success is True
+
+    def test_invalid_concurrency_raises_error(self) -> None:
+        """max_concurrencyが1未満の場合にValueErrorが発生することを確認する。"""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            PublishService(max_concurrency=0)
+
     @pytest.mark.asyncio()
     async def test_test_connection_registered(self) -> None:
         """登録済みサービスの接続テストを確認する。"""
@@ -116,3 +230,133 @@ class TestPublishService:
 
         result = await service.test_connection("unknown")
         assert result is False
+
+
+class TestPublisherFactories:
+    """投稿クライアントの生成関数のテスト。"""
+
+    def test_factory_is_not_called_until_needed(self) -> None:
+        """生成関数が登録時には呼ばれないことを確認する。"""
+        service = PublishService()
+        factory = MagicMock(return_value=_create_mock_publisher("qiita"))
+        service.register_factory("qiita", factory)
+
+        factory.assert_not_called()
+        assert "qiita" in service.get_publishers()
+        assert "qiita" in service.get_publishers()
+        factory.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_publish_builds_publisher_on_first_use(self) -> None:
+        """投稿時に未生成の投稿クライアントが生成されることを確認する。"""
+        service = PublishService()
+        factory = MagicMock(return_value=_create_mock_publisher("qiita"))
+        service.register_factory("qiita", factory)
+
+        results = await service.publish(
+            PublishRequest(title="テスト", body="本文"), ["qiita"]
+        )
+
+        assert results[0].success is True
+        factory.assert_called_once()
+
+    def test_unconfigured_result_is_cached_until_invalidated(self) -> None:
+        """認証情報が未設定（None）の結果は invalidate されるまで再利用されることを確認する。"""
+        service = PublishService()
+        factory = MagicMock(side_effect=[None, _create_mock_publisher("qiita")])
+        service.register_factory("qiita", factory)
+
+        assert service.get_publishers() == {}
+        assert service.get_publishers() == {}
+        factory.assert_called_once()
+
+        service.invalidate("qiita")
+
+        assert "qiita" in service.get_publishers()
+        assert factory.call_count == 2
+
+    def test_invalidate_rebuilds_publisher(self) -> None:
+        """invalidate 後は新しい認証情報で投稿クライアントが生成し直されることを確認する。"""
+        service = PublishService()
+        old, new = _create_mock_publisher("qiita"), _create_mock_publisher("qiita")
+        service.register_factory("qiita", MagicMock(side_effect=[old, new]))
+
+        assert service.get_publishers()["qiita"] is old
+        service.invalidate("qiita")
+
+        assert service.get_publishers()["qiita"] is new
+
+    def test_invalidate_keeps_directly_registered_publisher(self) -> None:
+        """register_publisher で登録した投稿クライアントは破棄されないことを確認する。"""
+        service = PublishService()
+        publisher = _create_mock_publisher("qiita")
+        service.register_publisher(publisher)
+
+        service.invalidate("qiita")
+
+        assert service.get_publishers() == {"qiita": publisher}
+
+    @pytest.mark.asyncio()
+    async def test_factory_runs_off_event_loop(self) -> None:
+        """投稿時の生成関数がイベントループのスレッド外で呼ばれることを確認する。"""
+        service = PublishService()
+        threads: list[int] = []
+
+        def _factory() -> BlogPublisher:
+            threads.append(threading.get_ident())
+            return _create_mock_publisher("qiita")
+
+        service.register_factory("qiita", _factory)
+
+        results = await service.publish(
+            PublishRequest(title="テスト", body="本文"), ["qiita"]
+        )
+
+        assert results[0].success is True
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio()
+    async def test_slow_factory_does_not_block_other_services(self) -> None:
+        """生成に時間のかかるサービスが他のサービスの投稿を妨げないことを確認する。"""
+        service = PublishService()
+        published = threading.Event()
+        waited: list[bool] = []
+        hatena = _create_mock_publisher("hatena")
+        hatena.publish.side_effect = lambda request: _set_and_return(
+            published, PublishResult(success=True, service_name="hatena")
+        )
+
+        def _slow_factory() -> BlogPublisher:
+            # 他のサービスの投稿が終わるまで生成を終えない
+            waited.append(published.wait(2))
+            return _create_mock_publisher("qiita")
+
+        service.register_factory("qiita", _slow_factory)
+        service.register_factory("hatena", lambda: hatena)
+
+        results = await service.publish(
+            PublishRequest(title="テスト", body="本文"), ["qiita", "hatena"]
+        )
+
+        assert waited == [True]
+        assert [r.success for r in results] == [True, True]
+
+    @pytest.mark.asyncio()
+    async def test_failing_factory_is_treated_as_unregistered(self) -> None:
+        """生成に失敗したサービスへの投稿が失敗結果になることを確認する。"""
+        service = PublishService()
+        service.register_factory("qiita", MagicMock(side_effect=RuntimeError("boom")))
+
+        results = await service.publish(
+            PublishRequest(title="テスト", body="本文"), ["qiita"]
+        )
+
+        assert results[0].success is False
+        assert "未登録" in (results[0].error_message or "")
+
+
+def _set_and_return(event: threading.Event, result: PublishResult) -> PublishResult:
+    """イベントを設定して結果を返す。"""
+    event.set()
+    return result
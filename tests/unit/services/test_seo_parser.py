@@ -0,0 +1,218 @@
+"""SEO分析用Markdownパーサーのテスト。"""
+
+import pytest
+
+from postblog.services.seo_parser import (
+    find_edit_range,
+    merge_edit_ranges,
+    parse_article,
+    reparse_article,
+)
+
+
+BODY = """# Python入門
+
+Python入門の**基本**を解説します。
+
+## インストール
+
+- 公式サイトからダウンロード
+- インストーラーを実行
+1. 確認する
+
+### 変数
+
+| 型 | 例 |
+|---|---|
+| int | 42 |
+
+詳しくは[公式ドキュメント](https://docs.python.org/)を参照してください。"""
+
+
+class TestParseArticle:
+    """parse_article関数のテスト。"""
+
+    def test_heading_levels(self) -> None:
+        """見出しレベルごとの出現数が記録されることを確認する。"""
+        parsed = parse_article(BODY)
+
+        assert parsed.heading_levels == {1: 1, 2: 1, 3: 1}
+        assert parsed.heading_texts == {"Python入門": 1, "インストール": 1, "変数": 1}
+
+    def test_heading_requires_space(self) -> None:
+        """記号の直後に空白がない行は見出しとみなさないことを確認する。"""
+        parsed = parse_article("#タグ\n\n####### 7レベル")
+
+        assert not parsed.has_headings
+
+    def test_headings_with_offsets(self) -> None:
+        """見出しの位置情報が記録されることを確認する。"""
+        parsed = parse_article(BODY)
+
+        offsets = [h.offset for h in parsed.headings]
+        assert [BODY[o : o + 2] for o in offsets] == ["# ", "##", "##"]
+
+    def test_plain_text_strips_markdown(self) -> None:
+        """プレーンテキストから記法が除去され小文字化されることを確認する。"""
+        parsed = parse_article("# **Python** `code`")
+
+        assert parsed.plain_text == " python code"
+        assert parsed.plain_length == len("pythoncode")
+
+    def test_keyword_count(self) -> None:
+        """プレーンテキスト中のキーワード数を数えることを確認する。"""
+        parsed = parse_article(BODY)
+
+        assert parsed.keyword_count("python入門") == 2
+
+    def test_lists_and_tables(self) -> None:
+        """リスト行とテーブル行が数えられることを確認する。"""
+        parsed = parse_article(BODY)
+
+        assert parsed.list_items == 3
+        assert parsed.table_rows == 3
+        assert parsed.has_list
+        assert parsed.has_table
+
+    def test_table_requires_rule(self) -> None:
+        """区切り線のない "|" はテーブルとみなさないことを確認する。"""
+        parsed = parse_article("a | b")
+
+        assert not parsed.has_table
+
+    def test_links(self) -> None:
+        """外部リンクが記録されることを確認する。"""
+        parsed = parse_article(BODY)
+
+        assert parsed.link_count == 1
+        assert parsed.links[0].url == "https://docs.python.org/"
+        assert parsed.links[0].text == "公式ドキュメント"
+
+    def test_paragraphs_exclude_headings(self) -> None:
+        """見出しで始まるブロックは段落に含めないことを確認する。"""
+        parsed = parse_article(BODY)
+
+        assert parsed.paragraph_count == 4
+        assert len(parsed.paragraphs) == 4
+        assert BODY[parsed.paragraphs[0].offset :].startswith("Python入門の")
+
+    def test_long_paragraph(self) -> None:
+        """句点が6つ以上の段落を長い段落として数えることを確認する。"""
+        parsed = parse_article("短い。\n\n" + "文。" * 6)
+
+        assert parsed.paragraph_count == 2
+        assert parsed.long_paragraph_count == 1
+
+    def test_lead(self) -> None:
+        """冒頭100文字が小文字化されて記録されることを確認する。"""
+        parsed = parse_article("ABC" + "あ" * 200)
+
+        assert parsed.lead.startswith("abc")
+        assert len(parsed.lead) == 100
+
+    def test_empty_body(self) -> None:
+        """空の本文を解析できることを確認する。"""
+        parsed = parse_article("")
+
+        assert parsed.plain_length == 0
+        assert parsed.paragraph_count == 0
+        assert parsed.headings == []
+        assert parsed.links == []
+
+
+class TestReparseArticle:
+    """reparse_article関数のテスト。"""
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            (BODY, BODY.replace("基本", "基本と応用")),
+            (BODY, BODY.replace("## インストール\n\n", "")),
+            (BODY, BODY.replace("\n\n### 変数", "\n### 変数")),
+            (BODY, BODY + "\n\n追加の段落。" + "文。" * 6),
+            ("", BODY),
+            (BODY, ""),
+        ],
+    )
+    def test_matches_full_parse(self, old: str, new: str) -> None:
+        """差分再解析の集計値が全体解析と一致することを確認する。"""
+        start, old_end, new_end = find_edit_range(old, new)
+
+        edit = reparse_article(parse_article(old), new, start, old_end, new_end)
+        full = parse_article(new)
+
+        assert edit.parsed.body == new
+        assert edit.parsed.plain_length == full.plain_length
+        assert edit.parsed.heading_levels == full.heading_levels
+        assert edit.parsed.heading_texts == full.heading_texts
+        assert edit.parsed.paragraph_count == full.paragraph_count
+        assert edit.parsed.long_paragraph_count == full.long_paragraph_count
+        assert edit.parsed.list_items == full.list_items
+        assert edit.parsed.table_rows == full.table_rows
+        assert edit.parsed.link_count == full.link_count
+
+    def test_removed_and_inserted_regions(self) -> None:
+        """再解析した領域の編集前後の解析結果が返されることを確認する。"""
+        old = "段落1。\n\n段落2。\n\n段落3。"
+        new = "段落1。\n\n変更後。\n\n段落3。"
+
+        edit = reparse_article(parse_article(old), new, *find_edit_range(old, new))
+
+        assert edit.removed.keyword_count("段落2") == 1
+        assert edit.inserted.keyword_count("変更後") == 1
+        assert edit.inserted.keyword_count("段落3") == 0
+
+    def test_inconsistent_range_raises(self) -> None:
+        """本文と矛盾する編集範囲で ValueError が発生することを確認する。"""
+        with pytest.raises(ValueError):
+            reparse_article(parse_article("abc"), "abcd", 0, 1, 1)
+
+
+class TestFindEditRange:
+    """find_edit_range関数のテスト。"""
+
+    def test_replacement(self) -> None:
+        """置換された範囲を返すことを確認する。"""
+        assert find_edit_range("abcXYdef", "abcZdef") == (3, 5, 4)
+
+    def test_identical(self) -> None:
+        """同一の文字列では空の範囲を返すことを確認する。"""
+        assert find_edit_range("abc", "abc") == (3, 3, 3)
+
+    def test_insertion(self) -> None:
+        """挿入のみの場合は編集前の範囲が空になることを確認する。"""
+        assert find_edit_range("ab", "aXb") == (1, 1, 2)
+
+
+class TestMergeEditRanges:
+    """merge_edit_ranges関数のテスト。"""
+
+    def test_single_edit(self) -> None:
+        """1件の編集の範囲をそのまま返すことを確認する。"""
+        assert merge_edit_ranges([(3, 2, 1)]) == (3, 5, 4)
+
+    def test_typing(self) -> None:
+        """連続した入力が1つの挿入範囲にまとまることを確認する。"""
+        # "ab" -> "aXb" -> "aXYb"
+        assert merge_edit_ranges([(1, 0, 1), (2, 0, 1)]) == (1, 1, 3)
+
+    def test_separate_edits(self) -> None:
+        """離れた編集の間を含む範囲にまとまることを確認する。"""
+        old = "0123456789"
+        # "0123456789" -> "01X3456789" -> "01X34567"
+        new = "01X34567"
+
+        start, old_end, new_end = merge_edit_ranges([(2, 1, 1), (8, 2, 0)])
+
+        assert old[:start] == new[:start]
+        assert old[old_end:] == new[new_end:]
+        assert (start, old_end, new_end) == (2, 10, 8)
+
+    def test_edit_before_previous_edit(self) -> None:
+        """前の編集より手前の編集で開始位置が戻ることを確認する。"""
+        # "abcdef" -> "abcXdef" -> "bcXdef"
+        assert merge_edit_ranges([(3, 0, 1), (0, 1, 0)]) == (0, 3, 3)
+
+    def test_no_edits(self) -> None:
+        """編集がない場合は空の範囲を返すことを確認する。"""
+        assert merge_edit_ranges([]) == (0, 0, 0)
@@ -1,6 +1,11 @@
 """SEO分析サービスのテスト。"""
 
-from postblog.services.seo_service import analyze_seo
+from postblog.services.seo_parser import find_edit_range, parse_article
+from postblog.services.seo_service import (
+    analyze_seo,
+    analyze_seo_incremental,
+    analyze_seo_with_state,
+)
 
 
 GOOD_ARTICLE = """# Python入門ガイド
@@ -210,3 +215,87 @@ class TestAnalyzeSeo:
         assert result.score >= 0
         body_item = next(i for i in result.items if i.name == "キーワード密度")
         assert body_item.status == "fail"
+
+    def test_reuses_parsed_article(self) -> None:
+        """解析済みの本文を渡しても同じ結果になることを確認する。"""
+        parsed = parse_article(GOOD_ARTICLE)
+
+        result = analyze_seo(
+            title="Python入門ガイド",
+            body=GOOD_ARTICLE,
+            keyword="python入門",
+            parsed=parsed,
+        )
+
+        expected = analyze_seo(
+            title="Python入門ガイド", body=GOOD_ARTICLE, keyword="python入門"
+        )
+        assert result == expected
+
+    def test_stale_parsed_article_is_ignored(self) -> None:
+        """本文と一致しない解析結果は使われないことを確認する。"""
+        parsed = parse_article("## 古い見出し\n\n### 古い小見出し")
+
+        result = analyze_seo(
+            title="テスト", body="見出しなし", keyword="test", parsed=parsed
+        )
+
+        heading = next(i for i in result.items if i.name == "見出し階層")
+        assert heading.status == "fail"
+
+
+class TestAnalyzeSeoIncremental:
+    """analyze_seo_incremental関数のテスト。"""
+
+    def _analyze_edit(
+        self,
+        new_body: str,
+        keyword: str = "python入門",
+        title: str = "Python入門ガイド",
+    ) -> None:
+        previous, state = analyze_seo_with_state(
+            title="Python入門ガイド", body=GOOD_ARTICLE, keyword="python入門"
+        )
+        start, old_end, new_end = find_edit_range(GOOD_ARTICLE, new_body)
+
+        result, new_state = analyze_seo_incremental(
+            previous,
+            state,
+            title,
+            new_body,
+            keyword,
+            start=start,
+            old_end=old_end,
+            new_end=new_end,
+        )
+
+        expected, expected_state = analyze_seo_with_state(
+            title=title, body=new_body, keyword=keyword
+        )
+        assert result == expected
+        assert new_state.keyword_hits == expected_state.keyword_hits
+        assert new_state.heading_keyword_hits == expected_state.heading_keyword_hits
+
+    def test_paragraph_edit(self) -> None:
+        """段落の編集後に全体分析と同じ結果になることを確認する。"""
+        self._analyze_edit(
+            GOOD_ARTICLE.replace("基本を学びました", "Python入門を終えました")
+        )
+
+    def test_heading_edit(self) -> None:
+        """見出しの編集後に全体分析と同じ結果になることを確認する。"""
+        self._analyze_edit(GOOD_ARTICLE.replace("## まとめ", "## Python入門のまとめ"))
+
+    def test_removing_sections(self) -> None:
+        """複数の段落を削除した後に全体分析と同じ結果になることを確認する。"""
+        start = GOOD_ARTICLE.index("## Pythonとは")
+        end = GOOD_ARTICLE.index("## まとめ")
+        self._analyze_edit(GOOD_ARTICLE[:start] + GOOD_ARTICLE[end:])
+
+    def test_keyword_change(self) -> None:
+        """キーワードが変わった場合も全体分析と同じ結果になることを確認する。"""
+        self._analyze_edit(GOOD_ARTICLE + "\n\n追記。", keyword="データ分析")
+
+    def test_title_change(self) -> None:
+        """タイトルが変わった場合も全体分析と同じ結果になることを確認する。"""
+        self._analyze_edit(GOOD_ARTICLE, title="まったく別のタイトル")